@@ -28,6 +28,9 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
     - If view has AllowAny permission → returns None (skip for public endpoints)
     - If key is invalid/expired → raises AuthenticationFailed
     - If user is inactive/deleted → raises AuthenticationFailed
+
+    Resolved keys are cached by key hash when DJANGO_CFG_API_KEY_CACHE_TTL > 0
+    (see services/api_key_cache.py); rotation, deletion and user saves evict.
     """
 
     keyword = "X-API-Key"
@@ -84,15 +87,19 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
     def _authenticate_credentials(self, request, key):
         """Validate API key and return (user, key_instance)."""
         from .models.api_key import UserAPIKey
-
-        try:
-            api_key = UserAPIKey.objects.select_related("user").get(key=key)
-        except (UserAPIKey.DoesNotExist, ValueError, ValidationError):
-            # ValueError / ValidationError: key is not a well-formed UUID, so it
-            # can never match — treat the same as a missing key (invalid auth),
-            # not an unhandled 500.
-            logger.warning("API key authentication failed: invalid key")
-            raise exceptions.AuthenticationFailed("Invalid API key.")
+        from .services.api_key_cache import cache_api_key, get_cached_api_key
+
+        api_key = get_cached_api_key(key)
+        if api_key is None:
+            try:
+                api_key = UserAPIKey.objects.select_related("user").get(key=key)
+            except (UserAPIKey.DoesNotExist, ValueError, ValidationError):
+                # ValueError / ValidationError: key is not a well-formed UUID, so it
+                # can never match — treat the same as a missing key (invalid auth),
+                # not an unhandled 500.
+                logger.warning("API key authentication failed: invalid key")
+                raise exceptions.AuthenticationFailed("Invalid API key.")
+            cache_api_key(key, api_key)
 
         user = api_key.user
 
@@ -0,0 +1,131 @@
+"""
+Tests for the API key lookup cache in APIKeyAuthentication.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+
+from .authentication import APIKeyAuthentication
+from .models.api_key import UserAPIKey
+from .services import api_key_cache as api_key_cache_service
+from .services.api_key_cache import cache_api_key, get_cached_api_key, invalidate_user_api_key
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_key_cache(settings):
+    settings.DJANGO_CFG_API_KEY_CACHE_TTL = 60
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_key():
+    user = get_user_model().objects.create_user(
+        email="agent@example.com", password="secret"
+    )
+    return UserAPIKey.objects.for_user(user)
+
+
+class TestAPIKeyCache:
+    """Test cached API key resolution and invalidation."""
+
+    def test_cache_hit_runs_no_queries(self, api_key_cache, api_key, django_assert_num_queries):
+        auth = APIKeyAuthentication()
+
+        # Lookup + re-check before caching
+        with django_assert_num_queries(2):
+            auth._authenticate_credentials(None, api_key.full_key)
+
+        with django_assert_num_queries(0):
+            user, cached = auth._authenticate_credentials(None, api_key.full_key)
+
+        assert user.pk == api_key.user_id
+        assert cached.pk == api_key.pk
+        assert cached.full_key == api_key.full_key
+
+    def test_entry_holds_neither_key_nor_password(self, api_key_cache, api_key):
+        auth = APIKeyAuthentication()
+        auth._authenticate_credentials(None, api_key.full_key)
+
+        entry = cache.get(f"django_cfg:api_key:{api_key_cache_service._hash_key(api_key.full_key)}")
+        assert entry is not None
+        assert api_key.key not in entry
+        assert api_key.full_key not in repr(entry)
+        assert api_key.user.password not in repr(entry)
+
+    def test_disabled_by_default(self, settings, api_key, django_assert_num_queries):
+        settings.DJANGO_CFG_API_KEY_CACHE_TTL = 0
+        auth = APIKeyAuthentication()
+        auth._authenticate_credentials(None, api_key.full_key)
+
+        with django_assert_num_queries(1):
+            auth._authenticate_credentials(None, api_key.full_key)
+
+    def test_regenerate_invalidates_old_key(self, api_key_cache, api_key, django_capture_on_commit_callbacks):
+        auth = APIKeyAuthentication()
+        old_key = api_key.full_key
+        auth._authenticate_credentials(None, old_key)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_key.regenerate()
+
+        with pytest.raises(AuthenticationFailed):
+            auth._authenticate_credentials(None, old_key)
+        auth._authenticate_credentials(None, api_key.full_key)
+
+    def test_delete_invalidates(self, api_key_cache, api_key, django_capture_on_commit_callbacks):
+        auth = APIKeyAuthentication()
+        auth._authenticate_credentials(None, api_key.full_key)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAPIKey.objects.get(pk=api_key.pk).delete()
+
+        with pytest.raises(AuthenticationFailed):
+            auth._authenticate_credentials(None, api_key.full_key)
+
+    def test_deactivation_invalidates(self, api_key_cache, api_key, django_capture_on_commit_callbacks):
+        auth = APIKeyAuthentication()
+        auth._authenticate_credentials(None, api_key.full_key)
+
+        user = api_key.user
+        user.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            auth._authenticate_credentials(None, api_key.full_key)
+
+    def test_key_loaded_before_regenerate_is_never_served(
+        self, api_key_cache, api_key, django_capture_on_commit_callbacks
+    ):
+        auth = APIKeyAuthentication()
+        old_key = api_key.full_key
+        # A request loaded the key; it is rotated and committed before the
+        # request gets to cache what it loaded
+        stale = UserAPIKey.objects.select_related("user").get(pk=api_key.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            UserAPIKey.objects.get(pk=api_key.pk).regenerate()
+
+        cache_api_key(old_key, stale)
+
+        with pytest.raises(AuthenticationFailed):
+            auth._authenticate_credentials(None, old_key)
+
+    def test_write_racing_an_eviction_is_ignored(
+        self, api_key_cache, api_key, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        # The re-check passes, then an eviction commits before the entry is written
+        def current_until_evicted(loaded):
+            with django_capture_on_commit_callbacks(execute=True):
+                invalidate_user_api_key(loaded.user_id)
+            return True
+
+        monkeypatch.setattr(api_key_cache_service, "_is_current", current_until_evicted)
+        cache_api_key(api_key.full_key, api_key)
+
+        assert get_cached_api_key(api_key.full_key) is None
@@ -0,0 +1,191 @@
+"""
+API key lookup cache for APIKeyAuthentication.
+
+Machine clients send the same X-API-Key on every call; this cache lets them
+authenticate without a database round trip. Entries are keyed by a sha256 of
+the presented key and hold only the key's pk, its user id and the user fields
+authentication checks. Neither the key nor the password hash is ever written
+to the cache: a hit rebuilds a UserAPIKey from the presented key and a user
+whose other fields are deferred (loaded on access).
+
+Invalidation is explicit:
+- key rotated (``regenerate()``) or deleted → UserAPIKey post_save/post_delete
+- user saved or deleted (is_active, is_deleted) → User post_save/post_delete
+
+Both paths run once the transaction commits and go through a per-user index
+entry that records which key hash is cached for that user, so no database
+lookup is needed to find the stale entry. They also replace a per-user
+version stored with every entry: a request that loaded the key before the
+commit but caches it afterwards writes an entry that is never served. The
+version is read before the loaded row is re-checked against the database, so
+either the re-check sees the committed change or the entry carries the old
+version. Changes made with queryset.update() apply after the TTL.
+
+Disabled unless DJANGO_CFG_API_KEY_CACHE_TTL > 0 (JWTConfig.api_key_cache_ttl).
+"""
+
+import hashlib
+import logging
+import uuid
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+_PREFIX_KEY = "django_cfg:api_key"
+_PREFIX_OWNER = "django_cfg:api_key:user"
+_PREFIX_VERSION = "django_cfg:api_key:version"
+
+# Outlives any cache TTL; an expired version just orphans its entries
+_VERSION_TTL = 24 * 60 * 60
+
+
+def _hash_key(key) -> str:
+    """Hash a presented API key for use in cache keys."""
+    return hashlib.sha256(str(key).strip().lower().encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _cached_user_fields() -> tuple:
+    """User attnames kept in an entry (concrete field order, for ``from_db``)."""
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    return tuple(
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.primary_key or field.name in {
+            User.USERNAME_FIELD,
+            User.get_email_field_name(),
+            "is_active",
+            "is_staff",
+            "is_superuser",
+            "deleted_at",
+        }
+    )
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex
+
+
+def _user_version(user_id) -> str:
+    """The user's current cache version, creating one if there is none."""
+    version_key = f"{_PREFIX_VERSION}:{user_id}"
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, _new_version(), _VERSION_TTL)
+        version = cache.get(version_key)
+    return version
+
+
+def _is_current(api_key) -> bool:
+    """Whether the key row and the user fields authentication checks are unchanged."""
+    from ..models.api_key import UserAPIKey
+
+    return UserAPIKey.objects.using(api_key._state.db).filter(
+        pk=api_key.pk,
+        key=api_key.key,
+        user__is_active=api_key.user.is_active,
+        user__deleted_at=api_key.user.deleted_at,
+    ).exists()
+
+
+def get_api_key_cache_ttl() -> int:
+    """Seconds to cache a resolved API key (0 = disabled)."""
+    return int(getattr(settings, "DJANGO_CFG_API_KEY_CACHE_TTL", 0) or 0)
+
+
+def _rebuild(key, key_pk, user_id, user_values):
+    """A UserAPIKey for the presented key with a minimal ``user`` attached."""
+    from django.contrib.auth import get_user_model
+
+    from ..models.api_key import UserAPIKey
+
+    User = get_user_model()
+    user = User.from_db(User._default_manager.db, _cached_user_fields(), user_values)
+    api_key = UserAPIKey.from_db(
+        UserAPIKey._default_manager.db,
+        ("id", "user_id", "key"),
+        (key_pk, user_id, UserAPIKey._meta.get_field("key").to_python(key)),
+    )
+    api_key.user = user
+    return api_key
+
+
+def get_cached_api_key(key):
+    """
+    Return a UserAPIKey (with a minimal ``user``) for a cached presented key.
+
+    Returns:
+        UserAPIKey instance, or None on miss / when caching is disabled
+    """
+    if get_api_key_cache_ttl() <= 0:
+        return None
+
+    try:
+        entry = cache.get(f"{_PREFIX_KEY}:{_hash_key(key)}")
+        if entry is None:
+            return None
+        version, key_pk, user_id, user_values = entry
+        if cache.get(f"{_PREFIX_VERSION}:{user_id}") != version:
+            return None
+        return _rebuild(key, key_pk, user_id, user_values)
+    except Exception as e:
+        logger.warning(f"API key cache read failed: {e}")
+        return None
+
+
+def cache_api_key(key, api_key) -> None:
+    """
+    Cache a resolved UserAPIKey under the hash of the presented key.
+
+    Costs one extra query: the row is re-checked after the user's version is
+    read, and not cached if it changed since it was loaded.
+    """
+    ttl = get_api_key_cache_ttl()
+    if ttl <= 0:
+        return
+
+    key_hash = _hash_key(key)
+    user_values = tuple(getattr(api_key.user, attname) for attname in _cached_user_fields())
+    try:
+        version = _user_version(api_key.user_id)
+        if not _is_current(api_key):
+            return
+        cache.set_many(
+            {
+                f"{_PREFIX_KEY}:{key_hash}": (version, api_key.pk, api_key.user_id, user_values),
+                f"{_PREFIX_OWNER}:{api_key.user_id}": key_hash,
+            },
+            ttl,
+        )
+    except Exception as e:
+        logger.warning(f"API key cache write failed: {e}")
+
+
+def invalidate_user_api_key(user_id, using=None) -> None:
+    """Evict whatever API key is cached for a user once the transaction commits."""
+
+    def evict():
+        owner_key = f"{_PREFIX_OWNER}:{user_id}"
+        try:
+            cache.set(f"{_PREFIX_VERSION}:{user_id}", _new_version(), _VERSION_TTL)
+            key_hash = cache.get(owner_key)
+            if key_hash:
+                cache.delete_many([f"{_PREFIX_KEY}:{key_hash}", owner_key])
+        except Exception as e:
+            logger.warning(f"API key cache invalidation failed for user {user_id}: {e}")
+
+    transaction.on_commit(evict, using=using)
+
+
+__all__ = [
+    "get_api_key_cache_ttl",
+    "get_cached_api_key",
+    "cache_api_key",
+    "invalidate_user_api_key",
+]
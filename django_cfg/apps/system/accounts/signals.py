@@ -5,7 +5,7 @@ Django signals for automatic email notifications on user account changes.
 import logging
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import Signal, receiver
 from django.utils import timezone
 
@@ -118,6 +118,22 @@ def create_user_api_key(sender, instance, created, **kwargs):
         UserAPIKey.objects.for_user(instance)
 
 
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_api_key_cache(sender, instance, using=None, **kwargs):
+    """Evict the user's cached API key so is_active/is_deleted apply at once."""
+    from .services.api_key_cache import invalidate_user_api_key
+    invalidate_user_api_key(instance.pk, using=using)
+
+
+@receiver(post_save, sender="django_cfg_accounts.UserAPIKey")
+@receiver(post_delete, sender="django_cfg_accounts.UserAPIKey")
+def invalidate_rotated_api_key(sender, instance, using=None, **kwargs):
+    """Evict the cached key when it is rotated (regenerate()) or deleted."""
+    from .services.api_key_cache import invalidate_user_api_key
+    invalidate_user_api_key(instance.user_id, using=using)
+
+
 @receiver(post_save, sender=User)
 def send_user_login_notification(sender, instance, created, **kwargs):
     """Send login notification email (triggered by login events)."""
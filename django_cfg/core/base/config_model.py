@@ -602,6 +602,8 @@ class DjangoConfig(BaseModel):
         for _alias, db_config in self.databases.items():
             if db_config.migrate_to:
                 referenced_databases.add(db_config.migrate_to)
+            if db_config.replica_of:
+                referenced_databases.add(db_config.replica_of)
 
         missing_databases = referenced_databases - set(self.databases.keys())
         if missing_databases:
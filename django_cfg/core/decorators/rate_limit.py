@@ -21,12 +21,18 @@ Example usage:
     @rate_limit(key='user', rate='20/minute')
     async def ai_chat_send_message(conn, params):
         ...
+
+    # GCRA (token bucket) - one Lua call, one small key per identity
+    @rate_limit(key='ip', rate='600/minute', algorithm='gcra')
+    def hot_endpoint(request):
+        ...
 """
 
 import asyncio
 import hashlib
 import inspect
 import logging
+import math
 import time
 from functools import wraps
 from typing import Any, Callable, Literal, Optional, TypeVar, Union
@@ -41,6 +47,45 @@ F = TypeVar("F", bound=Callable)
 # Rate limit key types
 KeyType = Literal["ip", "user", "user_or_ip", "custom"]
 
+# Rate limit algorithms
+AlgorithmType = Literal["sliding_window", "gcra"]
+
+# GCRA (Generic Cell Rate Algorithm) as a single server-side script.
+#
+# State is one string key per identity holding the "theoretical arrival time"
+# (TAT, milliseconds). Denied requests never write, so abusive clients cannot
+# inflate their own window. Server TIME is used so worker clock skew is harmless.
+#
+# KEYS[1] = rate limit key
+# ARGV[1] = emission interval in ms (window / limit)
+# ARGV[2] = burst (limit)
+# Returns {allowed (0/1), remaining, reset_in_seconds}
+_GCRA_LUA = """
+local emission = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + emission
+local allow_at = new_tat - emission * burst
+if now < allow_at then
+    return {0, 0, math.ceil((allow_at - now) / 1000)}
+end
+
+local ttl = math.ceil(new_tat - now)
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', ttl)
+local remaining = math.floor((now - allow_at) / emission)
+return {1, remaining, math.ceil(ttl / 1000)}
+"""
+
+# Registered lazily; redis-py's Script handles EVALSHA + NOSCRIPT fallback
+_gcra_script = None
+
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded."""
@@ -259,6 +304,72 @@ def _check_rate_limit_redis(
     return True, remaining, reset_in
 
 
+def _check_rate_limit_redis_gcra(
+    redis_client,
+    key: str,
+    limit: int,
+    window: int,
+) -> tuple[bool, int, int]:
+    """
+    Check rate limit using Redis with GCRA (token bucket).
+
+    One EVALSHA round trip and one small string key per identity,
+    instead of the four-command ZSET pipeline of the sliding window.
+
+    Args:
+        redis_client: Redis client instance
+        key: Cache key
+        limit: Maximum requests allowed (burst size)
+        window: Time window in seconds
+
+    Returns:
+        Tuple of (allowed, remaining, reset_in_seconds)
+    """
+    global _gcra_script
+
+    if _gcra_script is None:
+        _gcra_script = redis_client.register_script(_GCRA_LUA)
+
+    emission_ms = window * 1000 / limit
+    allowed, remaining, reset_in = _gcra_script(
+        keys=[f"{key}:gcra"],
+        args=[emission_ms, limit],
+        client=redis_client,
+    )
+
+    return bool(allowed), int(remaining), int(reset_in)
+
+
+def _check_rate_limit_memory_gcra(
+    key: str,
+    limit: int,
+    window: int,
+) -> tuple[bool, int, int]:
+    """
+    Check rate limit with GCRA using Django cache (fallback).
+
+    WARNING: This is not atomic and does not work across multiple workers.
+    Use Redis in production.
+    """
+    from django.core.cache import cache
+
+    now = time.time()
+    cache_key = f"memory:{key}:gcra"
+
+    emission = window / limit
+    tat = max(cache.get(cache_key, now), now)
+    new_tat = tat + emission
+    allow_at = new_tat - emission * limit
+
+    if now < allow_at:
+        return False, 0, math.ceil(allow_at - now)
+
+    cache.set(cache_key, new_tat, math.ceil(new_tat - now))
+    remaining = int((now - allow_at) / emission)
+
+    return True, remaining, math.ceil(new_tat - now)
+
+
 def _check_rate_limit_memory(
     key: str,
     limit: int,
@@ -301,6 +412,7 @@ def _check_rate_limit(
     key: str,
     limit: int,
     window: int,
+    algorithm: AlgorithmType = "sliding_window",
 ) -> tuple[bool, int, int]:
     """
     Check rate limit using best available backend.
@@ -311,12 +423,16 @@ def _check_rate_limit(
     redis_client = _get_redis_client()
 
     if redis_client:
+        if algorithm == "gcra":
+            return _check_rate_limit_redis_gcra(redis_client, key, limit, window)
         return _check_rate_limit_redis(redis_client, key, limit, window)
     else:
         logger.warning(
             "Redis not available for rate limiting. "
             "Using in-memory fallback (not suitable for production)."
         )
+        if algorithm == "gcra":
+            return _check_rate_limit_memory_gcra(key, limit, window)
         return _check_rate_limit_memory(key, limit, window)
 
 
@@ -350,6 +466,7 @@ def rate_limit(
     custom_key: Optional[str] = None,
     block: bool = True,
     on_exceed: Optional[Callable] = None,
+    algorithm: AlgorithmType = "sliding_window",
 ) -> Callable[[F], F]:
     """
     Universal rate limiting decorator.
@@ -372,6 +489,10 @@ def rate_limit(
                If False, set request.rate_limited = True and continue.
         on_exceed: Optional callback when limit exceeded.
                    Called with (request_or_conn, limit, remaining, reset_in)
+        algorithm: Rate limiting algorithm:
+            - "sliding_window": Exact sliding window (ZSET per identity)
+            - "gcra": GCRA / token bucket, allows bursts up to the limit
+              and refills smoothly. Single Lua call, O(1) memory per key.
 
     Returns:
         Decorated function
@@ -387,6 +508,12 @@ def rate_limit(
     """
     limit, window = _parse_rate(rate)
 
+    if algorithm not in ("sliding_window", "gcra"):
+        raise ValueError(
+            f"Unknown rate limit algorithm '{algorithm}'. "
+            "Expected 'sliding_window' or 'gcra'."
+        )
+
     def decorator(func: F) -> F:
         # Determine if function is async
         is_async = asyncio.iscoroutinefunction(func)
@@ -418,7 +545,7 @@ def rate_limit(
 
                 # Check rate limit
                 allowed, remaining, reset_in = _check_rate_limit(
-                    cache_key, limit, window
+                    cache_key, limit, window, algorithm
                 )
 
                 if not allowed:
@@ -474,7 +601,7 @@ def rate_limit(
 
                 # Check rate limit
                 allowed, remaining, reset_in = _check_rate_limit(
-                    cache_key, limit, window
+                    cache_key, limit, window, algorithm
                 )
 
                 if not allowed:
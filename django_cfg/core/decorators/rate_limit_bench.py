@@ -0,0 +1,107 @@
+"""
+Benchmark: sliding window vs GCRA rate limiting.
+
+Compares Redis round trips, commands sent and key memory per identity.
+Runs against a local Redis when a URL is given, otherwise fakeredis
+(requires ``fakeredis`` and ``lupa`` for Lua support).
+
+GCRA refills continuously, so it admits slightly more than the limit
+over the run; the first GCRA call also pays one SCRIPT LOAD round trip.
+
+Usage:
+    python -m django_cfg.core.decorators.rate_limit_bench
+    python -m django_cfg.core.decorators.rate_limit_bench redis://localhost:6379/15
+"""
+
+import sys
+import time
+
+from .rate_limit import _check_rate_limit_redis, _check_rate_limit_redis_gcra
+
+REQUESTS = 2000
+LIMIT = 1000
+WINDOW = 60
+
+
+class _CountingClient:
+    """Proxy counting round trips and commands sent to Redis."""
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = 0
+        self.commands = 0
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def execute_command(self, *args, **options):
+        self.round_trips += 1
+        self.commands += 1
+        return self._client.execute_command(*args, **options)
+
+    def evalsha(self, *args):
+        self.round_trips += 1
+        self.commands += 1
+        return self._client.evalsha(*args)
+
+    def pipeline(self, *args, **kwargs):
+        pipe = self._client.pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        def counted_execute(*a, **kw):
+            self.round_trips += 1
+            self.commands += len(pipe.command_stack)
+            return execute(*a, **kw)
+
+        pipe.execute = counted_execute
+        return pipe
+
+
+def _key_memory(client, key: str) -> int:
+    """Memory used by a key (MEMORY USAGE, or DUMP size on fakeredis)."""
+    try:
+        return client.memory_usage(key) or 0
+    except Exception:
+        dumped = client.dump(key)
+        return len(dumped) if dumped else 0
+
+
+def _run(name: str, check, raw_client, key: str, state_key: str) -> None:
+    raw_client.delete(state_key)
+    client = _CountingClient(raw_client)
+
+    allowed = 0
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        ok, _, _ = check(client, key, LIMIT, WINDOW)
+        allowed += ok
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{name:<15} allowed={allowed:<5} "
+        f"round_trips={client.round_trips:<6} commands={client.commands:<6} "
+        f"key_bytes={_key_memory(raw_client, state_key):<7} "
+        f"ops/s={REQUESTS / elapsed:,.0f}"
+    )
+    raw_client.delete(state_key)
+
+
+def main(argv: list[str]) -> None:
+    if argv:
+        import redis
+
+        client = redis.Redis.from_url(argv[0])
+        target = argv[0]
+    else:
+        import fakeredis
+
+        client = fakeredis.FakeStrictRedis()
+        target = "fakeredis"
+
+    print(f"{REQUESTS} requests, limit {LIMIT}/{WINDOW}s, one identity ({target})")
+    _run("sliding_window", _check_rate_limit_redis, client, "bench:rl", "bench:rl")
+    _run("gcra", _check_rate_limit_redis_gcra, client, "bench:rl", "bench:rl:gcra")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
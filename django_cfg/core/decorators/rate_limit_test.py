@@ -12,6 +12,7 @@ from .rate_limit import (
     _parse_rate,
     _get_cache_key,
     _check_rate_limit_memory,
+    _check_rate_limit_redis_gcra,
     rate_limit,
     RateLimitExceeded,
 )
@@ -134,6 +135,57 @@ class TestMemoryRateLimit:
         assert remaining == 0
 
 
+class TestGCRARateLimit:
+    """Test GCRA rate limiting (requires fakeredis with Lua support)."""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.FakeStrictRedis()
+
+    def test_allows_burst_up_to_limit(self, redis_client):
+        results = [
+            _check_rate_limit_redis_gcra(redis_client, "gcra-key", limit=5, window=60)
+            for _ in range(5)
+        ]
+
+        assert all(allowed for allowed, _, _ in results)
+        assert [remaining for _, remaining, _ in results] == [4, 3, 2, 1, 0]
+
+    def test_blocks_over_limit(self, redis_client):
+        for _ in range(5):
+            _check_rate_limit_redis_gcra(redis_client, "gcra-key", limit=5, window=60)
+
+        allowed, remaining, reset_in = _check_rate_limit_redis_gcra(
+            redis_client, "gcra-key", limit=5, window=60
+        )
+
+        assert allowed is False
+        assert remaining == 0
+        assert 0 < reset_in <= 12  # one emission interval (60s / 5)
+
+    def test_denied_requests_do_not_extend_window(self, redis_client):
+        for _ in range(5):
+            _check_rate_limit_redis_gcra(redis_client, "gcra-key", limit=5, window=60)
+        state = redis_client.get("gcra-key:gcra")
+
+        for _ in range(50):
+            _check_rate_limit_redis_gcra(redis_client, "gcra-key", limit=5, window=60)
+
+        assert redis_client.get("gcra-key:gcra") == state
+
+    def test_single_small_key(self, redis_client):
+        _check_rate_limit_redis_gcra(redis_client, "gcra-key", limit=5, window=60)
+
+        assert redis_client.keys("*") == [b"gcra-key:gcra"]
+        assert 0 < redis_client.pttl("gcra-key:gcra") <= 12000
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            rate_limit(rate="10/minute", algorithm="leaky")
+
+
 class TestRateLimitDecorator:
     """Test the rate_limit decorator."""
 
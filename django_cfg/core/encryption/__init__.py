@@ -46,6 +46,7 @@ Components:
     - EncryptionConfig: Pydantic configuration model
     - EncryptableSerializerMixin: DRF serializer mixin
     - EncryptedJSONRenderer: Full response encryption
+    - StreamEncryptor / decrypt_stream: Framed AES-GCM for streamed responses
     - EncryptionMiddleware: Request encryption detection
     - AES256GCMCipher: Encryption cipher
     - KeyManager: Key management and caching
@@ -62,6 +63,7 @@ from .config import (
 )
 from .ciphers import (
     AES256GCMCipher,
+    BoundAES256GCMCipher,
     AuthenticationError,
     CipherBase,
     DecryptionError,
@@ -82,6 +84,13 @@ from .keys import (
     reset_key_manager,
 )
 from .middleware import EncryptionMiddleware, encryption_enabled
+from .streaming import (
+    STREAM_ALGORITHM,
+    StreamEncryptor,
+    decrypt_stream,
+    iter_decrypt_segments,
+    iter_json,
+)
 
 # Lazy imports for DRF-dependent modules to avoid circular imports.
 # DRF triggers Django settings loading at import time, which can cause
@@ -89,9 +98,9 @@ from .middleware import EncryptionMiddleware, encryption_enabled
 
 
 def __getattr__(name: str):
-    if name in ("EncryptedJSONRenderer", "OptionalEncryptedJSONRenderer"):
-        from .renderers import EncryptedJSONRenderer, OptionalEncryptedJSONRenderer
-        return {"EncryptedJSONRenderer": EncryptedJSONRenderer, "OptionalEncryptedJSONRenderer": OptionalEncryptedJSONRenderer}[name]
+    if name in ("EncryptedJSONRenderer", "OptionalEncryptedJSONRenderer", "encrypted_streaming_response"):
+        from . import renderers as _r
+        return getattr(_r, name)
     if name in (
         "EncryptableSerializerMixin", "EncryptedCharField", "EncryptedDecimalField",
         "EncryptedFieldMixin", "EncryptedFloatField", "EncryptedIntegerField", "EncryptedJSONField",
@@ -114,6 +123,7 @@ __all__ = [
     "CipherBase",
     "EncryptionResult",
     "AES256GCMCipher",
+    "BoundAES256GCMCipher",
     "get_default_cipher",
     # Exceptions
     "EncryptionException",
@@ -133,9 +143,16 @@ __all__ = [
     # Middleware
     "EncryptionMiddleware",
     "encryption_enabled",
+    # Streaming
+    "STREAM_ALGORITHM",
+    "StreamEncryptor",
+    "iter_json",
+    "iter_decrypt_segments",
+    "decrypt_stream",
     # Renderers
     "EncryptedJSONRenderer",
     "OptionalEncryptedJSONRenderer",
+    "encrypted_streaming_response",
     # Serializers
     "EncryptableSerializerMixin",
     "EncryptedFieldMixin",
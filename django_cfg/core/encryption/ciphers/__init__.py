@@ -5,7 +5,7 @@ Available ciphers:
     - AES256GCMCipher: AES-256 in GCM mode (recommended)
 """
 
-from .aes import AES256GCMCipher, get_default_cipher
+from .aes import AES256GCMCipher, BoundAES256GCMCipher, get_default_cipher
 from .base import CipherBase, EncryptionResult
 from .exceptions import (
     AuthenticationError,
@@ -23,6 +23,7 @@ __all__ = [
     "EncryptionResult",
     # Implementations
     "AES256GCMCipher",
+    "BoundAES256GCMCipher",
     "get_default_cipher",
     # Exceptions
     "EncryptionException",
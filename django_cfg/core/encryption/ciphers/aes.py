@@ -6,6 +6,8 @@ Provides AES-256-GCM authenticated encryption cipher.
 
 from __future__ import annotations
 
+import secrets
+
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -143,6 +145,86 @@ class AES256GCMCipher(CipherBase):
                 context={"ciphertext_length": len(ciphertext)},
             ) from e
 
+    def bind(self, key: bytes) -> "BoundAES256GCMCipher":
+        """
+        Bind the cipher to one key for encrypting many values.
+
+        Args:
+            key: 32-byte encryption key
+
+        Returns:
+            BoundAES256GCMCipher reusing one AESGCM context for that key
+        """
+        return BoundAES256GCMCipher(self, key)
+
+
+class BoundAES256GCMCipher:
+    """
+    AES-256-GCM bound to a single key.
+
+    Builds the AESGCM context once and draws nonces from a pooled
+    `secrets.token_bytes()` buffer, so encrypting many values (e.g. every
+    encrypted field of a list response) only varies the nonce.
+
+    Example:
+        ```python
+        bound = AES256GCMCipher().bind(key)
+        results = [bound.encrypt(value) for value in values]
+        ```
+    """
+
+    # Nonces fetched from the OS per refill
+    NONCE_POOL_SIZE = 256
+
+    def __init__(self, cipher: AES256GCMCipher, key: bytes):
+        cipher.validate_key(key)
+        self.cipher = cipher
+        self._aesgcm = AESGCM(key)
+        self._nonce_pool = b""
+        self._nonce_offset = 0
+
+    @property
+    def algorithm_name(self) -> str:
+        return self.cipher.algorithm_name
+
+    def _next_nonce(self) -> bytes:
+        iv_size = self.cipher.iv_size
+        if self._nonce_offset + iv_size > len(self._nonce_pool):
+            self._nonce_pool = secrets.token_bytes(iv_size * self.NONCE_POOL_SIZE)
+            self._nonce_offset = 0
+        nonce = self._nonce_pool[self._nonce_offset:self._nonce_offset + iv_size]
+        self._nonce_offset += iv_size
+        return nonce
+
+    def encrypt(self, plaintext: bytes) -> EncryptionResult:
+        """
+        Encrypt data with the bound key and a fresh random nonce.
+
+        Args:
+            plaintext: Data to encrypt
+
+        Returns:
+            EncryptionResult with ciphertext, IV, and authentication tag
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        try:
+            iv = self._next_nonce()
+            ciphertext_with_tag = self._aesgcm.encrypt(iv, plaintext, None)
+        except Exception as e:
+            raise EncryptionError(
+                f"AES-256-GCM encryption failed: {e}",
+                context={"plaintext_length": len(plaintext)},
+            ) from e
+
+        tag_size = self.cipher.auth_tag_size
+        return EncryptionResult(
+            ciphertext=ciphertext_with_tag[:-tag_size],
+            iv=iv,
+            auth_tag=ciphertext_with_tag[-tag_size:],
+        )
+
 
 # Convenience function
 def get_default_cipher() -> AES256GCMCipher:
@@ -51,6 +51,19 @@ class KeyDerivationConfig(BaseModel):
         default="SHA-256",
         description="Hash function for key derivation",
     )
+    cache_size: int = Field(
+        default=1000,
+        ge=0,
+        le=1_000_000,
+        description="Derived keys kept in the per-process LRU cache (0 = disabled)",
+    )
+    shared_cache: bool = Field(
+        default=False,
+        description=(
+            "Store derived keys, wrapped with a key-encryption key, in the "
+            "Django cache so new workers skip derivation"
+        ),
+    )
 
 
 class KeyRotationConfig(BaseModel):
@@ -6,17 +6,22 @@ Provides key derivation and management utilities.
 
 from .derivation import (
     derive_key_from_components,
+    derive_key_hkdf,
+    derive_key_hkdf_expand,
     derive_key_pbkdf2,
     generate_salt,
 )
-from .manager import KeyManager, get_key_manager, reset_key_manager
+from .manager import KEY_IDS, KeyManager, get_key_manager, reset_key_manager
 
 __all__ = [
     # Derivation
     "derive_key_pbkdf2",
+    "derive_key_hkdf",
+    "derive_key_hkdf_expand",
     "derive_key_from_components",
     "generate_salt",
     # Manager
+    "KEY_IDS",
     "KeyManager",
     "get_key_manager",
     "reset_key_manager",
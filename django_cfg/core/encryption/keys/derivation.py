@@ -1,7 +1,8 @@
 """
 Key derivation functions for Django-CFG encryption.
 
-Provides PBKDF2-based key derivation for generating encryption keys.
+Provides PBKDF2-based key derivation for generating encryption keys, and
+HKDF-Expand for cheap per-context subkeys from a PBKDF2-derived master key.
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ import secrets
 from typing import Literal
 
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF, HKDFExpand
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 
@@ -60,6 +62,73 @@ def derive_key_pbkdf2(
     return kdf.derive(password)
 
 
+def derive_key_hkdf_expand(
+    master_key: bytes,
+    info: str | bytes,
+    key_length: int = 32,
+) -> bytes:
+    """
+    Derive a subkey from a uniformly random master key using HKDF-Expand.
+
+    Costs a couple of HMAC calls, so a per-user or per-session key can be
+    derived on every request once the (slow) master key is known.
+
+    Args:
+        master_key: Pseudorandom key, e.g. the output of derive_key_pbkdf2()
+        info: Context binding the subkey (e.g. "user:42")
+        key_length: Desired key length in bytes (default: 32 for AES-256)
+
+    Returns:
+        Derived subkey
+
+    Example:
+        ```python
+        master = derive_key_pbkdf2(settings.SECRET_KEY, salt)
+        user_key = derive_key_hkdf_expand(master, f"user:{user.id}")
+        ```
+    """
+    if isinstance(info, str):
+        info = info.encode("utf-8")
+
+    return HKDFExpand(
+        algorithm=hashes.SHA256(),
+        length=key_length,
+        info=info,
+    ).derive(master_key)
+
+
+def derive_key_hkdf(
+    secret: str | bytes,
+    info: str | bytes,
+    key_length: int = 32,
+) -> bytes:
+    """
+    Derive a key from a high-entropy secret using HKDF (extract + expand).
+
+    Only suitable for secrets that are already random (such as SECRET_KEY),
+    not for passwords — use derive_key_pbkdf2() for those.
+
+    Args:
+        secret: High-entropy input keying material
+        info: Context binding the key
+        key_length: Desired key length in bytes
+
+    Returns:
+        Derived key
+    """
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    if isinstance(info, str):
+        info = info.encode("utf-8")
+
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=key_length,
+        salt=None,
+        info=info,
+    ).derive(secret)
+
+
 def generate_salt(length: int = 16) -> bytes:
     """
     Generate a cryptographically secure random salt.
@@ -2,23 +2,42 @@
 Key management for Django-CFG encryption.
 
 Provides KeyManager for handling encryption key generation, caching, and rotation.
+
+Derivation modes (``KeyManager(mode=...)``):
+    - "pbkdf2" (key id "v1"): PBKDF2 per user/session context. Every new
+      context costs a full PBKDF2 run.
+    - "hkdf" (key id "v2"): PBKDF2 once for a master key, then HKDF-Expand
+      per user/session — microseconds per new context. Server-side only:
+      the `@djangocfg/crypto` browser client derives v1 keys, so the
+      configured manager used for API envelopes is always "pbkdf2".
+
+The key id is embedded in ciphertext envelopes ("kid"), and
+`get_encryption_key(key_id=...)` derives keys for any known version, so
+ciphertexts produced before switching modes remain decryptable.
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
-import secrets
-from functools import lru_cache
-from typing import TYPE_CHECKING, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal, Optional
 
-from .derivation import derive_key_pbkdf2, generate_salt
+from ..ciphers.exceptions import KeyError as EncryptionKeyError
+from .derivation import derive_key_hkdf, derive_key_hkdf_expand, derive_key_pbkdf2, generate_salt
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
+KeyMode = Literal["pbkdf2", "hkdf"]
+
+# Key id written into envelopes for each derivation mode
+KEY_IDS: dict[str, str] = {"pbkdf2": "v1", "hkdf": "v2"}
+_MODES_BY_KEY_ID = {kid: mode for mode, kid in KEY_IDS.items()}
+
 
 class KeyManager:
     """
@@ -28,15 +47,17 @@ class KeyManager:
     user-specific or session-specific context for per-user key isolation.
 
     Features:
-        - Key derivation from SECRET_KEY
+        - Key derivation from SECRET_KEY (per-context PBKDF2, or master + HKDF)
         - Optional per-user key isolation
         - Optional per-session key isolation
-        - In-memory caching for performance
+        - Thread-safe in-memory LRU cache of configurable size
+        - Optional shared cache of wrapped keys (Django cache) across workers
+        - Versioned key ids for decrypting older ciphertexts
         - Salt generation for client-side key derivation
 
     Example:
         ```python
-        manager = KeyManager()
+        manager = KeyManager(mode="hkdf")
 
         # Get global key
         key = manager.get_encryption_key()
@@ -46,6 +67,9 @@ class KeyManager:
 
         # Get key from request
         key = manager.get_key_for_request(request)
+
+        # Key for a ciphertext produced under another mode
+        key = manager.get_encryption_key(user_id=user.id, key_id="v1")
         ```
     """
 
@@ -53,11 +77,15 @@ class KeyManager:
     SALT_SIZE = 16
     DEFAULT_ITERATIONS = 100_000
     CACHE_SIZE = 1000  # Max cached keys
+    SHARED_CACHE_TIMEOUT = 24 * 60 * 60
 
     def __init__(
         self,
         iterations: int | None = None,
         key_prefix: str = "djangocfg_encryption",
+        mode: KeyMode = "pbkdf2",
+        cache_size: int | None = None,
+        shared_cache: bool = False,
     ):
         """
         Initialize KeyManager.
@@ -65,15 +93,34 @@ class KeyManager:
         Args:
             iterations: PBKDF2 iterations (default: 100,000)
             key_prefix: Prefix for key derivation salt
+            mode: "pbkdf2" (per-context PBKDF2) or "hkdf" (master + HKDF-Expand)
+            cache_size: Max keys kept in the in-memory LRU (0 disables it)
+            shared_cache: Also store keys, wrapped with a key-encryption key,
+                in the Django cache so other workers skip derivation
         """
+        if mode not in KEY_IDS:
+            raise ValueError(f"Unknown key derivation mode: {mode!r}")
+
         self.iterations = iterations or self.DEFAULT_ITERATIONS
         self.key_prefix = key_prefix
-        self._key_cache: dict[str, bytes] = {}
+        self.mode = mode
+        self.cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self.shared_cache = shared_cache
+        self._key_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._master_key: bytes | None = None
+        self._wrapping_key: bytes | None = None
+
+    @property
+    def key_id(self) -> str:
+        """Key id of the current derivation mode, written into envelopes."""
+        return KEY_IDS[self.mode]
 
     def get_encryption_key(
         self,
         user_id: int | str | None = None,
         session_id: str | None = None,
+        key_id: str | None = None,
     ) -> bytes:
         """
         Get encryption key for the given context.
@@ -86,30 +133,50 @@ class KeyManager:
         Args:
             user_id: Optional user ID for per-user key
             session_id: Optional session ID for per-session key
+            key_id: Key version from a ciphertext envelope (default: current)
 
         Returns:
             32-byte encryption key
-        """
-        cache_key = self._build_cache_key(user_id, session_id)
-
-        # Check cache
-        if cache_key in self._key_cache:
-            return self._key_cache[cache_key]
-
-        # Derive key
-        key = self._derive_key(user_id, session_id)
 
-        # Cache with size limit
-        if len(self._key_cache) >= self.CACHE_SIZE:
-            # Remove oldest entries (simple FIFO)
-            keys_to_remove = list(self._key_cache.keys())[: self.CACHE_SIZE // 2]
-            for k in keys_to_remove:
-                del self._key_cache[k]
-
-        self._key_cache[cache_key] = key
+        Raises:
+            KeyError: If key_id is not a known version
+        """
+        key_id = key_id or self.key_id
+        if key_id not in _MODES_BY_KEY_ID:
+            raise EncryptionKeyError(
+                f"Unknown encryption key id: {key_id!r}",
+                context={"known": sorted(_MODES_BY_KEY_ID)},
+            )
+
+        cache_key = f"{key_id}:{self._build_cache_key(user_id, session_id)}"
+
+        with self._lock:
+            key = self._key_cache.get(cache_key)
+            if key is not None:
+                self._key_cache.move_to_end(cache_key)
+                return key
+
+        key = self._load_shared(cache_key) if self.shared_cache else None
+        if key is None:
+            if _MODES_BY_KEY_ID[key_id] == "hkdf":
+                key = derive_key_hkdf_expand(
+                    self._get_master_key(),
+                    f"{self.key_prefix}:{self._build_cache_key(user_id, session_id)}",
+                    key_length=self.KEY_SIZE,
+                )
+            else:
+                key = self._derive_key(user_id, session_id)
+            if self.shared_cache:
+                self._store_shared(cache_key, key)
+
+        self._remember(cache_key, key)
         return key
 
-    def get_key_for_request(self, request: "HttpRequest") -> bytes:
+    def get_key_for_request(
+        self,
+        request: "HttpRequest",
+        key_id: str | None = None,
+    ) -> bytes:
         """
         Get encryption key for the current request.
 
@@ -117,6 +184,7 @@ class KeyManager:
 
         Args:
             request: Django HttpRequest
+            key_id: Key version from a ciphertext envelope (default: current)
 
         Returns:
             Encryption key
@@ -132,7 +200,7 @@ class KeyManager:
         if hasattr(request, "session") and request.session.session_key:
             session_id = request.session.session_key
 
-        return self.get_encryption_key(user_id=user_id, session_id=session_id)
+        return self.get_encryption_key(user_id=user_id, session_id=session_id, key_id=key_id)
 
     def generate_client_salt(self) -> bytes:
         """
@@ -147,10 +215,87 @@ class KeyManager:
         return generate_salt(self.SALT_SIZE)
 
     def clear_cache(self) -> None:
-        """Clear the key cache."""
-        self._key_cache.clear()
+        """Clear the in-memory key cache (shared entries expire on their own)."""
+        with self._lock:
+            self._key_cache.clear()
+            self._master_key = None
         logger.debug("Encryption key cache cleared")
 
+    def _remember(self, cache_key: str, key: bytes) -> None:
+        """Insert into the LRU, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._key_cache[cache_key] = key
+            self._key_cache.move_to_end(cache_key)
+            while len(self._key_cache) > self.cache_size:
+                self._key_cache.popitem(last=False)
+
+    def _get_master_key(self) -> bytes:
+        """PBKDF2 master key for "hkdf" mode, derived once per process."""
+        if self._master_key is not None:
+            return self._master_key
+
+        from django.conf import settings
+
+        master = self._load_shared("master") if self.shared_cache else None
+        if master is None:
+            salt_input = f"{self.key_prefix}:master".encode("utf-8")
+            master = derive_key_pbkdf2(
+                password=settings.SECRET_KEY,
+                salt=hashlib.sha256(salt_input).digest()[: self.SALT_SIZE],
+                iterations=self.iterations,
+                key_length=self.KEY_SIZE,
+            )
+            if self.shared_cache:
+                self._store_shared("master", master)
+
+        self._master_key = master
+        return master
+
+    def _get_wrapping_key(self) -> bytes:
+        """Key-encryption key for shared cache entries (HKDF of SECRET_KEY)."""
+        if self._wrapping_key is None:
+            from django.conf import settings
+
+            self._wrapping_key = derive_key_hkdf(
+                settings.SECRET_KEY, f"{self.key_prefix}:kek", key_length=self.KEY_SIZE
+            )
+        return self._wrapping_key
+
+    def _shared_cache_key(self, cache_key: str) -> str:
+        """Django cache key for a context; hashed so session ids never leak."""
+        digest = hashlib.sha256(f"{self.iterations}:{cache_key}".encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:key:{digest}"
+
+    def _load_shared(self, cache_key: str) -> bytes | None:
+        """Fetch and unwrap a key from the Django cache (None on miss/failure)."""
+        from cryptography.hazmat.primitives.keywrap import aes_key_unwrap
+        from django.core.cache import cache
+
+        try:
+            wrapped = cache.get(self._shared_cache_key(cache_key))
+            if wrapped is None:
+                return None
+            return aes_key_unwrap(self._get_wrapping_key(), wrapped)
+        except Exception as e:
+            logger.debug(f"Shared encryption key unavailable: {e}")
+            return None
+
+    def _store_shared(self, cache_key: str, key: bytes) -> None:
+        """Wrap a key (RFC 3394) and store it in the Django cache."""
+        from cryptography.hazmat.primitives.keywrap import aes_key_wrap
+        from django.core.cache import cache
+
+        try:
+            cache.set(
+                self._shared_cache_key(cache_key),
+                aes_key_wrap(self._get_wrapping_key(), key),
+                self.SHARED_CACHE_TIMEOUT,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store encryption key in shared cache: {e}")
+
     def _build_cache_key(
         self,
         user_id: int | str | None,
@@ -169,7 +314,7 @@ class KeyManager:
         session_id: str | None,
     ) -> bytes:
         """
-        Derive encryption key using PBKDF2.
+        Derive encryption key using PBKDF2 (key id "v1").
 
         Key material:
             - Django SECRET_KEY (base)
@@ -218,10 +363,29 @@ def get_key_manager() -> KeyManager:
     """
     global _key_manager
     if _key_manager is None:
-        _key_manager = KeyManager()
+        _key_manager = _build_key_manager()
     return _key_manager
 
 
+def _build_key_manager() -> KeyManager:
+    """Create a KeyManager from DjangoConfig.encryption.key_derivation, if set."""
+    try:
+        from django_cfg.core.state import get_current_config
+
+        config = get_current_config()
+        if config and getattr(config, "encryption", None):
+            key_derivation = config.encryption.key_derivation
+            return KeyManager(
+                iterations=key_derivation.iterations,
+                cache_size=key_derivation.cache_size,
+                shared_cache=key_derivation.shared_cache,
+            )
+    except Exception as e:
+        logger.debug(f"Could not load key derivation config: {e}")
+
+    return KeyManager()
+
+
 def reset_key_manager() -> None:
     """Reset the global KeyManager instance."""
     global _key_manager
@@ -0,0 +1,52 @@
+"""
+Benchmark: KeyManager cost of a first request per user.
+
+Derives keys for distinct users on a cold manager (the case of a new worker,
+or a user set larger than the cache) in both derivation modes, then shows a
+fresh worker picking keys up from the shared cache.
+
+Usage:
+    python -m django_cfg.core.encryption.keys.manager_bench
+"""
+
+import time
+
+import django
+from django.conf import settings
+
+PBKDF2_USERS = 50
+HKDF_USERS = 20_000
+
+
+def _setup() -> None:
+    if not settings.configured:
+        settings.configure(
+            SECRET_KEY="bench-" + "x" * 50,
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        )
+        django.setup()
+
+
+def _rate(label: str, manager, users: int) -> None:
+    started = time.perf_counter()
+    for user_id in range(users):
+        manager.get_encryption_key(user_id=user_id)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {users / elapsed:>10,.0f} keys/s  {elapsed / users * 1000:>8.3f} ms/key")
+
+
+def main() -> None:
+    _setup()
+    from .manager import KeyManager
+
+    print(f"PBKDF2 {KeyManager.DEFAULT_ITERATIONS:,} iterations, distinct users, cold cache")
+    _rate("pbkdf2 (v1), per user", KeyManager(mode="pbkdf2"), PBKDF2_USERS)
+    _rate("hkdf (v2), incl. master derivation", KeyManager(mode="hkdf"), HKDF_USERS)
+
+    warm = KeyManager(mode="pbkdf2", shared_cache=True, cache_size=0)
+    _rate("pbkdf2, filling shared cache", warm, PBKDF2_USERS)
+    _rate("pbkdf2, new worker, shared cache", KeyManager(mode="pbkdf2", shared_cache=True), PBKDF2_USERS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Tests for KeyManager derivation modes, key ids and caching.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from ..ciphers.exceptions import KeyError as EncryptionKeyError
+from .manager import KeyManager
+
+ITERATIONS = 1_000
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestKeyManager:
+    """Test key derivation, versioning and LRU/shared caching."""
+
+    def test_modes_derive_distinct_keys(self):
+        pbkdf2 = KeyManager(iterations=ITERATIONS, mode="pbkdf2")
+        hkdf = KeyManager(iterations=ITERATIONS, mode="hkdf")
+
+        assert pbkdf2.key_id == "v1"
+        assert hkdf.key_id == "v2"
+        assert pbkdf2.get_encryption_key(user_id=1) != hkdf.get_encryption_key(user_id=1)
+        assert hkdf.get_encryption_key(user_id=1) != hkdf.get_encryption_key(user_id=2)
+
+    def test_key_id_keeps_old_ciphertexts_decryptable(self):
+        legacy = KeyManager(iterations=ITERATIONS).get_encryption_key(user_id=7)
+        switched = KeyManager(iterations=ITERATIONS, mode="hkdf")
+
+        assert switched.get_encryption_key(user_id=7, key_id="v1") == legacy
+
+        with pytest.raises(EncryptionKeyError):
+            switched.get_encryption_key(user_id=7, key_id="v9")
+
+    def test_lru_evicts_least_recently_used(self):
+        manager = KeyManager(iterations=ITERATIONS, mode="hkdf", cache_size=2)
+        manager.get_encryption_key(user_id=1)
+        manager.get_encryption_key(user_id=2)
+        manager.get_encryption_key(user_id=1)
+        manager.get_encryption_key(user_id=3)
+
+        assert list(manager._key_cache) == ["v2:user:1", "v2:user:3"]
+
+    def test_shared_cache_stores_wrapped_keys(self, monkeypatch):
+        first = KeyManager(iterations=ITERATIONS, shared_cache=True)
+        key = first.get_encryption_key(user_id=5)
+
+        second = KeyManager(iterations=ITERATIONS, shared_cache=True)
+        monkeypatch.setattr(second, "_derive_key", pytest.fail)
+
+        assert second.get_encryption_key(user_id=5) == key
+        assert key not in cache.get(second._shared_cache_key("v1:user:5"))
+
+
+def test_configured_manager_uses_client_derivable_mode(monkeypatch):
+    from django_cfg.core import state
+
+    from ..config import EncryptionConfig, KeyDerivationConfig
+    from . import manager as manager_module
+
+    config = type("Config", (), {
+        "encryption": EncryptionConfig(key_derivation=KeyDerivationConfig(iterations=20_000)),
+    })()
+    monkeypatch.setattr(state, "get_current_config", lambda: config)
+    built = manager_module._build_key_manager()
+
+    assert (built.mode, built.iterations) == ("pbkdf2", 20_000)
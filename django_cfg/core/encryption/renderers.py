@@ -9,12 +9,14 @@ from __future__ import annotations
 import base64
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
+from django.http import StreamingHttpResponse
 from rest_framework.renderers import JSONRenderer
 
 from .ciphers import AES256GCMCipher
 from .keys import get_key_manager
+from .streaming import DEFAULT_SEGMENT_SIZE, StreamEncryptor, iter_json
 
 if TYPE_CHECKING:
     from rest_framework.request import Request
@@ -34,6 +36,7 @@ class EncryptedJSONRenderer(JSONRenderer):
         {
             "encrypted": true,
             "algorithm": "AES-256-GCM",
+            "kid": "v1",
             "salt": "base64_encoded_salt",
             "iv": "base64_encoded_iv",
             "data": "base64_encoded_ciphertext",
@@ -55,10 +58,17 @@ class EncryptedJSONRenderer(JSONRenderer):
         class MyViewSet(viewsets.ModelViewSet):
             renderer_classes = [EncryptedJSONRenderer]
         ```
+
+    Large responses:
+        `render()` holds the full JSON and its ciphertext in memory. For big
+        payloads use `render_stream()` or `encrypted_streaming_response()`,
+        which serialize and encrypt in framed segments (see streaming.py) so
+        peak memory is bounded by the segment size.
     """
 
     media_type = "application/json+encrypted"
     format = "json+encrypted"
+    segment_size = DEFAULT_SEGMENT_SIZE
 
     def render(
         self,
@@ -94,6 +104,48 @@ class EncryptedJSONRenderer(JSONRenderer):
             # Return unencrypted on error
             return json_bytes
 
+    def render_stream(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Render data as a stream of JSON chunks, encrypted in framed segments.
+
+        Args:
+            data: Data to render
+            accepted_media_type: Accepted media type
+            renderer_context: Renderer context with request
+
+        Yields:
+            Plain JSON chunks, or the streaming envelope when encrypting
+        """
+        request = renderer_context.get("request") if renderer_context else None
+        chunks = iter_json(
+            data,
+            encoder_class=self.encoder_class,
+            ensure_ascii=self.ensure_ascii,
+            chunk_size=self.segment_size,
+        )
+
+        if not self._should_encrypt(request, renderer_context):
+            return chunks
+
+        key_manager = get_key_manager()
+        if request:
+            key = key_manager.get_key_for_request(getattr(request, "_request", request))
+        else:
+            key = key_manager.get_encryption_key()
+
+        encryptor = StreamEncryptor(
+            key,
+            key_id=key_manager.key_id,
+            segment_size=self.segment_size,
+            salt=key_manager.generate_client_salt(),
+        )
+        return encryptor.encrypt(chunks)
+
     def _should_encrypt(
         self,
         request: "Request | None",
@@ -157,6 +209,7 @@ class EncryptedJSONRenderer(JSONRenderer):
         encrypted_response = {
             "encrypted": True,
             "algorithm": cipher.algorithm_name,
+            "kid": key_manager.key_id,
             "salt": base64.b64encode(client_salt).decode("ascii"),
             "iv": base64.b64encode(result.iv).decode("ascii"),
             "data": base64.b64encode(result.ciphertext).decode("ascii"),
@@ -166,6 +219,38 @@ class EncryptedJSONRenderer(JSONRenderer):
         return json.dumps(encrypted_response).encode("utf-8")
 
 
+def encrypted_streaming_response(
+    data: Any,
+    request: "Request",
+    view: Any = None,
+    status: int = 200,
+    renderer_class: type[EncryptedJSONRenderer] = EncryptedJSONRenderer,
+) -> StreamingHttpResponse:
+    """
+    Build a StreamingHttpResponse that serializes and encrypts incrementally.
+
+    Encryption follows the same triggers as the renderer (middleware flag or
+    `view.encrypt_response`); otherwise plain JSON is streamed.
+
+    Example:
+        ```python
+        class ExportView(APIView):
+            def get(self, request):
+                rows = Report.objects.values().iterator()
+                return encrypted_streaming_response(rows, request, view=self)
+        ```
+    """
+    renderer = renderer_class()
+    renderer_context = {"request": request, "view": view}
+    encrypting = renderer._should_encrypt(request, renderer_context)
+
+    return StreamingHttpResponse(
+        renderer.render_stream(data, renderer_context=renderer_context),
+        status=status,
+        content_type=EncryptedJSONRenderer.media_type if encrypting else "application/json",
+    )
+
+
 class OptionalEncryptedJSONRenderer(EncryptedJSONRenderer):
     """
     JSON renderer with optional encryption using standard media type.
@@ -0,0 +1,71 @@
+"""
+Benchmark: peak RSS when encrypting a ~50 MB JSON response.
+
+Each mode runs in a fresh subprocess. The payload is built first, then the
+growth of peak RSS (ru_maxrss) over that baseline is reported:
+- before: EncryptedJSONRenderer.render() (full JSON + full ciphertext + envelope)
+- after: render_stream() consumed chunk by chunk, as StreamingHttpResponse does
+
+Usage:
+    python -m django_cfg.core.encryption.renderers_bench
+"""
+
+import resource
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import django
+from django.conf import settings
+
+PAYLOAD_MB = 50
+ROW_BYTES = 200
+
+
+def _setup() -> None:
+    if not settings.configured:
+        settings.configure(SECRET_KEY="bench-" + "x" * 50, INSTALLED_APPS=[])
+        django.setup()
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(mode: str) -> None:
+    _setup()
+    from .renderers import EncryptedJSONRenderer
+
+    rows = PAYLOAD_MB * 1024 * 1024 // (ROW_BYTES + 40)
+    data = [{"id": i, "text": "x" * ROW_BYTES} for i in range(rows)]
+    context = {"request": SimpleNamespace(encryption_enabled=True, _request=SimpleNamespace())}
+    renderer = EncryptedJSONRenderer()
+    baseline = _peak_rss_mb()
+
+    started = time.perf_counter()
+    if mode == "before":
+        size = len(renderer.render(data, renderer_context=context))
+    else:
+        size = sum(len(chunk) for chunk in renderer.render_stream(data, renderer_context=context))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{mode:<8} output {size / 1024 / 1024:>6.1f} MB  "
+        f"peak RSS +{_peak_rss_mb() - baseline:>7.1f} MB  {elapsed:>5.2f}s"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        _run(sys.argv[1])
+        return
+
+    print(f"~{PAYLOAD_MB} MB JSON payload, encrypted")
+    for mode in ("before", "after"):
+        subprocess.run([sys.executable, "-m", __spec__.name, mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
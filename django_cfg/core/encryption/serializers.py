@@ -29,6 +29,80 @@ def decode_base64(data: str) -> bytes:
     return base64.b64decode(data.encode("ascii"))
 
 
+class FieldEncryptor:
+    """
+    Cipher and key resolved once, for encrypting many field values.
+
+    Holds an AES-256-GCM cipher bound to the request's key; each value costs
+    one `json.dumps`, one AES-GCM call with a pooled nonce and base64.
+    """
+
+    def __init__(self, request: Any = None):
+        key_manager = get_key_manager()
+
+        # Get key for current request
+        if request:
+            key = key_manager.get_key_for_request(request)
+        else:
+            key = key_manager.get_encryption_key()
+
+        self.cipher = AES256GCMCipher().bind(key)
+        self.key_id = key_manager.key_id
+
+    def encrypt(self, value: Any, field_name: str | None = None) -> dict[str, Any]:
+        """
+        Encrypt one value into a field envelope.
+
+        Args:
+            value: JSON-serializable value
+            field_name: Field name to include in the envelope (optional)
+
+        Returns:
+            Encrypted field envelope
+        """
+        # Serialize value to JSON bytes
+        plaintext = json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+        # Encrypt
+        result = self.cipher.encrypt(plaintext)
+
+        envelope: dict[str, Any] = {"encrypted": True}
+        if field_name is not None:
+            envelope["field"] = field_name
+        envelope.update({
+            "algorithm": self.cipher.algorithm_name,
+            "kid": self.key_id,
+            "iv": encode_base64(result.iv),
+            "data": encode_base64(result.ciphertext),
+            "auth_tag": encode_base64(result.auth_tag),
+        })
+        return envelope
+
+
+# Serializer context key holding the per-response FieldEncryptor
+_ENCRYPTOR_CONTEXT_KEY = "_djangocfg_field_encryptor"
+
+
+def get_field_encryptor(context: dict[str, Any]) -> FieldEncryptor:
+    """
+    Get the FieldEncryptor for a serializer context, creating it once.
+
+    DRF shares the root serializer's context with nested and `many=True`
+    child serializers, so one response resolves the cipher and key once.
+
+    Args:
+        context: Serializer context (may contain "request")
+
+    Returns:
+        FieldEncryptor for the context's request
+    """
+    encryptor = context.get(_ENCRYPTOR_CONTEXT_KEY)
+    if encryptor is None:
+        encryptor = FieldEncryptor(context.get("request"))
+        context[_ENCRYPTOR_CONTEXT_KEY] = encryptor
+    return encryptor
+
+
 class EncryptableSerializerMixin:
     """
     Mixin for serializers that support field-level encryption.
@@ -60,6 +134,7 @@ class EncryptableSerializerMixin:
         #     "price": {
         #         "encrypted": true,
         #         "algorithm": "AES-256-GCM",
+        #         "kid": "v1",
         #         "iv": "base64...",
         #         "data": "base64...",
         #         "auth_tag": "base64..."
@@ -128,6 +203,10 @@ class EncryptableSerializerMixin:
         """
         Encrypt a single field value.
 
+        The cipher and key are resolved once per serializer context (see
+        `get_field_encryptor`), so a `many=True` list reuses them for every
+        field of every row and only the nonce varies.
+
         Args:
             field_name: Name of the field being encrypted
             value: Value to encrypt
@@ -135,30 +214,7 @@ class EncryptableSerializerMixin:
         Returns:
             Encrypted field envelope
         """
-        cipher = AES256GCMCipher()
-        key_manager = get_key_manager()
-
-        # Get key for current request
-        request = self.context.get("request")  # type: ignore
-        if request:
-            key = key_manager.get_key_for_request(request)
-        else:
-            key = key_manager.get_encryption_key()
-
-        # Serialize value to JSON bytes
-        plaintext = json.dumps(value, ensure_ascii=False).encode("utf-8")
-
-        # Encrypt
-        result = cipher.encrypt(plaintext, key)
-
-        return {
-            "encrypted": True,
-            "field": field_name,
-            "algorithm": cipher.algorithm_name,
-            "iv": encode_base64(result.iv),
-            "data": encode_base64(result.ciphertext),
-            "auth_tag": encode_base64(result.auth_tag),
-        }
+        return get_field_encryptor(self.context).encrypt(value, field_name)  # type: ignore
 
 
 class EncryptedFieldMixin:
@@ -210,25 +266,8 @@ class EncryptedFieldMixin:
 
     def _encrypt_value(self, value: Any) -> dict[str, Any]:
         """Encrypt a value."""
-        cipher = AES256GCMCipher()
-        key_manager = get_key_manager()
-
-        request = self.context.get("request") if hasattr(self, "context") else None
-        if request:
-            key = key_manager.get_key_for_request(request)
-        else:
-            key = key_manager.get_encryption_key()
-
-        plaintext = json.dumps(value, ensure_ascii=False).encode("utf-8")
-        result = cipher.encrypt(plaintext, key)
-
-        return {
-            "encrypted": True,
-            "algorithm": cipher.algorithm_name,
-            "iv": encode_base64(result.iv),
-            "data": encode_base64(result.ciphertext),
-            "auth_tag": encode_base64(result.auth_tag),
-        }
+        context = self.context if hasattr(self, "context") else {}
+        return get_field_encryptor(context).encrypt(value)
 
 
 # Pre-built encrypted field types
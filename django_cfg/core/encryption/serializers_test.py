@@ -0,0 +1,60 @@
+"""
+Tests for per-context field encryption in EncryptableSerializerMixin.
+"""
+
+import json
+from types import SimpleNamespace
+
+from rest_framework import serializers
+
+from .ciphers import AES256GCMCipher
+from .keys import get_key_manager
+from .serializers import EncryptableSerializerMixin, FieldEncryptor, decode_base64
+
+
+class PriceSerializer(EncryptableSerializerMixin, serializers.Serializer):
+    encrypted_fields = ["price", "cost"]
+
+    name = serializers.CharField()
+    price = serializers.IntegerField()
+    cost = serializers.IntegerField()
+
+
+def _decrypt(envelope):
+    return json.loads(AES256GCMCipher().decrypt(
+        decode_base64(envelope["data"]),
+        get_key_manager().get_encryption_key(key_id=envelope["kid"]),
+        decode_base64(envelope["iv"]),
+        decode_base64(envelope["auth_tag"]),
+    ))
+
+
+class TestBatchFieldEncryption:
+    """Test cipher reuse across rows of a many=True serializer."""
+
+    def test_many_resolves_key_once(self, monkeypatch):
+        created = []
+        original_init = FieldEncryptor.__init__
+
+        def counting_init(self, request=None):
+            created.append(request)
+            original_init(self, request)
+
+        monkeypatch.setattr(FieldEncryptor, "__init__", counting_init)
+        rows = [SimpleNamespace(name=f"p{i}", price=i, cost=i * 2) for i in range(50)]
+        request = SimpleNamespace(encryption_enabled=True)
+
+        data = PriceSerializer(rows, many=True, context={"request": request}).data
+
+        assert len(created) == 1
+        assert [_decrypt(row["cost"]) for row in data] == [i * 2 for i in range(50)]
+        assert data[0]["price"]["field"] == "price"
+
+    def test_nonces_are_unique(self):
+        rows = [SimpleNamespace(name="p", price=1, cost=1) for _ in range(300)]
+        request = SimpleNamespace(encryption_enabled=True)
+
+        data = PriceSerializer(rows, many=True, context={"request": request}).data
+        ivs = {row[field]["iv"] for row in data for field in ("price", "cost")}
+
+        assert len(ivs) == 600
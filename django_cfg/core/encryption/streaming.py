@@ -0,0 +1,318 @@
+"""
+Streaming (framed) AES-256-GCM encryption for large responses.
+
+The payload is cut into fixed-size segments, each sealed separately with
+AES-256-GCM, so neither the plaintext JSON nor the ciphertext ever has to be
+held in memory in full. Used by `EncryptedJSONRenderer.render_stream()` and
+`encrypted_streaming_response()` with Django's StreamingHttpResponse.
+
+Each stream is sealed under its own subkey, HKDF-SHA256 of the key with a
+random 32-byte salt carried in the header (as Tink's streaming AEAD does).
+With long-lived shared keys a 7-byte random nonce prefix alone would repeat
+after about 2^28 streams; per-stream keys make nonces only need to be unique
+within one stream.
+
+Segment nonces follow the STREAM construction: a random 7-byte prefix, a
+4-byte big-endian segment counter and a 1-byte "last segment" flag. Reordered,
+dropped or truncated segments therefore fail authentication.
+
+Envelope (streamed as JSON):
+    ```json
+    {
+        "encrypted": true,
+        "algorithm": "AES-256-GCM-STREAM",
+        "kid": "v1",
+        "salt": "base64_encoded_salt",
+        "stream_salt": "base64_encoded_32_bytes",
+        "nonce_prefix": "base64_encoded_7_bytes",
+        "segment_size": 65536,
+        "segments": ["base64(ciphertext + tag)", "..."]
+    }
+    ```
+
+Example:
+    ```python
+    from django_cfg.core.encryption.streaming import decrypt_stream
+
+    plaintext = decrypt_stream(response_bytes, key)
+    data = json.loads(plaintext)
+    ```
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import secrets
+import struct
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from .ciphers import AuthenticationError, DecryptionError
+
+STREAM_ALGORITHM = "AES-256-GCM-STREAM"
+DEFAULT_SEGMENT_SIZE = 64 * 1024
+NONCE_PREFIX_SIZE = 7
+STREAM_SALT_SIZE = 32
+MAX_SEGMENTS = 2**32
+
+_STREAM_KEY_INFO = b"django-cfg:" + STREAM_ALGORITHM.encode("ascii")
+
+
+def _stream_cipher(key: bytes, stream_salt: bytes) -> AESGCM:
+    """AES-GCM under the per-stream subkey HKDF-SHA256(key, stream_salt)."""
+    subkey = HKDF(
+        algorithm=hashes.SHA256(),
+        length=len(key),
+        salt=stream_salt,
+        info=_STREAM_KEY_INFO,
+    ).derive(key)
+    return AESGCM(subkey)
+
+
+def _segment_nonce(prefix: bytes, counter: int, last: bool) -> bytes:
+    if counter >= MAX_SEGMENTS:
+        raise ValueError("Too many segments for one stream")
+    return prefix + struct.pack(">I", counter) + (b"\x01" if last else b"\x00")
+
+
+# Lists nested deeper than this are encoded in one C-accelerated call
+_ITER_JSON_DEPTH = 2
+
+# List items encoded per call (bounds memory to this many rows of JSON)
+_ITER_JSON_BATCH = 256
+
+
+def _is_json_array(data: Any) -> bool:
+    """Lists, tuples and any other non-string, non-mapping iterable (generators, querysets)."""
+    return (
+        hasattr(data, "__iter__")
+        and not isinstance(data, (str, bytes, bytearray, dict))
+    )
+
+
+def _iter_json_pieces(encoder: json.JSONEncoder, data: Any, depth: int) -> Iterator[str]:
+    """
+    Yield JSON text for data, descending only into the outer containers.
+
+    `JSONEncoder.iterencode()` runs in pure Python and is several times
+    slower than `encode()`. Only the top-level dict and top-level lists (a
+    list response, or `results` of a paginated one) are split; rows are
+    encoded in batches with one `encode()` call each, so memory stays bounded
+    by one batch of rows while the C speedups still apply.
+
+    Any iterable is read a batch at a time, so a generator or
+    `QuerySet.iterator()` source never has to be materialized either.
+    """
+    if depth < _ITER_JSON_DEPTH and _is_json_array(data):
+        yield "["
+        rows = iter(data)
+        separator = ""
+        while batch := list(islice(rows, _ITER_JSON_BATCH)):
+            # encode() of a batch minus its brackets: one C call per batch
+            yield separator + encoder.encode(batch)[1:-1]
+            separator = ","
+        yield "]"
+    elif (
+        depth == 0
+        and isinstance(data, dict)
+        and all(isinstance(key, str) for key in data)
+    ):
+        yield "{"
+        for index, (key, value) in enumerate(data.items()):
+            yield ("," if index else "") + encoder.encode(key) + ":"
+            yield from _iter_json_pieces(encoder, value, depth + 1)
+        yield "}"
+    else:
+        yield encoder.encode(data)
+
+
+def iter_json(
+    data: Any,
+    encoder_class: type[json.JSONEncoder] = json.JSONEncoder,
+    ensure_ascii: bool = False,
+    chunk_size: int = DEFAULT_SEGMENT_SIZE,
+) -> Iterator[bytes]:
+    """
+    Serialize data to compact JSON incrementally.
+
+    Args:
+        data: JSON-serializable data
+        encoder_class: JSONEncoder subclass (e.g. DRF's encoder)
+        ensure_ascii: Escape non-ASCII characters
+        chunk_size: Approximate bytes per yielded chunk
+
+    Yields:
+        UTF-8 JSON chunks of roughly chunk_size bytes
+    """
+    encoder = encoder_class(ensure_ascii=ensure_ascii, separators=(",", ":"))
+    buffer: list[str] = []
+    buffered = 0
+    for piece in _iter_json_pieces(encoder, data, 0):
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer, buffered = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+class StreamEncryptor:
+    """
+    Encrypts a byte stream into a framed AES-256-GCM JSON envelope.
+
+    Memory use is bounded by a couple of segments regardless of payload size.
+
+    Example:
+        ```python
+        encryptor = StreamEncryptor(key, key_id="v1")
+        response = StreamingHttpResponse(
+            encryptor.encrypt(iter_json(data)),
+            content_type="application/json+encrypted",
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        key_id: str | None = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        salt: bytes | None = None,
+    ):
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        self.key_id = key_id
+        self.segment_size = segment_size
+        self.salt = salt
+        self.stream_salt = secrets.token_bytes(STREAM_SALT_SIZE)
+        self.nonce_prefix = secrets.token_bytes(NONCE_PREFIX_SIZE)
+        self._aesgcm = _stream_cipher(key, self.stream_salt)
+
+    def _header(self) -> bytes:
+        header: dict[str, Any] = {
+            "encrypted": True,
+            "algorithm": STREAM_ALGORITHM,
+        }
+        if self.key_id is not None:
+            header["kid"] = self.key_id
+        if self.salt is not None:
+            header["salt"] = base64.b64encode(self.salt).decode("ascii")
+        header["stream_salt"] = base64.b64encode(self.stream_salt).decode("ascii")
+        header["nonce_prefix"] = base64.b64encode(self.nonce_prefix).decode("ascii")
+        header["segment_size"] = self.segment_size
+        # Drop the closing brace; segments are appended as the stream goes
+        return json.dumps(header).encode("utf-8")[:-1] + b', "segments": ['
+
+    def _seal(self, counter: int, plaintext: bytes, last: bool) -> bytes:
+        nonce = _segment_nonce(self.nonce_prefix, counter, last)
+        sealed = base64.b64encode(self._aesgcm.encrypt(nonce, plaintext, None))
+        return (b'"' if counter == 0 else b',"') + sealed + b'"'
+
+    def _segments(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Re-cut arbitrary chunks into exactly segment_size plaintext segments."""
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= self.segment_size:
+                yield bytes(buffer[: self.segment_size])
+                del buffer[: self.segment_size]
+        yield bytes(buffer)
+
+    def encrypt(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Encrypt plaintext chunks, yielding the JSON envelope piece by piece.
+
+        Args:
+            chunks: Plaintext byte chunks of any size
+
+        Yields:
+            Envelope bytes (header, one sealed segment per item, closing)
+        """
+        yield self._header()
+
+        counter = 0
+        pending: bytes | None = None
+        for segment in self._segments(chunks):
+            # Hold one segment back so the final one can carry the last flag
+            if pending is not None:
+                yield self._seal(counter, pending, last=False)
+                counter += 1
+            pending = segment
+
+        yield self._seal(counter, pending or b"", last=True)
+        yield b"]}"
+
+
+def iter_decrypt_segments(envelope: dict[str, Any], key: bytes) -> Iterator[bytes]:
+    """
+    Decrypt a framed envelope segment by segment.
+
+    Args:
+        envelope: Parsed envelope dict
+        key: 32-byte decryption key
+
+    Yields:
+        Plaintext segments in order
+
+    Raises:
+        DecryptionError: If the envelope is malformed or truncated
+        AuthenticationError: If a segment fails verification
+    """
+    if envelope.get("algorithm") != STREAM_ALGORITHM:
+        raise DecryptionError(
+            "Not a streaming envelope",
+            context={"algorithm": envelope.get("algorithm")},
+        )
+
+    try:
+        stream_salt = base64.b64decode(envelope["stream_salt"])
+        prefix = base64.b64decode(envelope["nonce_prefix"])
+        segments = envelope["segments"]
+    except (KeyError, ValueError) as e:
+        raise DecryptionError(f"Malformed streaming envelope: {e}") from e
+
+    if not segments:
+        raise DecryptionError("Streaming envelope has no segments")
+
+    aesgcm = _stream_cipher(key, stream_salt)
+    last_index = len(segments) - 1
+    for counter, sealed in enumerate(segments):
+        nonce = _segment_nonce(prefix, counter, counter == last_index)
+        try:
+            yield aesgcm.decrypt(nonce, base64.b64decode(sealed), None)
+        except InvalidTag as e:
+            # Also raised when segments were dropped from the end: the new
+            # last segment was sealed without the last flag
+            raise AuthenticationError() from e
+
+
+def decrypt_stream(payload: bytes | str | dict[str, Any], key: bytes) -> bytes:
+    """
+    Decrypt a complete framed envelope (client/test helper).
+
+    Args:
+        payload: Envelope as bytes, str or parsed dict
+        key: 32-byte decryption key
+
+    Returns:
+        Decrypted plaintext bytes
+    """
+    envelope = payload if isinstance(payload, dict) else json.loads(payload)
+    return b"".join(iter_decrypt_segments(envelope, key))
+
+
+__all__ = [
+    "STREAM_ALGORITHM",
+    "DEFAULT_SEGMENT_SIZE",
+    "StreamEncryptor",
+    "iter_json",
+    "iter_decrypt_segments",
+    "decrypt_stream",
+]
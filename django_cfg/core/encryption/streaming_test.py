@@ -0,0 +1,100 @@
+"""
+Tests for framed streaming encryption and EncryptedJSONRenderer.render_stream.
+"""
+
+import json
+import secrets
+from types import SimpleNamespace
+
+import pytest
+
+from .ciphers import AuthenticationError
+from .keys import get_key_manager
+from .renderers import EncryptedJSONRenderer, encrypted_streaming_response
+from .streaming import StreamEncryptor, decrypt_stream
+
+KEY = secrets.token_bytes(32)
+
+
+def _encrypt(payload: bytes, segment_size: int = 16) -> dict:
+    chunks = [payload[i:i + 5] for i in range(0, len(payload), 5)]
+    body = b"".join(StreamEncryptor(KEY, segment_size=segment_size).encrypt(chunks))
+    return json.loads(body)
+
+
+class TestStreamEncryptor:
+    """Test framing, round trips and tamper detection."""
+
+    @pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 64, 1000])
+    def test_round_trip(self, size):
+        payload = secrets.token_bytes(size)
+        envelope = _encrypt(payload)
+
+        assert decrypt_stream(envelope, KEY) == payload
+        assert len(envelope["segments"]) == size // 16 + 1
+
+    def test_truncation_is_detected(self):
+        envelope = _encrypt(b"x" * 100)
+        envelope["segments"] = envelope["segments"][:-1]
+
+        with pytest.raises(AuthenticationError):
+            decrypt_stream(envelope, KEY)
+
+    def test_each_stream_uses_its_own_subkey(self):
+        first, second = _encrypt(b"same payload"), _encrypt(b"same payload")
+        assert first["stream_salt"] != second["stream_salt"]
+
+        # Same key and nonce, different stream salt: must not decrypt
+        second["nonce_prefix"] = first["nonce_prefix"]
+        second["segments"] = first["segments"]
+        with pytest.raises(AuthenticationError):
+            decrypt_stream(second, KEY)
+
+    def test_reordering_is_detected(self):
+        envelope = _encrypt(b"x" * 16 + b"y" * 16 + b"z")
+        envelope["segments"][0], envelope["segments"][1] = (
+            envelope["segments"][1], envelope["segments"][0]
+        )
+
+        with pytest.raises(AuthenticationError):
+            decrypt_stream(envelope, KEY)
+
+
+class TestRenderStream:
+    """Test the renderer's streaming mode."""
+
+    def test_encrypted_stream_decrypts_to_json(self):
+        data = {"rows": [{"id": i, "name": f"Row {i} ✓"} for i in range(2000)]}
+        request = SimpleNamespace(encryption_enabled=True)
+
+        response = encrypted_streaming_response(data, request)
+        envelope = json.loads(b"".join(response.streaming_content))
+        key = get_key_manager().get_encryption_key(key_id=envelope["kid"])
+
+        assert response["Content-Type"] == EncryptedJSONRenderer.media_type
+        assert json.loads(decrypt_stream(envelope, key)) == data
+
+    def test_row_source_is_read_in_batches(self):
+        pulled = []
+
+        def rows():
+            for i in range(2000):
+                pulled.append(i)
+                yield {"id": i, "pad": "x" * 100}
+
+        chunks = EncryptedJSONRenderer().render_stream(
+            {"results": rows()}, renderer_context={"request": SimpleNamespace()}
+        )
+        first = next(chunks)
+
+        assert first.startswith(b'{"results":[{"id":0,')
+        assert len(pulled) < 2000
+        assert json.loads(first + b"".join(chunks))["results"][-1]["id"] == 1999
+
+    def test_plain_stream_without_flag(self):
+        data = [1, 2, 3]
+        renderer = EncryptedJSONRenderer()
+
+        chunks = renderer.render_stream(data, renderer_context={"request": SimpleNamespace()})
+
+        assert json.loads(b"".join(chunks)) == data
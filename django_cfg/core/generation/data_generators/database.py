@@ -6,7 +6,7 @@ Size: ~100 lines (focused on database settings)
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from ...base.config_model import DjangoConfig
@@ -124,14 +124,34 @@ class DatabaseSettingsGenerator:
             # Explicit per-database `apps=[...]` wins over feature defaults.
             routing_rules.setdefault(app_label, alias)
 
-        if not routing_rules:
+        read_replicas = self._collect_read_replicas()
+
+        if not routing_rules and not read_replicas:
             return {}
 
         return {
             "DATABASE_ROUTERS": ["django_cfg.routing.routers.DatabaseRouter"],
             "DATABASE_ROUTING_RULES": routing_rules,
+            "DATABASE_READ_REPLICAS": read_replicas,
         }
 
+    def _collect_read_replicas(self) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Read replicas grouped by primary alias.
+
+        Returns:
+            Mapping of primary alias → [(replica alias, weight), ...]
+        """
+        replicas: Dict[str, List[Tuple[str, int]]] = {}
+
+        for alias, db_config in self.config.databases.items():
+            if db_config.replica_of:
+                replicas.setdefault(db_config.replica_of, []).append(
+                    (alias, db_config.replica_weight)
+                )
+
+        return replicas
+
     def _collect_feature_routing_rules(self) -> Dict[str, str]:
         """
         Routing rules contributed by feature-level configs that declare a
@@ -172,6 +192,11 @@ class DatabaseSettingsGenerator:
         if db_config.test_mirror:
             return {"MIRROR": db_config.test_mirror}
 
+        # Replicas mirror their primary in tests (Django's documented setup),
+        # so reads routed to a replica see rows written in the same test.
+        if db_config.replica_of:
+            return {"MIRROR": db_config.replica_of}
+
         # Determine engine
         engine = db_config.engine or ""
 
@@ -126,8 +126,7 @@ class Command(BaseCommand):
         )
         self.stdout.write("Message queued...")
 
-        from django_cfg.modules.django_telegram import telegram_queue
-        telegram_queue.flush(timeout=5)
+        DjangoTelegram.flush_queue(timeout=5)
         self.stdout.write(self.style.SUCCESS("Sent!"))
 
     def _send_test(self, telegram: DjangoTelegram, chat_id: str = None):
@@ -163,8 +162,7 @@ class Command(BaseCommand):
             fail_silently=False,
         )
 
-        from django_cfg.modules.django_telegram import telegram_queue
-        telegram_queue.flush(timeout=5)
+        DjangoTelegram.flush_queue(timeout=5)
 
         self.stdout.write(self.style.SUCCESS(f"\nTest sent to {target_chat_id}"))
         self.stdout.write(f"\nUse in config:")
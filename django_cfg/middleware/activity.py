@@ -0,0 +1,253 @@
+"""
+Activity Recorder for Django CFG
+
+Single service behind last_login tracking. JWTAuthenticationWithLastLogin and
+UserActivityMiddleware both call `touch()`; touches are coalesced per user and
+written by `flush()` as one bulk UPDATE instead of one UPDATE per user.
+
+Pending touches live in a Redis hash shared by all worker processes when the
+default cache is Redis, and in process memory otherwise. Flushes run at
+request end once FLUSH_INTERVAL has passed, and at worker shutdown.
+
+Usage:
+    from django_cfg.middleware.activity import get_activity_recorder
+
+    recorder = get_activity_recorder()
+    recorder.touch(user.pk)
+    recorder.flush()  # e.g. from a management command or task
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Optional
+
+from django.contrib.auth import get_user_model
+from django.core.signals import request_finished
+from django.db import connections, router
+from django.utils import timezone
+
+from django_cfg.utils.cache_redis import get_cache_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityRecorder:
+    """
+    Coalesces user activity and writes last_login in bulk.
+
+    Thread-safe; one instance per process (see `get_activity_recorder`).
+    """
+
+    # Minimum seconds between recorded touches for the same user
+    UPDATE_INTERVAL = 300
+
+    # Seconds between flushes triggered at request end
+    FLUSH_INTERVAL = 30
+
+    # Flush early once this many users are pending
+    MAX_PENDING = 5000
+
+    # Users remembered for throttling (oldest evicted first)
+    MAX_TRACKED = 10000
+
+    # Rows per UPDATE statement
+    BATCH_SIZE = 500
+
+    REDIS_KEY = "django_cfg:activity:last_login"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Any, datetime] = {}
+        self._recent: "OrderedDict[Any, datetime]" = OrderedDict()
+        self._last_flush = time.monotonic()
+        self._touches = 0
+        self._flushed = 0
+
+    def touch(self, user_id, when: Optional[datetime] = None) -> bool:
+        """
+        Record activity for a user. Never touches the database.
+
+        Args:
+            user_id: User primary key
+            when: Activity time (default: now)
+
+        Returns:
+            True if recorded, False if throttled (recorded < UPDATE_INTERVAL ago)
+        """
+        now = when or timezone.now()
+
+        with self._lock:
+            last = self._recent.get(user_id)
+            if last and (now - last).total_seconds() < self.UPDATE_INTERVAL:
+                return False
+
+            self._recent[user_id] = now
+            self._recent.move_to_end(user_id)
+            if len(self._recent) > self.MAX_TRACKED:
+                self._recent.popitem(last=False)
+            self._touches += 1
+
+        redis_client = get_cache_redis_client()
+        if redis_client is not None:
+            try:
+                redis_client.hset(self.REDIS_KEY, str(user_id), now.timestamp())
+                return True
+            except Exception as e:
+                logger.warning(f"Activity recorder falling back to memory: {e}")
+
+        with self._lock:
+            self._pending[user_id] = now
+        return True
+
+    def flush_if_due(self, **kwargs) -> int:
+        """Flush if FLUSH_INTERVAL has passed or too many users are pending."""
+        if (
+            time.monotonic() - self._last_flush < self.FLUSH_INTERVAL
+            and len(self._pending) < self.MAX_PENDING
+        ):
+            return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all pending activity to the database.
+
+        Safe to call concurrently, at request end and at shutdown. On failure
+        the batch is put back and retried on the next flush.
+
+        Returns:
+            Number of users written
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+
+            pending = self._merge_redis_pending(pending)
+            if not pending:
+                return 0
+
+            try:
+                self._write(pending)
+            except Exception as e:
+                logger.error(f"Failed to flush last_login for {len(pending)} users: {e}")
+                with self._lock:
+                    for user_id, when in pending.items():
+                        if user_id not in self._pending or self._pending[user_id] < when:
+                            self._pending[user_id] = when
+                return 0
+
+            self._flushed += len(pending)
+            logger.debug(f"Flushed last_login for {len(pending)} users")
+            return len(pending)
+
+    def _merge_redis_pending(self, pending: Dict[Any, datetime]) -> Dict[Any, datetime]:
+        """Atomically take the shared Redis hash and merge it into ``pending``."""
+        redis_client = get_cache_redis_client()
+        if redis_client is None:
+            return pending
+
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.hgetall(self.REDIS_KEY)
+            pipe.delete(self.REDIS_KEY)
+            shared, _ = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not read shared activity hash: {e}")
+            return pending
+
+        pk_field = get_user_model()._meta.pk
+        for raw_id, raw_ts in shared.items():
+            if isinstance(raw_id, bytes):
+                raw_id = raw_id.decode()
+            user_id = pk_field.to_python(raw_id)
+            when = datetime.fromtimestamp(float(raw_ts), tz=dt_timezone.utc)
+            if user_id not in pending or pending[user_id] < when:
+                pending[user_id] = when
+
+        return pending
+
+    def _write(self, pending: Dict[Any, datetime]) -> None:
+        """Bulk UPDATE last_login, never moving it backwards."""
+        User = get_user_model()
+        connection = connections[router.db_for_write(User)]
+        items = list(pending.items())
+
+        if connection.vendor != "postgresql":
+            User.objects.using(connection.alias).bulk_update(
+                [User(pk=user_id, last_login=when) for user_id, when in items],
+                ["last_login"],
+                batch_size=self.BATCH_SIZE,
+            )
+            return
+
+        qn = connection.ops.quote_name
+        table = qn(User._meta.db_table)
+        pk = qn(User._meta.pk.column)
+        last_login = qn(User._meta.get_field("last_login").column)
+        row = f"(%s::{User._meta.pk.rel_db_type(connection)}, %s::timestamptz)"
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(items), self.BATCH_SIZE):
+                batch = items[start:start + self.BATCH_SIZE]
+                values = ", ".join([row] * len(batch))
+                cursor.execute(
+                    f"UPDATE {table} AS u SET {last_login} = v.seen "
+                    f"FROM (VALUES {values}) AS v(id, seen) "
+                    f"WHERE u.{pk} = v.id "
+                    f"AND (u.{last_login} IS NULL OR u.{last_login} < v.seen)",
+                    [param for item in batch for param in item],
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get recorder statistics for monitoring/debugging.
+
+        Returns:
+            dict: Pending/tracked sizes, counters and configuration
+        """
+        return {
+            'pending_users': len(self._pending),
+            'tracked_users': len(self._recent),
+            'touches': self._touches,
+            'flushed': self._flushed,
+            'shared': get_cache_redis_client() is not None,
+            'update_interval_seconds': self.UPDATE_INTERVAL,
+            'flush_interval_seconds': self.FLUSH_INTERVAL,
+        }
+
+
+_recorder: Optional[ActivityRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_activity_recorder() -> ActivityRecorder:
+    """
+    Get the process-wide activity recorder.
+
+    The first call hooks `flush_if_due` to request_finished and `flush`
+    to interpreter shutdown.
+    """
+    global _recorder
+
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                recorder = ActivityRecorder()
+                request_finished.connect(
+                    recorder.flush_if_due,
+                    weak=False,
+                    dispatch_uid="django_cfg_activity_recorder_flush",
+                )
+                atexit.register(recorder.flush)
+                _recorder = recorder
+
+    return _recorder
+
+
+__all__ = ["ActivityRecorder", "get_activity_recorder"]
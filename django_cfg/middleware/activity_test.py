@@ -0,0 +1,58 @@
+"""
+Tests for the batched last_login activity recorder.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .activity import ActivityRecorder
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def users():
+    User = get_user_model()
+    # Whatever the user model requires (CustomUser: email + username)
+    fields = [User.USERNAME_FIELD, *User.REQUIRED_FIELDS]
+    return [
+        User.objects.create_user(**dict.fromkeys(fields, f"user{i}@example.com"), password="x")
+        for i in range(3)
+    ]
+
+
+class TestActivityRecorder:
+    """Test coalescing and bulk flushing."""
+
+    def test_touch_is_throttled_and_does_not_query(self, users, django_assert_num_queries):
+        recorder = ActivityRecorder()
+
+        with django_assert_num_queries(0):
+            assert recorder.touch(users[0].pk) is True
+            assert recorder.touch(users[0].pk) is False
+
+    def test_flush_writes_all_users_in_one_statement(self, users, django_assert_num_queries):
+        recorder = ActivityRecorder()
+        now = timezone.now()
+        for user in users:
+            recorder.touch(user.pk, when=now)
+
+        with django_assert_num_queries(1):
+            assert recorder.flush() == 3
+
+        assert recorder.flush() == 0
+        for user in users:
+            user.refresh_from_db()
+            assert user.last_login == now
+
+    def test_flush_if_due_waits_for_interval(self, users):
+        recorder = ActivityRecorder()
+        recorder.touch(users[0].pk, when=timezone.now() - timedelta(minutes=1))
+
+        assert recorder.flush_if_due() == 0
+
+        recorder._last_flush -= recorder.FLUSH_INTERVAL
+        assert recorder.flush_if_due() == 1
@@ -20,6 +20,8 @@ from django.utils import timezone
 
 from django_cfg.modules.django_telegram import DjangoTelegram
 
+from .route_classifier import get_route_classifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +54,7 @@ def notify_admin_login_success(sender, request, user, **kwargs):
         **kwargs: Additional signal arguments
     """
     # Only monitor admin panel logins
-    if not request or not request.path.startswith('/admin/'):
+    if not request or not get_route_classifier().is_admin(request.path):
         return
 
     # Only monitor staff/superuser access
@@ -109,7 +111,7 @@ try:
             **kwargs: Additional signal arguments
         """
         # Only monitor admin panel
-        if not request or not request.path.startswith('/admin/'):
+        if not request or not get_route_classifier().is_admin(request.path):
             return
 
         # Handle missing credentials
@@ -151,7 +153,7 @@ try:
             **kwargs: Additional signal arguments
         """
         # Only monitor admin panel
-        if not request or not request.path.startswith('/admin/'):
+        if not request or not get_route_classifier().is_admin(request.path):
             return
 
         # Handle missing credentials
@@ -15,12 +15,19 @@ DPoP check — always use this class. Full chain + gotchas:
 """
 
 import logging
+import uuid
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.utils import timezone
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from rest_framework import exceptions
 from rest_framework.request import Request as DRFRequest
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .activity import get_activity_recorder
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +106,80 @@ class JWTAwareAuthenticationMixin:
 
 User = get_user_model()
 
+# Users resolved from JWTs (see DJANGO_CFG_JWT_USER_CACHE_TTL) are cached under
+# id + auth version + the token's revoke claim. The auth version is a random
+# per-user value replaced whenever the user changes, so entries cached before
+# a change (even by a request racing the write) are never read again.
+_USER_CACHE_KEY = "django_cfg:jwt_user:{}:{}:{}"
+_USER_VERSION_KEY = "django_cfg:jwt_user_version:{}"
+
+# Outlives any user cache TTL; an expired version just orphans its entries
+_USER_VERSION_TTL = 24 * 60 * 60
+
+# Only what authentication and request.user checks read; every other field is
+# deferred and loaded on access. The password hash is never cached.
+_CACHED_USER_FIELDS = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.primary_key or field.name in {
+        jwt_settings.USER_ID_FIELD,
+        User.USERNAME_FIELD,
+        User.get_email_field_name(),
+        "is_active",
+        "is_staff",
+        "is_superuser",
+    }
+)
+
+
+def _new_auth_version() -> str:
+    return uuid.uuid4().hex
+
+
+def _user_auth_version(user_id) -> str:
+    """The user's current auth version, creating one if there is none."""
+    key = _USER_VERSION_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_auth_version(), _USER_VERSION_TTL)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_cached_user(user, using=None) -> None:
+    """
+    Drop the cached JWT user so the next request reloads it from the DB.
+
+    Runs once the surrounding transaction commits: a request that reloads
+    the user before that would still read the old row.
+    """
+    user_id = getattr(user, jwt_settings.USER_ID_FIELD)
+
+    def bump_version():
+        try:
+            cache.set(_USER_VERSION_KEY.format(user_id), _new_auth_version(), _USER_VERSION_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cached JWT user: {e}")
+
+    transaction.on_commit(bump_version, using=using)
+
+
+def _invalidate_cached_user_on_change(sender, instance, using=None, **kwargs):
+    """Any save (password, is_active, profile) or delete evicts the cached user."""
+    invalidate_cached_user(instance, using=using)
+
+
+post_save.connect(
+    _invalidate_cached_user_on_change,
+    sender=User,
+    dispatch_uid="django_cfg_jwt_user_cache_post_save",
+)
+post_delete.connect(
+    _invalidate_cached_user_on_change,
+    sender=User,
+    dispatch_uid="django_cfg_jwt_user_cache_post_delete",
+)
+
 
 # Register OpenAPI extension for drf-spectacular
 try:
@@ -161,14 +242,16 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
     JWT Authentication that updates last_login on successful authentication.
 
     Updates last_login field with intelligent throttling to avoid database spam.
-    Only updates if last_login is None or older than the configured interval.
+    Activity goes through the shared ActivityRecorder, which coalesces touches
+    across requests (and worker processes, with Redis) into bulk UPDATEs.
 
     Features:
     - Automatic last_login tracking for all JWT-authenticated requests
     - Built-in throttling (default: 5 minutes) to minimize database writes
-    - In-memory cache for tracking last update times
-    - Automatic cache cleanup to prevent memory leaks
+    - Batched last_login writes shared with UserActivityMiddleware
     - Error handling to prevent authentication failures
+    - Optional short-TTL user cache (DJANGO_CFG_JWT_USER_CACHE_TTL) so hot
+      endpoints authenticate without touching the database
 
     Usage:
         Add to REST_FRAMEWORK settings:
@@ -177,16 +260,6 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
         ]
     """
 
-    # Class-level cache to track last update times (shared across all instances)
-    _last_updates = {}
-
-    # Update interval in seconds (5 minutes by default, same as UserActivityMiddleware)
-    UPDATE_INTERVAL = 300
-
-    # Maximum cache size before cleanup (prevents memory leaks)
-    MAX_CACHE_SIZE = 1000
-    CLEANUP_CACHE_SIZE = 500
-
     def get_user(self, validated_token):
         """
         Override to check if user is active/not deleted.
@@ -194,13 +267,20 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
         Simple JWT by default does NOT check is_active, so we add this check
         to ensure deleted/deactivated accounts cannot use existing tokens.
 
+        When DJANGO_CFG_JWT_USER_CACHE_TTL is set, the user is served from the
+        cache (see `_get_cached_user`) and only loaded from the DB on a miss.
+
         Args:
             validated_token: Validated JWT token
 
         Returns:
             User instance if active, raises AuthenticationFailed otherwise
         """
-        user = super().get_user(validated_token)
+        cache_key = self._user_cache_key(validated_token)
+        user = self._get_cached_user(cache_key)
+        if user is None:
+            user = super().get_user(validated_token)
+            self._cache_user(cache_key, user)
 
         # Check if user is active (is_active=False means deactivated or deleted)
         if not user.is_active:
@@ -215,6 +295,60 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
 
         return user
 
+    def _user_cache_key(self, validated_token):
+        """
+        Cache key for this token's user, or None when caching is off.
+
+        The key carries the user's auth version, read before the user is
+        loaded, and the token's REVOKE_TOKEN_CLAIM (if any). A user change
+        replaces the version, and a token issued before a password change
+        has its own key that simplejwt's check never lets into the cache.
+        """
+        if not getattr(settings, "DJANGO_CFG_JWT_USER_CACHE_TTL", 0):
+            return None
+
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return None
+
+        try:
+            version = _user_auth_version(user_id)
+        except Exception as e:
+            logger.warning(f"JWT user cache unavailable: {e}")
+            return None
+
+        return _USER_CACHE_KEY.format(
+            user_id, version, validated_token.get(jwt_settings.REVOKE_TOKEN_CLAIM, "")
+        )
+
+    def _get_cached_user(self, cache_key):
+        """Return the cached user, or None on a miss."""
+        if cache_key is None:
+            return None
+
+        try:
+            values = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"JWT user cache unavailable: {e}")
+            return None
+
+        if values is None:
+            return None
+
+        user = User.from_db(User._default_manager.db, _CACHED_USER_FIELDS, values)
+        return user if user.is_active else None
+
+    def _cache_user(self, cache_key, user):
+        """Store the user's auth fields for DJANGO_CFG_JWT_USER_CACHE_TTL seconds."""
+        if cache_key is None or not user.is_active:
+            return
+
+        values = tuple(getattr(user, attname) for attname in _CACHED_USER_FIELDS)
+        try:
+            cache.set(cache_key, values, settings.DJANGO_CFG_JWT_USER_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to cache JWT user {user.pk}: {e}")
+
     def authenticate(self, request):
         """
         Authenticate request and update last_login if needed.
@@ -248,8 +382,6 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
         No-op unless `DJANGO_CFG_DPOP_ENABLED` is set AND the token has `cnf.jkt`.
         Raises AuthenticationFailed if the proof is missing/invalid/mismatched.
         """
-        from django.conf import settings
-
         if not getattr(settings, "DJANGO_CFG_DPOP_ENABLED", False):
             return
 
@@ -289,77 +421,20 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
 
     def _update_last_login(self, user):
         """
-        Update user's last_login field with intelligent throttling.
+        Record user activity; last_login is written in bulk by the recorder.
 
-        Only updates if:
-        - last_login is None (never logged in)
-        - last_login is older than UPDATE_INTERVAL seconds
-
-        Uses UPDATE query to avoid triggering signals and save() overhead.
+        The shared ActivityRecorder throttles touches per user (UPDATE_INTERVAL)
+        and flushes them as one bulk UPDATE at request end / worker shutdown,
+        so authentication itself never writes to the database.
 
         Args:
-            user: User instance to update
+            user: Authenticated user instance
         """
-        now = timezone.now()
-        user_id = user.pk
-
-        # Check if we should update (avoid database spam)
-        last_update = self._last_updates.get(user_id)
-        if last_update and (now - last_update).total_seconds() < self.UPDATE_INTERVAL:
-            # Skip update - too soon since last update
-            return
-
         try:
-            # Use update() to avoid triggering signals and save() overhead
-            # This is more efficient than user.save(update_fields=['last_login'])
-            updated_count = User.objects.filter(pk=user_id).update(last_login=now)
-
-            if updated_count > 0:
-                # Cache the update time
-                self._last_updates[user_id] = now
-
-                logger.debug(
-                    f"Updated last_login for user {user.email} (ID: {user_id}) "
-                    f"via JWT authentication"
-                )
-
-                # Clean up old cache entries to prevent memory leaks
-                if len(self._last_updates) > self.MAX_CACHE_SIZE:
-                    self._cleanup_cache()
-
+            get_activity_recorder().touch(user.pk)
         except Exception as e:
             # Log error but don't break authentication
-            # Authentication should succeed even if last_login update fails
-            logger.error(
-                f"Failed to update last_login for user {user_id}: {e}",
-                exc_info=True
-            )
-
-    def _cleanup_cache(self):
-        """
-        Clean up old cache entries to prevent memory leaks.
-
-        Keeps only the most recent CLEANUP_CACHE_SIZE entries.
-        Sorted by update time (newest first).
-        """
-        try:
-            # Sort by update time (value), keep newest entries
-            sorted_items = sorted(
-                self._last_updates.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-
-            # Keep only the most recent entries
-            self._last_updates = dict(sorted_items[:self.CLEANUP_CACHE_SIZE])
-
-            logger.debug(
-                f"Cleaned up last_login cache: "
-                f"kept {len(self._last_updates)} most recent entries"
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to cleanup last_login cache: {e}")
+            logger.error(f"Failed to record activity for user {user.pk}: {e}", exc_info=True)
 
     @classmethod
     def get_cache_stats(cls):
@@ -367,11 +442,6 @@ class JWTAuthenticationWithLastLogin(JWTAuthentication):
         Get cache statistics for monitoring/debugging.
 
         Returns:
-            dict: Cache statistics including size and configuration
+            dict: Activity recorder statistics (see ActivityRecorder.get_stats)
         """
-        return {
-            'cache_size': len(cls._last_updates),
-            'max_cache_size': cls.MAX_CACHE_SIZE,
-            'update_interval_seconds': cls.UPDATE_INTERVAL,
-            'update_interval_minutes': cls.UPDATE_INTERVAL / 60,
-        }
+        return get_activity_recorder().get_stats()
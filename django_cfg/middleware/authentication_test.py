@@ -0,0 +1,111 @@
+"""
+Tests for the JWT user cache in JWTAuthenticationWithLastLogin.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import JWTAuthenticationWithLastLogin
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user_cache(settings):
+    settings.DJANGO_CFG_JWT_USER_CACHE_TTL = 60
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(
+        username="alice", email="alice@example.com", password="secret"
+    )
+
+
+def _token(user):
+    auth = JWTAuthenticationWithLastLogin()
+    return auth.get_validated_token(str(AccessToken.for_user(user)))
+
+
+class TestJWTUserCache:
+    """Test cached user resolution."""
+
+    def test_cache_hit_runs_no_queries(self, user_cache, user, django_assert_num_queries):
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+
+        with django_assert_num_queries(1):
+            auth.get_user(token)
+
+        with django_assert_num_queries(0):
+            cached = auth.get_user(token)
+
+        assert cached.pk == user.pk
+
+    def test_disabled_by_default(self, user, settings, django_assert_num_queries):
+        settings.DJANGO_CFG_JWT_USER_CACHE_TTL = 0
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+        auth.get_user(token)
+
+        with django_assert_num_queries(1):
+            auth.get_user(token)
+
+    def test_cached_user_holds_auth_fields_only(self, user_cache, user, django_assert_num_queries):
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+        auth.get_user(token)
+
+        with django_assert_num_queries(0):
+            cached = auth.get_user(token)
+            assert (cached.email, cached.is_active) == (user.email, True)
+        assert "password" in cached.get_deferred_fields()
+        assert user.password not in cache.get(auth._user_cache_key(token))
+
+    def test_deactivation_invalidates(self, user_cache, user, django_capture_on_commit_callbacks):
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+        auth.get_user(token)
+
+        user.is_active = False
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.get_user(token)
+
+    def test_delete_invalidates(self, user_cache, user, django_capture_on_commit_callbacks):
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+        auth.get_user(token)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.get_user(token)
+
+    def test_reload_racing_a_change_is_never_served(self, user_cache, user, django_capture_on_commit_callbacks):
+        auth = JWTAuthenticationWithLastLogin()
+        token = _token(user)
+        # A request resolves its key, then the user is deactivated and
+        # committed before it caches the row it loaded earlier
+        stale_key = auth._user_cache_key(token)
+        stale = get_user_model().objects.get(pk=user.pk)
+
+        user.is_active = False
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            user.save()
+            assert auth._user_cache_key(token) == stale_key  # not before commit
+        assert callbacks
+
+        auth._cache_user(stale_key, stale)
+
+        with pytest.raises(AuthenticationFailed):
+            auth.get_user(token)
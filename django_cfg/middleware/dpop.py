@@ -16,9 +16,14 @@ DPoP-lite needs:
   • verify_proof(...)       — validate a DPoP proof JWT against the request
   • extract_jkt_from_proof  — used at token-mint time to embed `cnf.jkt`
 
+Proof `jti`s are remembered for the freshness window in a pluggable replay store
+(`JtiReplayStore`: Redis `SET NX EX` when the cache is Redis, an in-memory LRU
+otherwise), so a replayed proof is rejected before any signature work. Parsed
+public keys and thumbprints are memoized per raw JWK.
+
 Deferred (full RFC 9449, see the auth-hardening plan): server-issued `DPoP-Nonce`
-challenge and a replay cache of proof `jti`. DPoP-lite already defeats simple
-token theft; nonce/replay harden against an attacker already executing in-page.
+challenge. DPoP-lite already defeats simple token theft; the nonce hardens against
+an attacker already executing in-page.
 """
 
 from __future__ import annotations
@@ -26,8 +31,13 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import logging
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
 import jwt
@@ -44,6 +54,15 @@ _ALLOWED_PROOF_ALGS = ("ES256", "ES384", "RS256")
 # and in-flight latency without leaving a wide replay window.
 _PROOF_MAX_AGE_SECONDS = 60
 
+# A proof is acceptable while |now - iat| <= max age, so its jti must be
+# remembered for the whole window on both sides of iat.
+_JTI_TTL_SECONDS = 2 * _PROOF_MAX_AGE_SECONDS
+
+# Distinct client keys whose parsed public key + thumbprint stay memoized.
+_JWK_CACHE_SIZE = 1024
+
+logger = logging.getLogger(__name__)
+
 
 class DPoPError(Exception):
     """A DPoP proof failed validation. Surfaced as 401 by the auth layer."""
@@ -91,6 +110,149 @@ def _public_key_from_jwk(public_jwk: dict[str, Any]):
     raise DPoPError(f"Unsupported JWK key type: {kty!r}")
 
 
+@lru_cache(maxsize=_JWK_CACHE_SIZE)
+def _parse_jwk_cached(jwk_json: str) -> tuple[Any, str]:
+    public_jwk = json.loads(jwk_json)
+    return _public_key_from_jwk(public_jwk), compute_jkt(public_jwk)
+
+
+def _parse_jwk(public_jwk: dict[str, Any]) -> tuple[Any, str]:
+    """
+    Return ``(public_key, jkt)`` for a public JWK, memoized per raw JWK.
+
+    A client signs every proof with the same key, so key parsing and the
+    thumbprint hash run once per key instead of once per request.
+    """
+    try:
+        jwk_json = json.dumps(public_jwk, separators=(",", ":"), sort_keys=True)
+        return _parse_jwk_cached(jwk_json)
+    except DPoPError:
+        raise
+    except Exception as exc:
+        raise DPoPError(f"DPoP proof 'jwk' is not a valid public key: {exc}") from exc
+
+
+class JtiReplayStore(ABC):
+    """
+    Remembers DPoP proof `jti`s for a bounded TTL.
+
+    Subclass and point `DJANGO_CFG_DPOP_JTI_STORE` at the dotted path (or call
+    `set_jti_store`) to plug in another backend.
+    """
+
+    @abstractmethod
+    def seen(self, key: str) -> bool:
+        """True if ``key`` was already recorded and has not expired."""
+
+    @abstractmethod
+    def add(self, key: str, ttl: int) -> bool:
+        """Record ``key`` for ``ttl`` seconds. Return False if it was already there."""
+
+
+class InMemoryJtiStore(JtiReplayStore):
+    """
+    Per-process LRU of seen `jti`s (default).
+
+    Bounded by ``max_size``; the oldest entries go first. Every entry has the
+    same TTL, so insertion order is expiry order and expired entries are
+    dropped from the front in O(1).
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge(self, now: float) -> None:
+        while self._entries:
+            key, expires = next(iter(self._entries.items()))
+            if expires > now and len(self._entries) <= self.max_size:
+                break
+            self._entries.popitem(last=False)
+
+    def seen(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires = self._entries.get(key)
+            return expires is not None and expires > now
+
+    def add(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is not None and expires > now:
+                return False
+            self._entries[key] = now + ttl
+            self._entries.move_to_end(key)
+            self._purge(now)
+            return True
+
+
+class RedisJtiStore(JtiReplayStore):
+    """
+    Shared replay store across workers via Redis ``SET NX EX``.
+
+    While Redis is unreachable it degrades to a per-process in-memory store
+    instead of failing every DPoP request.
+    """
+
+    KEY_PREFIX = "django_cfg:dpop:jti:"
+
+    def __init__(self, client):
+        self.client = client
+        self._fallback = InMemoryJtiStore()
+
+    def seen(self, key: str) -> bool:
+        try:
+            return bool(self.client.exists(self.KEY_PREFIX + key))
+        except Exception as exc:
+            logger.warning("DPoP replay store unavailable, using memory: %s", exc)
+            return self._fallback.seen(key)
+
+    def add(self, key: str, ttl: int) -> bool:
+        try:
+            return bool(self.client.set(self.KEY_PREFIX + key, 1, nx=True, ex=ttl))
+        except Exception as exc:
+            logger.warning("DPoP replay store unavailable, using memory: %s", exc)
+            return self._fallback.add(key, ttl)
+
+
+_jti_store: Optional[JtiReplayStore] = None
+
+
+def set_jti_store(store: Optional[JtiReplayStore]) -> None:
+    """Install a replay store (None = pick the default again on next use)."""
+    global _jti_store
+    _jti_store = store
+
+
+def get_jti_store() -> JtiReplayStore:
+    """
+    Get the active replay store.
+
+    `DJANGO_CFG_DPOP_JTI_STORE` (dotted path) wins; otherwise Redis when the
+    default cache is Redis, else the in-memory LRU.
+    """
+    global _jti_store
+
+    if _jti_store is None:
+        from django.conf import settings
+        from django.utils.module_loading import import_string
+
+        from django_cfg.utils.cache_redis import get_cache_redis_client
+
+        store_path = getattr(settings, "DJANGO_CFG_DPOP_JTI_STORE", None)
+        redis_client = None if store_path else get_cache_redis_client()
+        if store_path:
+            _jti_store = import_string(store_path)()
+        elif redis_client is not None:
+            _jti_store = RedisJtiStore(redis_client)
+        else:
+            _jti_store = InMemoryJtiStore()
+
+    return _jti_store
+
+
 def extract_jkt_from_proof(proof: str) -> str:
     """
     Validate a *login-time* proof's self-signature and return its key thumbprint.
@@ -99,12 +261,14 @@ def extract_jkt_from_proof(proof: str) -> str:
     self-consistent (signed by the key it embeds) and return the `jkt` to embed
     as `cnf.jkt` in the issued token. Raises DPoPError on any problem.
     """
-    public_jwk = _proof_header_jwk(proof)
-    _verify_self_signed(proof, public_jwk)
-    return compute_jkt(public_jwk)
+    header = _proof_header(proof)
+    key, jkt = _parse_jwk(header["jwk"])
+    _verify_self_signed(proof, key, header["alg"])
+    return jkt
 
 
-def _proof_header_jwk(proof: str) -> dict[str, Any]:
+def _proof_header(proof: str) -> dict[str, Any]:
+    """Parse and validate the proof's JOSE header (typ, alg, public jwk)."""
     try:
         header = jwt.get_unverified_header(proof)
     except Exception as exc:  # malformed token
@@ -120,13 +284,11 @@ def _proof_header_jwk(proof: str) -> dict[str, Any]:
         raise DPoPError("DPoP proof is missing the embedded public 'jwk' header.")
     if "d" in public_jwk:  # private key material must never be sent
         raise DPoPError("DPoP proof embeds private key material — rejected.")
-    return public_jwk
+    return header
 
 
-def _verify_self_signed(proof: str, public_jwk: dict[str, Any]) -> dict[str, Any]:
+def _verify_self_signed(proof: str, key: Any, alg: str) -> dict[str, Any]:
     """Verify the proof's signature against its own embedded public key."""
-    alg = jwt.get_unverified_header(proof).get("alg")
-    key = _public_key_from_jwk(public_jwk)
     try:
         return jwt.decode(
             proof,
@@ -154,14 +316,24 @@ def verify_proof(
       2. signature verifies against that embedded key (proof-of-possession)
       3. claims: `htm` matches the request method, `htu` matches the request URL
          (scheme+host+path), `iat` within the freshness window, `jti` present
+         and not seen before for this key (replay store)
       4. if `expected_jkt` is given (token has cnf.jkt), the proof key thumbprint
          must equal it — this is the binding check
 
-    Returns the computed `jkt` (useful at mint time). Raises DPoPError otherwise.
+    A replayed `jti` is rejected before the signature check, so replays cost no
+    crypto work. Returns the computed `jkt` (useful at mint time). Raises
+    DPoPError otherwise.
     """
-    public_jwk = _proof_header_jwk(proof)
-    claims = _verify_self_signed(proof, public_jwk)
-    jkt = compute_jkt(public_jwk)
+    header = _proof_header(proof)
+    key, jkt = _parse_jwk(header["jwk"])
+
+    # Cheap replay pre-check on the (unverified) jti; recorded atomically below
+    replay_store = get_jti_store()
+    unverified_jti = _unverified_jti(proof)
+    if unverified_jti and replay_store.seen(f"{jkt}:{unverified_jti}"):
+        raise DPoPError("DPoP proof 'jti' has already been used.")
+
+    claims = _verify_self_signed(proof, key, header["alg"])
 
     # htm — HTTP method binding
     htm = claims.get("htm")
@@ -181,17 +353,31 @@ def verify_proof(
     if abs(now - float(iat)) > _PROOF_MAX_AGE_SECONDS:
         raise DPoPError("DPoP proof 'iat' is outside the allowed freshness window.")
 
-    # jti — present (full replay-cache deferred; presence still required by spec)
-    if not claims.get("jti"):
+    # jti — present and unique per key within the freshness window
+    jti = claims.get("jti")
+    if not jti:
         raise DPoPError("DPoP proof is missing 'jti'.")
 
     # Binding: proof key must match the token's cnf.jkt
     if expected_jkt is not None and jkt != expected_jkt:
         raise DPoPError("DPoP proof key does not match the token binding (cnf.jkt).")
 
+    # Only fully valid proofs consume their jti
+    if not replay_store.add(f"{jkt}:{jti}", _JTI_TTL_SECONDS):
+        raise DPoPError("DPoP proof 'jti' has already been used.")
+
     return jkt
 
 
+def _unverified_jti(proof: str) -> Optional[str]:
+    """Read `jti` from the proof payload without verifying the signature."""
+    try:
+        jti = jwt.decode(proof, options={"verify_signature": False}).get("jti")
+    except Exception:
+        return None
+    return jti if isinstance(jti, str) else None
+
+
 def _normalize_htu(url: str) -> str:
     """Strip query and fragment; keep scheme://authority/path for htu comparison."""
     base = url.split("#", 1)[0].split("?", 1)[0]
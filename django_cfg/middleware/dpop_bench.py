@@ -0,0 +1,69 @@
+"""
+Benchmark: DPoP proof verifications per second.
+
+Compares verification with a cold JWK memo on every call (the previous
+behaviour: parse key + thumbprint per request) against the memoized path,
+and measures how fast replayed proofs are rejected by the jti store.
+
+Usage:
+    python -m django_cfg.middleware.dpop_bench
+"""
+
+import time
+import uuid
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+
+from . import dpop
+
+ITERATIONS = 2000
+URL = "https://api.example.com/api/profile/"
+
+
+def _make_proofs(count: int) -> list[str]:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    public_jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    headers = {"typ": "dpop+jwt", "alg": "ES256", "jwk": public_jwk}
+    return [
+        jwt.encode(
+            {"htm": "GET", "htu": URL, "iat": int(time.time()), "jti": uuid.uuid4().hex},
+            private_key,
+            algorithm="ES256",
+            headers=headers,
+        )
+        for _ in range(count)
+    ]
+
+
+def _rate(label: str, proofs: list[str], *, cold: bool, expect_error: bool = False) -> None:
+    started = time.perf_counter()
+    for proof in proofs:
+        if cold:
+            dpop._parse_jwk_cached.cache_clear()
+        try:
+            dpop.verify_proof(proof=proof, http_method="GET", http_url=URL, expected_jkt=None)
+        except dpop.DPoPError:
+            if not expect_error:
+                raise
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {len(proofs) / elapsed:>10,.0f} verifications/s")
+
+
+def main() -> None:
+    print(f"ES256 proofs, {ITERATIONS} per run, one client key")
+
+    dpop.set_jti_store(dpop.InMemoryJtiStore())
+    _rate("before (no JWK memo)", _make_proofs(ITERATIONS), cold=True)
+
+    dpop.set_jti_store(dpop.InMemoryJtiStore())
+    proofs = _make_proofs(ITERATIONS)
+    _rate("after (JWK memo)", proofs, cold=False)
+    _rate("replayed (rejected)", proofs, cold=False, expect_error=True)
+
+    dpop.set_jti_store(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Tests for DPoP proof replay protection.
+"""
+
+import time
+import uuid
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+
+from . import dpop
+
+URL = "https://api.example.com/api/profile/"
+
+
+def _make_proofs(count: int) -> list[str]:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    public_jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    headers = {"typ": "dpop+jwt", "alg": "ES256", "jwk": public_jwk}
+    return [
+        jwt.encode(
+            {"htm": "GET", "htu": URL, "iat": int(time.time()), "jti": uuid.uuid4().hex},
+            private_key,
+            algorithm="ES256",
+            headers=headers,
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def memory_store():
+    dpop.set_jti_store(dpop.InMemoryJtiStore())
+    yield
+    dpop.set_jti_store(None)
+
+
+class TestReplayProtection:
+    """Test the jti replay store."""
+
+    def test_replayed_proof_is_rejected(self):
+        proof = _make_proofs(1)[0]
+        dpop.verify_proof(proof=proof, http_method="GET", http_url=URL, expected_jkt=None)
+
+        with pytest.raises(dpop.DPoPError, match="already been used"):
+            dpop.verify_proof(proof=proof, http_method="GET", http_url=URL, expected_jkt=None)
+
+    def test_invalid_proof_does_not_consume_jti(self):
+        proof = _make_proofs(1)[0]
+        with pytest.raises(dpop.DPoPError, match="htm"):
+            dpop.verify_proof(proof=proof, http_method="POST", http_url=URL, expected_jkt=None)
+
+        dpop.verify_proof(proof=proof, http_method="GET", http_url=URL, expected_jkt=None)
+
+    def test_memory_store_is_bounded(self):
+        store = dpop.InMemoryJtiStore(max_size=10)
+        for i in range(50):
+            assert store.add(f"jti-{i}", ttl=60)
+
+        assert len(store._entries) == 10
+        assert store.seen("jti-49")
+        assert not store.seen("jti-0")
+
+    def test_store_must_implement_both_methods(self):
+        class SeenOnly(dpop.JtiReplayStore):
+            def seen(self, key):
+                return False
+
+        with pytest.raises(TypeError):
+            SeenOnly()
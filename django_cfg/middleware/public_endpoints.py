@@ -12,6 +12,8 @@ from typing import List, Optional
 from django.http import HttpRequest, HttpResponse
 from django.utils.deprecation import MiddlewareMixin
 
+from .route_classifier import DEFAULT_PUBLIC_PATTERNS, get_route_classifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,20 +29,11 @@ class PublicEndpointsMiddleware(MiddlewareMixin):
     - ✅ Smart JWT token detection
     - ✅ Automatic restoration of headers after processing
     - ✅ Detailed logging for debugging
-    - ✅ Performance optimized with compiled regex patterns
+    - ✅ Shared route classifier: one compiled regex, memoized per path
     """
 
-    # Default public endpoint patterns
-    DEFAULT_PUBLIC_PATTERNS = [
-        r'^/api/accounts/otp/',           # OTP endpoints (request, verify)
-        r'^/cfg/accounts/otp/',           # CFG OTP endpoints
-        r'^/api/accounts/token/refresh/', # Token refresh
-        r'^/cfg/accounts/token/refresh/', # CFG Token refresh
-        r'^/healthz(?:/|$)',              # Health check endpoints
-        r'^/admin/login/',                # Django admin login
-        r'^/api/schema/',                 # API schema endpoints
-        r'^/api/docs/',                   # API documentation
-    ]
+    # Default public endpoint patterns (settings.PUBLIC_ENDPOINT_PATTERNS overrides)
+    DEFAULT_PUBLIC_PATTERNS = DEFAULT_PUBLIC_PATTERNS
 
     def __init__(self, get_response=None):
         super().__init__(get_response)
@@ -53,31 +46,14 @@ class PublicEndpointsMiddleware(MiddlewareMixin):
         self._compile_patterns()
 
     def _compile_patterns(self):
-        """Compile regex patterns for better performance."""
-        patterns = self._get_public_patterns()
+        """Compile the shared route classifier's patterns (matching goes through the classifier)."""
+        patterns = get_route_classifier().public_patterns
         self.public_patterns = [re.compile(pattern) for pattern in patterns]
         logger.debug(f"Compiled {len(self.public_patterns)} public endpoint patterns")
 
-    def _get_public_patterns(self) -> List[str]:
-        """Get public endpoint patterns from Django settings or use defaults."""
-        from django.conf import settings
-
-        # Try to get patterns from settings
-        custom_patterns = getattr(settings, 'PUBLIC_ENDPOINT_PATTERNS', None)
-        if custom_patterns:
-            logger.debug(f"Using custom public patterns: {len(custom_patterns)} patterns")
-            return custom_patterns
-
-        # Use defaults
-        logger.debug(f"Using default public patterns: {len(self.DEFAULT_PUBLIC_PATTERNS)} patterns")
-        return self.DEFAULT_PUBLIC_PATTERNS
-
     def _is_public_endpoint(self, path: str) -> bool:
         """Check if the request path matches any public endpoint pattern."""
-        for pattern in self.public_patterns:
-            if pattern.match(path):
-                return True
-        return False
+        return get_route_classifier().is_public(path)
 
     def _has_jwt_token(self, request: HttpRequest) -> bool:
         """Check if request has a JWT Authorization header."""
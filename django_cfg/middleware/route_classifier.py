@@ -0,0 +1,237 @@
+"""
+Route Classifier for Django CFG
+
+One precompiled answer to "is this path public / API / admin / static?",
+shared by PublicEndpointsMiddleware, UserActivityMiddleware and the admin
+notification signals instead of each keeping its own pattern list and
+heuristics.
+
+Each category is a single alternation regex compiled once from settings and
+the DjangoConfig, so a lookup is one `match()` per category regardless of how
+many patterns are configured. Results are memoized per path in a bounded LRU;
+hot endpoints are classified once.
+
+Usage:
+    from django_cfg.middleware.route_classifier import get_route_classifier
+
+    routes = get_route_classifier()
+    if routes.is_public(request.path):
+        ...
+"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from django.core.signals import setting_changed
+
+logger = logging.getLogger(__name__)
+
+# Category bits returned by RouteClassifier.classify()
+PUBLIC = 1
+API = 2
+ADMIN = 4
+STATIC = 8
+
+# Default public endpoint patterns (override with settings.PUBLIC_ENDPOINT_PATTERNS)
+DEFAULT_PUBLIC_PATTERNS = [
+    r'^/api/accounts/otp/',           # OTP endpoints (request, verify)
+    r'^/cfg/accounts/otp/',           # CFG OTP endpoints
+    r'^/api/accounts/token/refresh/', # Token refresh
+    r'^/cfg/accounts/token/refresh/', # CFG Token refresh
+    r'^/healthz(?:/|$)',              # Health check endpoints
+    r'^/admin/login/',                # Django admin login
+    r'^/api/schema/',                 # API schema endpoints
+    r'^/api/docs/',                   # API documentation
+]
+
+DEFAULT_API_PREFIXES = ['/api/', '/cfg/']
+DEFAULT_ADMIN_PREFIXES = ['/admin/']
+
+
+def _compile_alternation(patterns: Iterable) -> Optional[Callable[[str], object]]:
+    """
+    Compile patterns into one `(?:p1)|(?:p2)|...` regex and return its `match`
+    (None if empty).
+
+    Patterns that can't be combined — precompiled ones, global inline flags
+    like `(?i)`, a group name used by two patterns — are matched one by one.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    if all(isinstance(p, str) for p in patterns):
+        try:
+            return re.compile("|".join(f"(?:{p})" for p in patterns)).match
+        except re.error as e:
+            logger.debug(f"Matching {len(patterns)} patterns separately: {e}")
+    compiled = [re.compile(p) for p in patterns]
+    return lambda path: any(regex.match(path) for regex in compiled)
+
+
+def _prefix_patterns(prefixes: Iterable[str]) -> list:
+    """Turn literal path prefixes into anchored regex patterns."""
+    return [f"^{re.escape(prefix)}" for prefix in prefixes if prefix]
+
+
+class RouteClassifier:
+    """
+    Classifies request paths into PUBLIC / API / ADMIN / STATIC bits.
+
+    Thread-safe; one instance per process (see `get_route_classifier`).
+    """
+
+    # Paths remembered (least recently used evicted first)
+    CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        public_patterns: Iterable[str] = DEFAULT_PUBLIC_PATTERNS,
+        api_prefixes: Iterable[str] = DEFAULT_API_PREFIXES,
+        admin_prefixes: Iterable[str] = DEFAULT_ADMIN_PREFIXES,
+        static_prefixes: Iterable[str] = (),
+        cache_size: Optional[int] = None,
+    ):
+        self.public_patterns = list(public_patterns)
+        self._rules = [
+            (PUBLIC, _compile_alternation(self.public_patterns)),
+            (API, _compile_alternation(_prefix_patterns(api_prefixes))),
+            (ADMIN, _compile_alternation(_prefix_patterns(admin_prefixes))),
+            (STATIC, _compile_alternation(_prefix_patterns(static_prefixes))),
+        ]
+        self._rules = [(bit, match) for bit, match in self._rules if match is not None]
+        self._cache_size = cache_size or self.CACHE_SIZE
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def classify(self, path: str) -> int:
+        """
+        Get the category bits for a path.
+
+        Args:
+            path: Request path (request.path or request.path_info)
+
+        Returns:
+            Bitwise OR of PUBLIC, API, ADMIN, STATIC
+        """
+        with self._lock:
+            flags = self._cache.get(path)
+            if flags is not None:
+                self._cache.move_to_end(path)
+                self._hits += 1
+                return flags
+
+        flags = 0
+        for bit, match in self._rules:
+            if match(path):
+                flags |= bit
+
+        with self._lock:
+            self._misses += 1
+            self._cache[path] = flags
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return flags
+
+    def is_public(self, path: str) -> bool:
+        """True if the path is an AllowAny endpoint (auth header ignored)."""
+        return bool(self.classify(path) & PUBLIC)
+
+    def is_api(self, path: str) -> bool:
+        """True if the path is under an API prefix (OpenAPI client or /cfg/)."""
+        return bool(self.classify(path) & API)
+
+    def is_admin(self, path: str) -> bool:
+        """True if the path is under the Django admin."""
+        return bool(self.classify(path) & ADMIN)
+
+    def is_static(self, path: str) -> bool:
+        """True if the path is under STATIC_URL or MEDIA_URL."""
+        return bool(self.classify(path) & STATIC)
+
+    def get_stats(self) -> dict:
+        """
+        Get classifier statistics for monitoring/debugging.
+
+        Returns:
+            dict: Cache size, hit/miss counters and configured pattern count
+        """
+        return {
+            'cached_paths': len(self._cache),
+            'cache_size': self._cache_size,
+            'hits': self._hits,
+            'misses': self._misses,
+            'public_patterns_count': len(self.public_patterns),
+        }
+
+    @classmethod
+    def from_settings(cls) -> "RouteClassifier":
+        """Build a classifier from Django settings and the DjangoConfig."""
+        from django.conf import settings
+
+        from django_cfg.modules.base import BaseCfgModule
+
+        public_patterns = getattr(settings, 'PUBLIC_ENDPOINT_PATTERNS', None) or DEFAULT_PUBLIC_PATTERNS
+
+        # The OpenAPI client's prefix counts only when a client is configured
+        api_prefixes = ['/cfg/']
+        try:
+            config = BaseCfgModule.get_config()
+            openapi_client = getattr(config, 'openapi_client', None) if config else None
+            if openapi_client:
+                api_prefixes.insert(0, f"/{getattr(openapi_client, 'api_prefix', 'api')}/")
+        except Exception:
+            api_prefixes = list(DEFAULT_API_PREFIXES)
+
+        static_prefixes = [
+            url for url in (getattr(settings, 'STATIC_URL', None), getattr(settings, 'MEDIA_URL', None))
+            if isinstance(url, str) and url.startswith('/') and url != '/'
+        ]
+
+        return cls(
+            public_patterns=public_patterns,
+            api_prefixes=api_prefixes,
+            static_prefixes=static_prefixes,
+        )
+
+
+_classifier: Optional[RouteClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_route_classifier() -> RouteClassifier:
+    """Get the process-wide route classifier, building it on first use."""
+    global _classifier
+
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = RouteClassifier.from_settings()
+                logger.debug(f"Route classifier built: {_classifier.get_stats()}")
+
+    return _classifier
+
+
+def reset_route_classifier(**kwargs) -> None:
+    """Drop the cached classifier so the next call rebuilds it from settings."""
+    global _classifier
+    _classifier = None
+
+
+setting_changed.connect(reset_route_classifier, dispatch_uid="django_cfg_route_classifier_reset")
+
+
+__all__ = [
+    "PUBLIC",
+    "API",
+    "ADMIN",
+    "STATIC",
+    "DEFAULT_PUBLIC_PATTERNS",
+    "RouteClassifier",
+    "get_route_classifier",
+    "reset_route_classifier",
+]
@@ -0,0 +1,71 @@
+"""
+Tests for the shared RouteClassifier.
+"""
+
+from .route_classifier import (
+    ADMIN,
+    API,
+    PUBLIC,
+    STATIC,
+    RouteClassifier,
+    get_route_classifier,
+)
+
+
+def _classifier(**kwargs):
+    return RouteClassifier(static_prefixes=['/static/', '/media/'], **kwargs)
+
+
+class TestRouteClassifier:
+    """Test path classification and memoization."""
+
+    def test_categories(self):
+        routes = _classifier()
+
+        assert routes.classify('/api/accounts/otp/request/') == PUBLIC | API
+        assert routes.classify('/api/orders/1/') == API
+        assert routes.classify('/admin/login/') == PUBLIC | ADMIN
+        assert routes.classify('/admin/auth/user/') == ADMIN
+        assert routes.classify('/static/app.js') == STATIC
+        assert routes.classify('/healthz') == PUBLIC
+        assert routes.classify('/healthzz') == 0
+
+    def test_prefixes_are_literal(self):
+        routes = RouteClassifier(api_prefixes=['/v1.0/'])
+
+        assert routes.is_api('/v1.0/items/')
+        assert not routes.is_api('/v1x0/items/')
+
+    def test_patterns_that_cannot_be_combined(self):
+        routes = RouteClassifier(public_patterns=[
+            r'(?i)^/open/',                 # global flag, only valid at the start
+            r'^/a/(?P<id>\d+)/$',
+            r'^/b/(?P<id>\d+)/$',           # same group name
+        ])
+
+        assert routes.is_public('/OPEN/x/')
+        assert routes.is_public('/a/1/')
+        assert routes.is_public('/b/2/')
+        assert not routes.is_public('/c/3/')
+
+    def test_only_cfg_is_api_without_openapi_client(self):
+        routes = RouteClassifier.from_settings()
+
+        assert routes.is_api('/cfg/accounts/')
+        assert not routes.is_api('/api/orders/')
+
+    def test_lru_is_bounded(self):
+        routes = _classifier(cache_size=2)
+        for path in ('/a/', '/b/', '/c/', '/c/'):
+            routes.classify(path)
+
+        stats = routes.get_stats()
+        assert stats['cached_paths'] == 2
+        assert stats['hits'] == 1
+        assert stats['misses'] == 3
+
+    def test_settings_change_rebuilds(self, settings):
+        settings.PUBLIC_ENDPOINT_PATTERNS = [r'^/open/']
+
+        assert get_route_classifier().is_public('/open/thing/')
+        assert not get_route_classifier().is_public('/api/docs/')
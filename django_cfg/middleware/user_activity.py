@@ -7,12 +7,13 @@ making API requests. Only works when accounts app is enabled.
 
 import logging
 
-from django.contrib.auth import get_user_model
-from django.utils import timezone
 from django.utils.deprecation import MiddlewareMixin
 
 from django_cfg.modules.base import BaseCfgModule
 
+from .activity import get_activity_recorder
+from .route_classifier import get_route_classifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +26,7 @@ class UserActivityMiddleware(MiddlewareMixin, BaseCfgModule):
     
     Features:
     - Updates last_login every 5 minutes to avoid database spam
+    - Writes are batched by the shared ActivityRecorder (one bulk UPDATE)
     - Only tracks API requests (not regular web requests)
     - Only works when accounts app is enabled
     - KISS principle - no configuration needed
@@ -36,11 +38,7 @@ class UserActivityMiddleware(MiddlewareMixin, BaseCfgModule):
         BaseCfgModule.__init__(self)
         self.get_response = get_response
 
-        # Cache for tracking last update times (in memory)
-        self._last_updates = {}
-
         # Fixed configuration - KISS principle
-        self.update_interval = 300  # 5 minutes
         self.api_only = True  # Only track API requests
 
     def process_request(self, request):
@@ -97,63 +95,19 @@ class UserActivityMiddleware(MiddlewareMixin, BaseCfgModule):
             if not path.endswith('/') or 'admin' not in path:
                 return True
 
-        # 4. Check if path matches configured API prefixes
-        path = request.path_info
-        try:
-            config = self.get_config()
-            if config:
-                # Check Django Client (OpenAPI) API prefix
-                if hasattr(config, 'openapi_client') and config.openapi_client:
-                    api_prefix = f"/{getattr(config.openapi_client, 'api_prefix', 'api')}/"
-                    if path.startswith(api_prefix):
-                        return True
-
-                # Check Django CFG prefix (always /cfg/ by default)
-                if path.startswith('/cfg/'):
-                    return True
-        except Exception:
-            # Fallback to basic path detection
-            if path.startswith(('/api/', '/cfg/')):
-                return True
-
-        return False
+        # 4. Check if path matches configured API prefixes (OpenAPI client, /cfg/)
+        return get_route_classifier().is_api(request.path_info)
 
     def _update_user_activity(self, user, request):
         """
-        Update user's last_login field if enough time has passed.
-        
+        Record user activity; last_login is written in bulk by the recorder.
+
         Args:
             user: User instance
             request: Django HttpRequest object
         """
-        now = timezone.now()
-        user_id = user.pk
-
-        # Check if we should update (avoid database spam)
-        last_update = self._last_updates.get(user_id)
-        if last_update and (now - last_update).total_seconds() < self.update_interval:
-            return
-
-        # Update user's last_login
-        User = get_user_model()
-        try:
-            # Use update() to avoid triggering signals and save() overhead
-            User.objects.filter(pk=user_id).update(last_login=now)
-
-            # Cache the update time
-            self._last_updates[user_id] = now
-
-            # Log the activity (optional, for debugging)
-            logger.debug(f"Updated last_login for user {user.email} from {request.path}")
-
-            # Clean up old cache entries (keep only last 1000 users)
-            if len(self._last_updates) > 1000:
-                # Remove oldest entries
-                sorted_items = sorted(self._last_updates.items(), key=lambda x: x[1])
-                self._last_updates = dict(sorted_items[-500:])
-
-        except Exception as e:
-            logger.error(f"Failed to update last_login for user {user_id}: {e}")
+        if get_activity_recorder().touch(user.pk):
+            logger.debug(f"Recorded activity for user {user.pk} from {request.path}")
 
     def get_activity_stats(self):
         """
@@ -162,8 +116,9 @@ class UserActivityMiddleware(MiddlewareMixin, BaseCfgModule):
         Returns:
             dict: Statistics about tracked users and configuration
         """
+        stats = get_activity_recorder().get_stats()
         return {
-            'tracked_users': len(self._last_updates),
-            'update_interval': self.update_interval,
+            **stats,
+            'update_interval': stats['update_interval_seconds'],
             'api_only': self.api_only,
         }
@@ -121,6 +121,31 @@ class JWTConfig(BaseModel):
         )
     )
 
+    # === Performance ===
+    user_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        le=3600,
+        description=(
+            "Cache the user resolved from an access token for this many seconds "
+            "(0 = disabled). Hot endpoints then authenticate with zero queries. "
+            "Only auth fields are cached (never the password hash); entries are "
+            "evicted once a user save/delete commits (password, is_active); "
+            "changes made via queryset.update() apply after the TTL."
+        )
+    )
+
+    api_key_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        le=3600,
+        description=(
+            "Cache X-API-Key lookups (keyed by a hash of the key) for this many "
+            "seconds (0 = disabled). Entries are evicted when the key is "
+            "regenerated or deleted and on user save/delete."
+        )
+    )
+
     # === Advanced Settings ===
     leeway: int = Field(
         default=0,
@@ -234,6 +259,8 @@ class JWTConfig(BaseModel):
             # Top-level flag the DPoP auth layer reads (SIMPLE_JWT is owned by
             # simplejwt and ignores unknown keys, so DPoP config lives outside it).
             "DJANGO_CFG_DPOP_ENABLED": self.dpop_enabled,
+            "DJANGO_CFG_JWT_USER_CACHE_TTL": self.user_cache_ttl,
+            "DJANGO_CFG_API_KEY_CACHE_TTL": self.api_key_cache_ttl,
         }
 
 # Export the main class
@@ -378,6 +378,16 @@ class DjangoRQConfig(BaseModel):
         ),
     )
 
+    # Job ID -> queue index
+    index_jobs: bool = Field(
+        default=True,
+        description=(
+            "Record each job's queue in Redis at enqueue time (rq:jobqueue:<id>) so "
+            "cancellation and job lookups resolve a job with one GET instead of "
+            "searching every queue. Uses IndexedQueue as RQ QUEUE_CLASS."
+        ),
+    )
+
     # Automatic cleanup configuration
     enable_auto_cleanup: bool = Field(
         default=True,
@@ -615,6 +625,10 @@ class DjangoRQConfig(BaseModel):
 
         settings["RQ_QUEUES"] = rq_queues
         settings["RQ"] = {"COMMIT_MODE": self.commit_mode}
+        if self.index_jobs:
+            settings["RQ"]["QUEUE_CLASS"] = "django_cfg.modules.django_rq.services.job_index.IndexedQueue"
+        if self.health.enabled and self.health.count_job_events:
+            settings["RQ"]["WORKER_CLASS"] = "django_cfg.modules.django_rq.health.collector.MetricsWorker"
         settings["RQ_SHOW_ADMIN_LINK"] = self.show_admin_link
 
         if self.exception_handlers:
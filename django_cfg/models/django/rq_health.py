@@ -222,6 +222,34 @@ class RQHealthConfig(BaseModel):
         ),
     )
 
+    metrics_refresh_interval_sec: float = Field(
+        default=15.0,
+        ge=1.0,
+        description=(
+            "Interval in seconds between pipelined metric snapshots when the "
+            "collector's background refresh is running"
+        ),
+    )
+
+    metrics_max_staleness_sec: float = Field(
+        default=30.0,
+        ge=0.0,
+        description=(
+            "Serve queue metrics from a cached snapshot up to this many seconds old "
+            "instead of reading Redis per check. 0 = always read live."
+        ),
+    )
+
+    count_job_events: bool = Field(
+        default=False,
+        description=(
+            "Count started/finished/failed jobs per queue in Redis by setting RQ "
+            "WORKER_CLASS to MetricsWorker (a custom worker class can mix in "
+            "JobEventCountingMixin instead). Enqueues are counted by the job index "
+            "queue class."
+        ),
+    )
+
     thresholds: QueueHealthThresholds = Field(
         default_factory=QueueHealthThresholds,
         description="Default per-metric thresholds applied to every monitored queue",
@@ -150,6 +150,24 @@ class DatabaseConfig(BaseModel):
         ),
     )
 
+    # Read replica configuration
+    replica_of: Optional[str] = Field(
+        default=None,
+        description=(
+            "Mark this database as a read replica of another alias. Reads for "
+            "models routed to that alias are spread across its replicas; writes "
+            "and migrations never go to a replica. Reads stay on the primary for "
+            "the rest of a request after a write (read-your-writes)."
+        ),
+    )
+
+    replica_weight: int = Field(
+        default=1,
+        description="Relative share of reads this replica receives (weighted round-robin)",
+        ge=1,
+        le=1000,
+    )
+
     # Internal fields for parsed connection strings
     _is_connection_string: bool = PrivateAttr(default=False)
     _parsed_components: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -252,6 +270,15 @@ class DatabaseConfig(BaseModel):
         """
         return routing.has_routing_rules(self)
 
+    def is_replica(self) -> bool:
+        """
+        Check if this database is a read replica.
+
+        Returns:
+            True if replica_of is set
+        """
+        return routing.is_replica(self)
+
     def test_connection(self) -> bool:
         """
         Test database connection (placeholder for future implementation).
@@ -61,6 +61,19 @@ def has_routing_rules(config: "DatabaseConfig") -> bool:  # type: ignore
     return bool(config.apps)
 
 
+def is_replica(config: "DatabaseConfig") -> bool:  # type: ignore
+    """
+    Check if this database is a read replica.
+
+    Args:
+        config: DatabaseConfig instance
+
+    Returns:
+        True if replica_of is set
+    """
+    return bool(config.replica_of)
+
+
 def test_connection(config: "DatabaseConfig") -> bool:  # type: ignore
     """
     Test database connection (placeholder for future implementation).
@@ -81,5 +94,6 @@ __all__ = [
     "allows_operation",
     "get_migration_database",
     "has_routing_rules",
+    "is_replica",
     "test_connection",
 ]
@@ -153,6 +153,13 @@ def validate_connection_after(config: "DatabaseConfig") -> "DatabaseConfig":  #
         if not config._is_connection_string and not config.name:
             raise ValueError("PostGIS database name is required")
 
+    # Validate read replica constraints
+    if config.replica_of and config.apps:
+        raise ValueError(
+            "A read replica cannot have its own apps routing. "
+            f"Route the apps to the primary '{config.replica_of}' instead."
+        )
+
     return config
 
 
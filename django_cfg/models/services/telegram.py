@@ -51,6 +51,16 @@ class TelegramConfig(BaseModel):
         description="Disable link previews in messages",
     )
 
+    dedup_window: float = Field(
+        default=60.0,
+        description=(
+            "Identical messages to the same chat within this many seconds are sent once, "
+            "followed by a '×N repeated' summary when the window closes (0 disables)"
+        ),
+        ge=0,
+        le=3600,
+    )
+
     # Connection settings
     timeout: int = Field(
         default=30,
@@ -86,6 +96,48 @@ class TelegramConfig(BaseModel):
         le=60.0,
     )
 
+    # Cross-process outbox (text messages)
+    outbox_path: Optional[str] = Field(
+        default=None,
+        description=(
+            "SQLite file shared by all processes on the host for outgoing text messages. "
+            "When set, one process at a time drains it within Telegram's global and per-chat "
+            "limits; when unset, each process uses its own in-memory queue"
+        ),
+    )
+
+    outbox_max_size: int = Field(
+        default=10000,
+        description="Maximum messages waiting in the outbox (CRITICAL messages are always accepted)",
+        ge=100,
+    )
+
+    outbox_global_rate: float = Field(
+        default=25.0,
+        description="Messages per second across all chats",
+        gt=0,
+        le=30.0,
+    )
+
+    outbox_chat_rate: float = Field(
+        default=1.0,
+        description="Messages per second to a single chat",
+        gt=0,
+        le=30.0,
+    )
+
+    outbox_group_rate_per_minute: float = Field(
+        default=20.0,
+        description="Messages per minute to a single group or channel",
+        gt=0,
+    )
+
+    outbox_coalesce_window: float = Field(
+        default=2.0,
+        description="Consecutive messages to a chat created within this many seconds are sent as one",
+        ge=0,
+    )
+
     @field_validator('bot_token')
     @classmethod
     def validate_bot_token(cls, v: str) -> str:
@@ -169,6 +221,9 @@ class TelegramConfig(BaseModel):
         if self.webhook_secret:
             config['webhook_secret'] = self.webhook_secret
 
+        if self.outbox_path:
+            config['outbox_path'] = self.outbox_path
+
         return config
 
 
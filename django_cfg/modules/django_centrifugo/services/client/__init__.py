@@ -6,17 +6,20 @@ Two client implementations:
 - DirectCentrifugoClient: Direct to Centrifugo (for internal use, lightweight)
 """
 
+from .batch import BatchPublishResult, PublishBatcher
 from .client import CentrifugoClient, PublishResponse, get_centrifugo_client
 from .config import DjangoCfgCentrifugoConfig
 from .direct_client import DirectCentrifugoClient, get_direct_centrifugo_client
 from .exceptions import (
     CentrifugoBaseException,
+    CentrifugoCircuitOpenError,
     CentrifugoConfigurationError,
     CentrifugoConnectionError,
     CentrifugoPublishError,
     CentrifugoTimeoutError,
     CentrifugoValidationError,
 )
+from .resilience import CircuitBreaker, CircuitState
 
 __all__ = [
     "DjangoCfgCentrifugoConfig",
@@ -25,10 +28,15 @@ __all__ = [
     "DirectCentrifugoClient",
     "get_direct_centrifugo_client",
     "PublishResponse",
+    "BatchPublishResult",
+    "PublishBatcher",
+    "CircuitBreaker",
+    "CircuitState",
     "CentrifugoBaseException",
     "CentrifugoTimeoutError",
     "CentrifugoPublishError",
     "CentrifugoConnectionError",
+    "CentrifugoCircuitOpenError",
     "CentrifugoConfigurationError",
     "CentrifugoValidationError",
 ]
@@ -0,0 +1,580 @@
+"""
+Batched publishing helpers for Centrifugo clients.
+
+Groups many publishes into Centrifugo `/api/batch` (or `/api/broadcast`)
+requests so fan-out to thousands of channels costs a handful of round trips
+instead of one HTTP request per message.
+
+Both clients get their batched entry points from `BatchPublishMixin`:
+- `publish_many()` / `broadcast()`: send a known set of messages now
+- `publish_batched()`: coalesce concurrent single publishes through a
+  `PublishBatcher`, flushed when `max_batch_size` messages are queued or
+  `flush_interval` seconds after the first one, whichever comes first
+
+A server answering 404/405 on `/api/batch` is sent single publishes instead,
+and the batch endpoint is probed again after `BATCH_REPROBE_INTERVAL`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import httpx
+from django_cfg.utils import get_logger
+from pydantic import BaseModel
+
+from .exceptions import (
+    CentrifugoCircuitOpenError,
+    CentrifugoConnectionError,
+    CentrifugoPublishError,
+    CentrifugoTimeoutError,
+    CentrifugoValidationError,
+)
+from .resilience import DEFAULT_MAX_RETRY_DELAY, CircuitBreaker, compute_backoff
+
+logger = get_logger("centrifugo.batch")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 0.01
+
+# Seconds to publish individually after /api/batch answered 404/405
+BATCH_REPROBE_INTERVAL = 300.0
+
+# (index in the caller's input, channel, serialized data, message_id)
+BatchItem = Tuple[int, str, dict, str]
+
+
+class BatchPublishResult(BaseModel):
+    """Per-message result of a batched publish."""
+
+    index: int
+    channel: str
+    message_id: str
+    published: bool
+    offset: Optional[int] = None
+    epoch: Optional[str] = None
+    error: Optional[str] = None
+    error_code: Optional[int] = None
+
+
+def serialize_data(data: BaseModel | dict) -> dict:
+    """
+    Serialize message data the same way single publishes do.
+
+    Raises:
+        CentrifugoValidationError: If data is neither a BaseModel nor a dict
+    """
+    if isinstance(data, BaseModel):
+        try:
+            return data.model_dump()
+        except Exception as e:
+            raise CentrifugoValidationError(
+                f"Failed to serialize Pydantic model: {e}",
+                validation_errors=[str(e)],
+            )
+    if isinstance(data, dict):
+        return data
+    raise CentrifugoValidationError(
+        f"data must be BaseModel or dict, got {type(data).__name__}"
+    )
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_batch_payload(items: Sequence[BatchItem]) -> dict:
+    """Build a Centrifugo `/api/batch` request body."""
+    return {
+        "commands": [
+            {"publish": {"channel": channel, "data": data}}
+            for _, channel, data, _ in items
+        ]
+    }
+
+
+def _unwrap(body: Any) -> Any:
+    # Centrifugo wraps API replies in {"result": ...}; tolerate both shapes
+    if isinstance(body, dict) and isinstance(body.get("result"), dict):
+        return body["result"]
+    return body
+
+
+def _result_from_reply(item: BatchItem, reply: Any, key: str) -> BatchPublishResult:
+    index, channel, _, message_id = item
+    reply = reply if isinstance(reply, dict) else {}
+    error = reply.get("error")
+    if error:
+        return BatchPublishResult(
+            index=index,
+            channel=channel,
+            message_id=message_id,
+            published=False,
+            error=error.get("message", "Unknown error"),
+            error_code=error.get("code"),
+        )
+
+    result = reply.get(key) or {}
+    return BatchPublishResult(
+        index=index,
+        channel=channel,
+        message_id=message_id,
+        published=True,
+        offset=result.get("offset"),
+        epoch=result.get("epoch"),
+    )
+
+
+def _missing_reply(item: BatchItem) -> BatchPublishResult:
+    index, channel, _, message_id = item
+    return BatchPublishResult(
+        index=index,
+        channel=channel,
+        message_id=message_id,
+        published=False,
+        error="No reply for command in batch response",
+    )
+
+
+def parse_batch_replies(body: Any, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+    """
+    Map a `/api/batch` response onto per-message results.
+
+    Replies are positional: `{"replies": [{"publish": {...}} | {"error": {...}}]}`.
+    """
+    replies = _unwrap(body).get("replies") or [] if isinstance(body, dict) else []
+    return [
+        _result_from_reply(item, replies[position], "publish")
+        if position < len(replies)
+        else _missing_reply(item)
+        for position, item in enumerate(items)
+    ]
+
+
+def parse_broadcast_responses(body: Any, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+    """
+    Map a `/api/broadcast` response onto per-channel results.
+
+    Responses are positional: `{"responses": [{"result": {...}} | {"error": {...}}]}`.
+    """
+    responses = _unwrap(body).get("responses") or [] if isinstance(body, dict) else []
+    return [
+        _result_from_reply(item, responses[position], "result")
+        if position < len(responses)
+        else _missing_reply(item)
+        for position, item in enumerate(items)
+    ]
+
+
+def failed_results(items: Sequence[BatchItem], error: Exception) -> List[BatchPublishResult]:
+    """Mark every message of a batch as failed with the same error."""
+    return [
+        BatchPublishResult(
+            index=index,
+            channel=channel,
+            message_id=message_id,
+            published=False,
+            error=str(error),
+            error_code=getattr(error, "status_code", None),
+        )
+        for index, channel, _, message_id in items
+    ]
+
+
+async def post_with_retries(
+    http_client: httpx.AsyncClient,
+    path: str,
+    payload: dict,
+    max_retries: int,
+    retry_delay: float,
+    target_url: str,
+    max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+    breaker: Optional[CircuitBreaker] = None,
+) -> httpx.Response:
+    """
+    POST a batch request, retrying transport errors and 5xx responses.
+
+    Returns the first response with a status below 500 (the caller decides
+    what a 4xx means for it). Retries use full-jitter exponential backoff
+    based on retry_delay; every attempt goes through the breaker if given.
+
+    Raises:
+        CentrifugoCircuitOpenError: If the breaker rejects an attempt
+        CentrifugoConnectionError: If the server cannot be reached
+        CentrifugoTimeoutError: If the request times out
+        CentrifugoPublishError: If the server keeps failing
+    """
+    last_error: Optional[Exception] = None
+    attempts = max(max_retries, 1)
+
+    for attempt in range(attempts):
+        if breaker is not None and not breaker.allow():
+            raise CentrifugoCircuitOpenError(
+                "Circuit open after repeated failures, failing fast",
+                wrapper_url=target_url,
+                retry_after=breaker.cooldown,
+            )
+
+        try:
+            response = await http_client.post(path, json=payload)
+            if response.status_code < 500:
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+            last_error = CentrifugoPublishError(
+                f"HTTP {response.status_code}: {response.text}",
+                status_code=response.status_code,
+            )
+
+        except httpx.TimeoutException as e:
+            last_error = CentrifugoTimeoutError(
+                f"HTTP timeout on batch request: {e}",
+                channel=path,
+                timeout_seconds=int(http_client.timeout.read or 0),
+            )
+
+        except httpx.TransportError as e:
+            last_error = CentrifugoConnectionError(
+                f"Failed to connect: {e}",
+                wrapper_url=target_url,
+            )
+
+        except BaseException:
+            # Cancelled, or an error that says nothing about the server:
+            # no outcome to record, but free a half-open probe slot
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if breaker is not None:
+            breaker.record_failure()
+        logger.debug(f"Batch attempt {attempt + 1}/{attempts} to {path} failed: {last_error}")
+
+        if attempt < attempts - 1:
+            await asyncio.sleep(compute_backoff(attempt, base=retry_delay, cap=max_retry_delay))
+
+    raise last_error
+
+
+class PublishBatcher:
+    """
+    Coalesces concurrent single publishes into batch requests.
+
+    Each `publish()` call queues one message and waits for its own result.
+    The queue is flushed when it reaches `max_batch_size` messages or
+    `flush_interval` seconds after the first queued message.
+
+    Example:
+        >>> batcher = PublishBatcher(client._send_batch, max_batch_size=100, flush_interval=0.01)
+        >>> results = await asyncio.gather(
+        ...     *(batcher.publish(f"user#{i}", {"n": i}) for i in range(1000))
+        ... )  # 10 HTTP requests
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[Sequence[BatchItem]], Awaitable[List[BatchPublishResult]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple[BatchItem, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+        self.batches_sent = 0
+        self.messages_sent = 0
+
+    async def publish(self, channel: str, data: dict, message_id: str) -> BatchPublishResult:
+        """Queue one message and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((len(self._pending), channel, data, message_id), future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_now)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Send queued messages now and wait for in-flight batches."""
+        self._flush_now()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush_now(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._deliver(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, pending: List[Tuple[BatchItem, asyncio.Future]]) -> None:
+        items = [item for item, _ in pending]
+        try:
+            results = await self._send_batch(items)
+        except Exception as e:
+            results = failed_results(items, e)
+
+        self.batches_sent += 1
+        self.messages_sent += len(items)
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """Get batcher counters."""
+        return {
+            "pending": len(self._pending),
+            "batches_sent": self.batches_sent,
+            "messages_sent": self.messages_sent,
+            "max_batch_size": self.max_batch_size,
+            "flush_interval": self.flush_interval,
+        }
+
+
+def prepare_items(messages: Iterable[Tuple[str, BaseModel | dict]], new_id: Callable[[], str]) -> List[BatchItem]:
+    """Serialize (channel, data) pairs into batch items, validating all first."""
+    return [
+        (index, channel, serialize_data(data), new_id())
+        for index, (channel, data) in enumerate(messages)
+    ]
+
+
+def reindex(results: List[BatchPublishResult], items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+    """Restore the caller's indexes on results produced for a slice of items."""
+    for result, item in zip(results, items):
+        result.index = item[0]
+    return results
+
+
+class BatchPublishMixin:
+    """
+    Batched publishing shared by CentrifugoClient and DirectCentrifugoClient.
+
+    The host class calls `_init_batching()` from its `__init__` and provides
+    `_http_client`, `_breaker`, `max_retries`, `retry_delay`,
+    `retry_max_delay`, `publish(channel, data)` and `_endpoint_url` (used in
+    error messages). Hooks:
+    - `_send_broadcast()`: defaults to `/api/batch`; override for servers
+      with `/api/broadcast`
+    - `_log_batch()`: record batch outcomes in the publish log (no-op)
+    """
+
+    def _init_batching(self, max_batch_size: int, flush_interval: float) -> None:
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._batcher: Optional[PublishBatcher] = None
+        self._batcher_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set when the server has no /api/batch; re-probed after it passes
+        self._batch_unsupported_until = 0.0
+
+    @property
+    def batch_endpoint_available(self) -> bool:
+        """False while publishing individually after a 404/405 on /api/batch."""
+        return time.monotonic() >= self._batch_unsupported_until
+
+    async def publish_many(
+        self,
+        messages: Iterable[Tuple[str, BaseModel | dict]],
+        max_batch_size: Optional[int] = None,
+    ) -> List[BatchPublishResult]:
+        """
+        Publish many messages (fire-and-forget) using /api/batch requests.
+
+        Messages are grouped into batches of at most max_batch_size; batches
+        are sent concurrently over the pooled connections. Failures are
+        reported per message instead of raised. If the server has no batch
+        endpoint, messages fall back to concurrent single publishes.
+
+        Args:
+            messages: (channel, data) pairs
+            max_batch_size: Override the client's batch size
+
+        Returns:
+            One BatchPublishResult per message, in input order
+
+        Raises:
+            CentrifugoValidationError: If any message data is invalid (nothing is sent)
+
+        Example:
+            >>> results = await client.publish_many(
+            ...     (f"user#{user_id}", {"title": "Maintenance at 22:00"})
+            ...     for user_id in user_ids
+            ... )
+            >>> failed = [r for r in results if not r.published]
+        """
+        items = prepare_items(messages, lambda: str(uuid4()))
+        size = max_batch_size or self.max_batch_size
+
+        batches = await asyncio.gather(
+            *(self._send_batch(batch) for batch in chunked(items, size))
+        )
+        return [result for batch in batches for result in batch]
+
+    async def broadcast(
+        self,
+        channels: Sequence[str],
+        data: BaseModel | dict,
+        max_batch_size: Optional[int] = None,
+    ) -> List[BatchPublishResult]:
+        """
+        Publish the same data to many channels.
+
+        Args:
+            channels: Target channels
+            data: Pydantic model or dict with message data
+            max_batch_size: Override the client's batch size (channels per request)
+
+        Returns:
+            One BatchPublishResult per channel, in input order
+
+        Example:
+            >>> results = await client.broadcast(
+            ...     channels=["user#1", "user#2", "user#3"],
+            ...     data={"event": "config_reloaded"},
+            ... )
+        """
+        data = serialize_data(data)
+        items = [(index, channel, data, str(uuid4())) for index, channel in enumerate(channels)]
+        size = max_batch_size or self.max_batch_size
+
+        batches = await asyncio.gather(
+            *(self._send_broadcast(batch) for batch in chunked(items, size))
+        )
+        return [result for batch in batches for result in batch]
+
+    async def publish_batched(self, channel: str, data: BaseModel | dict) -> BatchPublishResult:
+        """
+        Publish one message through the client's coalescing batcher.
+
+        Concurrent calls are merged into /api/batch requests, flushed after
+        flush_interval seconds or once max_batch_size messages are queued.
+
+        Args:
+            channel: Centrifugo channel name
+            data: Pydantic model or dict with message data
+
+        Returns:
+            BatchPublishResult for this message
+        """
+        return await self._get_batcher().publish(channel, serialize_data(data), str(uuid4()))
+
+    def _get_batcher(self) -> PublishBatcher:
+        """Get the batcher bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._batcher_loop is not loop:
+            self._batcher = PublishBatcher(
+                self._send_batch,
+                max_batch_size=self.max_batch_size,
+                flush_interval=self.flush_interval,
+            )
+            self._batcher_loop = loop
+        return self._batcher
+
+    async def _flush_batcher(self) -> None:
+        """Send messages still queued in this loop's batcher (on close)."""
+        if self._batcher is not None and self._batcher_loop is asyncio.get_running_loop():
+            await self._batcher.flush()
+
+    async def _send_batch(self, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+        """Send one /api/batch request and map replies onto items."""
+        if not self.batch_endpoint_available:
+            return await self._send_individually(items)
+
+        start_time = time.time()
+        try:
+            response = await self._post("/api/batch", build_batch_payload(items))
+            if response.status_code in (404, 405):
+                logger.info(
+                    f"No /api/batch endpoint at {self._endpoint_url}, publishing messages "
+                    f"individually for {BATCH_REPROBE_INTERVAL:.0f}s"
+                )
+                self._batch_unsupported_until = time.monotonic() + BATCH_REPROBE_INTERVAL
+                return await self._send_individually(items)
+            results = parse_batch_replies(self._json_or_raise(response), items)
+        except Exception as e:
+            logger.warning(f"Batch publish of {len(items)} message(s) failed: {e}")
+            results = failed_results(items, e)
+        else:
+            logger.debug(f"Published batch of {len(items)} message(s)")
+
+        results = reindex(results, items)
+        await self._log_batch(items, results, int((time.time() - start_time) * 1000))
+        return results
+
+    async def _send_broadcast(self, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+        """Send one broadcast chunk (all items carry the same data)."""
+        return await self._send_batch(items)
+
+    async def _send_individually(self, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+        """Fallback for servers without /api/batch: concurrent single publishes."""
+
+        async def send(item: BatchItem) -> BatchPublishResult:
+            index, channel, data, message_id = item
+            try:
+                result = await self.publish(channel=channel, data=data)
+            except Exception as e:
+                return failed_results([item], e)[0]
+            return BatchPublishResult(
+                index=index,
+                channel=channel,
+                message_id=result.message_id,
+                published=result.published,
+            )
+
+        return list(await asyncio.gather(*(send(item) for item in items)))
+
+    async def _post(self, path: str, payload: dict) -> httpx.Response:
+        return await post_with_retries(
+            self._http_client,
+            path,
+            payload,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            target_url=self._endpoint_url,
+            max_retry_delay=self.retry_max_delay,
+            breaker=self._breaker,
+        )
+
+    @staticmethod
+    def _json_or_raise(response: httpx.Response) -> Any:
+        """Response body of a 200, else CentrifugoPublishError."""
+        if response.status_code != 200:
+            raise CentrifugoPublishError(
+                f"HTTP {response.status_code}: {response.text}",
+                status_code=response.status_code,
+            )
+        return response.json()
+
+    async def _log_batch(
+        self,
+        items: Sequence[BatchItem],
+        results: List[BatchPublishResult],
+        duration_ms: int,
+    ) -> None:
+        """Record the outcome of each message of a batch request (no-op here)."""
+
+
+__all__ = [
+    "BatchPublishMixin",
+    "BatchPublishResult",
+    "PublishBatcher",
+    "DEFAULT_MAX_BATCH_SIZE",
+    "DEFAULT_FLUSH_INTERVAL",
+]
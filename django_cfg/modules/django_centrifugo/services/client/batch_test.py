@@ -0,0 +1,188 @@
+"""
+Tests for batched publishing against a local stub Centrifugo HTTP server.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from . import batch
+from .client import CentrifugoClient
+from .direct_client import DirectCentrifugoClient
+
+
+class StubCentrifugoHandler(BaseHTTPRequestHandler):
+    """Answers /api/batch and /api/broadcast; channels starting with "bad" fail."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))
+
+        if self.path == "/api/batch" and self.server.batch_enabled:
+            replies = [
+                {"error": {"code": 102, "message": "unknown channel"}}
+                if command["publish"]["channel"].startswith("bad")
+                else {"publish": {"offset": position + 1, "epoch": "e"}}
+                for position, command in enumerate(body["commands"])
+            ]
+            self._reply(200, {"replies": replies})
+        elif self.path == "/api/broadcast":
+            responses = [
+                {"error": {"code": 102, "message": "unknown channel"}}
+                if channel.startswith("bad")
+                else {"result": {"offset": 1, "epoch": "e"}}
+                for channel in body["channels"]
+            ]
+            self._reply(200, {"result": {"responses": responses}})
+        elif self.path == "/api/publish":
+            self._reply(200, {"message_id": "m", "published": True})
+        else:
+            self._reply(404, {"detail": "not found"})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCentrifugoHandler)
+    server.requests = []
+    server.batch_enabled = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _direct_client(server, **kwargs):
+    return DirectCentrifugoClient(
+        api_url=f"{_url(server)}/api", api_key="test", retry_delay=0.01, **kwargs
+    )
+
+
+class TestDirectClientBatching:
+    """Test publish_many, broadcast and publish_batched on the direct client."""
+
+    @pytest.mark.asyncio
+    async def test_publish_many_groups_into_batches(self, stub_server):
+        messages = [(f"user#{i}", {"n": i}) for i in range(250)]
+        messages[7] = ("bad#7", {"n": 7})
+
+        async with _direct_client(stub_server, max_batch_size=100) as client:
+            results = await client.publish_many(messages)
+
+        assert [path for path, _ in stub_server.requests] == ["/api/batch"] * 3
+        assert [r.index for r in results] == list(range(250))
+        assert [r.channel for r in results] == [channel for channel, _ in messages]
+        assert results[7].published is False
+        assert results[7].error_code == 102
+        assert sum(r.published for r in results) == 249
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reports_per_channel(self, stub_server):
+        channels = ["user#1", "bad#2", "user#3"]
+
+        async with _direct_client(stub_server) as client:
+            results = await client.broadcast(channels, {"event": "reload"})
+
+        path, body = stub_server.requests[0]
+        assert path == "/api/broadcast"
+        assert body == {"channels": channels, "data": {"event": "reload"}}
+        assert [r.published for r in results] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_publish_batched_coalesces_concurrent_calls(self, stub_server):
+        async with _direct_client(stub_server, max_batch_size=50, flush_interval=0.05) as client:
+            results = await asyncio.gather(
+                *(client.publish_batched(f"user#{i}", {"n": i}) for i in range(120))
+            )
+
+        assert len(stub_server.requests) == 3
+        assert all(r.published for r in results)
+        assert [r.channel for r in results] == [f"user#{i}" for i in range(120)]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_fails_each_message(self):
+        client = DirectCentrifugoClient(
+            api_url="http://127.0.0.1:9/api", api_key="test", max_retries=1
+        )
+        async with client:
+            results = await client.publish_many([("a", {}), ("b", {})])
+
+        assert [r.published for r in results] == [False, False]
+        assert all("connection error" in r.error for r in results)
+
+
+class TestWrapperClientBatching:
+    """Test publish_many on the wrapper client, with and without /api/batch."""
+
+    @pytest.mark.asyncio
+    async def test_publish_many_uses_batch_endpoint(self, stub_server):
+        async with CentrifugoClient(wrapper_url=_url(stub_server), max_batch_size=10) as client:
+            results = await client.broadcast([f"user#{i}" for i in range(25)], {"x": 1})
+
+        assert [path for path, _ in stub_server.requests] == ["/api/batch"] * 3
+        assert all(r.published for r in results)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_batch_endpoint(self, stub_server):
+        stub_server.batch_enabled = False
+
+        async with CentrifugoClient(wrapper_url=_url(stub_server), retry_delay=0.01) as client:
+            results = await client.publish_many([("a", {}), ("b", {}), ("c", {})])
+            assert client.get_connection_info()["batch_endpoint"] is False
+
+        paths = [path for path, _ in stub_server.requests]
+        assert paths == ["/api/batch"] + ["/api/publish"] * 3
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.published for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_is_probed_again(self, stub_server, monkeypatch):
+        stub_server.batch_enabled = False
+
+        async with CentrifugoClient(wrapper_url=_url(stub_server), retry_delay=0.01) as client:
+            monkeypatch.setattr(batch, "BATCH_REPROBE_INTERVAL", 0.05)
+            await client.publish_many([("a", {})])
+            await client.publish_many([("b", {})])
+
+            stub_server.batch_enabled = True
+            await asyncio.sleep(0.05)
+            results = await client.publish_many([("c", {}), ("d", {})])
+            assert client.get_connection_info()["batch_endpoint"] is True
+
+        paths = [path for path, _ in stub_server.requests]
+        assert paths == ["/api/batch", "/api/publish", "/api/publish", "/api/batch"]
+        assert all(r.published for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batched_publishes_are_logged(self, stub_server, monkeypatch):
+        from ..logging import CentrifugoLogger
+
+        logged = []
+
+        async def log_batch(items, results, duration_ms=None):
+            logged.extend((item[1], result.published) for item, result in zip(items, results))
+
+        monkeypatch.setattr(CentrifugoLogger, "log_batch_async", log_batch)
+
+        async with CentrifugoClient(wrapper_url=_url(stub_server)) as client:
+            await client.publish_many([("user#1", {}), ("bad#2", {})])
+
+        assert logged == [("user#1", True), ("bad#2", False)]
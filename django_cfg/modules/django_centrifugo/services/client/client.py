@@ -10,19 +10,37 @@ Mirrors DjangoCfgRPCClient interface for easy migration from legacy WebSocket so
 import asyncio
 import json
 import time
-from typing import Any, Optional, Type, TypeVar
+from collections import deque
+from typing import Any, List, Optional, Sequence, Type, TypeVar
 from uuid import uuid4
 
 import httpx
 from django_cfg.utils import get_logger
 from pydantic import BaseModel
 
+from .batch import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_BATCH_SIZE,
+    BatchItem,
+    BatchPublishMixin,
+    BatchPublishResult,
+    serialize_data,
+)
 from .exceptions import (
+    CentrifugoCircuitOpenError,
     CentrifugoConfigurationError,
     CentrifugoConnectionError,
     CentrifugoPublishError,
     CentrifugoTimeoutError,
-    CentrifugoValidationError,
+)
+
+from .resilience import (
+    DEFAULT_COOLDOWN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRY_DELAY,
+    CircuitBreaker,
+    CircuitState,
+    compute_backoff,
 )
 
 logger = get_logger("centrifugo.client")
@@ -38,9 +56,10 @@ class PublishResponse(BaseModel):
     delivered: bool = False
     acks_received: int = 0
     timeout: bool = False
+    queued: bool = False
 
 
-class CentrifugoClient:
+class CentrifugoClient(BatchPublishMixin):
     """
     Async Centrifugo client for Django to communicate with Centrifugo server.
 
@@ -50,6 +69,8 @@ class CentrifugoClient:
     - Supports ACK tracking for delivery confirmation
     - Type-safe API with Pydantic models
     - Connection pooling for performance
+    - Batched fan-out with per-message results (publish_many, broadcast)
+    - Exponential backoff with full jitter and a circuit breaker
     - Automatic logging with CentrifugoLogger
     - Mirrors DjangoCfgRPCClient interface for migration
 
@@ -84,6 +105,12 @@ class CentrifugoClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         verify_ssl: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        retry_max_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        circuit_failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        circuit_cooldown: float = DEFAULT_COOLDOWN,
+        outbox_max_size: int = 0,
     ):
         """
         Initialize Centrifugo client.
@@ -95,8 +122,15 @@ class CentrifugoClient:
             ack_timeout: Default ACK timeout (seconds)
             http_timeout: HTTP request timeout (seconds)
             max_retries: Maximum retry attempts
-            retry_delay: Delay between retries (seconds)
+            retry_delay: Base delay for exponential backoff between retries (seconds)
             verify_ssl: Whether to verify SSL certificates (default: False, allows self-signed certs)
+            max_batch_size: Maximum messages per /api/batch request
+            flush_interval: Maximum wait before publish_batched() flushes (seconds)
+            retry_max_delay: Upper bound of a single backoff delay (seconds)
+            circuit_failure_threshold: Consecutive failures that open the circuit
+            circuit_cooldown: Time an open circuit fails fast before probing (seconds)
+            outbox_max_size: Fire-and-forget publishes kept in memory while the
+                circuit is open, replayed on recovery (0 = fail fast)
         """
         self.wrapper_url = wrapper_url or self._get_wrapper_url_from_settings()
         self.wrapper_api_key = wrapper_api_key
@@ -106,6 +140,19 @@ class CentrifugoClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.verify_ssl = verify_ssl
+        self._init_batching(max_batch_size, flush_interval)
+
+        self.retry_max_delay = retry_max_delay
+        self.outbox_max_size = outbox_max_size
+        self._breaker = CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            cooldown=circuit_cooldown,
+            # A probe outliving its HTTP timeout was abandoned
+            probe_timeout=http_timeout,
+        )
+        self._outbox: deque = deque()
+        self._outbox_drain: Optional[asyncio.Future] = None
+        self.outbox_dropped = 0
 
         # Create HTTP client with connection pooling
         headers = {"Content-Type": "application/json"}
@@ -170,7 +217,7 @@ class CentrifugoClient:
 
         Raises:
             CentrifugoPublishError: If publish fails
-            CentrifugoValidationError: If data validation fails
+            CentrifugoValidationError: If data is not a BaseModel or dict (serialize_data)
 
         Example:
             >>> result = await client.publish(
@@ -217,7 +264,7 @@ class CentrifugoClient:
         Raises:
             CentrifugoTimeoutError: If ACK timeout exceeded
             CentrifugoPublishError: If publish fails
-            CentrifugoValidationError: If data validation fails
+            CentrifugoValidationError: If data is not a BaseModel or dict (serialize_data)
 
         Example:
             >>> result = await client.publish_with_ack(
@@ -273,20 +320,11 @@ class CentrifugoClient:
         start_time = time.time()
 
         # Serialize data
-        if isinstance(data, BaseModel):
-            try:
-                data_dict = data.model_dump()
-            except Exception as e:
-                raise CentrifugoValidationError(
-                    f"Failed to serialize Pydantic model: {e}",
-                    validation_errors=[str(e)],
-                )
-        elif isinstance(data, dict):
-            data_dict = data
-        else:
-            raise CentrifugoValidationError(
-                f"data must be BaseModel or dict, got {type(data).__name__}"
-            )
+        data_dict = serialize_data(data)
+
+        # Open circuit: no I/O, no log row
+        if not self._breaker.allow():
+            return self._reject_open_circuit(message_id, channel, data_dict, wait_for_ack)
 
         # Create log entry (async)
         log_entry = None
@@ -303,6 +341,9 @@ class CentrifugoClient:
                 caller_ip=caller_ip,
                 user_agent=user_agent,
             )
+        except asyncio.CancelledError:
+            self._breaker.release()
+            raise
         except Exception as e:
             logger.warning(f"Failed to create log entry: {e}", exc_info=True)
 
@@ -314,12 +355,22 @@ class CentrifugoClient:
             "ack_timeout": ack_timeout if wait_for_ack else 0,
         }
 
-        # Retry logic
+        # Retry logic (the first attempt was admitted by the breaker above)
         last_error = None
-        for attempt in range(self.max_retries):
+        attempts = max(self.max_retries, 1)
+        for attempt in range(attempts):
+            if attempt and not self._breaker.allow():
+                last_error = self._circuit_open_error()
+                break
+
             try:
                 response = await self._http_client.post("/api/publish", json=payload)
 
+                if response.status_code < 500:
+                    self._breaker.record_success()
+                else:
+                    self._breaker.record_failure()
+
                 if response.status_code == 200:
                     result_data = response.json()
                     duration_ms = int((time.time() - start_time) * 1000)
@@ -348,6 +399,8 @@ class CentrifugoClient:
                         except Exception as e:
                             logger.warning(f"Failed to update log entry: {e}", exc_info=True)
 
+                    self._schedule_outbox_drain()
+
                     return PublishResponse(
                         message_id=result_data.get("message_id", message_id),
                         published=result_data.get("published", True),
@@ -364,28 +417,40 @@ class CentrifugoClient:
                         response_data=response.json() if response.text else None,
                     )
 
+            except asyncio.CancelledError:
+                # No outcome to record, but free a half-open probe slot
+                self._breaker.release()
+                raise
+
             except httpx.TimeoutException as e:
+                self._breaker.record_failure()
                 last_error = CentrifugoTimeoutError(
                     f"HTTP timeout to wrapper: {e}",
                     channel=channel,
                     timeout_seconds=self.http_timeout,
                 )
 
-            except httpx.ConnectError as e:
+            except httpx.TransportError as e:
+                # Refused, reset or dropped connections
+                self._breaker.record_failure()
                 last_error = CentrifugoConnectionError(
                     f"Failed to connect to wrapper: {e}",
                     wrapper_url=self.wrapper_url,
                 )
 
             except Exception as e:
+                # Also releases a half-open probe slot
+                self._breaker.record_failure()
                 last_error = CentrifugoPublishError(
                     f"Unexpected error: {e}",
                     channel=channel,
                 )
 
-            # Retry delay
-            if attempt < self.max_retries - 1:
-                await asyncio.sleep(self.retry_delay)
+            # Jittered exponential backoff, so recovering servers see no herd
+            if attempt < attempts - 1:
+                await asyncio.sleep(
+                    compute_backoff(attempt, base=self.retry_delay, cap=self.retry_max_delay)
+                )
 
         # All retries failed
         duration_ms = int((time.time() - start_time) * 1000)
@@ -406,12 +471,94 @@ class CentrifugoClient:
                 logger.warning(f"Failed to update log entry: {e}")
 
         if last_error and isinstance(last_error, CentrifugoConnectionError):
-            logger.warning(f"Centrifugo unavailable after {self.max_retries} attempt(s): {last_error}")
+            logger.warning(f"Centrifugo unavailable after {attempt + 1} attempt(s): {last_error}")
 
         raise last_error if last_error else CentrifugoPublishError(
             "All retries failed", channel=channel
         )
 
+    @property
+    def _endpoint_url(self) -> str:
+        return self.wrapper_url
+
+    async def _log_batch(
+        self,
+        items: Sequence[BatchItem],
+        results: List[BatchPublishResult],
+        duration_ms: int,
+    ) -> None:
+        """Record batched publishes in the publish log, like single publishes."""
+        try:
+            from ..logging import CentrifugoLogger
+
+            await CentrifugoLogger.log_batch_async(items, results, duration_ms=duration_ms)
+        except Exception as e:
+            logger.warning(f"Failed to log batch publish: {e}", exc_info=True)
+
+    def _circuit_open_error(self) -> CentrifugoCircuitOpenError:
+        return CentrifugoCircuitOpenError(
+            "Circuit open after repeated failures, failing fast",
+            wrapper_url=self.wrapper_url,
+            retry_after=self._breaker.cooldown,
+        )
+
+    def _reject_open_circuit(
+        self,
+        message_id: str,
+        channel: str,
+        data: dict,
+        wait_for_ack: bool,
+    ) -> PublishResponse:
+        """
+        Handle a publish while the circuit is open.
+
+        Fire-and-forget messages spill to the outbox when one is configured;
+        ACK publishes cannot be confirmed later and always fail fast.
+
+        Raises:
+            CentrifugoCircuitOpenError: If the message is not queued
+        """
+        if not wait_for_ack and self.outbox_max_size:
+            if len(self._outbox) < self.outbox_max_size:
+                self._outbox.append((channel, data))
+                return PublishResponse(message_id=message_id, published=False, queued=True)
+            self.outbox_dropped += 1
+
+        raise self._circuit_open_error()
+
+    def _schedule_outbox_drain(self) -> None:
+        """Replay the outbox in the background once the wrapper answers again."""
+        if self._outbox and (self._outbox_drain is None or self._outbox_drain.done()):
+            self._outbox_drain = asyncio.ensure_future(self.drain_outbox())
+
+    async def drain_outbox(self) -> int:
+        """
+        Publish messages queued while the circuit was open.
+
+        Messages that fail because the wrapper is unreachable again go back
+        to the front of the outbox; messages rejected by Centrifugo itself
+        are dropped and logged.
+
+        Returns:
+            Number of messages published
+        """
+        if not self._outbox:
+            return 0
+
+        messages = list(self._outbox)
+        self._outbox.clear()
+        results = await self.publish_many(messages)
+
+        failed = [messages[result.index] for result in results if not result.published]
+        if failed and self._breaker.state is not CircuitState.CLOSED:
+            room = max(self.outbox_max_size - len(self._outbox), 0)
+            self._outbox.extendleft(reversed(failed[:room]))
+            self.outbox_dropped += max(len(failed) - room, 0)
+        elif failed:
+            logger.warning(f"Dropped {len(failed)} outbox message(s) rejected by Centrifugo")
+
+        return len(messages) - len(failed)
+
     async def fire_and_forget(
         self,
         channel: str,
@@ -485,6 +632,12 @@ class CentrifugoClient:
             "http_timeout": self.http_timeout,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
+            "max_batch_size": self.max_batch_size,
+            "flush_interval": self.flush_interval,
+            "batch_endpoint": self.batch_endpoint_available,
+            "circuit": self._breaker.get_stats(),
+            "outbox_size": len(self._outbox),
+            "outbox_dropped": self.outbox_dropped,
         }
 
     async def close(self):
@@ -496,6 +649,7 @@ class CentrifugoClient:
         Example:
             >>> await client.close()
         """
+        await self._flush_batcher()
         await self._http_client.aclose()
         logger.info("Centrifugo client closed")
 
@@ -575,10 +729,17 @@ def _create_client_from_settings() -> CentrifugoClient:
         max_retries=cfg.max_retries,
         retry_delay=cfg.retry_delay,
         verify_ssl=cfg.verify_ssl,
+        max_batch_size=cfg.batch_max_size,
+        flush_interval=cfg.batch_flush_interval,
+        retry_max_delay=cfg.retry_max_delay,
+        circuit_failure_threshold=cfg.circuit_failure_threshold,
+        circuit_cooldown=cfg.circuit_cooldown,
+        outbox_max_size=cfg.outbox_max_size,
     )
 
 
 __all__ = [
+    "BatchPublishResult",
     "CentrifugoClient",
     "get_centrifugo_client",
     "PublishResponse",
@@ -134,7 +134,54 @@ class DjangoCfgCentrifugoConfig(BaseModel):
         default=1.0,
         ge=0.1,
         le=10.0,
-        description="Delay between retries (seconds)",
+        description="Base delay for exponential backoff with full jitter between retries (seconds)",
+    )
+
+    retry_max_delay: float = Field(
+        default=30.0,
+        ge=0.1,
+        le=300.0,
+        description="Upper bound of a single retry backoff delay (seconds)",
+    )
+
+    # Circuit breaker settings
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Consecutive connection failures that open the circuit (publishes then fail fast)",
+    )
+
+    circuit_cooldown: float = Field(
+        default=30.0,
+        ge=0.1,
+        le=600.0,
+        description="Time an open circuit fails fast before letting a half-open probe through (seconds)",
+    )
+
+    outbox_max_size: int = Field(
+        default=0,
+        ge=0,
+        le=100_000,
+        description=(
+            "Fire-and-forget publishes kept in memory while the circuit is open and replayed "
+            "on recovery (0 = fail fast with CentrifugoCircuitOpenError)"
+        ),
+    )
+
+    # Batch settings
+    batch_max_size: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Maximum messages per /api/batch or /api/broadcast request",
+    )
+
+    batch_flush_interval: float = Field(
+        default=0.01,
+        ge=0.0,
+        le=5.0,
+        description="Maximum time publish_batched() waits before flushing a partial batch (seconds)",
     )
 
     # SSL settings
@@ -160,6 +207,46 @@ class DjangoCfgCentrifugoConfig(BaseModel):
         description="Log level for Centrifugo module",
     )
 
+    # Publish log storage
+    log_model: str | None = Field(
+        default=None,
+        description="Model receiving publish log rows ('app_label.ModelName'); None disables publish logging",
+        examples=["myapp.CentrifugoLog"],
+    )
+
+    log_buffered: bool = Field(
+        default=True,
+        description="Queue publish log records in memory and write them with bulk_create",
+    )
+
+    log_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        le=1_000_000,
+        description="Maximum buffered log records; records beyond this are dropped and counted",
+    )
+
+    log_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Records per bulk_create; a full batch triggers an immediate flush",
+    )
+
+    log_flush_interval: float = Field(
+        default=1.0,
+        ge=0.05,
+        le=60.0,
+        description="Maximum time a buffered log record waits before being written (seconds)",
+    )
+
+    log_success_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of successful publishes to log (failures and timeouts are always logged)",
+    )
+
     @field_validator("wrapper_url", "centrifugo_url")
     @classmethod
     def validate_urls(cls, v: str) -> str:
@@ -218,10 +305,22 @@ class DjangoCfgCentrifugoConfig(BaseModel):
                 "HTTP_TIMEOUT": self.http_timeout,
                 "MAX_RETRIES": self.max_retries,
                 "RETRY_DELAY": self.retry_delay,
+                "RETRY_MAX_DELAY": self.retry_max_delay,
+                "CIRCUIT_FAILURE_THRESHOLD": self.circuit_failure_threshold,
+                "CIRCUIT_COOLDOWN": self.circuit_cooldown,
+                "OUTBOX_MAX_SIZE": self.outbox_max_size,
                 "VERIFY_SSL": self.verify_ssl,
+                "BATCH_MAX_SIZE": self.batch_max_size,
+                "BATCH_FLUSH_INTERVAL": self.batch_flush_interval,
                 "LOG_ALL_CALLS": self.log_all_calls,
                 "LOG_ONLY_WITH_ACK": self.log_only_with_ack,
                 "LOG_LEVEL": self.log_level,
+                "LOG_MODEL": self.log_model,
+                "LOG_BUFFERED": self.log_buffered,
+                "LOG_QUEUE_SIZE": self.log_queue_size,
+                "LOG_BATCH_SIZE": self.log_batch_size,
+                "LOG_FLUSH_INTERVAL": self.log_flush_interval,
+                "LOG_SUCCESS_SAMPLE_RATE": self.log_success_sample_rate,
             }
         }
 
@@ -244,7 +343,13 @@ class DjangoCfgCentrifugoConfig(BaseModel):
             "http_timeout": self.http_timeout,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
+            "retry_max_delay": self.retry_max_delay,
+            "circuit_failure_threshold": self.circuit_failure_threshold,
+            "circuit_cooldown": self.circuit_cooldown,
+            "outbox_max_size": self.outbox_max_size,
             "verify_ssl": self.verify_ssl,
+            "max_batch_size": self.batch_max_size,
+            "flush_interval": self.batch_flush_interval,
         }
 
 
@@ -18,19 +18,39 @@ Use CentrifugoClient (with wrapper) for:
 
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
 import httpx
 from django_cfg.utils import get_logger
 
+from .batch import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_BATCH_SIZE,
+    BatchItem,
+    BatchPublishMixin,
+    BatchPublishResult,
+    failed_results,
+    parse_broadcast_responses,
+    reindex,
+)
 from .exceptions import (
+    CentrifugoCircuitOpenError,
     CentrifugoConfigurationError,
     CentrifugoConnectionError,
     CentrifugoPublishError,
 )
 
+from .resilience import (
+    DEFAULT_COOLDOWN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRY_DELAY,
+    CircuitBreaker,
+    compute_backoff,
+)
+
 logger = get_logger("centrifugo.direct_client")
 
 
@@ -43,7 +63,7 @@ class PublishResponse:
         self.delivered = published  # For compatibility
 
 
-class DirectCentrifugoClient:
+class DirectCentrifugoClient(BatchPublishMixin):
     """
     Direct Centrifugo HTTP API client.
 
@@ -55,6 +75,8 @@ class DirectCentrifugoClient:
     - No wrapper overhead
     - Direct API key authentication
     - Minimal latency for internal calls
+    - Batched fan-out via /api/batch and /api/broadcast
+    - Jittered exponential backoff; circuit breaker fails fast while down
 
     Example:
         >>> from django_cfg.modules.django_centrifugo.services.client import DirectCentrifugoClient
@@ -78,6 +100,11 @@ class DirectCentrifugoClient:
         max_retries: int = 3,
         retry_delay: float = 0.5,
         verify_ssl: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        retry_max_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        circuit_failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        circuit_cooldown: float = DEFAULT_COOLDOWN,
     ):
         """
         Initialize direct Centrifugo client.
@@ -87,8 +114,13 @@ class DirectCentrifugoClient:
             api_key: Centrifugo API key for authentication
             http_timeout: HTTP request timeout (seconds)
             max_retries: Maximum retry attempts
-            retry_delay: Delay between retries (seconds)
+            retry_delay: Base delay for exponential backoff between retries (seconds)
             verify_ssl: Whether to verify SSL certificates
+            max_batch_size: Maximum commands per /api/batch or /api/broadcast request
+            flush_interval: Maximum wait before publish_batched() flushes (seconds)
+            retry_max_delay: Upper bound of a single backoff delay (seconds)
+            circuit_failure_threshold: Consecutive failures that open the circuit
+            circuit_cooldown: Time an open circuit fails fast before probing (seconds)
         """
         self.api_url = api_url or self._get_api_url_from_settings()
         self.api_key = api_key or self._get_api_key_from_settings()
@@ -96,6 +128,14 @@ class DirectCentrifugoClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.verify_ssl = verify_ssl
+        self._init_batching(max_batch_size, flush_interval)
+        self.retry_max_delay = retry_max_delay
+        self._breaker = CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            cooldown=circuit_cooldown,
+            # A probe outliving its HTTP timeout was abandoned
+            probe_timeout=http_timeout,
+        )
 
         # Create HTTP client
         headers = {"Content-Type": "application/json"}
@@ -182,11 +222,25 @@ class DirectCentrifugoClient:
         }
 
         last_error = None
+        attempts = max(self.max_retries, 1)
+
+        for attempt in range(attempts):
+            if not self._breaker.allow():
+                last_error = CentrifugoCircuitOpenError(
+                    "Circuit open after repeated failures, failing fast",
+                    wrapper_url=self.api_url,
+                    retry_after=self._breaker.cooldown,
+                )
+                break
 
-        for attempt in range(self.max_retries):
             try:
                 response = await self._http_client.post("/api", json=payload)
 
+                if response.status_code < 500:
+                    self._breaker.record_success()
+                else:
+                    self._breaker.record_failure()
+
                 if response.status_code == 200:
                     result = response.json()
 
@@ -214,31 +268,49 @@ class DirectCentrifugoClient:
                         channel=channel,
                     )
 
-            except httpx.ConnectError as e:
+            except asyncio.CancelledError:
+                # No outcome to record, but free a half-open probe slot
+                self._breaker.release()
+                raise
+
+            except httpx.TransportError as e:
+                # Refused, reset, dropped or timed-out connections
+                self._breaker.record_failure()
                 last_error = CentrifugoConnectionError(
                     f"Failed to connect to Centrifugo: {e}",
                     wrapper_url=self.api_url,
                 )
                 logger.debug(
-                    f"Connection attempt {attempt + 1}/{self.max_retries} failed: {e}"
+                    f"Connection attempt {attempt + 1}/{attempts} failed: {e}"
+                )
+
+            except CentrifugoPublishError as e:
+                # Centrifugo answered; the breaker already counted the response
+                last_error = CentrifugoPublishError(
+                    f"Publish failed: {e}",
+                    channel=channel,
                 )
+                logger.error(f"Publish attempt {attempt + 1}/{attempts} failed: {e}")
 
             except Exception as e:
+                # Also releases a half-open probe slot
+                self._breaker.record_failure()
                 last_error = CentrifugoPublishError(
                     f"Publish failed: {e}",
                     channel=channel,
                 )
-                logger.error(f"Publish attempt {attempt + 1}/{self.max_retries} failed: {e}")
+                logger.error(f"Publish attempt {attempt + 1}/{attempts} failed: {e}")
 
-            # Retry delay
-            if attempt < self.max_retries - 1:
-                import asyncio
-                await asyncio.sleep(self.retry_delay)
+            # Jittered exponential backoff, so recovering servers see no herd
+            if attempt < attempts - 1:
+                await asyncio.sleep(
+                    compute_backoff(attempt, base=self.retry_delay, cap=self.retry_max_delay)
+                )
 
         # All retries failed
         if last_error:
             if isinstance(last_error, CentrifugoConnectionError):
-                logger.warning(f"Centrifugo unavailable after {self.max_retries} attempt(s): {last_error}")
+                logger.warning(f"Centrifugo unavailable after {attempt + 1} attempt(s): {last_error}")
             raise last_error
         else:
             raise CentrifugoPublishError(
@@ -246,8 +318,29 @@ class DirectCentrifugoClient:
                 channel=channel,
             )
 
+    async def _send_broadcast(self, items: Sequence[BatchItem]) -> List[BatchPublishResult]:
+        """Send one /api/broadcast request and map responses onto items."""
+        payload = {
+            "channels": [channel for _, channel, _, _ in items],
+            "data": items[0][2],
+        }
+        try:
+            response = await self._post("/api/broadcast", payload)
+            results = parse_broadcast_responses(self._json_or_raise(response), items)
+        except Exception as e:
+            logger.warning(f"Broadcast to {len(items)} channel(s) failed: {e}")
+            return failed_results(items, e)
+
+        logger.debug(f"Broadcast to {len(items)} channel(s)")
+        return reindex(results, items)
+
+    @property
+    def _endpoint_url(self) -> str:
+        return self.api_url
+
     async def close(self):
         """Close HTTP client connection."""
+        await self._flush_batcher()
         await self._http_client.aclose()
         logger.debug("DirectCentrifugoClient closed")
 
@@ -279,12 +372,25 @@ def get_direct_centrifugo_client() -> DirectCentrifugoClient:
     global _direct_client_instance
 
     if _direct_client_instance is None:
-        _direct_client_instance = DirectCentrifugoClient()
+        from ..config_helper import get_centrifugo_config
+
+        config = get_centrifugo_config()
+        if config:
+            _direct_client_instance = DirectCentrifugoClient(
+                max_batch_size=config.batch_max_size,
+                flush_interval=config.batch_flush_interval,
+                retry_max_delay=config.retry_max_delay,
+                circuit_failure_threshold=config.circuit_failure_threshold,
+                circuit_cooldown=config.circuit_cooldown,
+            )
+        else:
+            _direct_client_instance = DirectCentrifugoClient()
 
     return _direct_client_instance
 
 
 __all__ = [
+    "BatchPublishResult",
     "DirectCentrifugoClient",
     "get_direct_centrifugo_client",
     "PublishResponse",
@@ -139,6 +139,34 @@ class CentrifugoConnectionError(CentrifugoBaseException):
         return f"Centrifugo connection error: {self.message}"
 
 
+class CentrifugoCircuitOpenError(CentrifugoConnectionError):
+    """
+    Publish rejected without I/O because the circuit breaker is open.
+
+    Raised after repeated connection failures, until the cooldown elapses
+    and a probe succeeds. Subclass of CentrifugoConnectionError, so existing
+    "Centrifugo unavailable" handling keeps working.
+
+    Example:
+        >>> try:
+        ...     await client.publish(channel="test", data={})
+        ... except CentrifugoCircuitOpenError as e:
+        ...     print(f"Retry in {e.retry_after:.0f}s")
+    """
+
+    def __init__(self, message: str, wrapper_url: Optional[str] = None, retry_after: float = 0.0):
+        """
+        Initialize circuit-open error.
+
+        Args:
+            message: Error message
+            wrapper_url: URL the breaker protects
+            retry_after: Configured cooldown before the next probe (seconds)
+        """
+        super().__init__(message, wrapper_url=wrapper_url)
+        self.retry_after = retry_after
+
+
 class CentrifugoConfigurationError(CentrifugoBaseException):
     """
     Centrifugo configuration error.
@@ -207,6 +235,7 @@ __all__ = [
     "CentrifugoTimeoutError",
     "CentrifugoPublishError",
     "CentrifugoConnectionError",
+    "CentrifugoCircuitOpenError",
     "CentrifugoConfigurationError",
     "CentrifugoValidationError",
 ]
@@ -0,0 +1,198 @@
+"""
+Backoff and circuit breaking for Centrifugo publishing.
+
+Backoff is exponential with full jitter — ``random(0, min(cap, base *
+2**attempt))`` — so publishers that lost Centrifugo at the same moment do
+not retry, and reconnect, in lockstep.
+
+The circuit breaker wraps one client's HTTP endpoint:
+
+    CLOSED     normal — calls flow through.
+    OPEN       too many consecutive transport failures — fast-fail, no I/O,
+               until a cooldown elapses.
+    HALF_OPEN  cooldown elapsed — allow a limited number of probes; a success
+               closes the breaker, a failure re-opens it.
+
+A probe that never reports back (its task was cancelled, or it died on an
+error the caller did not count) would hold its HALF_OPEN slot forever, so
+callers ``release()`` abandoned calls and probes older than
+``probe_timeout`` are expired as a backstop.
+
+Same shape as ``django_llm.pipeline.circuit_breaker``, kept local so the
+Centrifugo client does not import the LLM package. Thread-safe, since the
+client singleton is shared by every event loop in the process, and
+time-injectable for tests.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque
+
+DEFAULT_MAX_RETRY_DELAY = 30.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0
+DEFAULT_PROBE_TIMEOUT = 30.0
+
+
+def compute_backoff(
+    attempt: int,
+    *,
+    base: float,
+    cap: float = DEFAULT_MAX_RETRY_DELAY,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Full-jitter exponential backoff for a zero-based attempt index.
+
+    ``sleep = random(0, min(cap, base * 2**attempt))``.
+    """
+    ceiling = min(cap, base * (2 ** attempt))
+    return rng() * ceiling
+
+
+class CircuitState(str, Enum):
+    """The three circuit-breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """A single circuit breaker.
+
+    Args:
+        failure_threshold: consecutive failures that trip CLOSED -> OPEN.
+        cooldown: seconds an OPEN breaker waits before allowing a probe.
+        half_open_probes: concurrent calls let through while HALF_OPEN.
+        probe_timeout: seconds after which an unanswered probe is presumed
+            abandoned and its slot freed.
+        now: monotonic clock, injectable for tests (default ``time.monotonic``).
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        half_open_probes: int = 1,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        now: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_probes = half_open_probes
+        self.probe_timeout = probe_timeout
+        self._now = now
+        self._lock = threading.Lock()
+
+        self._state: CircuitState = CircuitState.CLOSED
+        self._consecutive_failures: int = 0
+        self._opened_at: float | None = None
+        # Admission times of the HALF_OPEN probes in flight, oldest first
+        self._probes: Deque[float] = deque()
+
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, re-evaluating an elapsed OPEN cooldown."""
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Whether a call may proceed.
+
+        CLOSED -> always; HALF_OPEN -> only while fewer than
+        ``half_open_probes`` probes are in flight; OPEN -> False until the
+        cooldown elapses (which transitions it to HALF_OPEN).
+        """
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.HALF_OPEN and len(self._probes) < self.half_open_probes:
+                self._probes.append(self._now())
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        """A call admitted by ``allow()`` ended without an outcome — free its probe slot.
+
+        Call this when the call is cancelled or fails in a way that says
+        nothing about the server; it neither closes nor re-opens the breaker.
+        """
+        with self._lock:
+            if self._probes:
+                self._probes.popleft()
+
+    def record_success(self) -> None:
+        """A call reached the server — reset failures and close the breaker."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probes.clear()
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        """A call failed — count it and open (or re-open) if past threshold.
+
+        A failure during HALF_OPEN re-opens immediately; the failed probe
+        is what HALF_OPEN exists to catch.
+        """
+        with self._lock:
+            if self._current_state() is CircuitState.HALF_OPEN:
+                self._trip()
+                return
+
+            self._consecutive_failures += 1
+            if self._state is CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._trip()
+
+    def get_stats(self) -> dict:
+        """Get state and counters."""
+        with self._lock:
+            return {
+                "state": self._current_state().value,
+                "consecutive_failures": self._consecutive_failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._cooldown_elapsed():
+            self._state = CircuitState.HALF_OPEN
+            self._probes.clear()
+        elif self._state is CircuitState.HALF_OPEN:
+            expired = self._now() - self.probe_timeout
+            while self._probes and self._probes[0] <= expired:
+                self._probes.popleft()
+        return self._state
+
+    def _trip(self) -> None:
+        """Move to OPEN and start the cooldown."""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._now()
+        self._probes.clear()
+        self.trips += 1
+        if self._consecutive_failures < self.failure_threshold:
+            self._consecutive_failures = self.failure_threshold
+
+    def _cooldown_elapsed(self) -> bool:
+        """Whether the OPEN cooldown has fully elapsed."""
+        if self._opened_at is None:
+            return False
+        return (self._now() - self._opened_at) >= self.cooldown
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "compute_backoff",
+]
@@ -0,0 +1,207 @@
+"""
+Tests for backoff, the circuit breaker and outbox spill, against a stub
+server that drops connections.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from .client import CentrifugoClient
+from .direct_client import DirectCentrifugoClient
+from .exceptions import CentrifugoCircuitOpenError, CentrifugoConnectionError
+from .resilience import CircuitBreaker, CircuitState, compute_backoff
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Closes the connection without a response while server.down is set."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))
+
+        if self.server.down:
+            self.close_connection = True
+            return
+
+        if self.path == "/api/batch":
+            payload = {"replies": [{"publish": {}} for _ in body["commands"]]}
+        else:
+            payload = {"message_id": "m", "published": True, "result": {}}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.requests = []
+    server.down = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs):
+    options = {
+        "max_retries": 3,
+        "retry_delay": 0.01,
+        "circuit_failure_threshold": 2,
+        "circuit_cooldown": 0.05,
+    }
+    options.update(kwargs)
+    return CentrifugoClient(wrapper_url=f"http://127.0.0.1:{server.server_address[1]}", **options)
+
+
+class TestBackoffAndBreaker:
+    """Test the pure backoff and state machine."""
+
+    def test_backoff_is_full_jitter_and_capped(self):
+        assert compute_backoff(0, base=1.0, rng=lambda: 0.5) == 0.5
+        assert compute_backoff(3, base=1.0, rng=lambda: 0.5) == 4.0
+        assert compute_backoff(10, base=1.0, cap=5.0, rng=lambda: 1.0) == 5.0
+        assert compute_backoff(2, base=1.0, rng=lambda: 0.0) == 0.0
+
+    def test_half_open_admits_one_probe(self):
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10, now=lambda: clock[0])
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow() is False
+
+        clock[0] = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        clock[0] = 20
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.get_stats()["trips"] == 2
+
+    def test_abandoned_probe_frees_its_slot(self):
+        clock = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10, probe_timeout=5, now=lambda: clock[0])
+        breaker.record_failure()
+
+        clock[0] = 10
+        assert breaker.allow() is True
+        breaker.release()  # probe cancelled before an outcome
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        # Never released: expired after probe_timeout
+        clock[0] = 15
+        assert breaker.allow() is True
+
+
+class TestCircuitAgainstDroppingServer:
+    """Test client behaviour while the server drops every connection."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, flaky_server):
+        async with _client(flaky_server, circuit_cooldown=60) as client:
+            with pytest.raises(CentrifugoConnectionError):
+                await client.publish("user#1", {"n": 1})
+            # Threshold 2: the third retry was not attempted
+            assert len(flaky_server.requests) == 2
+
+            with pytest.raises(CentrifugoCircuitOpenError):
+                await client.publish("user#1", {"n": 2})
+            assert len(flaky_server.requests) == 2
+            assert client.get_connection_info()["circuit"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_circuit(self, flaky_server):
+        async with _client(flaky_server) as client:
+            with pytest.raises(CentrifugoConnectionError):
+                await client.publish("user#1", {})
+
+            flaky_server.down = False
+            await _wait_for_half_open(client)
+            result = await client.publish("user#1", {})
+
+        assert result.published is True
+        assert client.get_connection_info()["circuit"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_outbox_replays_after_recovery(self, flaky_server):
+        async with _client(flaky_server, outbox_max_size=2, circuit_cooldown=60) as client:
+            with pytest.raises(CentrifugoConnectionError):
+                await client.publish("user#1", {"n": 1})
+
+            queued = [await client.publish(f"user#{n}", {"n": n}) for n in (2, 3)]
+            assert [r.queued for r in queued] == [True, True]
+            # Outbox full: fail fast and count the drop
+            with pytest.raises(CentrifugoCircuitOpenError):
+                await client.publish("user#4", {"n": 4})
+            assert client.get_connection_info()["outbox_dropped"] == 1
+
+            flaky_server.down = False
+            client._breaker.cooldown = 0
+            await _wait_for_half_open(client)
+            assert await client.drain_outbox() == 2
+
+        batch = [body for path, body in flaky_server.requests if path == "/api/batch"]
+        assert [c["publish"]["channel"] for c in batch[0]["commands"]] == ["user#2", "user#3"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_slot(self, flaky_server):
+        async with _client(flaky_server, circuit_cooldown=0.05) as client:
+            with pytest.raises(CentrifugoConnectionError):
+                await client.publish("user#1", {})
+            await _wait_for_half_open(client)
+
+            client._http_client.post = _hang
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.publish("user#1", {}), 0.05)
+
+            assert client._breaker.state is CircuitState.HALF_OPEN
+            assert client._breaker.allow() is True
+
+    @pytest.mark.asyncio
+    async def test_direct_client_fails_fast(self, flaky_server):
+        client = DirectCentrifugoClient(
+            api_url=f"http://127.0.0.1:{flaky_server.server_address[1]}/api",
+            api_key="test",
+            retry_delay=0.01,
+            circuit_failure_threshold=2,
+            circuit_cooldown=60,
+        )
+        async with client:
+            with pytest.raises(CentrifugoConnectionError):
+                await client.publish("user#1", {})
+            with pytest.raises(CentrifugoCircuitOpenError):
+                await client.publish("user#1", {})
+
+        assert len(flaky_server.requests) == 2
+
+
+async def _hang(*args, **kwargs):
+    await asyncio.sleep(60)
+
+
+async def _wait_for_half_open(client):
+    for _ in range(100):
+        if client._breaker.state is CircuitState.HALF_OPEN:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("circuit did not reach half-open")
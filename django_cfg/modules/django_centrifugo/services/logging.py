@@ -0,0 +1,457 @@
+"""
+Centrifugo Publish Logging.
+
+Records the outcome of every CentrifugoClient publish, batched ones included. A record is built in
+memory when the publish starts and written once, when its outcome is known,
+so a publish never waits for a database round trip.
+
+Two write modes (DjangoCfgCentrifugoConfig.log_buffered):
+- buffered (default): records go to a bounded in-memory queue drained by a
+  background thread with `bulk_create`, every `log_flush_interval` seconds
+  or as soon as `log_batch_size` records are queued. When the queue is full,
+  new records are dropped and counted instead of blocking the publisher.
+- sync: each record is written as it completes (one INSERT per publish).
+
+Sampling: failures and ACK timeouts are always logged; successful publishes
+are logged at `log_success_sample_rate` (e.g. 0.01 for 1%).
+
+Rows are written to the model named by `log_model` ("app_label.ModelName").
+Record fields are copied onto model fields of the same name; fields the model
+does not have are skipped. With no model configured, nothing is logged.
+"""
+
+from __future__ import annotations
+
+import atexit
+import random
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone as tz
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+from django_cfg.utils import get_logger
+
+logger = get_logger("centrifugo.logging")
+
+STATUS_PENDING = "pending"
+STATUS_SUCCESS = "success"
+STATUS_TIMEOUT = "timeout"
+STATUS_FAILED = "failed"
+
+LogSink = Callable[[List["PublishLogRecord"]], None]
+
+
+@dataclass
+class PublishLogRecord:
+    """One publish, as written to the log table."""
+
+    message_id: str
+    channel: str
+    data: dict
+    wait_for_ack: bool
+    ack_timeout: Optional[int] = None
+    user_id: Optional[Any] = None
+    caller_ip: Optional[str] = None
+    user_agent: Optional[str] = None
+    status: str = STATUS_PENDING
+    acks_received: int = 0
+    duration_ms: Optional[int] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(tz.utc))
+    completed_at: Optional[datetime] = None
+
+
+def model_sink(model_label: str, batch_size: int = 500) -> LogSink:
+    """
+    Build a sink that bulk-inserts records into a Django model.
+
+    Args:
+        model_label: "app_label.ModelName"
+        batch_size: Rows per INSERT statement
+
+    Returns:
+        Callable writing a list of records in one savepointed transaction
+    """
+    from django.apps import apps
+    from django.db import router, transaction
+
+    model = apps.get_model(model_label)
+    field_names = set()
+    for model_field in model._meta.concrete_fields:
+        field_names.add(model_field.name)
+        field_names.add(model_field.attname)
+
+    def write(records: List[PublishLogRecord]) -> None:
+        rows = [
+            model(**{name: value for name, value in asdict(record).items() if name in field_names})
+            for record in records
+        ]
+        # Savepointed: a failing log write must not break a caller's transaction
+        with transaction.atomic(using=router.db_for_write(model)):
+            model.objects.bulk_create(rows, batch_size=batch_size)
+
+    return write
+
+
+class PublishLogWriter:
+    """
+    Bounded, thread-safe buffer of publish log records.
+
+    `submit()` never blocks and never touches the database; a daemon thread
+    drains the queue in batches through the sink.
+
+    Example:
+        >>> writer = PublishLogWriter(model_sink("myapp.CentrifugoLog"))
+        >>> writer.submit(record)
+        >>> writer.get_stats()["dropped_overflow"]
+        0
+    """
+
+    def __init__(
+        self,
+        sink: LogSink,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        self._sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Deque[PublishLogRecord] = deque()
+        self._lock = threading.Lock()
+        # Serializes sink calls between the thread and explicit flush()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped_overflow = 0
+        self.dropped_errors = 0
+        self.write_errors = 0
+
+    def submit(self, record: PublishLogRecord) -> bool:
+        """
+        Queue a record for writing.
+
+        Returns:
+            False if the queue was full and the record was dropped
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped_overflow += 1
+                return False
+            self._queue.append(record)
+            self.enqueued += 1
+            queued = len(self._queue)
+
+        if self._thread is None:
+            self._start()
+        if queued >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write everything queued now, in the calling thread.
+
+        Returns:
+            Number of records written
+        """
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def close(self) -> None:
+        """Stop the background thread and write what is left."""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def get_stats(self) -> dict:
+        """Get queue depth and write/drop counters."""
+        return {
+            "queued": len(self._queue),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped_overflow": self.dropped_overflow,
+            "dropped_errors": self.dropped_errors,
+            "write_errors": self.write_errors,
+            "max_queue_size": self.max_queue_size,
+        }
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="centrifugo-log-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        from django.db import close_old_connections
+
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def _take_batch(self) -> List[PublishLogRecord]:
+        with self._lock:
+            count = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _write(self, batch: List[PublishLogRecord]) -> int:
+        with self._write_lock:
+            try:
+                self._sink(batch)
+            except Exception as e:
+                self.write_errors += 1
+                self.dropped_errors += len(batch)
+                logger.warning(f"Failed to write {len(batch)} publish log record(s): {e}")
+                return 0
+        self.written += len(batch)
+        return len(batch)
+
+
+class CentrifugoLogger:
+    """
+    Publish log facade used by CentrifugoClient.
+
+    All methods are best-effort: logging failures are reported via the
+    module logger and never reach the publisher.
+    """
+
+    @staticmethod
+    async def create_log_async(
+        message_id: str,
+        channel: str,
+        data: dict,
+        wait_for_ack: bool,
+        ack_timeout: Optional[int] = None,
+        user: Optional[Any] = None,
+        caller_ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> Optional[PublishLogRecord]:
+        """
+        Start a log record for a publish (in memory only).
+
+        Returns:
+            PublishLogRecord, or None when publish logging is disabled
+        """
+        if _get_log_settings() is None:
+            return None
+
+        return PublishLogRecord(
+            message_id=message_id,
+            channel=channel,
+            data=data,
+            wait_for_ack=wait_for_ack,
+            ack_timeout=ack_timeout,
+            user_id=getattr(user, "pk", None),
+            caller_ip=caller_ip,
+            user_agent=user_agent,
+        )
+
+    @classmethod
+    async def mark_success_async(
+        cls,
+        record: PublishLogRecord,
+        acks_received: int = 0,
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """Complete a record as delivered/published (subject to sampling)."""
+        record.acks_received = acks_received
+        await cls._complete(record, STATUS_SUCCESS, duration_ms)
+
+    @classmethod
+    async def mark_timeout_async(
+        cls,
+        record: PublishLogRecord,
+        acks_received: int = 0,
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """Complete a record whose ACK wait timed out (always logged)."""
+        record.acks_received = acks_received
+        await cls._complete(record, STATUS_TIMEOUT, duration_ms)
+
+    @classmethod
+    async def mark_failed_async(
+        cls,
+        record: PublishLogRecord,
+        error_code: str,
+        error_message: str,
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """Complete a record as failed (always logged)."""
+        record.error_code = error_code
+        record.error_message = error_message
+        await cls._complete(record, STATUS_FAILED, duration_ms)
+
+    @classmethod
+    async def log_batch_async(
+        cls,
+        items: Sequence[Tuple[int, str, dict, str]],
+        results: Sequence[Any],
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """
+        Log the messages of one batch request (fire-and-forget publishes).
+
+        Args:
+            items: (index, channel, data, message_id) batch items
+            results: BatchPublishResult per item, in the same order
+            duration_ms: Duration of the whole batch request
+        """
+        if _get_log_settings() is None:
+            return
+
+        completed_at = datetime.now(tz.utc)
+        records = []
+        for (_, channel, data, message_id), result in zip(items, results):
+            record = PublishLogRecord(
+                message_id=message_id,
+                channel=channel,
+                data=data,
+                wait_for_ack=False,
+                status=STATUS_SUCCESS if result.published else STATUS_FAILED,
+                duration_ms=duration_ms,
+                completed_at=completed_at,
+            )
+            if not result.published:
+                record.error_code = str(result.error_code) if result.error_code is not None else None
+                record.error_message = result.error
+            records.append(record)
+        await cls._write(records)
+
+    @classmethod
+    async def _complete(cls, record: PublishLogRecord, status: str, duration_ms: Optional[int]) -> None:
+        record.status = status
+        record.duration_ms = duration_ms
+        record.completed_at = datetime.now(tz.utc)
+        await cls._write([record])
+
+    @staticmethod
+    async def _write(records: List[PublishLogRecord]) -> None:
+        """Sample and write completed records (buffered or one INSERT batch)."""
+        config = _get_log_settings()
+        if config is None:
+            return
+        records = [record for record in records if _should_log(record, config)]
+        if not records:
+            return
+
+        if config.log_buffered:
+            writer = get_publish_log_writer()
+            for record in records:
+                writer.submit(record)
+            return
+
+        from asgiref.sync import sync_to_async
+
+        try:
+            await sync_to_async(_get_sink())(records)
+        except Exception as e:
+            logger.warning(f"Failed to write {len(records)} publish log record(s): {e}")
+
+    @staticmethod
+    def get_stats() -> dict:
+        """Get buffered writer counters (empty when not buffering)."""
+        return _writer.get_stats() if _writer is not None else {}
+
+
+def _should_log(record: PublishLogRecord, config) -> bool:
+    """Failures and timeouts always; successes per flags and sample rate."""
+    if record.status != STATUS_SUCCESS:
+        return True
+    if not config.log_all_calls and config.log_only_with_ack and not record.wait_for_ack:
+        return False
+    rate = config.log_success_sample_rate
+    return rate >= 1.0 or random.random() < rate
+
+
+def _get_log_settings():
+    """Centrifugo config if publish logging is configured, else None."""
+    from .config_helper import get_centrifugo_config
+
+    config = get_centrifugo_config()
+    if config is None or not config.log_model:
+        return None
+    return config
+
+
+_sink: Optional[LogSink] = None
+_writer: Optional[PublishLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_sink() -> LogSink:
+    global _sink
+
+    if _sink is None:
+        config = _get_log_settings()
+        _sink = model_sink(config.log_model, batch_size=config.log_batch_size)
+    return _sink
+
+
+def get_publish_log_writer() -> PublishLogWriter:
+    """
+    Get the process-wide buffered writer (created from config on first use).
+
+    Returns:
+        PublishLogWriter instance
+    """
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                from .config_helper import get_centrifugo_config_or_default
+
+                config = get_centrifugo_config_or_default()
+                _writer = PublishLogWriter(
+                    _get_sink(),
+                    max_queue_size=config.log_queue_size,
+                    batch_size=config.log_batch_size,
+                    flush_interval=config.log_flush_interval,
+                )
+                atexit.register(_writer.close)
+    return _writer
+
+
+def reset_publish_log_writer() -> None:
+    """Flush and discard the global writer (useful in tests)."""
+    global _sink, _writer
+
+    with _writer_lock:
+        if _writer is not None:
+            atexit.unregister(_writer.close)
+            _writer.close()
+        _writer = None
+        _sink = None
+
+
+__all__ = [
+    "CentrifugoLogger",
+    "PublishLogRecord",
+    "PublishLogWriter",
+    "get_publish_log_writer",
+    "model_sink",
+    "reset_publish_log_writer",
+]
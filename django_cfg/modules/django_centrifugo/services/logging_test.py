@@ -0,0 +1,164 @@
+"""
+Tests for buffered Centrifugo publish logging.
+"""
+
+import threading
+import time
+
+import pytest
+
+from . import config_helper
+from . import logging as publish_logging
+from .client.config import DjangoCfgCentrifugoConfig
+from .logging import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    CentrifugoLogger,
+    PublishLogRecord,
+    PublishLogWriter,
+)
+
+
+class ListSink:
+    """Sink collecting written batches; signals when one arrives."""
+
+    def __init__(self):
+        self.batches = []
+        self.written = threading.Event()
+
+    def __call__(self, records):
+        self.batches.append(list(records))
+        self.written.set()
+
+
+def _record(n=0, wait_for_ack=True):
+    return PublishLogRecord(
+        message_id=f"m{n}", channel=f"user#{n}", data={"n": n}, wait_for_ack=wait_for_ack
+    )
+
+
+class TestPublishLogWriter:
+    """Test batching, timer flush and bounded overflow."""
+
+    def test_full_batch_flushes_immediately(self):
+        sink = ListSink()
+        writer = PublishLogWriter(sink, batch_size=10, flush_interval=60)
+
+        for n in range(10):
+            writer.submit(_record(n))
+
+        assert sink.written.wait(5)
+        assert [r.message_id for r in sink.batches[0]] == [f"m{n}" for n in range(10)]
+        writer.close()
+
+    def test_partial_batch_flushes_on_timer(self):
+        sink = ListSink()
+        writer = PublishLogWriter(sink, batch_size=100, flush_interval=0.05)
+
+        writer.submit(_record())
+
+        assert sink.written.wait(5)
+        assert len(sink.batches[0]) == 1
+        writer.close()
+
+    def test_overflow_is_dropped_and_counted(self):
+        release = threading.Event()
+        sink = ListSink()
+
+        def slow_sink(records):
+            release.wait(5)
+            sink(records)
+
+        writer = PublishLogWriter(slow_sink, max_queue_size=5, batch_size=1000, flush_interval=60)
+        accepted = [writer.submit(_record(n)) for n in range(8)]
+        release.set()
+        writer.close()
+
+        assert accepted == [True] * 5 + [False] * 3
+        stats = writer.get_stats()
+        assert stats["dropped_overflow"] == 3
+        assert stats["written"] == 5
+
+    def test_sink_errors_are_counted(self):
+        def broken_sink(records):
+            raise RuntimeError("db gone")
+
+        writer = PublishLogWriter(broken_sink, batch_size=1000, flush_interval=60)
+        writer.submit(_record())
+        writer.close()
+
+        assert writer.get_stats()["write_errors"] == 1
+        assert writer.get_stats()["dropped_errors"] == 1
+
+
+class TestCentrifugoLogger:
+    """Test sampling and the client-facing facade."""
+
+    @pytest.fixture
+    def sink(self, monkeypatch):
+        sink = ListSink()
+        config = DjangoCfgCentrifugoConfig(
+            log_model="tests.PublishLog",
+            log_all_calls=True,
+            log_success_sample_rate=0.0,
+            log_flush_interval=60,
+        )
+        monkeypatch.setattr(publish_logging, "_get_log_settings", lambda: config)
+        monkeypatch.setattr(publish_logging, "_get_sink", lambda: sink)
+        monkeypatch.setattr(config_helper, "get_centrifugo_config_or_default", lambda: config)
+        publish_logging.reset_publish_log_writer()
+        yield sink
+        publish_logging.reset_publish_log_writer()
+
+    @pytest.mark.asyncio
+    async def test_failures_logged_successes_sampled_out(self, sink):
+        ok = await CentrifugoLogger.create_log_async("ok", "user#1", {}, wait_for_ack=True)
+        bad = await CentrifugoLogger.create_log_async("bad", "user#2", {}, wait_for_ack=True)
+
+        await CentrifugoLogger.mark_success_async(ok, acks_received=1, duration_ms=3)
+        await CentrifugoLogger.mark_failed_async(bad, "CentrifugoConnectionError", "down", 5)
+        publish_logging.get_publish_log_writer().flush()
+
+        records = [record for batch in sink.batches for record in batch]
+        assert [(r.message_id, r.status) for r in records] == [("bad", STATUS_FAILED)]
+        assert records[0].error_message == "down"
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_sink(self, sink, monkeypatch):
+        monkeypatch.setattr(publish_logging, "_should_log", lambda record, config: True)
+
+        def slow_sink(records):
+            time.sleep(0.5)
+            sink(records)
+
+        monkeypatch.setattr(publish_logging, "_get_sink", lambda: slow_sink)
+        publish_logging.reset_publish_log_writer()
+
+        started = time.perf_counter()
+        record = await CentrifugoLogger.create_log_async("m", "user#1", {}, wait_for_ack=False)
+        await CentrifugoLogger.mark_success_async(record)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.1
+        assert record.status == STATUS_SUCCESS
+        assert CentrifugoLogger.get_stats()["enqueued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_results_logged_per_message(self, sink):
+        from .client.batch import BatchPublishResult
+
+        items = [(0, "user#1", {}, "m1"), (1, "bad#2", {}, "m2")]
+        results = [
+            BatchPublishResult(index=0, channel="user#1", message_id="m1", published=True),
+            BatchPublishResult(
+                index=1, channel="bad#2", message_id="m2", published=False,
+                error="unknown channel", error_code=102,
+            ),
+        ]
+
+        await CentrifugoLogger.log_batch_async(items, results, duration_ms=4)
+        publish_logging.get_publish_log_writer().flush()
+
+        records = [record for batch in sink.batches for record in batch]
+        assert [(r.message_id, r.status, r.error_code) for r in records] == [("m2", STATUS_FAILED, "102")]
+        assert records[0].duration_ms == 4
@@ -27,11 +27,12 @@ Usage:
 from __future__ import annotations
 
 from datetime import datetime, timezone as tz
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import logging
 
 from .client import (
+    BatchPublishResult,
     CentrifugoClient,
     DirectCentrifugoClient,
     PublishResponse,
@@ -341,6 +342,75 @@ class CentrifugoPublisher:
         else:
             return await self._client.publish(channel=channel, data=event_data, user=user)
 
+    async def publish_many(
+        self,
+        messages: Iterable[Tuple[str, Dict[str, Any]]],
+        event_type: Optional[str] = None,
+    ) -> List[BatchPublishResult]:
+        """
+        Publish many messages in batched requests.
+
+        Args:
+            messages: (channel, data) pairs
+            event_type: If set, wrap each data dict like publish_custom()
+
+        Returns:
+            One BatchPublishResult per message, in input order
+
+        Example:
+            >>> results = await publisher.publish_many(
+            ...     [(f"bot#{bot.id}#status", {"status": bot.status}) for bot in bots],
+            ...     event_type="status_sync",
+            ... )
+        """
+        if event_type:
+            timestamp = datetime.now(tz.utc).isoformat()
+            messages = [
+                (channel, {"event_type": event_type, "timestamp": timestamp, **data})
+                for channel, data in messages
+            ]
+        else:
+            messages = list(messages)
+
+        logger.debug(f"Publishing {len(messages)} message(s) in batches")
+
+        return await self._client.publish_many(messages)
+
+    async def broadcast(
+        self,
+        channels: Sequence[str],
+        data: Dict[str, Any],
+        event_type: Optional[str] = None,
+    ) -> List[BatchPublishResult]:
+        """
+        Publish the same data to many channels in batched requests.
+
+        Args:
+            channels: Target channels
+            data: Event data dict
+            event_type: If set, wrap data like publish_custom()
+
+        Returns:
+            One BatchPublishResult per channel, in input order
+
+        Example:
+            >>> await publisher.broadcast(
+            ...     channels=[f"user#{uid}" for uid in user_ids],
+            ...     data={"title": "Maintenance at 22:00"},
+            ...     event_type="announcement",
+            ... )
+        """
+        if event_type:
+            data = {
+                "event_type": event_type,
+                "timestamp": datetime.now(tz.utc).isoformat(),
+                **data,
+            }
+
+        logger.debug(f"Broadcasting to {len(channels)} channel(s)")
+
+        return await self._client.broadcast(channels=channels, data=data)
+
 
 # Singleton instance
 _publisher_instance: Optional[CentrifugoPublisher] = None
@@ -9,6 +9,7 @@ import time
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from ..core.types import ChatCompletionResponse
+from ..pipeline.race import RaceCancelled, current_leg
 from ..providers import ConfigBuilder
 from ..structured.response_format import ResponseFormat, build_response_format
 
@@ -24,6 +25,11 @@ logger = logging.getLogger(__name__)
 class ChatRequestHandler:
     """Handles chat completion requests with caching."""
 
+    # Inside a race leg, stream the response so a losing leg can hang up.
+    # Opt-in per provider: the streamed call sets stream_options, which not
+    # every OpenAI-compatible backend accepts.
+    STREAM_RACE_PROVIDERS = frozenset({"openai", "openrouter"})
+
     def __init__(
         self,
         provider_manager: 'ProviderManager',
@@ -47,6 +53,8 @@ class ChatRequestHandler:
         self.stats_manager = stats_manager
         self.response_builder = response_builder
         self.tokenizer = tokenizer
+        # Providers that rejected a streamed race leg but served it unstreamed
+        self._unstreamable_providers = set()
 
     def chat_completion(
         self,
@@ -142,11 +150,14 @@ class ChatRequestHandler:
         logger.debug(f"Estimated input tokens: {estimated_tokens}")
 
         # Make API call
+        leg = current_leg()
         start_time = time.time()
         try:
             api_response = self._make_api_call(
                 client, api_model, messages, max_tokens, temperature,
-                response_format, provider=provider, **kwargs
+                response_format, provider=provider,
+                race_leg=leg if provider in self.STREAM_RACE_PROVIDERS else None,
+                prompt_tokens=estimated_tokens, **kwargs
             )
             processing_time = time.time() - start_time
 
@@ -167,9 +178,14 @@ class ChatRequestHandler:
                 model=model,
                 provider=provider
             )
+            if leg is not None:
+                leg.add_tokens(completion_response.tokens_used)
 
             return completion_response
 
+        except RaceCancelled:
+            logger.debug(f"Chat completion for {model} cancelled: another race leg won")
+            raise
         except Exception as e:
             self.stats_manager.record_failure()
             logger.error(f"Chat completion failed: {e}")
@@ -227,6 +243,8 @@ class ChatRequestHandler:
         temperature: Optional[float],
         response_format: Optional[dict],
         provider: Optional[str] = None,
+        race_leg=None,
+        prompt_tokens: int = 0,
         **kwargs
     ):
         """
@@ -240,6 +258,11 @@ class ChatRequestHandler:
             temperature: Temperature
             response_format: Normalized API response_format dict, or None
             provider: Resolved provider name (drives strict-schema routing)
+            race_leg: Race leg this call runs in; the response is streamed
+                so the leg can be cancelled mid-generation. If the provider
+                rejects the streamed request (400/422), it is retried
+                unstreamed and the provider is no longer streamed
+            prompt_tokens: Estimated input tokens, billed if the leg is cancelled
             **kwargs: Additional parameters
 
         Returns:
@@ -269,4 +292,69 @@ class ChatRequestHandler:
         params.update(kwargs)
 
         logger.debug(f"Making chat completion request with model: {model}")
-        return client.chat.completions.create(**params)
+        if race_leg is None or provider in self._unstreamable_providers:
+            return client.chat.completions.create(**params)
+
+        from openai import BadRequestError, UnprocessableEntityError
+
+        try:
+            return self._stream_api_call(client, params, race_leg, prompt_tokens)
+        except (BadRequestError, UnprocessableEntityError) as e:
+            logger.warning(f"Streamed race leg rejected by {provider}, retrying unstreamed: {e}")
+
+        response = client.chat.completions.create(**params)
+        # Only the stream parameters were the problem: stop streaming here
+        self._unstreamable_providers.add(provider)
+        return response
+
+    def _stream_api_call(self, client, params: dict, leg, prompt_tokens: int):
+        """
+        Make the API call as a stream that a lost race leg can hang up.
+
+        The stream's ``close`` is registered on the leg, so cancelling it
+        drops the connection and the provider stops generating. Chunks are
+        accumulated into a regular ``ChatCompletion``; like the unstreamed
+        call, a ``length`` or ``content_filter`` finish is returned, not
+        raised, so callers can inspect ``finish_reason``.
+
+        Raises:
+            RaceCancelled: If the leg was cancelled before or during the call
+        """
+        from openai import ContentFilterFinishReasonError, LengthFinishReasonError
+        from openai.lib.streaming.chat import ChatCompletionStreamState
+        from openai.types.chat import ChatCompletion
+
+        leg.check()
+        stream = client.chat.completions.create(
+            **{**params, "stream": True, "stream_options": {"include_usage": True}}
+        )
+        state = ChatCompletionStreamState()
+        chunks = 0
+        leg.on_cancel(stream.close)
+        try:
+            for chunk in stream:
+                if leg.cancelled:
+                    break
+                state.handle_chunk(chunk)
+                chunks += 1
+        except Exception:
+            if not leg.cancelled:
+                raise
+        finally:
+            leg.discard(stream.close)
+            stream.close()
+
+        if leg.cancelled:
+            # Billed so far: the prompt plus roughly one token per chunk
+            leg.add_tokens(prompt_tokens + chunks)
+            raise RaceCancelled(f"race leg {leg.model}#{leg.index} cancelled mid-stream")
+        try:
+            return state.get_final_completion()
+        except LengthFinishReasonError as e:
+            return e.completion
+        except ContentFilterFinishReasonError:
+            # The error carries no completion: build it from the chunks
+            snapshot = state.current_completion_snapshot.model_dump()
+            for choice in snapshot["choices"]:
+                choice["message"]["role"] = choice["message"].get("role") or "assistant"
+            return ChatCompletion.model_validate(snapshot)
@@ -5,7 +5,8 @@ Handles embedding generation requests with provider-specific strategies.
 """
 
 import logging
-from typing import TYPE_CHECKING, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Optional
 
 from ..core.types import EmbeddingResponse
 from ..embeddings.mock_embedder import is_mock_embedding
@@ -22,6 +23,13 @@ logger = logging.getLogger(__name__)
 class EmbeddingRequestHandler:
     """Handles embedding generation requests."""
 
+    #: Batch limits for :meth:`generate_embeddings`. Providers cap a request
+    #: at 2048 inputs and ~300k tokens; stay well inside both.
+    BATCH_SIZE = 256
+    BATCH_MAX_CHARS = 200_000
+    #: Batch requests in flight at once.
+    MAX_CONCURRENCY = 4
+
     def __init__(
         self,
         provider_manager: 'ProviderManager',
@@ -147,15 +155,16 @@ class EmbeddingRequestHandler:
         *,
         dimensions: int | None = None,
     ) -> list[EmbeddingResponse]:
-        """Embed MANY texts, sending only the cache misses, in ONE request.
+        """Embed MANY texts, sending only the cache misses, in batched requests.
 
         Same cache keys, same stats, same provider routing as
         :meth:`generate_embedding` — this is that method's batch twin, not a
         second embedding path. Returns one response per input, in input order.
 
-        Only the OpenRouter embedder has a real batch endpoint wired up (it is
-        the project's provider). Every other route falls back to a serial loop,
-        which is exactly the old behaviour — correct, just not fast.
+        The cache is read with one bulk lookup and written in one transaction.
+        Misses are deduplicated, split into requests of at most
+        ``BATCH_SIZE`` texts / ``BATCH_MAX_CHARS`` characters, and sent with
+        up to ``MAX_CONCURRENCY`` requests in flight (OpenRouter and OpenAI).
 
         Args:
             texts: Texts to embed. Must not contain empty strings; an empty text
@@ -178,25 +187,23 @@ class EmbeddingRequestHandler:
 
         cache_model = model if dimensions is None else f"{model}@{dimensions}"
 
-        # Resolve from cache first. Only what is left over costs a round-trip —
-        # this is what makes a re-run of a backfill nearly free.
-        resolved: list[EmbeddingResponse | None] = []
-        missing_indices: list[int] = []
-        for index, text in enumerate(texts):
-            cached = self.cache_manager.get_cached_embedding(text, cache_model)
+        # Resolve from cache first, in one bulk lookup. Only what is left over
+        # costs a round-trip — this is what makes a re-run of a backfill nearly free.
+        resolved = self.cache_manager.get_cached_embeddings(texts, cache_model)
+        missing_by_text: dict[str, list[int]] = {}
+        for index, (text, cached) in enumerate(zip(texts, resolved)):
             if cached:
                 self.stats_manager.record_cache_hit()
-                resolved.append(cached)
             else:
                 self.stats_manager.record_cache_miss()
-                resolved.append(None)
-                missing_indices.append(index)
+                # Duplicate inputs are embedded once
+                missing_by_text.setdefault(text, []).append(index)
 
-        if not missing_indices:
-            return [item for item in resolved if item is not None]
+        if not missing_by_text:
+            return list(resolved)
 
-        missing_texts = [texts[i] for i in missing_indices]
-        self.stats_manager.record_request()
+        missing_texts = list(missing_by_text)
+        batches = self._split_batches(missing_texts)
         provider = self.provider_selector.get_provider_for_task("embedding")
 
         try:
@@ -204,46 +211,122 @@ class EmbeddingRequestHandler:
 
             if provider == "openrouter" and self.openrouter_embedder is not None:
                 logger.debug(
-                    "Batch-embedding %d texts via OpenRouter (model=%s)",
-                    len(missing_texts), model,
-                )
-                fresh = self.openrouter_embedder.generate_batch(
-                    client, missing_texts, model, dimensions=dimensions,
+                    "Batch-embedding %d texts via OpenRouter in %d requests (model=%s)",
+                    len(missing_texts), len(batches), model,
                 )
+
+                def embed_batch(batch):
+                    return self.openrouter_embedder.generate_batch(
+                        client, batch, model, dimensions=dimensions,
+                    )
             elif provider == "openai" and client is not None:
-                # The OpenAI embedder has no batch method (and no `dimensions`
-                # parameter). Serial, as before — no provider is worse off than
-                # it was, and the one we actually use is faster.
-                fresh = [
-                    self.openai_embedder.generate(client, text, model)
-                    for text in missing_texts
-                ]
+                # The OpenAI embedder has no `dimensions` parameter.
+                logger.debug(
+                    "Batch-embedding %d texts via OpenAI in %d requests (model=%s)",
+                    len(missing_texts), len(batches), model,
+                )
+
+                def embed_batch(batch):
+                    return self.openai_embedder.generate_batch(client, batch, model)
             else:
                 logger.warning(
                     "No real embedding provider for %r — falling back to mock",
                     provider,
                 )
-                fresh = [
-                    self.mock_embedder.generate(text, model) for text in missing_texts
-                ]
+                batches = [missing_texts]
 
-            for index, text, result in zip(missing_indices, missing_texts, fresh):
-                # Same rule as the scalar path: a mock never enters the cache.
-                if not is_mock_embedding(result):
-                    self.cache_manager.cache_embedding_response(result, text, cache_model)
-                resolved[index] = result
+                def embed_batch(batch):
+                    return [self.mock_embedder.generate(text, model) for text in batch]
 
-            self.stats_manager.record_success(
-                tokens=sum(item.tokens for item in fresh),
-                cost=sum(item.cost for item in fresh),
-                model=model,
-                provider=provider,
+            fresh, error = self._run_batches(embed_batch, batches)
+
+            for text, result in fresh.items():
+                for index in missing_by_text[text]:
+                    resolved[index] = result
+
+            # Same rule as the scalar path: a mock never enters the cache.
+            # Completed batches are cached even if another one failed, so a
+            # retry only pays for what is still missing.
+            self.cache_manager.cache_embedding_responses(
+                [(text, result) for text, result in fresh.items() if not is_mock_embedding(result)],
+                cache_model,
             )
 
-            return [item for item in resolved if item is not None]
+            if fresh:
+                self.stats_manager.record_success(
+                    tokens=sum(item.tokens for item in fresh.values()),
+                    cost=sum(item.cost for item in fresh.values()),
+                    model=model,
+                    provider=provider,
+                )
+            if error is not None:
+                raise error
+
+            return list(resolved)
 
         except Exception as e:
             self.stats_manager.record_failure()
             error_msg = f"Batch embedding generation failed: {e}"
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
+
+    def _split_batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into requests of at most BATCH_SIZE texts and BATCH_MAX_CHARS characters."""
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        chars = 0
+        for text in texts:
+            if batch and (len(batch) >= self.BATCH_SIZE or chars + len(text) > self.BATCH_MAX_CHARS):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(text)
+            chars += len(text)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _run_batches(
+        self,
+        embed_batch: "Callable[[list[str]], list[EmbeddingResponse]]",
+        batches: list[list[str]],
+    ) -> "tuple[dict[str, EmbeddingResponse], Exception | None]":
+        """
+        Run batches with at most MAX_CONCURRENCY requests in flight.
+
+        Returns:
+            ({text: response} for the batches that succeeded, first error or None)
+        """
+        fresh: dict[str, EmbeddingResponse] = {}
+        error: Exception | None = None
+
+        def collect(batch, results):
+            for text, result in zip(batch, results):
+                fresh[text] = result
+
+        for _ in batches:
+            self.stats_manager.record_request()
+
+        if len(batches) == 1 or self.MAX_CONCURRENCY <= 1:
+            for batch in batches:
+                try:
+                    collect(batch, embed_batch(batch))
+                except Exception as e:
+                    error = e
+                    break
+            return fresh, error
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENCY, len(batches)),
+            thread_name_prefix="llm-embed",
+        ) as executor:
+            futures = {executor.submit(embed_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                try:
+                    collect(futures[future], future.result())
+                except Exception as e:
+                    if error is None:
+                        error = e
+                        # Don't start batches that haven't begun yet
+                        for pending in futures:
+                            pending.cancel()
+        return fresh, error
@@ -0,0 +1,130 @@
+"""
+Benchmark: embedding a corpus against a local stub embedding server.
+
+The stub serves an OpenAI-compatible ``/v1/embeddings`` endpoint with a
+fixed per-request latency; the real OpenAI SDK client talks to it over HTTP.
+Compares, for a cold cache and then a warm re-run:
+- before: one cache lookup and one ``/embeddings`` request per text, serially
+  (the previous OpenAI route of ``generate_embeddings``)
+- after: ``EmbeddingRequestHandler.generate_embeddings`` — one bulk cache
+  lookup, misses in batches of ``BATCH_SIZE`` with ``MAX_CONCURRENCY`` in flight
+
+Usage:
+    python -m django_cfg.modules.django_llm.client.embedding_handler_bench
+"""
+
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+# The serial path pays this per text, so keep "before" corpora small
+BEFORE_SIZES = (500, 2000)
+SIZES = (500, 2000, 10000)
+LATENCY = 0.01  # seconds per request
+DIMENSIONS = 64
+
+
+class _StubEmbeddingsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        time.sleep(LATENCY)
+        self.server.requests += 1
+        payload = json.dumps({
+            "object": "list",
+            "model": body["model"],
+            "data": [
+                {"object": "embedding", "index": i, "embedding": [len(text) / 100.0] * DIMENSIONS}
+                for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubEmbeddingsHandler)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _handler(client, cache_dir):
+    from ..embeddings.mock_embedder import MockEmbedder
+    from ..embeddings.openai_embedder import OpenAIEmbedder
+    from ..storage.cache_manager import RequestCacheManager
+    from .embedding_handler import EmbeddingRequestHandler
+    from .stats import StatsManager
+
+    return EmbeddingRequestHandler(
+        provider_manager=SimpleNamespace(get_client=lambda provider: client),
+        provider_selector=SimpleNamespace(get_provider_for_task=lambda task: "openai"),
+        cache_manager=RequestCacheManager(cache_dir=cache_dir, max_cache_size=100000),
+        stats_manager=StatsManager(),
+        openai_embedder=OpenAIEmbedder(),
+        mock_embedder=MockEmbedder(),
+    )
+
+
+def _embed_before(handler, client, texts, model):
+    """The previous per-text route: lookup, request and cache write per text."""
+    results = []
+    for text in texts:
+        cached = handler.cache_manager.get_cached_embedding(text, model)
+        if cached is None:
+            cached = handler.openai_embedder.generate(client, text, model)
+            handler.cache_manager.cache_embedding_response(cached, text, model)
+        results.append(cached)
+    return results
+
+
+def _timed(server, embed) -> tuple:
+    server.requests = 0
+    started = time.perf_counter()
+    embed()
+    return time.perf_counter() - started, server.requests
+
+
+def main() -> None:
+    import logging
+
+    from openai import OpenAI
+
+    logging.getLogger("django_cfg.modules.django_llm.registry.pricing").setLevel(logging.ERROR)
+    server = _start_stub()
+    client = OpenAI(base_url=f"http://127.0.0.1:{server.server_port}/v1", api_key="stub", max_retries=0)
+    model = "text-embedding-3-small"
+
+    print(f"Stub server latency {LATENCY * 1000:.0f} ms/request")
+    print(f"{'texts':>6}  {'path':>6}  {'cold s':>7}  {'requests':>8}  {'warm s':>7}")
+
+    for count in SIZES:
+        texts = [f"Document {n}: " + "lorem ipsum " * (n % 20 + 1) for n in range(count)]
+        paths = [("after", lambda h: h.generate_embeddings(texts, model))]
+        if count in BEFORE_SIZES:
+            paths.insert(0, ("before", lambda h: _embed_before(h, client, texts, model)))
+
+        for name, embed in paths:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                handler = _handler(client, cache_dir)
+                cold_s, requests = _timed(server, lambda: embed(handler))
+                warm_s, _ = _timed(server, lambda: embed(handler))
+            print(f"{count:>6,}  {name:>6}  {cold_s:>7.2f}  {requests:>8,}  {warm_s:>7.3f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
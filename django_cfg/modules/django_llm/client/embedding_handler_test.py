@@ -0,0 +1,126 @@
+"""
+Tests for bulk-cached, batched embedding generation.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ..embeddings.mock_embedder import MockEmbedder
+from ..embeddings.openai_embedder import OpenAIEmbedder
+from ..storage.cache_manager import RequestCacheManager
+from .embedding_handler import EmbeddingRequestHandler
+from .stats import StatsManager
+
+
+class FakeEmbeddingsAPI:
+    """`client.embeddings` stand-in: returns items in reverse order, tracks concurrency."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, input, model):
+        with self._lock:
+            self.requests.append(list(input))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on is not None and self.fail_on in input:
+                raise ConnectionError("provider unavailable")
+            data = [
+                SimpleNamespace(index=index, embedding=[float(len(text)), float(index)])
+                for index, text in enumerate(input)
+            ]
+            return SimpleNamespace(data=data[::-1], usage=SimpleNamespace(total_tokens=len(input)))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def make_handler(tmp_path):
+    def make(api):
+        client = SimpleNamespace(embeddings=api)
+        handler = EmbeddingRequestHandler(
+            provider_manager=SimpleNamespace(get_client=lambda provider: client),
+            provider_selector=SimpleNamespace(get_provider_for_task=lambda task: "openai"),
+            cache_manager=RequestCacheManager(cache_dir=tmp_path, max_cache_size=10000),
+            stats_manager=StatsManager(),
+            openai_embedder=OpenAIEmbedder(),
+            mock_embedder=MockEmbedder(),
+        )
+        return handler
+
+    return make
+
+
+class TestGenerateEmbeddings:
+    """Test cache use, batching and concurrency."""
+
+    def test_requests_only_misses_in_bounded_batches(self, make_handler, monkeypatch):
+        api = FakeEmbeddingsAPI(delay=0.02)
+        handler = make_handler(api)
+        monkeypatch.setattr(handler, "BATCH_SIZE", 10)
+        monkeypatch.setattr(handler, "MAX_CONCURRENCY", 3)
+        handler.generate_embeddings(["cached 1", "cached 2"])
+        api.requests.clear()
+
+        texts = ["cached 1"] + [f"text {n}" for n in range(45)] + ["text 3", "cached 2"]
+        results = handler.generate_embeddings(texts)
+
+        # Results line up with the inputs despite reordered provider responses
+        assert [r.text_length for r in results] == [len(t) for t in texts]
+        assert results[4].embedding == results[-2].embedding  # "text 3" twice
+        requested = [text for batch in api.requests for text in batch]
+        assert sorted(requested) == sorted(f"text {n}" for n in range(45))
+        assert max(len(batch) for batch in api.requests) == 10
+        assert api.max_in_flight == 3
+
+        api.requests.clear()
+        assert [r.embedding for r in handler.generate_embeddings(texts)] == [r.embedding for r in results]
+        assert api.requests == []
+
+    def test_character_limit_splits_batches(self, make_handler, monkeypatch):
+        api = FakeEmbeddingsAPI()
+        handler = make_handler(api)
+        monkeypatch.setattr(handler, "BATCH_MAX_CHARS", 25)
+
+        handler.generate_embeddings(["a" * 10, "b" * 10, "c" * 10, "d" * 30])
+
+        assert [len(batch) for batch in api.requests] == [2, 1, 1]
+
+    def test_failed_batch_keeps_completed_ones_cached(self, make_handler, monkeypatch):
+        api = FakeEmbeddingsAPI(fail_on="text 7")
+        handler = make_handler(api)
+        monkeypatch.setattr(handler, "BATCH_SIZE", 5)
+        monkeypatch.setattr(handler, "MAX_CONCURRENCY", 1)
+        texts = [f"text {n}" for n in range(10)]
+
+        with pytest.raises(RuntimeError, match="provider unavailable"):
+            handler.generate_embeddings(texts)
+
+        api.fail_on = None
+        api.requests.clear()
+        handler.generate_embeddings(texts)
+        assert api.requests == [texts[5:]]
+
+
+def test_llm_cache_bulk_roundtrip(tmp_path):
+    manager = RequestCacheManager(cache_dir=tmp_path, cache_ttl=60)
+    cache = manager.cache
+    cache.set_many([("h1", {"v": 1}, "m"), ("h2", {"v": 2}, "m"), ("bad", {"v": object()}, "m")])
+    cache.memory_cache.clear()
+    cache._conn.execute("UPDATE llm_responses SET expires_at = 0 WHERE request_hash = 'h2'")
+    cache._conn.commit()
+
+    assert cache.get_many(["h1", "h2", "h1", "missing"]) == {"h1": {"v": 1}}
+    # Expired rows are removed on read
+    assert cache._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] == 1
@@ -30,9 +30,10 @@ from .types import (
     TokenUsage,
     ValidationResult,
 )
-from .tokenizer import Tokenizer
+from .tokenizer import ConversationTokenCounter, Tokenizer
 
 __all__ = [
+    "ConversationTokenCounter",
     "Tokenizer",
     # types
     'CacheInfo',
@@ -2,22 +2,51 @@
 Token counting utilities using tiktoken.
 
 Provides token counting functionality for various LLM models.
+
+Counts are memoized in an LRU keyed by (encoding, content hash), so system
+prompts and history turns that are re-checked against the context budget on
+every request are encoded once. `count_many` encodes the misses of a batch in
+one `encode_batch` call, and `ConversationTokenCounter` keeps a running total
+as turns are appended.
 """
 
+import hashlib
 import logging
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Per-message formatting overhead added by count_messages_tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _format_message(message: Dict[str, str]) -> str:
+    """Format message as it would be sent to API"""
+    role = message.get('role', 'user')
+    content = message.get('content', '')
+    return f"{role}\n{content}"
+
 
 class Tokenizer:
     """Token counting utility using tiktoken."""
 
-    def __init__(self):
-        """Initialize tokenizer with encoder cache."""
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize tokenizer with encoder cache.
+
+        Args:
+            cache_size: Maximum number of memoized token counts (0 disables)
+        """
         self.encoders = {}
+        self.cache_size = cache_size
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _get_encoder(self, model: str):
         """Get tiktoken encoder for model."""
@@ -44,41 +73,158 @@ class Tokenizer:
         else:
             return "cl100k_base"
 
+    def _cache_key(self, encoding_name: str, text: str) -> Tuple[str, bytes]:
+        """LRU key: encoding plus a content hash (cheap next to BPE encoding)."""
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return encoding_name, digest
+
     def count_tokens(self, text: str, model: str) -> int:
         """
         Count tokens in text using tiktoken.
-        
+
         Args:
             text: Text to count tokens for
             model: Model name for encoding
-            
+
         Returns:
             Number of tokens
         """
+        return self.count_many([text], model)[0]
+
+    def count_many(self, texts: Iterable[str], model: str) -> List[int]:
+        """
+        Count tokens for several texts.
+
+        Cached counts are reused; the remaining distinct texts are encoded
+        in one `encode_batch` call.
+
+        Args:
+            texts: Texts to count tokens for
+            model: Model name for encoding
+
+        Returns:
+            Token count per text, in input order
+        """
+        texts = list(texts)
         encoder = self._get_encoder(model)
-        return len(encoder.encode(text))
+        if self.cache_size <= 0:
+            return self._encode_counts(encoder, texts)
+
+        keys = [self._cache_key(encoder.name, text) for text in texts]
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: Dict[Tuple[str, bytes], List[int]] = {}
+        with self._lock:
+            for index, key in enumerate(keys):
+                count = self._counts.get(key)
+                if count is None:
+                    missing.setdefault(key, []).append(index)
+                else:
+                    self._counts.move_to_end(key)
+                    counts[index] = count
+            self.cache_hits += len(texts) - sum(len(indices) for indices in missing.values())
+            self.cache_misses += len(missing)
+
+        if missing:
+            miss_keys = list(missing)
+            fresh = self._encode_counts(encoder, [texts[missing[key][0]] for key in miss_keys])
+            with self._lock:
+                for key, count in zip(miss_keys, fresh):
+                    for index in missing[key]:
+                        counts[index] = count
+                    self._counts[key] = count
+                    self._counts.move_to_end(key)
+                while len(self._counts) > self.cache_size:
+                    self._counts.popitem(last=False)
+
+        return counts
+
+    @staticmethod
+    def _encode_counts(encoder, texts: List[str]) -> List[int]:
+        if len(texts) == 1:
+            return [len(encoder.encode(texts[0]))]
+        return [len(tokens) for tokens in encoder.encode_batch(texts)]
 
     def count_messages_tokens(self, messages: List[Dict[str, str]], model: str) -> int:
         """
         Count total tokens in messages.
-        
+
         Args:
             messages: List of chat messages
             model: Model name for encoding
-            
+
         Returns:
             Total number of tokens
         """
-        total_tokens = 0
-
-        for message in messages:
-            # Format message as it would be sent to API
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            formatted_message = f"{role}\n{content}"
-            total_tokens += self.count_tokens(formatted_message, model)
+        if not messages:
+            return 0
+        total_tokens = sum(self.count_many([_format_message(m) for m in messages], model))
 
         # Add overhead for message formatting
-        total_tokens += len(messages) * 4  # Rough estimate for message overhead
+        total_tokens += len(messages) * MESSAGE_OVERHEAD_TOKENS  # Rough estimate for message overhead
 
         return total_tokens
+
+    def conversation_counter(
+        self,
+        model: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+    ) -> "ConversationTokenCounter":
+        """Running token total for a conversation (see ConversationTokenCounter)."""
+        counter = ConversationTokenCounter(self, model)
+        if messages:
+            counter.extend(messages)
+        return counter
+
+    def clear_cache(self) -> None:
+        """Drop memoized token counts."""
+        with self._lock:
+            self._counts.clear()
+
+    def get_cache_info(self) -> Dict[str, int]:
+        """Token count cache statistics."""
+        return {
+            "size": len(self._counts),
+            "max_size": self.cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+
+
+class ConversationTokenCounter:
+    """
+    Incremental token count for a growing conversation.
+
+    `total` always equals `Tokenizer.count_messages_tokens(messages)` for
+    the messages added so far, but appending a turn only counts that turn.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, model: str):
+        self.tokenizer = tokenizer
+        self.model = model
+        self.message_tokens: List[int] = []
+        self.total = 0
+
+    def append(self, message: Dict[str, str]) -> int:
+        """Add a turn. Returns the new total."""
+        return self.extend([message])
+
+    def extend(self, messages: List[Dict[str, str]]) -> int:
+        """Add several turns. Returns the new total."""
+        counts = self.tokenizer.count_many([_format_message(m) for m in messages], self.model)
+        for count in counts:
+            self.message_tokens.append(count + MESSAGE_OVERHEAD_TOKENS)
+        self.total += sum(counts) + len(counts) * MESSAGE_OVERHEAD_TOKENS
+        return self.total
+
+    def pop(self, index: int = -1) -> int:
+        """Remove a turn (e.g. when trimming history). Returns the new total."""
+        self.total -= self.message_tokens.pop(index)
+        return self.total
+
+    def reset(self) -> None:
+        """Forget all turns."""
+        self.message_tokens.clear()
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.message_tokens)
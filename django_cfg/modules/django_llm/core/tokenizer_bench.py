@@ -0,0 +1,101 @@
+"""
+Benchmark: context-budget checks over a 200-turn conversation.
+
+After every turn the whole history is counted again, as the chat handler's
+budget check does. Compares:
+- before: every message re-encoded on every check (the previous Tokenizer)
+- cached: `Tokenizer.count_messages_tokens` with the count LRU
+- incremental: `ConversationTokenCounter.append` per turn
+
+Uses cl100k_base when its BPE file is available (cached or downloadable),
+otherwise a synthetic byte-pair encoding so the benchmark runs offline.
+
+Usage:
+    python -m django_cfg.modules.django_llm.core.tokenizer_bench
+"""
+
+import string
+import time
+
+import tiktoken
+
+from .tokenizer import Tokenizer
+
+TURNS = 200
+MODEL = "gpt-4o"
+
+
+def _encoding():
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        ranks = {bytes([b]): b for b in range(256)}
+        alphabet = (string.ascii_letters + " ").encode()
+        for a in alphabet:
+            for b in alphabet:
+                ranks.setdefault(bytes([a, b]), len(ranks))
+        return tiktoken.Encoding(
+            name="synthetic_bigram",
+            pat_str=r"""'s|'t|'re|'ve|'m|'ll|'d| ?\w+| ?\d+| ?[^\s\w]+|\s+""",
+            mergeable_ranks=ranks,
+            special_tokens={},
+        )
+
+
+def _conversation():
+    system = {"role": "system", "content": "You are a meticulous assistant. " * 60}
+    turns = []
+    for n in range(TURNS):
+        role = "user" if n % 2 == 0 else "assistant"
+        body = f"Turn {n}. " + "The quick brown fox jumps over the lazy dog. " * (5 + n % 25)
+        turns.append({"role": role, "content": body})
+    return system, turns
+
+
+def _count_before(encoder, messages) -> int:
+    total = 0
+    for message in messages:
+        total += len(encoder.encode(f"{message.get('role', 'user')}\n{message.get('content', '')}"))
+    return total + len(messages) * 4
+
+
+def main() -> None:
+    encoder = _encoding()
+    system, turns = _conversation()
+    print(f"{TURNS}-turn conversation, full history counted after every turn (encoding: {encoder.name})")
+
+    results = {}
+
+    started = time.perf_counter()
+    history = [system]
+    for turn in turns:
+        history.append(turn)
+        results["before"] = _count_before(encoder, history)
+    before_s = time.perf_counter() - started
+
+    tokenizer = Tokenizer()
+    tokenizer.encoders[MODEL] = encoder
+    started = time.perf_counter()
+    history = [system]
+    for turn in turns:
+        history.append(turn)
+        results["cached"] = tokenizer.count_messages_tokens(history, MODEL)
+    cached_s = time.perf_counter() - started
+
+    tokenizer = Tokenizer()
+    tokenizer.encoders[MODEL] = encoder
+    started = time.perf_counter()
+    counter = tokenizer.conversation_counter(MODEL, [system])
+    for turn in turns:
+        results["incremental"] = counter.append(turn)
+    incremental_s = time.perf_counter() - started
+
+    assert len(set(results.values())) == 1, results
+    print(f"{'path':>12}  {'total ms':>9}  {'per check ms':>12}")
+    for name, seconds in (("before", before_s), ("cached", cached_s), ("incremental", incremental_s)):
+        print(f"{name:>12}  {seconds * 1000:>9.1f}  {seconds * 1000 / TURNS:>12.3f}")
+    print(f"final history: {results['before']:,} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Tests for memoized and batched token counting.
+"""
+
+import pytest
+import tiktoken
+
+from .tokenizer import Tokenizer
+
+MODEL = "gpt-4o-mini"
+
+
+def _offline_encoding(name="bytes_test"):
+    """Byte-level BPE with no merges: one token per UTF-8 byte, no download needed."""
+    return tiktoken.Encoding(
+        name=name,
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([b]): b for b in range(256)},
+        special_tokens={},
+    )
+
+
+class CountingEncoding:
+    """Wraps an encoding and counts how many texts reach the BPE encoder."""
+
+    def __init__(self, encoding):
+        self._encoding = encoding
+        self.name = encoding.name
+        self.encoded = 0
+        self.batches = 0
+
+    def encode(self, text):
+        self.encoded += 1
+        return self._encoding.encode(text)
+
+    def encode_batch(self, texts):
+        self.batches += 1
+        self.encoded += len(texts)
+        return self._encoding.encode_batch(texts)
+
+
+@pytest.fixture
+def tokenizer():
+    tokenizer = Tokenizer(cache_size=100)
+    tokenizer.encoders[MODEL] = CountingEncoding(_offline_encoding())
+    return tokenizer
+
+
+def _conversation(turns):
+    messages = [{"role": "system", "content": "You are a helpful assistant."}]
+    for n in range(turns):
+        role = "user" if n % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": f"turn {n}: " + "word " * n})
+    return messages
+
+
+class TestTokenizer:
+    """Test the count cache and batch counting."""
+
+    def test_counts_are_memoized(self, tokenizer):
+        encoder = tokenizer.encoders[MODEL]
+
+        assert tokenizer.count_tokens("héllo", MODEL) == 6
+        assert tokenizer.count_tokens("héllo", MODEL) == 6
+        assert encoder.encoded == 1
+        assert tokenizer.get_cache_info()["hits"] == 1
+
+    def test_count_many_encodes_distinct_misses_in_one_batch(self, tokenizer):
+        encoder = tokenizer.encoders[MODEL]
+        tokenizer.count_tokens("cached", MODEL)
+
+        counts = tokenizer.count_many(["a", "bb", "cached", "a", "ccc"], MODEL)
+
+        assert counts == [1, 2, 6, 1, 3]
+        assert (encoder.encoded, encoder.batches) == (1 + 3, 1)
+
+    def test_cache_is_per_encoding_and_bounded(self, tokenizer):
+        tokenizer.encoders["other"] = CountingEncoding(_offline_encoding("other"))
+        tokenizer.count_tokens("same text", MODEL)
+        tokenizer.count_tokens("same text", "other")
+        assert tokenizer.encoders["other"].encoded == 1
+
+        tokenizer.count_many([f"text {n}" for n in range(150)], MODEL)
+        assert tokenizer.get_cache_info()["size"] == 100
+
+    def test_messages_and_incremental_counter_agree(self, tokenizer):
+        messages = _conversation(30)
+        expected = sum(len(f"{m['role']}\n{m['content']}".encode()) + 4 for m in messages)
+
+        assert tokenizer.count_messages_tokens(messages, MODEL) == expected
+
+        counter = tokenizer.conversation_counter(MODEL, messages[:10])
+        for message in messages[10:]:
+            counter.append(message)
+        assert counter.total == expected
+        assert len(counter) == len(messages)
+        assert counter.pop(0) == tokenizer.count_messages_tokens(messages[1:], MODEL)
+
+    def test_cache_can_be_disabled(self):
+        tokenizer = Tokenizer(cache_size=0)
+        encoder = tokenizer.encoders[MODEL] = CountingEncoding(_offline_encoding())
+
+        assert tokenizer.count_many(["x", "x"], MODEL) == [1, 1]
+        assert tokenizer.count_tokens("x", MODEL) == 1
+        assert encoder.encoded == 3
+        assert tokenizer.get_cache_info()["size"] == 0
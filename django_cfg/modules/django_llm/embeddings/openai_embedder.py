@@ -76,3 +76,58 @@ class OpenAIEmbedder:
             dimension=len(embedding_vector),
             response_time=response_time
         )
+
+    def generate_batch(self, client, texts: list[str], model: str) -> list[EmbeddingResponse]:
+        """
+        Generate embeddings for many texts in one API call.
+
+        Returns one response per input, in input order. The request's token
+        usage and cost are attributed to the first response, as in
+        ``OpenRouterEmbedder.generate_batch``.
+
+        Args:
+            client: OpenAI client instance
+            texts: Non-empty texts to embed
+            model: Embedding model to use
+        """
+        if not texts:
+            return []
+
+        start_time = time.time()
+
+        # Remove provider prefix if present
+        api_model = model
+        if model.startswith("openai/"):
+            api_model = model.replace("openai/", "")
+
+        response = client.embeddings.create(
+            input=list(texts),
+            model=api_model
+        )
+
+        if len(response.data) != len(texts):
+            raise RuntimeError(f"expected {len(texts)} embeddings, got {len(response.data)}")
+
+        # Items carry their input index; don't rely on response order
+        ordered = sorted(response.data, key=lambda item: item.index)
+        tokens_used = response.usage.total_tokens
+        cost = calculate_embedding_cost(tokens_used, model, self.models_cache)
+        response_time = time.time() - start_time
+
+        logger.debug(
+            f"Generated {len(texts)} embeddings: {tokens_used} tokens, "
+            f"${cost:.6f}, {response_time:.2f}s"
+        )
+
+        return [
+            EmbeddingResponse(
+                embedding=item.embedding,
+                tokens=tokens_used if position == 0 else 0,
+                cost=cost if position == 0 else 0.0,
+                model=model,
+                text_length=len(text),
+                dimension=len(item.embedding),
+                response_time=response_time
+            )
+            for position, (item, text) in enumerate(zip(ordered, texts))
+        ]
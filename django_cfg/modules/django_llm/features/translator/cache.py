@@ -1,160 +1,260 @@
 """
 Translation Cache Manager - stores translations by language pairs like in unreal_llm
+
+The persistent layer is a SQLite store (WAL mode) keyed by
+(lang_pair, text hash), so a lookup reads one row and a translation job
+writes all its new entries in one transaction. An in-memory ``TTLCache``
+sits in front of it as an L1 read cache.
+
+Older versions kept one ``{source}→{target}.json`` file per language pair;
+those files are imported on first use and renamed to ``*.json.migrated``.
 """
 
 import hashlib
 import json
 import logging
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# SQLite busy_timeout in milliseconds — wait rather than fail when another
+# process holds a write lock.
+_BUSY_TIMEOUT_MS = 5000
+
+# Stay well below SQLite's host-parameter limit in IN (...) lookups
+_LOOKUP_CHUNK = 500
+
+
 class TranslationCacheManager:
-    """Manages translation caching with TTL and file persistence (per language pair)"""
+    """Manages translation caching with TTL and SQLite persistence (per language pair)"""
 
     def __init__(self, cache_dir: Optional[str] = None, ttl_hours: int = 24):
         """
         Initialize translation cache manager
-        
+
         Args:
             cache_dir: Directory for file cache
-            ttl_hours: Time-to-live for cache in hours
+            ttl_hours: Time-to-live for the in-memory cache in hours
         """
         # Default cache directory inside the package module structure
         if cache_dir is None:
             # Resolve to the modules.django_llm package root
             module_dir = Path(__file__).parent.parent.parent.parent  # llm/features/translator/cache.py -> modules.django_llm pkg root
             default_cache_dir = module_dir / ".cache" / "llm_translate"
-
-            # Create cache directory if it doesn't exist
-            default_cache_dir.mkdir(parents=True, exist_ok=True)
         else:
             default_cache_dir = Path(cache_dir)
 
+        # Create cache directory if it doesn't exist
+        default_cache_dir.mkdir(parents=True, exist_ok=True)
+
         self.cache_dir = default_cache_dir
+        self.cache_file = self.cache_dir / "translations.sqlite3"
         self.ttl_seconds = ttl_hours * 3600
 
         # In-memory cache with TTL (like in unreal_llm)
         self._memory_cache = TTLCache(maxsize=1000, ttl=self.ttl_seconds)
 
-        logger.info(f"Translation cache initialized: {self.cache_dir}")
+        # One connection shared by the translator's threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        self._init_db()
+        self.migrate_json_files()
+
+        logger.info(f"Translation cache initialized: {self.cache_file}")
+
+    def _init_db(self) -> None:
+        """Create the schema and apply pragmas for multi-process safety."""
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                lang_pair   TEXT NOT NULL,
+                text_hash   TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                created_at  REAL NOT NULL,
+                PRIMARY KEY (lang_pair, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def _get_lang_pair(self, source_lang: str, target_lang: str) -> str:
+        """Language pair key (like the old per-pair file names)"""
+        return f"{source_lang}→{target_lang}"
 
     def _get_cache_file(self, source_lang: str, target_lang: str) -> Path:
-        """Get cache file path for language pair (like in unreal_llm)"""
-        return self.cache_dir / f"{source_lang}→{target_lang}.json"
+        """Get legacy JSON cache file path for language pair (like in unreal_llm)"""
+        return self.cache_dir / f"{self._get_lang_pair(source_lang, target_lang)}.json"
 
     def _get_text_hash(self, text: str) -> str:
         """Generate hash for text"""
         return hashlib.md5(text.encode('utf-8')).hexdigest()
 
-    def _load_file_cache(self, source_lang: str, target_lang: str) -> Dict[str, Any]:
-        """Load translations from file cache"""
-        cache_file = self._get_cache_file(source_lang, target_lang)
-
-        if not cache_file.exists():
-            return {}
-
-        try:
-            with open(cache_file, encoding='utf-8') as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
-            logger.warning(f"Failed to load cache file {cache_file}: {e}")
-            return {}
-
-    def _save_file_cache(self, source_lang: str, target_lang: str, cache_data: Dict[str, Any]):
-        """Save translations to file cache"""
-        cache_file = self._get_cache_file(source_lang, target_lang)
-
-        try:
-            # Ensure directory exists
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-
-        except OSError as e:
-            logger.error(f"Failed to save cache file {cache_file}: {e}")
+    def _write(self, lang_pair: str, entries: Dict[str, str], replace: bool = True) -> None:
+        """Upsert {text_hash: translation} for a language pair in one transaction."""
+        if not entries:
+            return
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"{verb} INTO translations (lang_pair, text_hash, translation, created_at) VALUES (?, ?, ?, ?)",
+                    [(lang_pair, text_hash, translation, now) for text_hash, translation in entries.items()],
+                )
 
     def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
         """Get translation from cache"""
         text_hash = self._get_text_hash(text)
-        cache_key = f"{source_lang}→{target_lang}:{text_hash}"
+        lang_pair = self._get_lang_pair(source_lang, target_lang)
+        cache_key = f"{lang_pair}:{text_hash}"
 
         # Check memory cache first
         if cache_key in self._memory_cache:
             return self._memory_cache[cache_key]
 
-        # Check file cache
-        file_cache = self._load_file_cache(source_lang, target_lang)
-        if text_hash in file_cache:
-            translation = file_cache[text_hash]
-            # Store in memory cache
-            self._memory_cache[cache_key] = translation
-            return translation
+        # Check persistent cache
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation FROM translations WHERE lang_pair = ? AND text_hash = ?",
+                (lang_pair, text_hash),
+            ).fetchone()
+        if row is None:
+            return None
 
-        return None
+        # Store in memory cache
+        self._memory_cache[cache_key] = row[0]
+        return row[0]
+
+    def get_many(self, texts: Iterable[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """
+        Get cached translations for several texts at once.
+
+        Returns:
+            {text: translation} for the texts that are cached
+        """
+        lang_pair = self._get_lang_pair(source_lang, target_lang)
+        found: Dict[str, str] = {}
+        missing: Dict[str, list] = {}
+
+        for text in texts:
+            text_hash = self._get_text_hash(text)
+            cache_key = f"{lang_pair}:{text_hash}"
+            if cache_key in self._memory_cache:
+                found[text] = self._memory_cache[cache_key]
+            else:
+                missing.setdefault(text_hash, []).append(text)
+
+        hashes = list(missing)
+        for start in range(0, len(hashes), _LOOKUP_CHUNK):
+            chunk = hashes[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT text_hash, translation FROM translations "
+                    f"WHERE lang_pair = ? AND text_hash IN ({placeholders})",
+                    (lang_pair, *chunk),
+                ).fetchall()
+            for text_hash, translation in rows:
+                self._memory_cache[f"{lang_pair}:{text_hash}"] = translation
+                for text in missing[text_hash]:
+                    found[text] = translation
+
+        return found
 
     def set(self, text: str, source_lang: str, target_lang: str, translation: str):
         """Store translation in cache"""
-        text_hash = self._get_text_hash(text)
-        cache_key = f"{source_lang}→{target_lang}:{text_hash}"
+        self.set_many({text: translation}, source_lang, target_lang)
+        logger.debug(f"Cached translation: {source_lang}→{target_lang} ({len(text)} chars)")
 
-        # Store in memory cache
-        self._memory_cache[cache_key] = translation
+    def set_many(self, translations: Dict[str, str], source_lang: str, target_lang: str):
+        """Store several translations in one transaction (e.g. all new texts of a JSON document)"""
+        lang_pair = self._get_lang_pair(source_lang, target_lang)
+        entries = {}
+        for text, translation in translations.items():
+            text_hash = self._get_text_hash(text)
+            entries[text_hash] = translation
+            self._memory_cache[f"{lang_pair}:{text_hash}"] = translation
+
+        try:
+            self._write(lang_pair, entries)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save translations for {lang_pair}: {e}")
+
+    def migrate_json_files(self) -> int:
+        """
+        Import legacy per-language-pair JSON files into the SQLite store.
 
-        # Store in file cache
-        file_cache = self._load_file_cache(source_lang, target_lang)
-        file_cache[text_hash] = translation
-        self._save_file_cache(source_lang, target_lang, file_cache)
+        Entries already in the store win. Each imported file is renamed to
+        ``*.json.migrated`` so it is read only once.
 
-        logger.debug(f"Cached translation: {source_lang}→{target_lang} ({len(text)} chars)")
+        Returns:
+            Number of entries imported
+        """
+        imported = 0
+        for cache_file in sorted(self.cache_dir.glob("*→*.json")):
+            try:
+                with open(cache_file, encoding='utf-8') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("expected an object of {hash: translation}")
+                entries = {str(k): v for k, v in data.items() if isinstance(v, str)}
+                self._write(cache_file.stem, entries, replace=False)
+                cache_file.rename(cache_file.with_name(f"{cache_file.name}.migrated"))
+            except (OSError, ValueError, sqlite3.Error) as e:
+                logger.warning(f"Failed to migrate cache file {cache_file}: {e}")
+                continue
+            imported += len(entries)
+            logger.info(f"Migrated {len(entries)} translations from {cache_file.name}")
+        return imported
 
     def clear(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None):
         """Clear cache (all or specific language pair)"""
         if source_lang and target_lang:
             # Clear specific language pair
-            cache_file = self._get_cache_file(source_lang, target_lang)
-            if cache_file.exists():
-                cache_file.unlink()
+            lang_pair = self._get_lang_pair(source_lang, target_lang)
+            with self._lock:
+                with self._conn:
+                    self._conn.execute("DELETE FROM translations WHERE lang_pair = ?", (lang_pair,))
 
             # Clear from memory cache
-            prefix = f"{source_lang}→{target_lang}:"
+            prefix = f"{lang_pair}:"
             keys_to_remove = [k for k in self._memory_cache.keys() if k.startswith(prefix)]
             for key in keys_to_remove:
                 del self._memory_cache[key]
 
-            logger.info(f"Cleared cache for {source_lang}→{target_lang}")
+            logger.info(f"Cleared cache for {lang_pair}")
         else:
             # Clear all caches
             self._memory_cache.clear()
-
-            # Remove all cache files
-            if self.cache_dir.exists():
-                for cache_file in self.cache_dir.glob("*.json"):
-                    cache_file.unlink()
+            with self._lock:
+                with self._conn:
+                    self._conn.execute("DELETE FROM translations")
 
             logger.info("Cleared all translation caches")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        stats = {
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT lang_pair, COUNT(*) FROM translations GROUP BY lang_pair ORDER BY lang_pair"
+            ).fetchall()
+
+        return {
             'memory_cache_size': len(self._memory_cache),
             'cache_dir': str(self.cache_dir),
-            'language_pairs': []
+            'cache_file': str(self.cache_file),
+            'file_size': self.cache_file.stat().st_size if self.cache_file.exists() else 0,
+            'language_pairs': [
+                {'pair': lang_pair, 'translations': count}
+                for lang_pair, count in rows
+            ],
         }
-
-        # Count file caches
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                lang_pair = cache_file.stem
-                file_cache = self._load_file_cache(*lang_pair.split('→'))
-                stats['language_pairs'].append({
-                    'pair': lang_pair,
-                    'translations': len(file_cache),
-                    'file_size': cache_file.stat().st_size
-                })
-
-        return stats
@@ -0,0 +1,103 @@
+"""
+Benchmark: translation cache writes and cold lookups versus entry count.
+
+Compares:
+- before: one JSON file per language pair, re-read and rewritten with
+  indent=2 on every `set`, fully loaded on every memory miss (the previous
+  TranslationCacheManager); O(n²) I/O, so only run at small sizes
+- after: SQLite store, one `set_many` transaction per translation job and
+  one `get_many` lookup per document
+
+Usage:
+    python -m django_cfg.modules.django_llm.features.translator.cache_bench
+"""
+
+import hashlib
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from .cache import TranslationCacheManager
+
+LEGACY_SIZES = (1000, 3000)
+SIZES = (1000, 3000, 10000, 100000)
+# Texts per translation job (e.g. strings in one JSON document)
+JOB_SIZE = 500
+
+
+class _LegacyJsonCache:
+    """The previous file layer: whole-file read on miss, whole-file rewrite on set."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_file = cache_dir / "en→ru.json"
+
+    def _load(self) -> dict:
+        if not self.cache_file.exists():
+            return {}
+        with open(self.cache_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    def set(self, text: str, translation: str) -> None:
+        data = self._load()
+        data[hashlib.md5(text.encode("utf-8")).hexdigest()] = translation
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def get(self, text: str):
+        return self._load().get(hashlib.md5(text.encode("utf-8")).hexdigest())
+
+
+def _texts(count: int) -> list:
+    return [f"Translatable string number {n} with some padding text" for n in range(count)]
+
+
+def _bench_legacy(count: int) -> tuple:
+    texts = _texts(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _LegacyJsonCache(Path(tmp))
+        started = time.perf_counter()
+        for text in texts:
+            cache.set(text, text.upper())
+        write_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for text in texts[:JOB_SIZE]:
+            cache.get(text)
+        read_s = time.perf_counter() - started
+    return write_s, read_s
+
+
+def _bench_sqlite(count: int) -> tuple:
+    texts = _texts(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TranslationCacheManager(cache_dir=tmp)
+        started = time.perf_counter()
+        for start in range(0, count, JOB_SIZE):
+            job = texts[start:start + JOB_SIZE]
+            cache.set_many({text: text.upper() for text in job}, "en", "ru")
+        write_s = time.perf_counter() - started
+
+        cold = TranslationCacheManager(cache_dir=tmp)
+        started = time.perf_counter()
+        found = cold.get_many(texts[-JOB_SIZE:], "en", "ru")
+        read_s = time.perf_counter() - started
+        assert len(found) == min(JOB_SIZE, count)
+    return write_s, read_s
+
+
+def main() -> None:
+    print(f"Write N entries, then look up {JOB_SIZE} texts from a cold process (en→ru)")
+    print(f"{'entries':>8}  {'json write s':>12}  {'json read ms':>12}  {'sqlite write s':>14}  {'sqlite read ms':>14}")
+
+    for count in SIZES:
+        legacy = _bench_legacy(count) if count in LEGACY_SIZES else None
+        write_s, read_s = _bench_sqlite(count)
+        legacy_cols = (
+            f"{legacy[0]:>12.2f}  {legacy[1] * 1000:>12.1f}" if legacy else f"{'-':>12}  {'-':>12}"
+        )
+        print(f"{count:>8,}  {legacy_cols}  {write_s:>14.2f}  {read_s * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
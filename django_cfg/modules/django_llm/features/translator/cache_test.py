@@ -0,0 +1,73 @@
+"""
+Tests for the SQLite-backed translation cache.
+"""
+
+import hashlib
+import json
+
+from .cache import TranslationCacheManager
+
+
+def _hash(text):
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+class TestTranslationCacheManager:
+    """Test lookups, batched writes and persistence."""
+
+    def test_set_many_and_get_many(self, tmp_path):
+        cache = TranslationCacheManager(cache_dir=str(tmp_path))
+        cache.set_many({"hello": "привет", "world": "мир"}, "en", "ru")
+        cache.set("cat", "en", "de", "Katze")
+
+        assert cache.get_many(["hello", "world", "missing"], "en", "ru") == {"hello": "привет", "world": "мир"}
+        assert cache.get("cat", "en", "ru") is None
+        assert cache.get("cat", "en", "de") == "Katze"
+
+        # A new instance reads from disk, not from the memory cache
+        reopened = TranslationCacheManager(cache_dir=str(tmp_path))
+        assert reopened.get_many(["hello", "world"], "en", "ru") == {"hello": "привет", "world": "мир"}
+        assert reopened.get("hello", "en", "ru") == "привет"
+        assert {p["pair"]: p["translations"] for p in reopened.get_stats()["language_pairs"]} == {
+            "en→de": 1,
+            "en→ru": 2,
+        }
+
+    def test_get_many_spans_lookup_chunks(self, tmp_path):
+        cache = TranslationCacheManager(cache_dir=str(tmp_path))
+        texts = [f"text {n}" for n in range(1200)]
+        cache.set_many({text: text.upper() for text in texts}, "en", "fr")
+        cache._memory_cache.clear()
+
+        found = cache.get_many(texts + texts[:5], "en", "fr")
+
+        assert len(found) == 1200
+        assert found["text 1199"] == "TEXT 1199"
+
+    def test_clear_language_pair(self, tmp_path):
+        cache = TranslationCacheManager(cache_dir=str(tmp_path))
+        cache.set("a", "en", "ru", "а")
+        cache.set("a", "en", "de", "ä")
+
+        cache.clear("en", "ru")
+
+        assert cache.get("a", "en", "ru") is None
+        assert cache.get("a", "en", "de") == "ä"
+        cache.clear()
+        assert TranslationCacheManager(cache_dir=str(tmp_path)).get("a", "en", "de") is None
+
+
+def test_migrates_legacy_json_files(tmp_path):
+    legacy = tmp_path / "en→ru.json"
+    legacy.write_text(json.dumps({_hash("hello"): "привет", _hash("world"): "мир"}), encoding="utf-8")
+    (tmp_path / "en→de.json").write_text("{not json", encoding="utf-8")
+
+    cache = TranslationCacheManager(cache_dir=str(tmp_path))
+
+    assert cache.get("hello", "en", "ru") == "привет"
+    assert cache.get_many(["world"], "en", "ru") == {"world": "мир"}
+    assert not legacy.exists()
+    assert (tmp_path / "en→ru.json.migrated").exists()
+    # Unreadable files are left in place for inspection
+    assert (tmp_path / "en→de.json").exists()
+    assert cache.migrate_json_files() == 0
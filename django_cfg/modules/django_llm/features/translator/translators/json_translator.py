@@ -120,16 +120,15 @@ class JsonTranslator:
                 else:
                     actual_source_lang = 'en'
 
-            # Check cache for each text
-            cached_translations = {}
-            uncached_texts = []
-
-            for text in translatable_texts:
-                cached_translation = self.cache.get(text, actual_source_lang, target_language)
-                if cached_translation:
-                    cached_translations[text] = cached_translation
-                else:
-                    uncached_texts.append(text)
+            # Check cache for all texts in one lookup
+            cached_translations = {
+                text: translation
+                for text, translation in self.cache.get_many(
+                    translatable_texts, actual_source_lang, target_language
+                ).items()
+                if translation
+            }
+            uncached_texts = [text for text in translatable_texts if text not in cached_translations]
 
             logger.info(f"Cache: {len(cached_translations)} hits, {len(uncached_texts)} misses")
 
@@ -171,9 +170,8 @@ class JsonTranslator:
                     uncached_json, translated_partial_data, uncached_texts
                 )
 
-                # Cache new translations
-                for original_text, translated_text in new_translations.items():
-                    self.cache.set(original_text, actual_source_lang, target_language, translated_text)
+                # Cache new translations in one batch
+                self.cache.set_many(new_translations, actual_source_lang, target_language)
 
                 # Combine cached + new translations
                 all_translations = {**cached_translations, **new_translations}
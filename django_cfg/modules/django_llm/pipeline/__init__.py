@@ -2,19 +2,30 @@
 Pipeline — decorator layers around the LLM client.
 
 The reliability core: a classified retry helper, a circuit breaker, a
-model-cascade router, and a client-side rate limiter. The cost layer adds
+model-cascade router, a client-side rate limiter, and hedged racing of one
+model across parallel legs with cancellation of the losers. ``shared`` keeps breaker and rate-limit
+state in Redis so every worker process sees one budget and one outage. The cost layer adds
 per-attempt spend tracking, a wasted-spend metric, and a billed-but-unusable
 cost-leak alert.
 
 Host-agnostic — depends only on the ``core`` error taxonomy, the stdlib,
-and (for the Telegram alert) the ``_integration`` host seam.
+and (for the Telegram alert) the ``_integration`` host seam; the Redis client
+for shared state is injected.
 """
 
 from .circuit_breaker import CircuitBreaker, CircuitState
 from .cost import CostEvent, CostTracker, alert_wasted_call
+from .race import RaceCancelled, RaceLeg, RaceStats, current_leg, get_race_stats, race_call
 from .ratelimit import RateLimiter
 from .retry import compute_backoff, retry_call
 from .router import ModelRouter
+from .shared import (
+    SharedCircuitBreaker,
+    SharedPipelineState,
+    SharedRateLimiter,
+    configure_shared_state,
+    get_shared_state,
+)
 
 __all__ = [
     "CircuitBreaker",
@@ -26,4 +37,15 @@ __all__ = [
     "retry_call",
     "ModelRouter",
     "RateLimiter",
+    "RaceCancelled",
+    "RaceLeg",
+    "RaceStats",
+    "current_leg",
+    "get_race_stats",
+    "race_call",
+    "SharedCircuitBreaker",
+    "SharedPipelineState",
+    "SharedRateLimiter",
+    "configure_shared_state",
+    "get_shared_state",
 ]
@@ -0,0 +1,325 @@
+"""
+Hedged racing — run one call as parallel legs, keep the first success.
+
+Some providers (gonka) have a latency tail far longer than their median, so
+a model's turn is run as a race: one leg starts immediately and further legs
+are launched only while the running ones are still slower than the model
+usually is. The first leg to return wins; the losers are cancelled.
+
+Cancellation is cooperative. Every leg carries a ``RaceLeg`` token, visible
+to the code running inside it through ``current_leg()``. The chat handler
+streams a raced request and registers the stream's ``close`` on the token,
+so cancelling a loser hangs up its HTTP stream and the provider stops
+generating. Tokens a loser consumed before hanging up are the racing
+overhead and are counted as wasted.
+
+Legs run on one long-lived, bounded executor shared by every router, and
+``RaceStats`` (process-wide) keeps per-model win rates, wasted tokens and a
+window of winning latencies that sets each model's hedge delay.
+
+Host-agnostic — stdlib only.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures as _futures
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Upper bound on legs in flight across the whole process.
+RACE_MAX_WORKERS = 32
+
+# Hedge-delay estimation: winning latencies kept per model, samples needed
+# before the delay adapts, and the quantile a running leg must exceed
+# before another is launched.
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+HEDGE_QUANTILE = 0.9
+
+
+class RaceCancelled(Exception):
+    """A leg was cancelled because another leg already won."""
+
+
+class RaceLeg:
+    """Cancellation token and accounting for one leg of a race.
+
+    Code running inside the leg calls ``check()`` before starting work and
+    registers anything that can abort in-flight I/O with ``on_cancel``.
+    ``cancel()`` (called by the racer when another leg wins) sets the flag
+    and runs those closers.
+    """
+
+    def __init__(self, model: str, index: int) -> None:
+        self.model = model
+        self.index = index
+        self.tokens = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._cancelled = threading.Event()
+        self._closers: list[Callable[[], object]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def latency(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def cancel(self) -> None:
+        """Mark the leg lost and abort its registered I/O."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                closer()
+            except Exception as exc:  # the leg surfaces its own error
+                logger.debug("race leg %s#%d: closer failed: %s", self.model, self.index, exc)
+
+    def check(self) -> None:
+        """Raise ``RaceCancelled`` if the leg has already lost."""
+        if self._cancelled.is_set():
+            raise RaceCancelled(f"race leg {self.model}#{self.index} cancelled")
+
+    def on_cancel(self, closer: Callable[[], object]) -> None:
+        """Run ``closer`` on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._closers.append(closer)
+                return
+        closer()
+
+    def discard(self, closer: Callable[[], object]) -> None:
+        """Unregister a closer whose I/O has finished."""
+        with self._lock:
+            if closer in self._closers:
+                self._closers.remove(closer)
+
+    def add_tokens(self, tokens: int) -> None:
+        """Account tokens billed by work done inside this leg."""
+        with self._lock:
+            self.tokens += max(0, int(tokens or 0))
+
+
+_current_leg: contextvars.ContextVar[RaceLeg | None] = contextvars.ContextVar(
+    "django_llm_race_leg", default=None
+)
+
+
+def current_leg() -> RaceLeg | None:
+    """The race leg the calling code runs in, or ``None`` outside a race."""
+    return _current_leg.get()
+
+
+class _ModelRaceStats:
+    __slots__ = ("races", "won", "wins_by_leg", "hedges", "hedge_wins",
+                 "cancelled_legs", "wasted_tokens", "latencies")
+
+    def __init__(self) -> None:
+        self.races = 0
+        self.won = 0
+        self.wins_by_leg: dict[int, int] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.cancelled_legs = 0
+        self.wasted_tokens = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+
+class RaceStats:
+    """Process-wide racing metrics, per model. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._models: dict[str, _ModelRaceStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, model: str) -> _ModelRaceStats:
+        stats = self._models.get(model)
+        if stats is None:
+            stats = self._models[model] = _ModelRaceStats()
+        return stats
+
+    def hedge_delay(self, model: str, minimum: float) -> float:
+        """Seconds to wait on the running legs before launching another.
+
+        The ``HEDGE_QUANTILE`` of the model's recent winning latencies, so
+        only calls that are already slow for that model get hedged; never
+        below ``minimum`` (the configured stagger). Until enough samples
+        exist the stagger alone is used, i.e. every leg is launched.
+        """
+        with self._lock:
+            stats = self._models.get(model)
+            if stats is None or len(stats.latencies) < MIN_LATENCY_SAMPLES:
+                return minimum
+            samples = sorted(stats.latencies)
+        return max(minimum, samples[int(HEDGE_QUANTILE * (len(samples) - 1))])
+
+    def record_round(self, model: str, legs_launched: int, winner: RaceLeg | None) -> None:
+        with self._lock:
+            stats = self._get(model)
+            stats.races += 1
+            stats.hedges += legs_launched - 1
+            if winner is None:
+                return
+            stats.won += 1
+            stats.wins_by_leg[winner.index] = stats.wins_by_leg.get(winner.index, 0) + 1
+            if winner.index:
+                stats.hedge_wins += 1
+            if winner.latency is not None:
+                stats.latencies.append(winner.latency)
+
+    def record_loser(self, leg: RaceLeg) -> None:
+        """Account a losing leg once it has stopped."""
+        with self._lock:
+            stats = self._get(leg.model)
+            stats.cancelled_legs += 1
+            stats.wasted_tokens += leg.tokens
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-model metrics: win rates, hedge usefulness, wasted tokens."""
+        with self._lock:
+            result = {}
+            for model, stats in self._models.items():
+                latencies = sorted(stats.latencies)
+                result[model] = {
+                    "races": stats.races,
+                    "win_rate": stats.won / stats.races if stats.races else 0.0,
+                    "wins_by_leg": dict(stats.wins_by_leg),
+                    "hedges": stats.hedges,
+                    "hedge_win_rate": stats.hedge_wins / stats.hedges if stats.hedges else 0.0,
+                    "cancelled_legs": stats.cancelled_legs,
+                    "wasted_tokens": stats.wasted_tokens,
+                    "p50_latency": latencies[len(latencies) // 2] if latencies else None,
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+_race_stats = RaceStats()
+_executor: _futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_race_stats() -> RaceStats:
+    """The process-wide ``RaceStats``."""
+    return _race_stats
+
+
+def _race_executor() -> _futures.ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = _futures.ThreadPoolExecutor(
+                    max_workers=RACE_MAX_WORKERS, thread_name_prefix="llm-race"
+                )
+    return _executor
+
+
+def _run_leg(call: Callable[[str], R], leg: RaceLeg) -> R:
+    leg.check()
+    token = _current_leg.set(leg)
+    leg.started_at = time.monotonic()
+    try:
+        return call(leg.model)
+    except RaceCancelled:
+        raise
+    except Exception as exc:
+        if leg.cancelled:  # aborted I/O surfaces as a transport error
+            raise RaceCancelled(f"race leg {leg.model}#{leg.index} cancelled") from exc
+        raise
+    finally:
+        leg.finished_at = time.monotonic()
+        _current_leg.reset(token)
+
+
+def race_call(
+    call: Callable[[str], R],
+    model: str,
+    *,
+    legs: int,
+    rounds: int = 1,
+    stagger: float = 0.0,
+    stats: RaceStats | None = None,
+    executor: _futures.Executor | None = None,
+) -> R:
+    """Run ``call(model)`` as a hedged race of up to ``legs`` legs.
+
+    Per round, one leg starts at once; another is launched whenever the
+    running legs have all failed, or none has returned within the model's
+    ``hedge_delay`` (at least ``stagger`` — gonka's near-identical-burst
+    guard). The first leg to return wins and every other leg is cancelled.
+    A round in which all ``legs`` fail is retried up to ``rounds`` times;
+    then the last leg error is raised.
+    """
+    stats = stats or _race_stats
+    executor = executor or _race_executor()
+    last_exc: Exception | None = None
+
+    for round_idx in range(rounds):
+        delay = stats.hedge_delay(model, stagger)
+        running: dict[_futures.Future, RaceLeg] = {}
+        launched = 0
+        winner: RaceLeg | None = None
+        result = None
+        try:
+            while running or launched < legs:
+                if not running:
+                    leg = RaceLeg(model, launched)
+                    running[executor.submit(_run_leg, call, leg)] = leg
+                    launched += 1
+                timeout = delay if launched < legs else None
+                done, _ = _futures.wait(running, timeout=timeout, return_when=_futures.FIRST_COMPLETED)
+                if not done:
+                    # Every running leg is slower than this model usually is: hedge.
+                    leg = RaceLeg(model, launched)
+                    running[executor.submit(_run_leg, call, leg)] = leg
+                    launched += 1
+                    continue
+                for fut in done:
+                    leg = running.pop(fut)
+                    try:
+                        result = fut.result()
+                    except Exception as exc:  # this leg failed; others may still win
+                        last_exc = exc
+                        continue
+                    winner = leg
+                    break
+                if winner is not None:
+                    break
+        finally:
+            for fut, leg in running.items():
+                leg.cancel()
+                if not fut.cancel():
+                    fut.add_done_callback(lambda _fut, leg=leg: stats.record_loser(leg))
+            stats.record_round(model, launched, winner)
+
+        if winner is not None:
+            logger.debug(
+                "race: winner model=%s round=%d leg=%d/%d",
+                model, round_idx, winner.index, launched,
+            )
+            return result
+        logger.warning(
+            "race round %d: model=%s all %d legs failed (last: %s)",
+            round_idx, model, launched, last_exc,
+        )
+    raise last_exc or RuntimeError(f"race produced no result for {model}")
@@ -0,0 +1,198 @@
+"""
+Tests for hedged racing and cancellation of losing legs.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ..client.chat_handler import ChatRequestHandler
+from .race import MIN_LATENCY_SAMPLES, RaceCancelled, RaceLeg, RaceStats, current_leg, race_call
+
+
+def _leg_call(delays, started=None):
+    """A call whose duration depends on the leg index; aborts when cancelled."""
+
+    def call(model):
+        leg = current_leg()
+        if started is not None:
+            started.append(leg.index)
+        stop = threading.Event()
+        leg.on_cancel(stop.set)
+        leg.add_tokens(100)
+        if stop.wait(delays[leg.index]):
+            raise ConnectionError("stream closed")
+        return f"{model}#{leg.index}"
+
+    return call
+
+
+class TestRaceCall:
+    """Test winner selection, hedging and loser accounting."""
+
+    def test_fast_leg_wins_and_slow_leg_is_cancelled(self):
+        stats = RaceStats()
+
+        started = time.monotonic()
+        result = race_call(_leg_call([5.0, 0.01]), "m", legs=2, stagger=0.01, stats=stats)
+
+        assert result == "m#1"
+        assert time.monotonic() - started < 1.0
+        time.sleep(0.05)  # the loser's done-callback runs on its worker thread
+        snapshot = stats.snapshot()["m"]
+        assert snapshot["wins_by_leg"] == {1: 1}
+        assert snapshot["cancelled_legs"] == 1
+        assert snapshot["wasted_tokens"] == 100
+        assert snapshot["hedge_win_rate"] == 1.0
+
+    def test_hedges_only_calls_slower_than_usual(self):
+        stats = RaceStats()
+        for _ in range(MIN_LATENCY_SAMPLES):
+            leg = RaceLeg("m", 0)
+            leg.started_at, leg.finished_at = 0.0, 0.2
+            stats.record_round("m", 1, leg)
+
+        started = []
+        assert race_call(_leg_call([0.05, 0.0], started), "m", legs=2, stagger=0.01, stats=stats) == "m#0"
+        assert started == [0]
+
+        started.clear()
+        assert race_call(_leg_call([5.0, 0.0], started), "m", legs=2, stagger=0.01, stats=stats) == "m#1"
+        assert started == [0, 1]
+
+    def test_failed_rounds_are_retried_then_raise(self):
+        stats = RaceStats()
+        calls = []
+
+        def call(model):
+            calls.append(current_leg().index)
+            raise ValueError(f"bad {len(calls)}")
+
+        with pytest.raises(ValueError, match="bad [34]"):
+            race_call(call, "m", legs=2, rounds=2, stats=stats)
+        assert sorted(calls) == [0, 0, 1, 1]
+        assert stats.snapshot()["m"]["win_rate"] == 0.0
+
+
+class _StubSSEHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        if body["stream"] is not True or self.server.reject_stream:
+            self._reply_json(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        try:
+            for n in range(self.server.chunks):
+                self._event({"choices": [{"index": 0, "delta": {"content": f"w{n} "}, "finish_reason": None}]})
+                time.sleep(self.server.chunk_delay)
+            self._event({"choices": [{"index": 0, "delta": {}, "finish_reason": self.server.finish_reason}]})
+            self._event({"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10}})
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.server.completed += 1
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.disconnected += 1
+
+    def _reply_json(self, body):
+        if body["stream"] is True:
+            status, data = 400, {"error": {"message": "Unrecognized request argument: stream_options"}}
+        else:
+            status, data = 200, {
+                "id": "c1", "object": "chat.completion", "created": 0, "model": "m",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "whole"},
+                             "finish_reason": "stop"}],
+            }
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _event(self, data):
+        data = {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "m", **data}
+        self.wfile.write(f"data: {json.dumps(data)}\n\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def sse_client():
+    from openai import OpenAI
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubSSEHandler)
+    server.chunks, server.chunk_delay, server.completed, server.disconnected = 3, 0.0, 0, 0
+    server.requests, server.reject_stream, server.finish_reason = [], False, "stop"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OpenAI(base_url=f"http://127.0.0.1:{server.server_port}/v1", api_key="stub", max_retries=0)
+    yield server, client
+    server.shutdown()
+
+
+class TestStreamedLeg:
+    """Test the chat handler's streamed request inside a race leg."""
+
+    PARAMS = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+
+    def test_stream_is_accumulated_into_a_completion(self, sse_client):
+        server, client = sse_client
+
+        completion = ChatRequestHandler._stream_api_call(None, client, dict(self.PARAMS), RaceLeg("m", 0), 7)
+
+        assert completion.choices[0].message.content == "w0 w1 w2 "
+        assert completion.usage.total_tokens == 10
+
+    @pytest.mark.parametrize("finish_reason", ["length", "content_filter"])
+    def test_truncated_stream_is_returned_not_raised(self, sse_client, finish_reason):
+        server, client = sse_client
+        server.finish_reason = finish_reason
+
+        completion = ChatRequestHandler._stream_api_call(None, client, dict(self.PARAMS), RaceLeg("m", 0), 7)
+
+        assert completion.choices[0].finish_reason == finish_reason
+        assert completion.choices[0].message.content == "w0 w1 w2 "
+        assert completion.usage.total_tokens == 10
+
+    def test_cancelled_leg_hangs_up_and_counts_streamed_tokens(self, sse_client):
+        server, client = sse_client
+        server.chunks, server.chunk_delay = 1000, 0.01
+        leg = RaceLeg("m", 1)
+        threading.Timer(0.1, leg.cancel).start()
+
+        started = time.monotonic()
+        with pytest.raises(RaceCancelled):
+            ChatRequestHandler._stream_api_call(None, client, dict(self.PARAMS), leg, 7)
+
+        assert time.monotonic() - started < 2.0
+        assert 7 < leg.tokens < 7 + 100
+        deadline = time.monotonic() + 5
+        while not server.disconnected and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert (server.completed, server.disconnected) == (0, 1)
+
+    def test_rejected_stream_falls_back_to_a_plain_call(self, sse_client):
+        server, client = sse_client
+        server.reject_stream = True
+        handler = ChatRequestHandler(None, None, None, None, None)
+
+        def call():
+            return handler._make_api_call(
+                client, "m", self.PARAMS["messages"], None, None, None,
+                provider="gonkagate", race_leg=RaceLeg("m", 0),
+            )
+
+        assert call().choices[0].message.content == "whole"
+        assert [body["stream"] for body in server.requests] == [True, False]
+
+        # The provider is not streamed again
+        assert call().choices[0].message.content == "whole"
+        assert [body["stream"] for body in server.requests] == [True, False, False]
@@ -13,8 +13,8 @@ refill continuously at ``limit / 60`` per second.
 
 Pure, in-process, time-injectable — pass a ``now`` callable for
 deterministic tests. A per-process bucket undercounts across Django's
-gunicorn/uwsgi workers; a Redis-backed shared limiter is the eventual
-multi-worker fix and a later integration concern.
+gunicorn/uwsgi workers; ``shared.SharedRateLimiter`` keeps the same buckets
+in Redis for multi-worker deployments.
 """
 
 from __future__ import annotations
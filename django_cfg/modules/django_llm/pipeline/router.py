@@ -39,6 +39,10 @@ class ModelRouter:
         base_delay / max_delay: backoff bounds passed to the retry helper.
         failure_threshold: consecutive failures that open a model's breaker.
         cooldown: OPEN-state cooldown in seconds.
+        breaker_factory: ``factory(model, failure_threshold=, cooldown=)`` for
+            the per-model breakers — e.g. ``SharedPipelineState.breaker`` to
+            share circuit state across worker processes. Defaults to an
+            in-process ``CircuitBreaker``.
         sleep / rng / now: injectable for deterministic tests.
     """
 
@@ -51,6 +55,7 @@ class ModelRouter:
         max_delay: float = 60.0,
         failure_threshold: int = 5,
         cooldown: float = 30.0,
+        breaker_factory: Callable[..., CircuitBreaker] | None = None,
         sleep: Callable[[float], None] = time.sleep,
         rng: Callable[[], float] = random.random,
         now: Callable[[], float] = time.monotonic,
@@ -64,7 +69,13 @@ class ModelRouter:
         self._sleep = sleep
         self._rng = rng
         self._breakers: dict[str, CircuitBreaker] = {
-            model: CircuitBreaker(
+            model: breaker_factory(
+                model,
+                failure_threshold=failure_threshold,
+                cooldown=cooldown,
+            )
+            if breaker_factory is not None
+            else CircuitBreaker(
                 failure_threshold=failure_threshold,
                 cooldown=cooldown,
                 now=now,
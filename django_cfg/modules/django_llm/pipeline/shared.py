@@ -0,0 +1,356 @@
+"""
+Shared pipeline state — circuit breakers and rate limiters kept in Redis.
+
+``CircuitBreaker`` and ``RateLimiter`` hold their state in process memory,
+so under N gunicorn workers every worker discovers a provider outage on its
+own and every worker spends the full rate budget (N times the provider
+limit). The classes here keep that state in Redis instead:
+
+- ``SharedRateLimiter`` — the dual RPM/TPM bucket and 429 cooldown as one
+  atomic Lua script, timed by the Redis server clock so workers agree.
+- ``SharedCircuitBreaker`` — failure count and open time in a Redis hash;
+  in HALF_OPEN exactly one worker leases the probe (``SET NX PX``), the
+  rest keep fast-failing until the probe reports back or its lease lapses.
+
+Both subclass their in-process counterparts and fall back to that local
+state whenever Redis is unreachable; ``SharedPipelineState`` then skips
+Redis for ``retry_interval`` seconds instead of paying a connect timeout
+on every call. Losing Redis degrades to today's per-process behaviour, it
+never fails a request.
+
+Host-agnostic: the Redis client is injected (``redis.Redis`` or
+``fakeredis.FakeRedis``); ``redis`` is imported only by ``from_url``.
+
+Usage:
+
+    state = SharedPipelineState.from_url("redis://localhost:6379/2")
+    configure_shared_state(state)          # LLMRouter breakers become shared
+    limiter = state.rate_limiter("openrouter", rpm=500, tpm=2_000_000)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable
+
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIX = "django_llm"
+
+# Seconds to stay on local state after a Redis error before trying again.
+DEFAULT_RETRY_INTERVAL = 5.0
+
+# Breaker hashes outlive their cooldown by this long, then expire.
+_BREAKER_TTL_SECONDS = 3600
+
+_NOW = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+"""
+
+# KEYS[1] cooldown key, KEYS[2..] bucket hashes.
+# ARGV: (capacity, amount) per bucket. Returns the wait in seconds.
+_ACQUIRE_SCRIPT = _NOW + """
+local wait = 0
+local cooldown_until = tonumber(redis.call('GET', KEYS[1]))
+if cooldown_until and cooldown_until > now then
+  wait = cooldown_until - now
+end
+for i = 2, #KEYS do
+  local capacity = tonumber(ARGV[2 * i - 3])
+  local amount = tonumber(ARGV[2 * i - 2])
+  local rate = capacity / 60
+  local state = redis.call('HMGET', KEYS[i], 'tokens', 'updated')
+  local tokens = tonumber(state[1]) or capacity
+  local updated = tonumber(state[2]) or now
+  if now > updated then
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    updated = now
+  end
+  tokens = tokens - amount
+  redis.call('HSET', KEYS[i], 'tokens', tostring(tokens), 'updated', tostring(updated))
+  redis.call('PEXPIRE', KEYS[i], math.ceil((capacity - tokens) / rate * 1000) + 60000)
+  if tokens < 0 then
+    wait = math.max(wait, -tokens / rate)
+  end
+end
+return tostring(wait)
+"""
+
+# KEYS[1] cooldown key. ARGV[1] seconds. Extends, never shortens.
+_COOLDOWN_SCRIPT = _NOW + """
+local seconds = tonumber(ARGV[1])
+local current = tonumber(redis.call('GET', KEYS[1]))
+if not current or now + seconds > current then
+  redis.call('SET', KEYS[1], tostring(now + seconds), 'PX', math.ceil(seconds * 1000))
+end
+return 1
+"""
+
+# KEYS[1] breaker hash, KEYS[2] probe lease.
+# ARGV[1] cooldown, ARGV[2] lease ms, ARGV[3] lease token, ARGV[4] '1' to lease.
+_BREAKER_STATE_SCRIPT = _NOW + """
+local opened = tonumber(redis.call('HGET', KEYS[1], 'opened_at'))
+if not opened then
+  return 'closed'
+end
+if now - opened < tonumber(ARGV[1]) then
+  return 'open'
+end
+if ARGV[4] == '1' and redis.call('SET', KEYS[2], ARGV[3], 'NX', 'PX', ARGV[2]) then
+  return 'probe'
+end
+return 'half_open'
+"""
+
+# KEYS[1] breaker hash, KEYS[2] probe lease.
+# ARGV[1] failure threshold, ARGV[2] hash TTL ms. Returns the failure count.
+_BREAKER_FAILURE_SCRIPT = _NOW + """
+local opened = redis.call('HGET', KEYS[1], 'opened_at')
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+if opened or failures >= tonumber(ARGV[1]) then
+  redis.call('HSET', KEYS[1], 'opened_at', tostring(now))
+  redis.call('DEL', KEYS[2])
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return failures
+"""
+
+
+def _redis_errors() -> tuple[type[BaseException], ...]:
+    try:
+        from redis.exceptions import RedisError
+    except ImportError:
+        return (OSError,)
+    return (RedisError, OSError)
+
+
+class SharedPipelineState:
+    """A Redis connection plus the fallback policy for shared pipeline state.
+
+    Args:
+        client: a ``redis.Redis``-compatible client (scripting required).
+        prefix: namespace for every key this state writes.
+        retry_interval: seconds to use local state after a Redis error.
+        now: monotonic clock for the retry interval, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = DEFAULT_PREFIX,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        now: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.retry_interval = retry_interval
+        self._now = now
+        self._errors = _redis_errors()
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+        self._acquire = client.register_script(_ACQUIRE_SCRIPT)
+        self._cooldown = client.register_script(_COOLDOWN_SCRIPT)
+        self._breaker_state = client.register_script(_BREAKER_STATE_SCRIPT)
+        self._breaker_failure = client.register_script(_BREAKER_FAILURE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "SharedPipelineState":
+        """Connect with ``redis.Redis.from_url`` (short timeouts: Redis is advisory here)."""
+        import redis
+
+        client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        return cls(client, **kwargs)
+
+    @property
+    def available(self) -> bool:
+        """False while backing off after a Redis error."""
+        return self._now() >= self._down_until
+
+    def key(self, kind: str, name: str, part: str) -> str:
+        """``prefix:kind:{name}:part`` — the hash tag keeps one object's keys in one slot."""
+        return f"{self.prefix}:{kind}:{{{name}}}:{part}"
+
+    def run(self, script: Callable[..., Any], keys: list[str], args: list[Any]) -> Any:
+        """Run a registered script; ``None`` when Redis is unavailable."""
+        return self.execute(lambda: script(keys=keys, args=args))
+
+    def execute(self, operation: Callable[[], Any]) -> Any:
+        """Run a Redis operation; ``None`` when Redis is unavailable (use local state)."""
+        if not self.available:
+            return None
+        try:
+            return operation()
+        except self._errors as exc:
+            with self._lock:
+                first = self.available
+                self._down_until = self._now() + self.retry_interval
+            if first:
+                logger.warning(
+                    "Shared LLM pipeline state unavailable, using per-process state for %.0fs: %s",
+                    self.retry_interval, exc,
+                )
+            return None
+
+    def breaker(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        probe_lease: float = 60.0,
+    ) -> "SharedCircuitBreaker":
+        """A circuit breaker named ``name`` (e.g. a model id), shared by every worker."""
+        return SharedCircuitBreaker(
+            self, name,
+            failure_threshold=failure_threshold,
+            cooldown=cooldown,
+            probe_lease=probe_lease,
+        )
+
+    def rate_limiter(
+        self,
+        name: str,
+        *,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        fallback_fraction: float = 1.0,
+    ) -> "SharedRateLimiter":
+        """A rate limiter named ``name`` (e.g. a provider), shared by every worker."""
+        return SharedRateLimiter(self, name, rpm=rpm, tpm=tpm, fallback_fraction=fallback_fraction)
+
+
+class SharedCircuitBreaker(CircuitBreaker):
+    """A ``CircuitBreaker`` whose state lives in Redis.
+
+    Same interface and transitions as the in-process breaker, except that
+    HALF_OPEN admits one probe across all workers: ``allow()`` leases it for
+    ``probe_lease`` seconds, and the probe's ``record_success`` /
+    ``record_failure`` closes or re-opens the breaker for everyone. While
+    Redis is unavailable the inherited in-process state is used.
+    """
+
+    def __init__(
+        self,
+        state: SharedPipelineState,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        probe_lease: float = 60.0,
+    ) -> None:
+        super().__init__(failure_threshold=failure_threshold, cooldown=cooldown)
+        self.shared = state
+        self.name = name
+        self.probe_lease = probe_lease
+        self._keys = [state.key("breaker", name, "state"), state.key("breaker", name, "probe")]
+
+    def _shared_state(self, lease: bool) -> str | None:
+        result = self.shared.run(
+            self.shared._breaker_state,
+            self._keys,
+            [self.cooldown, int(self.probe_lease * 1000), uuid.uuid4().hex, "1" if lease else "0"],
+        )
+        if result is None:
+            return None
+        return result.decode() if isinstance(result, bytes) else result
+
+    @property
+    def state(self) -> CircuitState:
+        """Current shared state (local state while Redis is unavailable)."""
+        shared = self._shared_state(lease=False)
+        if shared is None:
+            return super().state
+        return CircuitState(shared)
+
+    def allow(self) -> bool:
+        """CLOSED -> True; HALF_OPEN -> True for the one worker that leases the probe."""
+        shared = self._shared_state(lease=True)
+        if shared is None:
+            return super().allow()
+        return shared in ("closed", "probe")
+
+    def record_success(self) -> None:
+        super().record_success()
+        self.shared.execute(lambda: self.shared.client.delete(*self._keys))
+
+    def record_failure(self) -> None:
+        ttl_ms = int(max(self.cooldown, _BREAKER_TTL_SECONDS) * 1000)
+        if self.shared.run(self.shared._breaker_failure, self._keys, [self.failure_threshold, ttl_ms]) is None:
+            super().record_failure()
+
+
+class SharedRateLimiter(RateLimiter):
+    """A ``RateLimiter`` whose buckets and 429 cooldown live in Redis.
+
+    Every worker draws from the same RPM/TPM budget. While Redis is
+    unavailable each worker falls back to a local limiter sized at
+    ``fallback_fraction`` of the budget — e.g. ``1 / workers`` to stay under
+    the provider limit during an outage, or 1.0 to favour throughput.
+    """
+
+    def __init__(
+        self,
+        state: SharedPipelineState,
+        name: str,
+        *,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        fallback_fraction: float = 1.0,
+    ) -> None:
+        super().__init__(
+            rpm=rpm * fallback_fraction if rpm is not None else None,
+            tpm=tpm * fallback_fraction if tpm is not None else None,
+        )
+        self.shared = state
+        self.name = name
+        self.rpm = rpm
+        self.tpm = tpm
+        self._cooldown_key = state.key("ratelimit", name, "cooldown")
+        self._rpm_key = state.key("ratelimit", name, "rpm")
+        self._tpm_key = state.key("ratelimit", name, "tpm")
+
+    def acquire(self, estimated_tokens: float = 0) -> float:
+        """Reserve one request and ``estimated_tokens`` from the shared budget."""
+        keys = [self._cooldown_key]
+        args: list[float] = []
+        if self.rpm is not None:
+            keys.append(self._rpm_key)
+            args.extend((self.rpm, 1))
+        if self.tpm is not None:
+            keys.append(self._tpm_key)
+            args.extend((self.tpm, estimated_tokens))
+        wait = self.shared.run(self.shared._acquire, keys, args)
+        if wait is None:
+            return super().acquire(estimated_tokens)
+        return float(wait)
+
+    def cooldown(self, seconds: float) -> None:
+        """Force a cooldown on every worker — call this on a provider 429."""
+        super().cooldown(seconds)
+        self.shared.run(self.shared._cooldown, [self._cooldown_key], [seconds])
+
+
+_default_state: SharedPipelineState | None = None
+
+
+def configure_shared_state(state: SharedPipelineState | str | None) -> SharedPipelineState | None:
+    """Set (a state or a Redis URL) or clear the process-wide shared state.
+
+    ``LLMRouter`` uses it for its per-model breakers unless one is passed in.
+    """
+    global _default_state
+    _default_state = SharedPipelineState.from_url(state) if isinstance(state, str) else state
+    return _default_state
+
+
+def get_shared_state() -> SharedPipelineState | None:
+    """The process-wide shared state, or ``None`` (in-process state only)."""
+    return _default_state
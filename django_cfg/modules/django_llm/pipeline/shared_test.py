@@ -0,0 +1,132 @@
+"""
+Tests for Redis-backed shared circuit breakers and rate limiters.
+"""
+
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis Lua scripting
+
+from ..core.errors import AllProvidersFailedError  # noqa: E402
+from .circuit_breaker import CircuitState  # noqa: E402
+from .router import ModelRouter  # noqa: E402
+from .shared import SharedPipelineState  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def workers(server):
+    """Two 'worker processes': separate clients and state, one Redis server."""
+    clock = FakeClock()
+    states = [
+        SharedPipelineState(fakeredis.FakeRedis(server=server), retry_interval=5.0, now=clock)
+        for _ in range(2)
+    ]
+    return states, clock
+
+
+class TestSharedRateLimiter:
+    """Test one budget across workers."""
+
+    def test_workers_draw_from_one_budget(self, workers):
+        (a, b), _ = workers
+        limiters = [a.rate_limiter("openrouter", rpm=6), b.rate_limiter("openrouter", rpm=6)]
+
+        waits = [limiters[n % 2].acquire() for n in range(6)]
+        assert waits == [0.0] * 6
+        # The 7th request overdraws the shared bucket by one (10s at 0.1 req/s)
+        assert limiters[0].acquire() == pytest.approx(10.0, abs=0.5)
+
+    def test_token_bucket_and_cooldown_are_shared(self, workers):
+        (a, b), _ = workers
+        first = a.rate_limiter("p", tpm=6000)
+        second = b.rate_limiter("p", tpm=6000)
+
+        assert first.acquire(5000) == 0.0
+        assert second.acquire(2000) == pytest.approx(10.0, abs=0.1)
+
+        other = b.rate_limiter("other", rpm=100)
+        a.rate_limiter("other", rpm=100).cooldown(30)
+        assert other.acquire() == pytest.approx(30.0, abs=0.1)
+
+
+class TestSharedCircuitBreaker:
+    """Test shared tripping and the leased half-open probe."""
+
+    def test_outage_seen_by_one_worker_opens_breaker_for_all(self, workers):
+        (a, b), _ = workers
+        ours = a.breaker("kimi", failure_threshold=2, cooldown=30)
+        theirs = b.breaker("kimi", failure_threshold=2, cooldown=30)
+
+        ours.record_failure()
+        theirs.record_failure()
+
+        assert ours.state is theirs.state is CircuitState.OPEN
+        assert not theirs.allow()
+
+    def test_half_open_admits_one_probe(self, workers):
+        (a, b), _ = workers
+        ours = a.breaker("kimi", failure_threshold=1, cooldown=0.05)
+        theirs = b.breaker("kimi", failure_threshold=1, cooldown=0.05)
+        ours.record_failure()
+        time.sleep(0.1)
+
+        assert theirs.state is CircuitState.HALF_OPEN
+        assert [theirs.allow(), ours.allow(), theirs.allow()] == [True, False, False]
+
+        theirs.record_failure()  # failed probe re-opens for everyone
+        assert ours.state is CircuitState.OPEN
+        time.sleep(0.1)
+        assert ours.allow()
+        ours.record_success()
+        assert theirs.state is CircuitState.CLOSED
+        assert theirs.allow()
+
+    def test_model_routers_share_breakers(self, workers):
+        (a, b), _ = workers
+
+        def down(model):
+            raise ConnectionError("provider down")
+
+        first = ModelRouter(["m"], max_attempts=1, failure_threshold=1, breaker_factory=a.breaker)
+        with pytest.raises(AllProvidersFailedError):
+            first.run(down)
+
+        second = ModelRouter(["m"], max_attempts=1, failure_threshold=1, breaker_factory=b.breaker)
+        with pytest.raises(AllProvidersFailedError) as exc_info:
+            second.run(lambda model: "ok")
+        assert exc_info.value.attempts[0]["reason"] == "circuit_open"
+
+
+def test_falls_back_to_local_state_while_redis_is_down(server, workers, caplog):
+    (state, _), clock = workers
+    limiter = state.rate_limiter("p", rpm=60, fallback_fraction=0.5)
+    breaker = state.breaker("m", failure_threshold=1, cooldown=30)
+    server.connected = False
+
+    # Local limiter holds half the budget
+    assert [limiter.acquire() for _ in range(30)] == [0.0] * 30
+    assert limiter.acquire() > 0
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert len([r for r in caplog.records if "unavailable" in r.message]) == 1
+
+    # Redis is retried after the interval; its state was never touched
+    server.connected = True
+    clock.now += 5.0
+    assert limiter.acquire() == 0.0
+    assert breaker.allow()
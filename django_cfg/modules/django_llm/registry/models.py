@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 import aiohttp
 from cachetools import TTLCache
 
+from .models_index import ModelsIndex
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -142,7 +144,13 @@ def _price_per_million(raw: Any) -> float:
         return 0.0
 
 class ModelsCache:
-    """Cache for OpenRouter models with pricing information"""
+    """Cache for OpenRouter models with pricing information
+
+    Catalogue queries (price ranges, provider, eligibility, search) are
+    answered from a ``ModelsIndex`` built when the catalogue is loaded or
+    refreshed. A refresh builds the new catalogue and its index aside and
+    swaps them in together, so readers never see a half-loaded catalogue.
+    """
 
     DEFAULT_TTL = 86400  # 24 hours default
     DEFAULT_CACHE_SIZE = 100
@@ -184,6 +192,7 @@ class ModelsCache:
         self.cache = TTLCache(maxsize=max_cache_size, ttl=cache_ttl)
         self.last_fetch_time: Optional[datetime] = None
         self.models: Dict[str, OpenRouterModel] = {}
+        self._models_index: Optional[ModelsIndex] = None
         self._sync_fetch_done = False
 
         # Cache key for models list
@@ -211,7 +220,7 @@ class ModelsCache:
 
             # Parse models
             models_data = data.get('models', {})
-            self.models = {}
+            models: Dict[str, OpenRouterModel] = {}
 
             for model_id, model_data in models_data.items():
                 try:
@@ -239,20 +248,14 @@ class ModelsCache:
                         is_embedding=model_data.get('is_embedding', False)
                     )
 
-                    self.models[model_id] = model_info
+                    models[model_id] = model_info
 
                 except Exception as e:
                     logger.warning(f"Failed to parse cached model {model_id}: {e}")
                     continue
 
-            if fetch_time_str:
-                self.last_fetch_time = datetime.fromisoformat(fetch_time_str)
-
-            # Also update memory cache
-            self.cache[self.models_cache_key] = {
-                "models": self.models,
-                "fetch_time": self.last_fetch_time
-            }
+            fetch_time = datetime.fromisoformat(fetch_time_str) if fetch_time_str else self.last_fetch_time
+            self._set_catalogue(models, fetch_time)
 
             logger.info(f"Loaded {len(self.models)} models from file cache")
             return True
@@ -323,8 +326,8 @@ class ModelsCache:
         if not force_refresh and self.models_cache_key in self.cache:
             logger.debug("Using cached models from memory")
             cached_data = self.cache[self.models_cache_key]
-            self.models = cached_data["models"]
-            self.last_fetch_time = cached_data["fetch_time"]
+            if cached_data["models"] is not self.models:
+                self._set_catalogue(cached_data["models"], cached_data["fetch_time"])
             return self.models
 
         # Check if we have models from file cache and they're still valid
@@ -354,25 +357,22 @@ class ModelsCache:
                     response.raise_for_status()
                     data = await response.json()
 
-                    # Parse models
-                    self.models = {}
+                    # Parse models into a fresh catalogue; the current one
+                    # keeps serving until it is swapped in below.
+                    models: Dict[str, OpenRouterModel] = {}
                     for model_data in data.get("data", []):
                         model_info = self._parse_model_data(model_data)
                         if model_info:
-                            self.models[model_info.id] = model_info
+                            models[model_info.id] = model_info
 
                     # Merge the dedicated embeddings catalogue. OpenRouter
                     # exposes embedding models on a SEPARATE endpoint that the
                     # chat `/models` list omits; without this the DB has no
                     # embedding prices and the gateway bills `DEFAULT_PRICING`.
-                    await self._fetch_embedding_models(session)
+                    await self._fetch_embedding_models(session, models)
 
                     # Update cache
-                    self.last_fetch_time = datetime.now()
-                    self.cache[self.models_cache_key] = {
-                        "models": self.models,
-                        "fetch_time": self.last_fetch_time
-                    }
+                    self._set_catalogue(models, datetime.now())
 
                     # Save to file
                     self._save_to_file()
@@ -396,9 +396,9 @@ class ModelsCache:
             raise
 
     async def _fetch_embedding_models(
-        self, session: "aiohttp.ClientSession"
+        self, session: "aiohttp.ClientSession", models: Dict[str, OpenRouterModel]
     ) -> None:
-        """Merge OpenRouter's embeddings catalogue into ``self.models``.
+        """Merge OpenRouter's embeddings catalogue into ``models``.
 
         OpenRouter lists embedding models on a SEPARATE endpoint
         (``/api/v1/embeddings/models``) that the chat ``/models`` response
@@ -430,7 +430,7 @@ class ModelsCache:
         for model_data in data.get("data", []):
             model_info = self._parse_model_data(model_data, is_embedding=True)
             if model_info:
-                self.models[model_info.id] = model_info
+                models[model_info.id] = model_info
                 added += 1
         logger.info(f"Merged {added} embedding models from OpenRouter")
 
@@ -483,17 +483,37 @@ class ModelsCache:
             except Exception as e:  # noqa: BLE001 — embeddings are additive
                 logger.warning("Sync embedding fetch failed: %s", e)
             if models:
-                self.models = models
-                self.last_fetch_time = datetime.now()
-                self.cache[self.models_cache_key] = {
-                    "models": self.models,
-                    "fetch_time": self.last_fetch_time,
-                }
+                self._set_catalogue(models, datetime.now())
                 self._save_to_file()
                 logger.info("Fetched %d models from OpenRouter (sync)", len(models))
         except Exception as e:
             logger.warning("Sync model fetch failed: %s", e)
 
+    def _set_catalogue(
+        self, models: Dict[str, OpenRouterModel], fetch_time: Optional[datetime]
+    ) -> None:
+        """Swap in a complete catalogue together with its index."""
+        index = ModelsIndex(models)
+        self.models = models
+        self._models_index = index
+        self.last_fetch_time = fetch_time
+        self.cache[self.models_cache_key] = {
+            "models": models,
+            "fetch_time": fetch_time,
+        }
+
+    def _index(self) -> ModelsIndex:
+        """The index for the current catalogue.
+
+        Rebuilt if ``models`` was replaced or resized behind the cache's back
+        (e.g. assigned directly); the new index is swapped in in one step.
+        """
+        index = self._models_index
+        if index is None or index.source is not self.models or index.size != len(self.models):
+            index = ModelsIndex(self.models)
+            self._models_index = index
+        return index
+
     def _parse_model_data(
         self, model_data: Dict[str, Any], *, is_embedding: bool = False
     ) -> Optional[OpenRouterModel]:
@@ -611,7 +631,7 @@ class ModelsCache:
 
     def get_models_by_provider(self, provider: str) -> List[OpenRouterModel]:
         """Get all models from a specific provider"""
-        return [model for model in self.models.values() if model.provider == provider]
+        return self._index().by_provider(provider)
 
     def get_models_by_price_range(self,
                                  min_price: float = 0.0,
@@ -626,23 +646,9 @@ class ModelsCache:
             price_type: "prompt" or "completion"
             
         Returns:
-            List of models in price range
+            List of models in price range, cheapest first
         """
-        filtered_models = []
-
-        for model in self.models.values():
-            if not model.is_available:
-                continue
-
-            price = model.pricing.prompt_price if price_type == "prompt" else model.pricing.completion_price
-
-            if min_price <= price <= max_price:
-                filtered_models.append(model)
-
-        # Sort by price
-        filtered_models.sort(key=lambda m: m.pricing.prompt_price if price_type == "prompt" else m.pricing.completion_price)
-
-        return filtered_models
+        return self._index().by_price_range(min_price, max_price, price_type)
 
     def get_free_models(self) -> List[OpenRouterModel]:
         """Get all free models (price = 0)"""
@@ -674,17 +680,13 @@ class ModelsCache:
         - require_tools / require_vision: keep only capable models.
         - text_chat_only: exclude image/audio/embedding-only entries.
         """
-        out = [
-            m
-            for m in self.models.values()
-            if (not available_only or m.is_available)
-            and (not text_chat_only or m.is_text_chat)
-            and (not require_tools or m.supports_tools)
-            and (not require_vision or m.supports_vision)
-            and m.max_price_per_1m <= max_price_per_1m
-        ]
-        out.sort(key=lambda m: m.pricing.prompt_price or 0.0)
-        return out
+        return self._index().eligible(
+            max_price_per_1m=max_price_per_1m,
+            require_tools=require_tools,
+            require_vision=require_vision,
+            text_chat_only=text_chat_only,
+            available_only=available_only,
+        )
 
     def embedding_models(self, *, available_only: bool = True) -> List[OpenRouterModel]:
         """All embedding models in the catalogue (from OpenRouter's
@@ -692,13 +694,7 @@ class ModelsCache:
         ``eligible_models`` (which is text-chat-only) so the pricing-sync
         pulls them through THIS accessor to write embedding rows to the DB.
         Sorted cheapest-first by prompt price."""
-        out = [
-            m
-            for m in self.models.values()
-            if m.is_embedding and (not available_only or m.is_available)
-        ]
-        out.sort(key=lambda m: m.pricing.prompt_price or 0.0)
-        return out
+        return self._index().embedding(available_only=available_only)
 
     def coding_models(
         self, *, max_price_per_1m: float = float('inf')
@@ -711,27 +707,8 @@ class ModelsCache:
         )
 
     def search_models(self, query: str) -> List[OpenRouterModel]:
-        """Search models by name, description, or tags"""
-        query_lower = query.lower()
-        results = []
-
-        for model in self.models.values():
-            # Search in name
-            if query_lower in model.name.lower():
-                results.append(model)
-                continue
-
-            # Search in description
-            if model.description and query_lower in model.description.lower():
-                results.append(model)
-                continue
-
-            # Search in tags
-            if any(query_lower in tag.lower() for tag in model.tags):
-                results.append(model)
-                continue
-
-        return results
+        """Search models by name, description, or tags (case-insensitive substring)"""
+        return self._index().search(query)
 
     def get_model_cost_estimate(self,
                                model_id: str,
@@ -789,7 +766,8 @@ class ModelsCache:
     def clear_cache(self):
         """Clear the cache"""
         self.cache.clear()
-        self.models.clear()
+        self.models = {}
+        self._models_index = None
         self.last_fetch_time = None
 
         # Also remove file cache
@@ -0,0 +1,233 @@
+"""
+Secondary indexes over a ModelsCache catalogue snapshot.
+
+``ModelsCache`` answers ``eligible_models``, ``get_models_by_price_range``,
+``get_models_by_provider`` and ``search_models`` from a ``ModelsIndex``
+built once per catalogue load instead of scanning and re-sorting every
+model per call:
+
+- price ranges: per price type, the available models sorted by price
+  (ties in catalogue order) with a parallel float array for ``bisect``.
+- capabilities: one int bitset per flag (available / text chat / tools /
+  vision) over the models sorted cheapest-first by prompt price, so a
+  filter is a few ANDs and the set bits come out already in result order.
+- providers: provider -> models, in catalogue order.
+- search: a token index — every word of a model's lowercased name,
+  description and tags -> bitset of models. A query's words narrow the
+  candidates (a word matches every indexed token containing it), and only
+  those are checked with the substring test, so results match the scan.
+
+An index is immutable. The cache builds a new one when its catalogue
+changes and swaps it in with a single assignment, so a reader always sees
+one consistent snapshot. Query results are memoized per snapshot.
+"""
+
+from __future__ import annotations
+
+import string
+from bisect import bisect_left, bisect_right
+from itertools import compress
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from .models import OpenRouterModel
+
+# Memoized query results kept per index snapshot.
+_MAX_MEMO_ENTRIES = 256
+
+_SEPARATOR = "\x00"
+
+# Token boundaries: whitespace, ASCII punctuation and the field separator.
+_TOKEN_BREAKS = str.maketrans(dict.fromkeys(string.punctuation + _SEPARATOR, " "))
+
+_BIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+T = TypeVar("T")
+
+
+def _tokens(text: str) -> List[str]:
+    return text.translate(_TOKEN_BREAKS).split()
+
+
+def _select(items: Sequence[T], mask: int) -> List[T]:
+    """``items[i]`` for every set bit ``i`` of ``mask``, in order."""
+    return list(compress(items, bin(mask)[:1:-1].encode().translate(_BIT_BYTES)))
+
+
+def _bitset(positions: Iterable[int], size: int) -> int:
+    bits = bytearray((size >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+class _PriceIndex:
+    """Available models sorted by one price, with the prices for bisect."""
+
+    def __init__(self, models: List["OpenRouterModel"], price_of) -> None:
+        ranked = sorted(
+            ((price_of(model), position, model) for position, model in enumerate(models)
+             if model.is_available),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        self.prices = [price for price, _, _ in ranked]
+        self.models = [model for _, _, model in ranked]
+
+    def between(self, low: float, high: float) -> List["OpenRouterModel"]:
+        return self.models[bisect_left(self.prices, low):bisect_right(self.prices, high)]
+
+
+class ModelsIndex:
+    """Read-only indexes over one catalogue snapshot (``model_id -> model``)."""
+
+    def __init__(self, models: Dict[str, "OpenRouterModel"]) -> None:
+        self.source = models
+        self.size = len(models)
+        ordered = list(models.values())
+
+        # Price ranges (available models only, like the linear filter).
+        self._prompt = _PriceIndex(ordered, lambda m: m.pricing.prompt_price)
+        self._completion = _PriceIndex(ordered, lambda m: m.pricing.completion_price)
+
+        # Capability bitsets over the cheapest-first order used by
+        # eligible_models / embedding_models.
+        self._cheapest = sorted(ordered, key=lambda m: m.pricing.prompt_price or 0.0)
+        self._cheapest_prices = [m.pricing.prompt_price or 0.0 for m in self._cheapest]
+        self._cheapest_caps = [m.max_price_per_1m for m in self._cheapest]
+        self._flags: Dict[str, int] = dict.fromkeys(
+            ("available", "text_chat", "tools", "vision", "embedding"), 0
+        )
+        for position, model in enumerate(self._cheapest):
+            bit = 1 << position
+            if model.is_available:
+                self._flags["available"] |= bit
+            if model.is_text_chat:
+                self._flags["text_chat"] |= bit
+            if model.supports_tools:
+                self._flags["tools"] |= bit
+            if model.supports_vision:
+                self._flags["vision"] |= bit
+            if model.is_embedding:
+                self._flags["embedding"] |= bit
+        self._all = (1 << len(self._cheapest)) - 1
+
+        # Provider map.
+        self._providers: Dict[str, List["OpenRouterModel"]] = {}
+        for model in ordered:
+            self._providers.setdefault(model.provider, []).append(model)
+
+        # Search: per model, its lowercased fields NUL-separated (so a match
+        # never spans two fields), and token -> bitset over catalogue order.
+        self._ordered = ordered
+        self._segments: List[str] = []
+        postings: Dict[str, List[int]] = {}
+        for position, model in enumerate(ordered):
+            fields = [model.name.lower(), (model.description or "").lower()]
+            fields.extend(tag.lower() for tag in model.tags)
+            segment = _SEPARATOR.join(fields)
+            self._segments.append(segment)
+            for token in set(_tokens(segment)):
+                postings.setdefault(token, []).append(position)
+        self._tokens = {token: _bitset(positions, len(ordered)) for token, positions in postings.items()}
+
+        self._memo: Dict[Tuple, List["OpenRouterModel"]] = {}
+
+    def _memoized(self, key: Tuple, compute) -> List["OpenRouterModel"]:
+        result = self._memo.get(key)
+        if result is None:
+            result = compute()
+            if len(self._memo) >= _MAX_MEMO_ENTRIES:
+                self._memo.clear()
+            self._memo[key] = result
+        return list(result)
+
+    def by_price_range(self, min_price: float, max_price: float, price_type: str) -> List["OpenRouterModel"]:
+        """Available models with ``min_price <= price <= max_price``, cheapest first."""
+        index = self._prompt if price_type == "prompt" else self._completion
+        return index.between(min_price, max_price)
+
+    def by_provider(self, provider: str) -> List["OpenRouterModel"]:
+        return list(self._providers.get(provider, ()))
+
+    def eligible(
+        self,
+        *,
+        max_price_per_1m: float,
+        require_tools: bool,
+        require_vision: bool,
+        text_chat_only: bool,
+        available_only: bool,
+    ) -> List["OpenRouterModel"]:
+        """See ``ModelsCache.eligible_models``."""
+        key = ("eligible", max_price_per_1m, require_tools, require_vision, text_chat_only, available_only)
+
+        def compute():
+            mask = self._all
+            if available_only:
+                mask &= self._flags["available"]
+            if text_chat_only:
+                mask &= self._flags["text_chat"]
+            if require_tools:
+                mask &= self._flags["tools"]
+            if require_vision:
+                mask &= self._flags["vision"]
+            # max(prompt, completion) <= cap implies prompt <= cap: drop the
+            # tail of the cheapest-first order before checking the rest.
+            mask &= (1 << bisect_right(self._cheapest_prices, max_price_per_1m)) - 1
+            models = _select(self._cheapest, mask)
+            if max_price_per_1m == float("inf"):
+                return models
+            caps = _select(self._cheapest_caps, mask)
+            return [model for model, cap in zip(models, caps) if cap <= max_price_per_1m]
+
+        return self._memoized(key, compute)
+
+    def embedding(self, *, available_only: bool) -> List["OpenRouterModel"]:
+        """See ``ModelsCache.embedding_models``."""
+        mask = self._flags["embedding"]
+        if available_only:
+            mask &= self._flags["available"]
+        return self._memoized(
+            ("embedding", available_only),
+            lambda: _select(self._cheapest, mask),
+        )
+
+    def _word_mask(self, word: str) -> int:
+        """Models with an indexed token containing ``word``."""
+        key = ("word", word)
+        mask = self._memo.get(key)
+        if mask is None:
+            mask = 0
+            for token, bits in self._tokens.items():
+                if word in token:
+                    mask |= bits
+            self._memo[key] = mask
+        return mask
+
+    def search(self, query: str) -> List["OpenRouterModel"]:
+        """Models whose name, description or a tag contains ``query`` (case-insensitive)."""
+        needle = query.lower()
+        if _SEPARATOR in needle:
+            return []
+
+        def compute():
+            ordered, segments = self._ordered, self._segments
+            words = _tokens(needle)
+            if not words:  # nothing to look up: plain scan
+                return [model for model, segment in zip(ordered, segments) if needle in segment]
+            # A query word has no token breaks, so wherever the query occurs
+            # each word lies inside one indexed token: the candidates are a
+            # superset of the matches.
+            mask = self._all
+            for word in words:
+                mask &= self._word_mask(word)
+                if not mask:
+                    return []
+            if words == [needle]:  # a lone word matches exactly its tokens
+                return _select(ordered, mask)
+            return [
+                model for model, segment in zip(_select(ordered, mask), _select(segments, mask))
+                if needle in segment
+            ]
+
+        return self._memoized(("search", needle), compute)
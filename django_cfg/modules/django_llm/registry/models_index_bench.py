@@ -0,0 +1,131 @@
+"""
+Benchmark: ModelsCache queries on a 5k-model synthetic catalogue.
+
+Compares, per query:
+- before: the previous linear scan + sort over every model
+- cold: the indexed query on a freshly built index (no memoized result)
+- warm: the indexed query repeated, as the router does in its hot path
+
+Also reports the one-off index build time paid on load/refresh.
+
+Usage:
+    python -m django_cfg.modules.django_llm.registry.models_index_bench
+"""
+
+import random
+import tempfile
+import time
+
+from .models import ModelPricing, ModelsCache, OpenRouterModel
+from .models_index import ModelsIndex
+
+CATALOGUE_SIZE = 5000
+REPEATS = 200
+
+VENDORS = ["openai", "anthropic", "google", "meta-llama", "mistralai", "qwen", "deepseek", "x-ai"]
+WORDS = ["chat", "coder", "vision", "instruct", "mini", "turbo", "reasoning", "flash", "pro", "lite"]
+
+
+def _catalogue():
+    rng = random.Random(42)
+    models = {}
+    for n in range(CATALOGUE_SIZE):
+        vendor = rng.choice(VENDORS)
+        words = rng.sample(WORDS, 2)
+        prompt = round(rng.lognormvariate(0, 1.5), 3) if rng.random() > 0.1 else 0.0
+        model = OpenRouterModel(
+            id=f"{vendor}/{words[0]}-{words[1]}-{n}",
+            name=f"{vendor.title()}: {words[0].title()} {words[1].title()} {n}",
+            description=" ".join(rng.choices(WORDS + ["model", "fast", "large", "context"], k=60)),
+            context_length=rng.choice([8192, 32768, 128000, 1000000]),
+            pricing=ModelPricing(prompt_price=prompt, completion_price=prompt * rng.choice([1, 2, 4, 5])),
+            provider=vendor,
+            tags=rng.sample(WORDS, 2),
+            is_available=rng.random() > 0.05,
+            input_modalities=rng.choice([["text"], ["text", "image"], ["text", "image", "audio"]]),
+            output_modalities=rng.choice([["text"], ["text"], ["embedding"]]),
+            supported_parameters=rng.sample(["tools", "response_format", "structured_outputs", "reasoning"], rng.randint(0, 4)),
+        )
+        models[model.id] = model
+    return models
+
+
+# The previous implementations, kept verbatim for comparison.
+def _eligible_before(models, max_price_per_1m=float("inf"), require_tools=False):
+    out = [
+        m for m in models.values()
+        if m.is_available and m.is_text_chat
+        and (not require_tools or m.supports_tools)
+        and m.max_price_per_1m <= max_price_per_1m
+    ]
+    out.sort(key=lambda m: m.pricing.prompt_price or 0.0)
+    return out
+
+
+def _price_range_before(models, min_price, max_price):
+    out = [m for m in models.values() if m.is_available and min_price <= m.pricing.prompt_price <= max_price]
+    out.sort(key=lambda m: m.pricing.prompt_price)
+    return out
+
+
+def _search_before(models, query):
+    q = query.lower()
+    return [
+        m for m in models.values()
+        if q in m.name.lower()
+        or (m.description and q in m.description.lower())
+        or any(q in tag.lower() for tag in m.tags)
+    ]
+
+
+def _per_call_us(fn, repeats=REPEATS):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - started) / repeats * 1e6
+
+
+def _cold_us(cache, fn, repeats=20):
+    total = 0.0
+    for _ in range(repeats):
+        cache._models_index = ModelsIndex(cache.models)
+        started = time.perf_counter()
+        fn()
+        total += time.perf_counter() - started
+    return total / repeats * 1e6
+
+
+def main() -> None:
+    models = _catalogue()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ModelsCache(api_key="bench", cache_dir=cache_dir)
+        started = time.perf_counter()
+        cache._set_catalogue(models, None)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        queries = [
+            ("eligible (all chat)",
+             lambda: _eligible_before(models), lambda: cache.eligible_models()),
+            ("eligible (tools, <=$1)",
+             lambda: _eligible_before(models, 1.0, True),
+             lambda: cache.eligible_models(max_price_per_1m=1.0, require_tools=True)),
+            ("price range 0.5-2",
+             lambda: _price_range_before(models, 0.5, 2.0), lambda: cache.get_models_by_price_range(0.5, 2.0)),
+            ("search 'coder'",
+             lambda: _search_before(models, "coder"), lambda: cache.search_models("coder")),
+            ("search 'qwen: flash'",
+             lambda: _search_before(models, "qwen: flash"), lambda: cache.search_models("qwen: flash")),
+        ]
+
+        print(f"{CATALOGUE_SIZE:,}-model catalogue, index build {build_ms:.1f} ms")
+        print(f"{'query':>24}  {'results':>7}  {'before us':>10}  {'cold us':>9}  {'warm us':>8}")
+        for name, before, after in queries:
+            assert [m.id for m in before()] == [m.id for m in after()], name
+            print(
+                f"{name:>24}  {len(after()):>7,}  {_per_call_us(before, 20):>10.0f}  "
+                f"{_cold_us(cache, after):>9.0f}  {_per_call_us(after):>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Tests for the ModelsCache secondary indexes.
+"""
+
+import random
+
+import pytest
+
+from .models import ModelPricing, ModelsCache, OpenRouterModel
+
+VENDORS = ["openai", "anthropic", "google", "meta", "mistral"]
+WORDS = ["chat", "code", "vision", "instruct", "mini", "turbo", "Reasoning", "flash"]
+
+
+def make_catalogue(count, seed=7):
+    rng = random.Random(seed)
+    models = {}
+    for n in range(count):
+        vendor = rng.choice(VENDORS)
+        words = rng.sample(WORDS, 2)
+        prompt = rng.choice([0.0, 0.0, 0.15, 0.5, 1.0, 3.0, 15.0]) * rng.choice([1, 2])
+        model = OpenRouterModel(
+            id=f"{vendor}/model-{n}",
+            name=f"{vendor.title()}: {words[0]} {n}",
+            description=rng.choice([None, f"A {words[1]} model", "General purpose"]),
+            context_length=rng.choice([8192, 128000]),
+            pricing=ModelPricing(prompt_price=prompt, completion_price=prompt * rng.choice([0, 1, 4])),
+            provider=vendor,
+            tags=rng.sample(WORDS, rng.randint(0, 2)),
+            is_available=rng.random() > 0.1,
+            input_modalities=rng.choice([["text"], ["text", "image"], ["image"]]),
+            output_modalities=rng.choice([["text"], [], ["embedding"]]),
+            supported_parameters=rng.sample(["tools", "response_format", "reasoning"], rng.randint(0, 3)),
+            is_embedding=rng.random() < 0.05,
+        )
+        models[model.id] = model
+    return models
+
+
+def linear_eligible(models, max_price, tools, vision, text_chat, available):
+    out = [
+        m for m in models.values()
+        if (not available or m.is_available)
+        and (not text_chat or m.is_text_chat)
+        and (not tools or m.supports_tools)
+        and (not vision or m.supports_vision)
+        and m.max_price_per_1m <= max_price
+    ]
+    out.sort(key=lambda m: m.pricing.prompt_price or 0.0)
+    return out
+
+
+def linear_search(models, query):
+    q = query.lower()
+    return [
+        m for m in models.values()
+        if q in m.name.lower()
+        or (m.description and q in m.description.lower())
+        or any(q in tag.lower() for tag in m.tags)
+    ]
+
+
+def linear_price_range(models, low, high, price_type):
+    def price(m):
+        return m.pricing.prompt_price if price_type == "prompt" else m.pricing.completion_price
+
+    return sorted((m for m in models.values() if m.is_available and low <= price(m) <= high), key=price)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ModelsCache(api_key="test", cache_dir=tmp_path)
+    cache._set_catalogue(make_catalogue(400), None)
+    return cache
+
+
+def _ids(models):
+    return [m.id for m in models]
+
+
+class TestModelsIndex:
+    """Indexed queries must return exactly what the linear scans returned."""
+
+    def test_eligible_models_match_linear_scan(self, cache):
+        for max_price in (0.0, 1.0, 4.0, float("inf")):
+            for flags in [(False, False, True, True), (True, False, True, True),
+                          (True, True, True, True), (False, True, False, False)]:
+                expected = linear_eligible(cache.models, max_price, *flags)
+                tools, vision, text_chat, available = flags
+                got = cache.eligible_models(
+                    max_price_per_1m=max_price, require_tools=tools, require_vision=vision,
+                    text_chat_only=text_chat, available_only=available,
+                )
+                assert _ids(got) == _ids(expected)
+
+        embedding = [m for m in cache.models.values() if m.is_embedding and m.is_available]
+        embedding.sort(key=lambda m: m.pricing.prompt_price or 0.0)
+        assert _ids(cache.embedding_models()) == _ids(embedding)
+
+    def test_price_range_provider_and_search_match_linear_scan(self, cache):
+        for low, high in [(0.0, 0.0), (0.0, 1.0), (0.5, 6.0), (10.0, float("inf"))]:
+            for price_type in ("prompt", "completion"):
+                assert _ids(cache.get_models_by_price_range(low, high, price_type)) == _ids(
+                    linear_price_range(cache.models, low, high, price_type)
+                )
+        assert _ids(cache.get_models_by_provider("meta")) == _ids(
+            m for m in cache.models.values() if m.provider == "meta"
+        )
+        for query in ("CODE", "openai: ", "model", "purpose", "3", "", "zzz", "ash"):
+            assert _ids(cache.search_models(query)) == _ids(linear_search(cache.models, query))
+
+    def test_results_are_fresh_lists(self, cache):
+        first = cache.search_models("chat")
+        first.clear()
+        assert cache.search_models("chat")
+        cache.eligible_models().clear()
+        assert cache.eligible_models()
+
+    def test_refresh_swaps_catalogue_and_index_together(self, cache):
+        before = cache.eligible_models()
+
+        cache._set_catalogue(make_catalogue(50, seed=1), None)
+
+        assert _ids(cache.eligible_models()) == _ids(linear_eligible(cache.models, float("inf"), False, False, True, True))
+        assert _ids(cache.eligible_models()) != _ids(before)
+
+        # Direct mutation of the catalogue is picked up too
+        extra = make_catalogue(1, seed=2)
+        cache.models.update({f"x/{k}": v for k, v in extra.items()})
+        assert len(cache.search_models("")) == 51
+
+        cache.clear_cache()
+        assert cache.search_models("") == []
@@ -40,16 +40,22 @@ Usage — raw text completion:
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures as _futures
 import logging
-import time
 from typing import Callable, TypeVar
 
 from pydantic import BaseModel
 
 from ..client.client import LLMClient
 from ..providers import LLMProvider
-from ..pipeline import ModelRouter, alert_wasted_call
+from ..pipeline import (
+    ModelRouter,
+    RaceCancelled,
+    SharedPipelineState,
+    alert_wasted_call,
+    get_race_stats,
+    get_shared_state,
+    race_call,
+)
 from ..core import AllProvidersFailedError
 from ..core.errors import LLMTruncationError, LLMValidationError
 from ..catalog import PROVIDER_GONKA, ModelRole, check, provider_for, races, recommend
@@ -133,6 +139,11 @@ class LLMRouter:
         race_size: DEPRECATED as a blanket setting — derived per model from
             ``catalog.races(model)`` when left ``None``. An explicit value
             overrides that for every model in the chain.
+        shared_state: Redis-backed ``pipeline.SharedPipelineState`` for the
+            per-model circuit breakers, so an outage seen by one worker
+            process fast-fails in all of them. Defaults to the process-wide
+            ``pipeline.configure_shared_state`` value; ``None`` there means
+            in-process breakers.
     """
 
     def __init__(
@@ -145,6 +156,7 @@ class LLMRouter:
         race_size: int | None = None,
         race_rounds: int = 2,
         race_stagger_seconds: float = 0.2,
+        shared_state: SharedPipelineState | None = None,
     ) -> None:
         if not model_chain:
             raise ValueError("LLMRouter requires a non-empty model_chain")
@@ -174,6 +186,7 @@ class LLMRouter:
         self._race_size_override = max(1, race_size) if race_size is not None else None
         self._race_rounds = max(1, race_rounds)
         self._race_stagger = max(0.0, race_stagger_seconds)
+        self._shared_state = shared_state
 
     # ── Per-model resolution — the catalog is the source of truth ───────────────
 
@@ -263,42 +276,31 @@ class LLMRouter:
         return call(model)
 
     def _race(self, call: "Callable[[str], R]", model: str, race_size: int) -> "R":
-        """Parallel race of ``race_size`` legs on ONE model.
-
-        Staggered starts dodge gonka's near-identical-burst guard. The first leg
-        that returns (no exception) wins; remaining legs are abandoned via
-        ``shutdown(wait=False)`` so wall-clock == the fastest leg. A round where
-        every leg raises (error / empty / validation) is retried up to
-        ``race_rounds`` before the model is given up on (and the caller — the
-        cascade — moves to the next model).
+        """Hedged race of up to ``race_size`` legs on ONE model.
+
+        Delegates to ``pipeline.race_call``: legs run on the shared, bounded
+        race executor; a further leg is launched only while the running ones
+        are slower than the model's recent winners (never sooner than the
+        stagger, which dodges gonka's near-identical-burst guard). The first
+        leg that returns wins and the losers are cancelled — their streamed
+        requests hang up, so they stop consuming tokens. A round where every
+        leg raises is retried up to ``race_rounds`` before the model is given
+        up on (and the cascade moves to the next model).
+
+        Win rates and wasted tokens per model: ``LLMRouter.race_stats()``.
         """
-        last_exc: Exception | None = None
-        for round_idx in range(self._race_rounds):
-            executor = _futures.ThreadPoolExecutor(max_workers=race_size)
-            futures: list[_futures.Future] = []
-            try:
-                for leg in range(race_size):
-                    if leg and self._race_stagger:
-                        time.sleep(self._race_stagger)
-                    futures.append(executor.submit(call, model))
-                for fut in _futures.as_completed(futures):
-                    try:
-                        result = fut.result()
-                        logger.debug(
-                            "LLMRouter race: winner model=%s round=%d legs=%d",
-                            model, round_idx, race_size,
-                        )
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        return result
-                    except Exception as exc:  # this leg lost; keep waiting
-                        last_exc = exc
-            finally:
-                executor.shutdown(wait=False)
-            logger.warning(
-                "LLMRouter race round %d: model=%s all %d legs failed (last: %s)",
-                round_idx, model, race_size, last_exc,
-            )
-        raise last_exc or RuntimeError(f"race produced no result for {model}")
+        return race_call(
+            call,
+            model,
+            legs=race_size,
+            rounds=self._race_rounds,
+            stagger=self._race_stagger,
+        )
+
+    @staticmethod
+    def race_stats() -> dict[str, dict]:
+        """Process-wide racing metrics per model (see ``pipeline.RaceStats``)."""
+        return get_race_stats().snapshot()
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -435,6 +437,10 @@ class LLMRouter:
                     ]
                     continue
 
+                except RaceCancelled:
+                    # Another race leg won; this one's spend is race overhead.
+                    raise
+
                 except Exception as exc:
                     # No recovery for these — always terminal, always alert.
                     logger.warning("LLMRouter.parse: model=%s failed: %s", model, exc)
@@ -519,12 +525,16 @@ class LLMRouter:
         The chain is capped at ``max_total_attempts`` so total work stays
         bounded even if a longer chain is supplied. ``base_delay`` maps to
         the configured retry cadence (unused at max_attempts=1, but kept so
-        any future within-model retry honours it).
+        any future within-model retry honours it). With shared state the
+        breakers live in Redis, so they persist across these fresh routers
+        and across worker processes.
         """
+        shared_state = self._shared_state or get_shared_state()
         return ModelRouter(
             self._chain[: self._max_total_attempts],
             max_attempts=1,
             base_delay=self._retry_delay,
+            breaker_factory=shared_state.breaker if shared_state is not None else None,
         )
 
     @staticmethod
@@ -12,7 +12,7 @@ import logging
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 # process holds a write lock.
 _BUSY_TIMEOUT_MS = 5000
 
+# Stay well below SQLite's host-parameter limit in IN (...) lookups
+_LOOKUP_CHUNK = 500
+
 
 class LLMCache:
     """Manages LLM response caching with TTL, LRU eviction and SQLite persistence."""
@@ -163,6 +166,107 @@ class LLMCache:
         self._prune()
         logger.debug(f"Cached response for hash: {request_hash[:8]}...")
 
+    def get_many(self, request_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached responses for many hashes: one ``IN`` query per 500 misses.
+
+        Returns:
+            {request_hash: response} for the hashes that hit; misses and
+            expired or corrupt rows are left out.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for request_hash in dict.fromkeys(request_hashes):
+            if request_hash in self.memory_cache:
+                found[request_hash] = self.memory_cache[request_hash]
+            else:
+                pending.append(request_hash)
+        if not pending:
+            return found
+
+        now = time.time()
+        stale: List[str] = []
+        hits: List[str] = []
+        for start in range(0, len(pending), _LOOKUP_CHUNK):
+            chunk = pending[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT request_hash, payload, expires_at FROM llm_responses "
+                f"WHERE request_hash IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for request_hash, payload_str, expires_at in rows:
+                if expires_at <= now:
+                    stale.append(request_hash)
+                    continue
+                try:
+                    response = json.loads(payload_str)
+                except (json.JSONDecodeError, TypeError) as exc:
+                    logger.warning(f"Corrupt cache row for {request_hash[:8]}...: {exc}")
+                    stale.append(request_hash)
+                    continue
+                found[request_hash] = response
+                hits.append(request_hash)
+                self.memory_cache[request_hash] = response
+
+        # Bump LRU recency and drop dead rows in one transaction.
+        if hits:
+            self._conn.executemany(
+                "UPDATE llm_responses SET last_hit_at = ? WHERE request_hash = ?",
+                [(now, request_hash) for request_hash in hits],
+            )
+        if stale:
+            self._conn.executemany(
+                "DELETE FROM llm_responses WHERE request_hash = ?",
+                [(request_hash,) for request_hash in stale],
+            )
+        if hits or stale:
+            self._conn.commit()
+
+        logger.debug(f"Persistent cache bulk lookup: {len(hits)} hits of {len(pending)}")
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, Dict[str, Any], str]]) -> int:
+        """
+        Cache many (request_hash, response, model) entries in one transaction.
+
+        Returns:
+            Number of entries written (unserializable responses are skipped)
+        """
+        now = time.time()
+        expires_at = now + self.ttl
+        rows = []
+        for request_hash, response, model in items:
+            try:
+                payload_str = json.dumps(response, ensure_ascii=False)
+            except (TypeError, ValueError) as exc:
+                logger.error(f"Failed to serialize response for cache: {exc}")
+                continue
+            rows.append((request_hash, payload_str, model, now, expires_at, now))
+            self.memory_cache[request_hash] = response
+        if not rows:
+            return 0
+
+        self._conn.executemany(
+            """
+            INSERT INTO llm_responses
+                (request_hash, payload, model, created_at, expires_at, last_hit_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(request_hash) DO UPDATE SET
+                payload     = excluded.payload,
+                model       = excluded.model,
+                created_at  = excluded.created_at,
+                expires_at  = excluded.expires_at,
+                last_hit_at = excluded.last_hit_at
+            """,
+            rows,
+        )
+        self._conn.commit()
+
+        self._prune()
+        logger.debug(f"Cached {len(rows)} responses")
+        return len(rows)
+
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache statistics."""
         row = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
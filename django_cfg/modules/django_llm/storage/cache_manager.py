@@ -9,7 +9,7 @@ cached: a hit would replay one arbitrary sample as if it were the answer.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .cache import LLMCache
 from ..core.types import ChatCompletionResponse, EmbeddingResponse
@@ -106,11 +106,7 @@ class RequestCacheManager:
     ) -> Optional[EmbeddingResponse]:
         """Return a cached embedding, or None. Embeddings are deterministic."""
         try:
-            request_hash = self.cache.generate_request_hash(
-                messages=[{"role": "user", "content": text}],
-                model=model,
-                task="embedding",
-            )
+            request_hash = self._embedding_hash(text, model)
             cached_response = self.cache.get_response(request_hash)
         except Exception as exc:
             logger.debug("Cache read skipped (fail-open): %s", exc)
@@ -129,16 +125,53 @@ class RequestCacheManager:
     ) -> None:
         """Cache an embedding response. No-op on error."""
         try:
-            request_hash = self.cache.generate_request_hash(
-                messages=[{"role": "user", "content": text}],
-                model=model,
-                task="embedding",
-            )
+            request_hash = self._embedding_hash(text, model)
             self.cache.set_response(request_hash, response.model_dump(), model)
             logger.debug("Cached embedding response")
         except Exception as exc:
             logger.debug("Cache write skipped (fail-open): %s", exc)
 
+    def _embedding_hash(self, text: str, model: str) -> str:
+        return self.cache.generate_request_hash(
+            messages=[{"role": "user", "content": text}],
+            model=model,
+            task="embedding",
+        )
+
+    def get_cached_embeddings(
+        self,
+        texts: List[str],
+        model: str,
+    ) -> List[Optional[EmbeddingResponse]]:
+        """Bulk twin of :meth:`get_cached_embedding`: one entry per text, None on miss."""
+        try:
+            hashes = [self._embedding_hash(text, model) for text in texts]
+            cached = self.cache.get_many(hashes)
+        except Exception as exc:
+            logger.debug("Cache read skipped (fail-open): %s", exc)
+            return [None] * len(texts)
+
+        results: List[Optional[EmbeddingResponse]] = []
+        for request_hash in hashes:
+            payload = cached.get(request_hash)
+            results.append(EmbeddingResponse(**payload) if payload else None)
+        return results
+
+    def cache_embedding_responses(
+        self,
+        items: List[Tuple[str, EmbeddingResponse]],
+        model: str,
+    ) -> None:
+        """Bulk twin of :meth:`cache_embedding_response` for (text, response) pairs."""
+        try:
+            self.cache.set_many(
+                (self._embedding_hash(text, model), response.model_dump(), model)
+                for text, response in items
+            )
+            logger.debug("Cached %d embedding responses", len(items))
+        except Exception as exc:
+            logger.debug("Cache write skipped (fail-open): %s", exc)
+
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache information (empty dict on error)."""
         try:
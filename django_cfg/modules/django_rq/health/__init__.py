@@ -11,6 +11,8 @@ Public API:
 - :class:`QueueHealthMonitor` — orchestrates one check cycle.
 - :func:`run_queue_health_check` — scheduled-task entry point.
 - :class:`QueueMetrics` / :func:`collect_queue_metrics` — metric collection.
+- :class:`QueueMetricsCollector` / :func:`get_collector` — cached, pipelined
+  snapshots plus job event counters; :func:`render_prometheus` exports them.
 - :class:`QueueStatus` / :class:`Severity` / :func:`evaluate` — evaluation.
 
 The monitor runs automatically when ``DjangoRQConfig.health.enabled`` is True
@@ -19,6 +21,14 @@ and is also exposed as the ``rq_health_check`` management command.
 
 from __future__ import annotations
 
+from .collector import (
+    MetricsSnapshot,
+    MetricsWorker,
+    QueueMetricsCollector,
+    get_collector,
+    record_job_event,
+    render_prometheus,
+)
 from .evaluator import MetricBreach, QueueStatus, Severity, evaluate
 from .metrics import QueueMetrics, collect_queue_metrics
 from .monitor import QueueHealthMonitor
@@ -29,6 +39,12 @@ __all__ = [
     "run_queue_health_check",
     "QueueMetrics",
     "collect_queue_metrics",
+    "QueueMetricsCollector",
+    "MetricsSnapshot",
+    "MetricsWorker",
+    "get_collector",
+    "record_job_event",
+    "render_prometheus",
     "QueueStatus",
     "Severity",
     "MetricBreach",
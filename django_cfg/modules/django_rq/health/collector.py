@@ -0,0 +1,460 @@
+"""
+Incremental, cached queue metrics for the RQ queue-health monitor.
+
+``collect_queue_metrics`` reads one queue with a dozen-plus Redis commands
+(more with workers and the orphan sample) every time it is called. Under
+frequent scraping that is steady Redis load for numbers that barely change
+between scrapes. This module keeps two cheaper sources instead:
+
+- **Event counters** — ``record_job_event`` bumps a per-queue Redis hash
+  (``enqueued`` / ``started`` / ``finished`` / ``failed``) from the enqueue
+  pipeline (``IndexedQueue``) and from :class:`MetricsWorker`. They are
+  cumulative, so they map directly to Prometheus counters.
+- **Snapshots** — :class:`QueueMetricsCollector` reads every queue's depth,
+  registry sizes, workers, orphan sample and scheduler lag in two pipelined
+  round trips per Redis server, and serves that snapshot until it is older
+  than ``max_staleness``. ``start()`` refreshes it on a fixed interval in a
+  daemon thread; without the thread it refreshes lazily on read.
+
+:func:`render_prometheus` formats a snapshot in the Prometheus text
+exposition format.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from django_cfg.utils import get_logger
+from rq import Worker
+from rq.utils import utcparse
+
+from .metrics import QueueMetrics
+from .scheduler import SCHEDULED_JOBS_KEY
+
+logger = get_logger("rq.health")
+
+METRICS_KEY_PREFIX = "dcfg:rq_metrics"
+
+JOB_EVENTS = ("enqueued", "started", "finished", "failed")
+
+# Registry name -> Redis key prefix, in RQ's own naming
+REGISTRIES = {
+    "started": "rq:wip:",
+    "finished": "rq:finished:",
+    "failed": "rq:failed:",
+    "deferred": "rq:deferred:",
+    "scheduled": "rq:scheduled:",
+}
+
+DEFAULT_REFRESH_INTERVAL = 15.0
+DEFAULT_MAX_STALENESS = 30.0
+
+
+def events_key(queue_name: str) -> str:
+    """Redis hash holding a queue's cumulative job event counters."""
+    return f"{METRICS_KEY_PREFIX}:events:{queue_name}"
+
+
+def record_job_event(connection, queue_name: str, event: str, count: int = 1) -> None:
+    """
+    Count a job lifecycle event. Never raises.
+
+    ``connection`` may be a pipeline, in which case the HINCRBY rides along
+    with the caller's round trip.
+    """
+    try:
+        connection.hincrby(events_key(queue_name), event, count)
+    except Exception as exc:
+        logger.debug(f"could not record '{event}' for queue '{queue_name}': {exc}")
+
+
+class JobEventCountingMixin:
+    """Worker mixin that counts started, finished and failed jobs per queue."""
+
+    def prepare_job_execution(self, job, remove_from_intermediate_queue: bool = False) -> None:
+        super().prepare_job_execution(job, remove_from_intermediate_queue=remove_from_intermediate_queue)
+        record_job_event(self.connection, job.origin, "started")
+
+    def handle_job_success(self, job, queue, started_job_registry) -> None:
+        super().handle_job_success(job, queue, started_job_registry)
+        record_job_event(self.connection, queue.name, "finished")
+
+    def handle_job_failure(self, job, queue, started_job_registry=None, exc_string="") -> None:
+        super().handle_job_failure(job, queue, started_job_registry=started_job_registry, exc_string=exc_string)
+        record_job_event(self.connection, queue.name, "failed")
+
+
+class MetricsWorker(JobEventCountingMixin, Worker):
+    """The default forking RQ worker, counting job events."""
+
+
+@dataclass
+class QueueSnapshot:
+    """One queue's slice of a :class:`MetricsSnapshot`."""
+
+    metrics: QueueMetrics
+    registries: Dict[str, int] = field(default_factory=dict)
+    events: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class MetricsSnapshot:
+    """All monitored queues, read at one point in time."""
+
+    queues: Dict[str, QueueSnapshot]
+    # Monotonic clock reading, for staleness checks
+    taken_at: float
+    collected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    scheduler_lag_sec: Optional[float] = None
+
+
+def _text(value) -> Optional[str]:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _int(value) -> int:
+    if value is None or isinstance(value, Exception):
+        return 0
+    return int(value)
+
+
+def _age_from_timestamp(value) -> Optional[float]:
+    if not value or isinstance(value, Exception):
+        return None
+    try:
+        moment = utcparse(_text(value)).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return max(0.0, (datetime.now(timezone.utc) - moment).total_seconds())
+
+
+class QueueMetricsCollector:
+    """
+    Pipelined, cached collector of per-queue health metrics.
+
+    Args:
+        queue_names: Queues to collect. None means every queue in ``RQ_QUEUES``.
+        orphan_sample_size: Queued IDs sampled per queue for the orphan ratio.
+        refresh_interval: Seconds between refreshes of the background thread.
+        max_staleness: Default age in seconds past which a read refreshes.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        queue_names: Optional[Sequence[str]] = None,
+        *,
+        orphan_sample_size: int = 200,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_staleness: float = DEFAULT_MAX_STALENESS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.queue_names = list(queue_names) if queue_names else None
+        self.orphan_sample_size = orphan_sample_size
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._snapshot: Optional[MetricsSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refreshes = 0
+
+    # ------------------------------------------------------------------ reads
+
+    def snapshot(self, max_staleness: Optional[float] = None) -> MetricsSnapshot:
+        """
+        Return the cached snapshot, refreshing it first if it is too old.
+
+        Concurrent readers that find it stale trigger a single refresh.
+        """
+        limit = self.max_staleness if max_staleness is None else max_staleness
+        snapshot = self._fresh(limit)
+        if snapshot is not None:
+            return snapshot
+        with self._refresh_lock:
+            snapshot = self._fresh(limit)
+            if snapshot is not None:
+                return snapshot
+            return self._refresh_locked()
+
+    def queue_metrics(self, queue_name: str, max_staleness: Optional[float] = None) -> QueueMetrics:
+        """Return a queue's :class:`QueueMetrics` from the snapshot. Never raises."""
+        try:
+            queue = self.snapshot(max_staleness).queues.get(queue_name)
+        except Exception as exc:
+            logger.error(f"metrics snapshot failed: {exc}", exc_info=True)
+            return QueueMetrics(queue=queue_name, collection_error=str(exc))
+        if queue is None:
+            return QueueMetrics(queue=queue_name, collection_error="queue not in metrics snapshot")
+        return queue.metrics
+
+    def refresh(self) -> MetricsSnapshot:
+        """Read a new snapshot from Redis now."""
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    # ------------------------------------------------------------ background
+
+    def start(self) -> None:
+        """Refresh every ``refresh_interval`` seconds in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rq-metrics-collector", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.warning(f"metrics refresh failed: {exc}")
+            self._stop.wait(self.refresh_interval)
+
+    # --------------------------------------------------------------- helpers
+
+    def _fresh(self, limit: float) -> Optional[MetricsSnapshot]:
+        snapshot = self._snapshot
+        if snapshot is not None and self._clock() - snapshot.taken_at <= limit:
+            return snapshot
+        return None
+
+    def _queues_by_server(self) -> List[List]:
+        import django_rq
+        from django.conf import settings
+
+        names = self.queue_names or list(getattr(settings, "RQ_QUEUES", {}).keys())
+        servers: Dict[str, List] = {}
+        for name in names:
+            queue = django_rq.get_queue(name)
+            servers.setdefault(repr(queue.connection.connection_pool), []).append(queue)
+        return list(servers.values())
+
+    def _refresh_locked(self) -> MetricsSnapshot:
+        queues: Dict[str, QueueSnapshot] = {}
+        scheduler_lag = None
+        for server_queues in self._queues_by_server():
+            try:
+                lag = self._read_server(server_queues, queues)
+                if scheduler_lag is None:
+                    scheduler_lag = lag
+            except Exception as exc:
+                logger.warning(f"metrics read failed for queues {[q.name for q in server_queues]}: {exc}")
+                for queue in server_queues:
+                    queues[queue.name] = QueueSnapshot(
+                        metrics=QueueMetrics(queue=queue.name, collection_error=str(exc))
+                    )
+
+        snapshot = MetricsSnapshot(queues=queues, taken_at=self._clock(), scheduler_lag_sec=scheduler_lag)
+        self._snapshot = snapshot
+        self.refreshes += 1
+        return snapshot
+
+    def _read_server(self, server_queues: List, out: Dict[str, QueueSnapshot]) -> Optional[float]:
+        """Read all queues sharing one Redis in two pipelined round trips."""
+        connection = server_queues[0].connection
+
+        # Round trip 1: sizes, counters, queue head, worker keys, scheduler
+        with connection.pipeline(transaction=False) as pipe:
+            for queue in server_queues:
+                pipe.llen(queue.key)
+                for prefix in REGISTRIES.values():
+                    pipe.zcard(f"{prefix}{queue.name}")
+                pipe.hgetall(events_key(queue.name))
+                pipe.lrange(queue.key, 0, max(0, self.orphan_sample_size - 1))
+                pipe.smembers(f"rq:workers:{queue.name}")
+            pipe.zrange(SCHEDULED_JOBS_KEY, 0, 0, withscores=True)
+            replies = pipe.execute(raise_on_error=False)
+
+        per_queue = 4 + len(REGISTRIES)
+        scheduled = replies[-1]
+        scheduler_lag = None
+        if scheduled and not isinstance(scheduled, Exception):
+            scheduler_lag = max(0.0, time.time() - float(scheduled[0][1]))
+
+        parsed = []
+        for n, queue in enumerate(server_queues):
+            chunk = replies[n * per_queue:(n + 1) * per_queue]
+            depth, *sizes, events, head, workers = chunk
+            job_ids = [_text(j) for j in head] if isinstance(head, list) else []
+            worker_keys = sorted(_text(w) for w in workers) if isinstance(workers, (set, list)) else []
+            parsed.append((queue, depth, sizes, events, job_ids, worker_keys))
+
+        # Round trip 2: sampled job hashes (existence + age), worker heartbeats
+        with connection.pipeline(transaction=False) as pipe:
+            for _, _, _, _, job_ids, worker_keys in parsed:
+                for job_id in job_ids:
+                    pipe.hmget(f"rq:job:{job_id}", "enqueued_at", "created_at")
+                for worker_key in worker_keys:
+                    pipe.hget(worker_key, "last_heartbeat")
+            replies = iter(pipe.execute(raise_on_error=False))
+
+        for queue, depth, sizes, events, job_ids, worker_keys in parsed:
+            metrics = QueueMetrics(queue=queue.name, depth=_int(depth), scheduler_lag_sec=scheduler_lag)
+            registries = dict(zip(REGISTRIES, (_int(size) for size in sizes)))
+            metrics.failed_count = registries["failed"]
+
+            missing_ids = []
+            for job_id in job_ids:
+                reply = next(replies)
+                if isinstance(reply, Exception):
+                    continue  # unknowable: treat as present, do not over-report
+                enqueued_at, created_at = reply
+                if enqueued_at is None and created_at is None:
+                    missing_ids.append(job_id)
+                elif metrics.oldest_job_age_sec is None:
+                    metrics.oldest_job_age_sec = _age_from_timestamp(enqueued_at or created_at)
+
+            metrics.orphan_sampled = len(job_ids)
+            metrics.orphan_missing = len(missing_ids)
+            metrics.orphan_missing_ids = missing_ids
+            metrics.orphan_id_ratio = len(missing_ids) / len(job_ids) if job_ids else 0.0
+
+            heartbeat_ages = [
+                age for age in (_age_from_timestamp(next(replies)) for _ in worker_keys) if age is not None
+            ]
+            metrics.worker_count = len(heartbeat_ages)
+            if heartbeat_ages:
+                metrics.worker_heartbeat_age_sec = min(heartbeat_ages)
+
+            if isinstance(events, dict):
+                event_counts = {_text(k): _int(v) for k, v in events.items()}
+            else:
+                event_counts = {}
+            out[queue.name] = QueueSnapshot(metrics=metrics, registries=registries, events=event_counts)
+
+        return scheduler_lag
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot: MetricsSnapshot, now: Optional[Callable[[], float]] = None) -> str:
+    """
+    Format a snapshot in the Prometheus text exposition format (0.0.4).
+
+    Unknown values (no workers, empty queue) are omitted rather than exported
+    as zero, so alerts on them do not fire on missing data.
+    """
+    families: Dict[str, tuple] = {
+        "rq_queue_depth": ("gauge", "Jobs waiting in the queue", []),
+        "rq_queue_registry_jobs": ("gauge", "Jobs in each RQ registry", []),
+        "rq_queue_oldest_job_age_seconds": ("gauge", "Age of the oldest queued job", []),
+        "rq_queue_workers": ("gauge", "Live workers listening on the queue", []),
+        "rq_queue_worker_heartbeat_age_seconds": ("gauge", "Age of the newest worker heartbeat", []),
+        "rq_queue_orphan_ratio": ("gauge", "Share of sampled queued IDs whose job hash is missing", []),
+        "rq_jobs_total": ("counter", "Job lifecycle events since counters were created", []),
+        "rq_scheduler_lag_seconds": ("gauge", "Lag of the most overdue scheduled job", []),
+        "rq_metrics_snapshot_age_seconds": ("gauge", "Age of the snapshot these metrics come from", []),
+    }
+
+    def add(name: str, value, **labels) -> None:
+        if value is None:
+            return
+        label_text = ",".join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+        series = f"{name}{{{label_text}}}" if label_text else name
+        families[name][2].append(f"{series} {_format_value(value)}")
+
+    for name in sorted(snapshot.queues):
+        queue = snapshot.queues[name]
+        metrics = queue.metrics
+        if metrics.collection_error:
+            continue
+        add("rq_queue_depth", metrics.depth, queue=name)
+        for registry, count in queue.registries.items():
+            add("rq_queue_registry_jobs", count, queue=name, registry=registry)
+        add("rq_queue_oldest_job_age_seconds", metrics.oldest_job_age_sec, queue=name)
+        add("rq_queue_workers", metrics.worker_count, queue=name)
+        add("rq_queue_worker_heartbeat_age_seconds", metrics.worker_heartbeat_age_sec, queue=name)
+        add("rq_queue_orphan_ratio", metrics.orphan_id_ratio, queue=name)
+        for event in JOB_EVENTS:
+            add("rq_jobs_total", queue.events.get(event, 0), queue=name, event=event)
+
+    add("rq_scheduler_lag_seconds", snapshot.scheduler_lag_sec)
+    clock = now or time.monotonic
+    add("rq_metrics_snapshot_age_seconds", max(0.0, clock() - snapshot.taken_at))
+
+    lines: List[str] = []
+    for name, (kind, help_text, samples) in families.items():
+        if not samples:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+_collector: Optional[QueueMetricsCollector] = None
+_collector_lock = threading.Lock()
+
+
+def get_collector(config=None) -> QueueMetricsCollector:
+    """
+    Return the process-wide collector, created from ``RQHealthConfig``.
+
+    Args:
+        config: Optional :class:`RQHealthConfig`; resolved from the active
+            DjangoConfig on first use when omitted.
+    """
+    global _collector
+
+    if _collector is not None:
+        return _collector
+    with _collector_lock:
+        if _collector is None:
+            if config is None:
+                from django_cfg.modules.django_rq.services.config_helper import get_rq_config
+
+                rq_config = get_rq_config()
+                config = getattr(rq_config, "health", None)
+            if config is None:
+                _collector = QueueMetricsCollector()
+            else:
+                _collector = QueueMetricsCollector(
+                    config.monitored_queues,
+                    orphan_sample_size=config.orphan_sample_size,
+                    refresh_interval=config.metrics_refresh_interval_sec,
+                    max_staleness=config.metrics_max_staleness_sec,
+                )
+    return _collector
+
+
+def reset_collector() -> None:
+    """Stop and drop the process-wide collector (tests, config reloads)."""
+    global _collector
+
+    with _collector_lock:
+        if _collector is not None:
+            _collector.stop(timeout=1)
+        _collector = None
+
+
+__all__ = [
+    "JOB_EVENTS",
+    "JobEventCountingMixin",
+    "MetricsSnapshot",
+    "MetricsWorker",
+    "QueueMetricsCollector",
+    "QueueSnapshot",
+    "get_collector",
+    "record_job_event",
+    "render_prometheus",
+    "reset_collector",
+]
@@ -0,0 +1,102 @@
+"""
+Tests for the cached, pipelined queue metrics collector.
+"""
+
+from datetime import datetime
+
+import fakeredis
+import pytest
+from rq.job import JobStatus
+from rq.registry import FailedJobRegistry
+from rq.utils import utcformat
+from rq.worker import SimpleWorker
+
+from ..services.job_index import IndexedQueue
+from .collector import JobEventCountingMixin, QueueMetricsCollector, render_prometheus
+
+
+@pytest.fixture
+def queues(settings, monkeypatch):
+    import django_rq
+
+    connection = fakeredis.FakeStrictRedis()
+    queues = {
+        name: IndexedQueue(name, connection=connection, commit_mode="auto")
+        for name in ("default", "low")
+    }
+    settings.RQ_QUEUES = {name: {} for name in queues}
+    monkeypatch.setattr(django_rq, "get_queue", lambda name: queues[name])
+    return queues
+
+
+class InlineMetricsWorker(JobEventCountingMixin, SimpleWorker):
+    """Runs jobs in-process so fakeredis sees the counters."""
+
+
+class TestSnapshot:
+    """Test snapshot contents and caching."""
+
+    def test_reads_all_queue_metrics(self, queues):
+        default = queues["default"]
+        connection = default.connection
+        jobs = [default.enqueue("builtins.print", n) for n in range(4)]
+        connection.delete(jobs[1].key)
+        failed = queues["low"].enqueue("builtins.print")
+        queues["low"].remove(failed)
+        failed.set_status(JobStatus.FAILED)
+        FailedJobRegistry("low", connection=connection).add(failed, ttl=3600)
+        connection.sadd("rq:workers:default", "rq:worker:w1")
+        connection.hset("rq:worker:w1", "last_heartbeat", utcformat(datetime.utcnow()))
+
+        snapshot = QueueMetricsCollector().refresh()
+
+        metrics = snapshot.queues["default"].metrics
+        assert metrics.depth == 4
+        assert (metrics.orphan_sampled, metrics.orphan_missing) == (4, 1)
+        assert metrics.orphan_missing_ids == [jobs[1].id]
+        assert metrics.oldest_job_age_sec is not None
+        assert metrics.worker_count == 1
+        assert snapshot.queues["default"].events == {"enqueued": 4}
+        assert snapshot.queues["low"].metrics.failed_count == 1
+        assert snapshot.queues["low"].registries["failed"] == 1
+
+    def test_serves_cached_snapshot_until_stale(self, queues):
+        clock = [0.0]
+        collector = QueueMetricsCollector(max_staleness=30, clock=lambda: clock[0])
+
+        assert collector.queue_metrics("default").depth == 0
+        queues["default"].enqueue("builtins.print")
+        clock[0] = 29
+        assert collector.queue_metrics("default").depth == 0
+        assert collector.queue_metrics("default", max_staleness=0).depth == 1
+        assert collector.refreshes == 2
+
+        assert collector.queue_metrics("missing").collection_error
+
+    def test_worker_counts_job_events(self, queues):
+        default = queues["default"]
+        default.enqueue("builtins.print", "ok")
+        default.enqueue("builtins.int", "not a number")
+
+        InlineMetricsWorker([default], connection=default.connection).work(burst=True)
+
+        events = QueueMetricsCollector().refresh().queues["default"].events
+        assert events == {"enqueued": 2, "started": 2, "finished": 1, "failed": 1}
+
+
+def test_prometheus_exposition(queues):
+    queues["default"].enqueue("builtins.print")
+    collector = QueueMetricsCollector(clock=lambda: 100.0)
+
+    text = render_prometheus(collector.refresh(), now=lambda: 105.0)
+
+    lines = text.splitlines()
+    assert "# TYPE rq_queue_depth gauge" in lines
+    assert 'rq_queue_depth{queue="default"} 1' in lines
+    assert 'rq_queue_registry_jobs{queue="low",registry="failed"} 0' in lines
+    assert "# TYPE rq_jobs_total counter" in lines
+    assert 'rq_jobs_total{queue="default",event="enqueued"} 1' in lines
+    assert "rq_metrics_snapshot_age_seconds 5.0" in lines
+    # No workers: heartbeat age is unknown, not zero
+    assert "rq_queue_worker_heartbeat_age_seconds" not in text
+    assert text.endswith("\n")
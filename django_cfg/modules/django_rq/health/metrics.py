@@ -5,6 +5,10 @@ Per-queue metric collection for the RQ queue-health monitor.
 returns a plain :class:`QueueMetrics` dataclass. It never raises — on failure
 it returns a ``QueueMetrics`` with ``collection_error`` set so the caller can
 still log/alert sensibly.
+
+For frequent reads (scrapes, dashboards) prefer the cached snapshot of
+:class:`~.collector.QueueMetricsCollector`, which produces the same
+``QueueMetrics`` from two pipelined round trips shared by all queues.
 """
 
 from __future__ import annotations
@@ -111,14 +115,22 @@ def _collect_orphan_ratio(redis_conn, queue_name: str, sample_size: int) -> tupl
     if not ids:
         return 0.0, 0, 0, []
 
-    missing_ids: List[str] = []
-    for job_id in ids:
-        try:
-            exists = redis_conn.exists(f"rq:job:{job_id}")
-        except Exception:  # pragma: no cover - defensive
-            exists = True  # treat unknowable as present, do not over-report
-        if not exists:
-            missing_ids.append(job_id)
+    try:
+        # One round trip for the whole sample
+        with redis_conn.pipeline(transaction=False) as pipe:
+            for job_id in ids:
+                pipe.exists(f"rq:job:{job_id}")
+            replies = pipe.execute(raise_on_error=False)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning(f"orphan existence check failed for queue '{queue_name}': {exc}")
+        return 0.0, 0, 0, []
+
+    missing_ids: List[str] = [
+        job_id
+        for job_id, exists in zip(ids, replies)
+        # treat unknowable (error reply) as present, do not over-report
+        if not isinstance(exists, Exception) and not exists
+    ]
 
     sampled = len(ids)
     missing = len(missing_ids)
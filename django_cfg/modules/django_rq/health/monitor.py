@@ -32,6 +32,7 @@ from .cooldown import (
     should_alert,
 )
 from .evaluator import QueueStatus, Severity, evaluate
+from .collector import get_collector
 from .metrics import collect_queue_metrics
 
 logger = get_logger("rq.health")
@@ -176,7 +177,10 @@ class QueueHealthMonitor:
 
     def _check_queue(self, queue_name: str, config: RQHealthConfig) -> QueueStatus:
         """Collect + evaluate a single queue and emit per-queue log lines."""
-        metrics = collect_queue_metrics(queue_name, orphan_sample_size=config.orphan_sample_size)
+        if config.metrics_max_staleness_sec > 0:
+            metrics = get_collector(config).queue_metrics(queue_name)
+        else:
+            metrics = collect_queue_metrics(queue_name, orphan_sample_size=config.orphan_sample_size)
         thresholds = config.thresholds_for(queue_name)
         status = evaluate(metrics, thresholds)
 
@@ -16,11 +16,13 @@ from .config_helper import (
     is_rq_enabled,
     register_schedules_from_config,
 )
+from .job_index import IndexedQueue, locate_job
 from .job_service import (
     JobActionResult,
     JobDetail,
     JobInfo,
     JobService,
+    job_to_info,
 )
 from .rq_converters import job_to_model, queue_to_model, worker_to_model
 
@@ -41,9 +43,13 @@ __all__ = [
     "is_cancellation_requested",
     "clear_cancellation_flag",
     "get_job_status",
+    # Job index
+    "IndexedQueue",
+    "locate_job",
     # Job service
     "JobService",
     "JobActionResult",
     "JobInfo",
     "JobDetail",
+    "job_to_info",
 ]
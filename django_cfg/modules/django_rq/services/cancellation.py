@@ -13,6 +13,10 @@ Usage in tasks:
                 return {"cancelled": True}
             process(item)
 
+Checks are served from an in-process cache refreshed every
+CANCEL_CHECK_INTERVAL seconds, and pushed immediately over Redis pub/sub,
+so they are safe to call on every loop iteration.
+
 Usage in views:
     from django_cfg.modules.django_rq.services import request_cancellation
 
@@ -25,6 +29,9 @@ Usage in views:
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from typing import TYPE_CHECKING
 
 from rq.job import JobStatus
@@ -37,6 +44,11 @@ logger = logging.getLogger("django_cfg.rq.cancellation")
 # Redis key prefix for cancellation flags
 CANCEL_FLAG_PREFIX = "rq:cancel:"
 CANCEL_FLAG_TTL = 3600  # 1 hour
+# Pub/sub channel announcing cancellation requests to workers
+CANCEL_CHANNEL = "rq:cancel"
+# Seconds a cached "not cancelled" answer is trusted before re-reading Redis
+CANCEL_CHECK_INTERVAL = 1.0
+_CACHE_MAX_ENTRIES = 10_000
 
 
 def request_cancellation(job_id: str) -> bool:
@@ -116,15 +128,25 @@ def force_stop_job(job_id: str) -> bool:
         return False
 
 
-def is_cancellation_requested(job_id: str | None = None) -> bool:
+def is_cancellation_requested(
+    job_id: str | None = None,
+    max_age: float | None = None,
+) -> bool:
     """
     Check if cancellation was requested for current or specified job.
 
     Call this periodically in long-running tasks to enable
-    cooperative cancellation.
+    cooperative cancellation. The answer is cached in-process and
+    re-read from Redis at most every ``max_age`` seconds (one pipelined
+    round trip for RQ's stopped status and our flag), so calling it on
+    every iteration of a tight loop is cheap. A pub/sub listener marks the
+    cached flag as soon as ``request_cancellation`` is called, so
+    cancellation is usually seen well before ``max_age`` expires.
 
     Args:
         job_id: Optional job ID. If None, uses current job.
+        max_age: Seconds a cached answer stays valid
+            (default: CANCEL_CHECK_INTERVAL). 0 always reads Redis.
 
     Returns:
         True if cancellation was requested
@@ -150,12 +172,11 @@ def is_cancellation_requested(job_id: str | None = None) -> bool:
     assert job_id is not None
 
     try:
-        # Check RQ's built-in stopped flag first
-        if current_job and current_job.is_stopped:
-            return True
-
-        # Check our cancellation flag
-        return _get_cancel_flag(job_id)
+        return _get_cancel_flag(
+            job_id,
+            current_job if current_job and current_job.id == job_id else None,
+            CANCEL_CHECK_INTERVAL if max_age is None else max_age,
+        )
 
     except Exception:
         return False
@@ -168,6 +189,7 @@ def clear_cancellation_flag(job_id: str) -> None:
     Args:
         job_id: RQ job ID
     """
+    _flag_cache.forget(job_id)
     try:
         _, queue = _find_job(job_id)
         if queue:
@@ -200,38 +222,146 @@ def get_job_status(job_id: str) -> str | None:
 
 
 def _find_job(job_id: str) -> tuple["Job | None", any]:
-    """Find job across all queues."""
-    import django_rq
-    from django.conf import settings
-    from rq.job import Job
+    """Find job via the job index, falling back to searching all queues."""
+    from .job_index import locate_job
 
-    if not hasattr(settings, "RQ_QUEUES"):
-        return None, None
-
-    for queue_name in settings.RQ_QUEUES.keys():
-        try:
-            queue = django_rq.get_queue(queue_name)
-            job = Job.fetch(job_id, connection=queue.connection)
-            return job, queue
-        except Exception:
-            continue
-
-    return None, None
+    return locate_job(job_id)
 
 
 def _set_cancel_flag(job_id: str, connection) -> None:
-    """Set cancellation flag in Redis."""
+    """Set cancellation flag in Redis and notify listening workers."""
     key = f"{CANCEL_FLAG_PREFIX}{job_id}"
-    connection.setex(key, CANCEL_FLAG_TTL, "1")
+    with connection.pipeline() as pipe:
+        pipe.setex(key, CANCEL_FLAG_TTL, "1")
+        pipe.publish(CANCEL_CHANNEL, job_id)
+        pipe.execute()
 
 
-def _get_cancel_flag(job_id: str) -> bool:
-    """Check cancellation flag in Redis."""
-    try:
-        import django_rq
+def _get_cancel_flag(job_id: str, job: "Job | None" = None, max_age: float = CANCEL_CHECK_INTERVAL) -> bool:
+    """
+    Check cancellation flag, served from the local cache when fresh.
 
-        queue = django_rq.get_queue("default")
-        key = f"{CANCEL_FLAG_PREFIX}{job_id}"
-        return bool(queue.connection.exists(key))
+    With a job, its own connection is used and RQ's stopped status is read
+    in the same pipeline; otherwise the job is located first.
+    """
+    cached = _flag_cache.get(job_id, max_age)
+    if cached is not None:
+        return cached
+
+    try:
+        if job is not None:
+            connection = job.connection
+        else:
+            job, queue = _find_job(job_id)
+            if queue is None:
+                return False
+            connection = queue.connection
+
+        with connection.pipeline(transaction=False) as pipe:
+            pipe.exists(f"{CANCEL_FLAG_PREFIX}{job_id}")
+            pipe.hget(job.key, "status")
+            flagged, status = pipe.execute()
     except Exception:
         return False
+
+    status = status.decode() if isinstance(status, bytes) else status
+    cancelled = bool(flagged) or status == JobStatus.STOPPED.value
+    _flag_cache.put(job_id, cancelled)
+    _ensure_listener(connection)
+    return cancelled
+
+
+class _CancelFlagCache:
+    """Per-process cache of cancellation answers. A True answer never expires."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[bool, float]] = {}
+
+    def get(self, job_id: str, max_age: float) -> bool | None:
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        cancelled, checked_at = entry
+        if cancelled or time.monotonic() - checked_at < max_age:
+            return cancelled
+        return None
+
+    def put(self, job_id: str, cancelled: bool) -> None:
+        with self._lock:
+            if len(self._entries) >= _CACHE_MAX_ENTRIES and job_id not in self._entries:
+                # Work horses check one job; a long-lived process checking
+                # many simply starts over rather than growing without bound.
+                self._entries.clear()
+            self._entries[job_id] = (cancelled, time.monotonic())
+
+    def mark_cancelled(self, job_id: str) -> None:
+        """Flag a job this process is watching; others are ignored."""
+        with self._lock:
+            if job_id in self._entries:
+                self._entries[job_id] = (True, time.monotonic())
+
+    def forget(self, job_id: str) -> None:
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+
+class _CancelListener:
+    """
+    Daemon thread subscribed to CANCEL_CHANNEL.
+
+    Pub/sub delivery is at-most-once (a message published while the
+    subscription reconnects is lost), so polling every ``max_age`` seconds
+    stays as the safety net.
+    """
+
+    def __init__(self, connection) -> None:
+        self.pid = os.getpid()
+        self._pubsub = connection.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(CANCEL_CHANNEL)
+        self._thread = threading.Thread(target=self._run, name="rq-cancel-listener", daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return self.pid == os.getpid() and self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                message = self._pubsub.get_message(timeout=1.0)
+                if message and message.get("type") == "message":
+                    job_id = message["data"]
+                    if isinstance(job_id, bytes):
+                        job_id = job_id.decode()
+                    _flag_cache.mark_cancelled(job_id)
+        except Exception as e:
+            logger.debug(f"Cancellation listener stopped: {e}")
+        finally:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+
+
+def _ensure_listener(connection) -> None:
+    """Start the pub/sub listener once per process (work horses are forked)."""
+    global _listener, _listener_failed_pid
+
+    if (_listener is not None and _listener.alive) or _listener_failed_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener is not None and _listener.alive:
+            return
+        try:
+            _listener = _CancelListener(connection)
+        except Exception as e:
+            # Polling alone still works; don't retry on every check
+            _listener_failed_pid = os.getpid()
+            logger.debug(f"Cancellation listener unavailable: {e}")
+
+
+_flag_cache = _CancelFlagCache()
+_listener: _CancelListener | None = None
+_listener_failed_pid: int | None = None
+_listener_lock = threading.Lock()
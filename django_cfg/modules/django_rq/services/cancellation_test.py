@@ -0,0 +1,111 @@
+"""
+Tests for the job index and cached cancellation checks.
+"""
+
+import time
+
+import fakeredis
+import pytest
+from rq.defaults import DEFAULT_RESULT_TTL
+from rq.job import Job, JobStatus
+
+from . import cancellation
+from .cancellation import is_cancellation_requested, request_cancellation
+from .job_index import IndexedQueue, job_index_key, job_index_ttl, locate_job
+
+
+@pytest.fixture
+def queues(settings, monkeypatch):
+    import django_rq
+
+    connection = fakeredis.FakeStrictRedis()
+    queues = {
+        name: IndexedQueue(name, connection=connection, commit_mode="auto")
+        for name in ("default", "low")
+    }
+    settings.RQ_QUEUES = {name: {} for name in queues}
+    monkeypatch.setattr(django_rq, "get_queue", lambda name: queues[name])
+    monkeypatch.setattr(cancellation, "_flag_cache", cancellation._CancelFlagCache())
+    monkeypatch.setattr(cancellation, "_listener", None)
+    return queues
+
+
+def _started(queue):
+    job = queue.enqueue("builtins.print", result_ttl=600, job_timeout=60)
+    job.set_status(JobStatus.STARTED)
+    return job
+
+
+class TestJobIndex:
+    """Test index writes and lookups."""
+
+    def test_enqueue_writes_index_with_ttl(self, queues):
+        job = queues["low"].enqueue("builtins.print", result_ttl=600, job_timeout=60)
+        connection = queues["low"].connection
+
+        assert connection.get(job_index_key(job.id)) == b"low"
+        assert 600 < connection.ttl(job_index_key(job.id)) <= 660
+
+    def test_unset_result_ttl_uses_rq_default(self, queues):
+        job = queues["low"].enqueue("builtins.print", job_timeout=60, ttl=100)
+
+        assert job_index_ttl(job) == 100 + 60 + DEFAULT_RESULT_TTL
+
+    def test_locate_uses_index_on_shared_redis(self, queues, monkeypatch):
+        job = queues["low"].enqueue("builtins.print")
+        fetches = []
+        fetch = Job.fetch
+
+        def counting_fetch(job_id, connection=None, **kwargs):
+            fetches.append(job_id)
+            return fetch(job_id, connection=connection, **kwargs)
+
+        monkeypatch.setattr(Job, "fetch", counting_fetch)
+
+        found, queue = locate_job(job.id)
+
+        assert (found.id, queue.name) == (job.id, "low")
+        assert len(fetches) == 1
+
+    def test_falls_back_without_index(self, queues):
+        job = queues["low"].enqueue("builtins.print")
+        queues["low"].connection.delete(job_index_key(job.id))
+
+        found, queue = locate_job(job.id)
+
+        assert (found.id, queue.name) == (job.id, "low")
+        assert locate_job("missing") == (None, None)
+
+
+class TestCachedCancellation:
+    """Test the local flag cache and pub/sub notification."""
+
+    def test_cached_until_max_age(self, queues):
+        job = _started(queues["default"])
+
+        assert is_cancellation_requested(job.id) is False
+        # Set behind the cache's back (no pub/sub notification)
+        queues["default"].connection.set(f"{cancellation.CANCEL_FLAG_PREFIX}{job.id}", "1")
+
+        assert is_cancellation_requested(job.id, max_age=60) is False
+        assert is_cancellation_requested(job.id, max_age=0) is True
+        # A positive answer sticks without further reads
+        queues["default"].connection.delete(f"{cancellation.CANCEL_FLAG_PREFIX}{job.id}")
+        assert is_cancellation_requested(job.id, max_age=0) is True
+
+    def test_stopped_status_counts_as_cancelled(self, queues):
+        job = _started(queues["default"])
+        job.set_status(JobStatus.STOPPED)
+
+        assert is_cancellation_requested(job.id) is True
+
+    def test_pubsub_notification_updates_cache(self, queues):
+        job = _started(queues["low"])
+        assert is_cancellation_requested(job.id, max_age=3600) is False
+
+        assert request_cancellation(job.id) is True
+
+        deadline = time.monotonic() + 2
+        while not is_cancellation_requested(job.id, max_age=3600):
+            assert time.monotonic() < deadline, "pub/sub notification not received"
+            time.sleep(0.01)
@@ -0,0 +1,160 @@
+"""
+Job ID → queue index for Django-RQ.
+
+Looking a job up by ID used to mean trying every configured queue in turn.
+`IndexedQueue` records which queue a job went to, in the same pipeline that
+enqueues it, so `locate_job()` resolves it with a single GET.
+
+The index entry expires `result_ttl` after the job could at the latest have
+finished (queue wait `ttl` + `timeout` + `result_ttl`, RQ's default if
+unset); jobs that never expire keep a persistent entry. A job without
+a queue `ttl` can wait indefinitely, but its wait is not covered: giving every
+such job (most of them) a persistent entry would grow Redis without bound.
+A missing entry (expired — e.g. a job queued for longer than its timeout and
+result TTL — unique/Lua enqueue, or a job enqueued by a plain `Queue`) is not
+an error: callers fall back to searching the queues.
+
+Enabled through `DjangoRQConfig.index_jobs`, which sets
+`RQ["QUEUE_CLASS"]` to `IndexedQueue`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from django_rq.queues import DjangoRQ
+from rq.defaults import DEFAULT_RESULT_TTL
+from rq.job import JobStatus
+
+if TYPE_CHECKING:
+    from redis import Redis
+    from redis.client import Pipeline
+    from rq.job import Job
+
+logger = logging.getLogger("django_cfg.rq.job_index")
+
+# Redis key prefix for job → queue index entries
+JOB_INDEX_PREFIX = "rq:jobqueue:"
+
+
+def job_index_key(job_id: str) -> str:
+    """Redis key of the index entry for job_id."""
+    return f"{JOB_INDEX_PREFIX}{job_id}"
+
+
+def job_index_ttl(job: "Job") -> Optional[int]:
+    """
+    Seconds to keep a job's index entry, or None to keep it forever.
+
+    Covers the longest the job can run and then keep its result, plus its
+    queue wait when it has a `ttl`. Without one the wait is unbounded and not
+    counted; a lookup after the entry expires scans the queues instead.
+    """
+    result_ttl = DEFAULT_RESULT_TTL if job.result_ttl is None else job.result_ttl
+    if result_ttl < 0:
+        return None
+    if job.ttl is not None and job.ttl < 0:
+        return None
+    return (job.ttl or 0) + (job.timeout or 0) + result_ttl or None
+
+
+def index_job(job: "Job", queue_name: str, pipeline: "Pipeline | Redis") -> None:
+    """Record that job_id lives in queue_name (queued on the given pipeline)."""
+    key = job_index_key(job.id)
+    ttl = job_index_ttl(job)
+    if ttl is None:
+        pipeline.set(key, queue_name)
+    else:
+        pipeline.set(key, queue_name, ex=ttl)
+
+
+def find_job_queue(job_id: str, connection: "Redis") -> Optional[str]:
+    """Name of the queue job_id was enqueued to, if it is indexed."""
+    try:
+        value = connection.get(job_index_key(job_id))
+    except Exception as e:
+        logger.debug(f"Job index lookup failed for {job_id}: {e}")
+        return None
+    if value is None:
+        return None
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def locate_job(job_id: str) -> "tuple[Job | None, DjangoRQ | None]":
+    """
+    Find a job and the queue it belongs to.
+
+    Reads the index once per distinct Redis server, then falls back to
+    fetching the job from each configured queue's connection.
+
+    Returns:
+        Tuple of (Job, queue) or (None, None) if not found.
+    """
+    import django_rq
+    from django.conf import settings
+    from rq.exceptions import NoSuchJobError
+    from rq.job import Job
+
+    queue_names = list(getattr(settings, "RQ_QUEUES", {}).keys())
+    queues = {}
+    for queue_name in queue_names:
+        try:
+            queues[queue_name] = django_rq.get_queue(queue_name)
+        except Exception as e:
+            logger.debug(f"Cannot open queue {queue_name}: {e}")
+
+    seen_servers = set()
+    for queue in queues.values():
+        server = repr(queue.connection.connection_pool)
+        if server in seen_servers:
+            continue
+        seen_servers.add(server)
+
+        indexed = find_job_queue(job_id, queue.connection)
+        if indexed in queues:
+            try:
+                return Job.fetch(job_id, connection=queue.connection), queues[indexed]
+            except NoSuchJobError:
+                return None, None
+            except Exception as e:
+                logger.debug(f"Fetching indexed job {job_id} failed: {e}")
+
+    for queue in queues.values():
+        try:
+            job = Job.fetch(job_id, connection=queue.connection)
+        except Exception:
+            continue
+        # Queues often share one Redis; the job's origin names the right one
+        return job, queues.get(job.origin, queue)
+
+    return None, None
+
+
+class IndexedQueue(DjangoRQ):
+    """
+    Django-RQ queue that indexes every job it persists.
+
+    The index write, and the health collector's ``enqueued`` counter, are
+    added to the pipeline RQ already uses to save the job hash and push its
+    ID, so enqueueing costs no extra round trip.
+    """
+
+    def _persist_job(self, job: "Job", pipeline: "Pipeline", status: JobStatus = JobStatus.QUEUED) -> None:
+        from ..health.collector import record_job_event
+
+        super()._persist_job(job, pipeline, status=status)
+        index_job(job, self.name, pipeline)
+        if status == JobStatus.QUEUED:
+            record_job_event(pipeline, self.name, "enqueued")
+
+
+__all__ = [
+    "IndexedQueue",
+    "JOB_INDEX_PREFIX",
+    "find_job_queue",
+    "index_job",
+    "job_index_key",
+    "job_index_ttl",
+    "locate_job",
+]
@@ -15,10 +15,13 @@ if TYPE_CHECKING:
     from rq.job import Job
 
 from .cancellation import request_cancellation, force_stop_job
-from .rq_converters import job_to_model
+from .rq_converters import job_to_model, map_job_status
 
 logger = logging.getLogger("django_cfg.rq.job_service")
 
+# Jobs per pipelined HGETALL round trip
+FETCH_BATCH_SIZE = 500
+
 
 @dataclass
 class JobActionResult:
@@ -68,6 +71,24 @@ class JobDetail:
     dependency_ids: list[str]
 
 
+def job_to_info(job: "Job", queue_name: str) -> JobInfo:
+    """
+    Build list-view JobInfo from an already loaded job.
+
+    Unlike `job_to_model()` this issues no Redis commands: the status comes
+    from the loaded hash and the result/exception are not needed.
+    """
+    return JobInfo(
+        id=job.id,
+        func_name=job.func_name or "unknown",
+        status=map_job_status(job.get_status(refresh=False)),
+        queue=queue_name,
+        created_at=job.created_at.isoformat() if job.created_at else "",
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        ended_at=job.ended_at.isoformat() if job.ended_at else None,
+    )
+
+
 class JobService:
     """Service for managing RQ jobs."""
 
@@ -75,25 +96,18 @@ class JobService:
         """
         Find a job by ID across all queues.
 
+        Uses the job index (see `job_index`), falling back to trying
+        each configured queue.
+
         Returns:
             Tuple of (Job, queue_name) or (None, None) if not found.
         """
-        import django_rq
-        from django.conf import settings
-        from rq.job import Job
+        from .job_index import locate_job
 
-        if not hasattr(settings, "RQ_QUEUES"):
+        job, queue = locate_job(job_id)
+        if job is None:
             return None, None
-
-        for queue_name in settings.RQ_QUEUES.keys():
-            try:
-                queue = django_rq.get_queue(queue_name)
-                job = Job.fetch(job_id, connection=queue.connection)
-                return job, queue_name
-            except Exception:
-                continue
-
-        return None, None
+        return job, queue.name
 
     def get_job_detail(self, job_id: str) -> JobDetail | None:
         """
@@ -135,21 +149,26 @@ class JobService:
         queue_filter: str | None = None,
         status_filter: str | None = None,
         limit_per_registry: int = 100,
+        offset: int = 0,
     ) -> list[JobInfo]:
         """
         List all jobs across all registries.
 
+        Pagination happens in Redis (LRANGE/ZRANGE per registry), and each
+        registry page is loaded with one pipelined HGETALL round trip, so
+        only the requested page is materialized.
+
         Args:
             queue_filter: Only return jobs from this queue
             status_filter: Only return jobs with this status
             limit_per_registry: Max jobs per registry (default 100)
+            offset: Jobs to skip in each registry
 
         Returns:
             List of JobInfo objects
         """
         import django_rq
         from django.conf import settings
-        from rq.job import Job
         from rq.registry import (
             FinishedJobRegistry,
             FailedJobRegistry,
@@ -160,9 +179,17 @@ class JobService:
 
         all_jobs = []
 
-        if not hasattr(settings, "RQ_QUEUES"):
+        if not hasattr(settings, "RQ_QUEUES") or limit_per_registry <= 0:
             return all_jobs
 
+        registry_classes = {
+            "started": StartedJobRegistry,
+            "finished": FinishedJobRegistry,
+            "failed": FailedJobRegistry,
+            "deferred": DeferredJobRegistry,
+            "scheduled": ScheduledJobRegistry,
+        }
+
         for queue_name in settings.RQ_QUEUES.keys():
             if queue_filter and queue_filter != queue_name:
                 continue
@@ -170,57 +197,19 @@ class JobService:
             try:
                 queue = django_rq.get_queue(queue_name)
 
-                registries = {
-                    "queued": {"jobs": queue.job_ids, "status": "queued"},
-                    "started": {
-                        "registry": StartedJobRegistry(queue_name, connection=queue.connection),
-                        "status": "started",
-                    },
-                    "finished": {
-                        "registry": FinishedJobRegistry(queue_name, connection=queue.connection),
-                        "status": "finished",
-                    },
-                    "failed": {
-                        "registry": FailedJobRegistry(queue_name, connection=queue.connection),
-                        "status": "failed",
-                    },
-                    "deferred": {
-                        "registry": DeferredJobRegistry(queue_name, connection=queue.connection),
-                        "status": "deferred",
-                    },
-                    "scheduled": {
-                        "registry": ScheduledJobRegistry(queue_name, connection=queue.connection),
-                        "status": "scheduled",
-                    },
-                }
-
-                for reg_data in registries.values():
-                    if status_filter and status_filter != reg_data["status"]:
+                if not status_filter or status_filter == "queued":
+                    job_ids = queue.get_job_ids(offset, limit_per_registry)
+                    all_jobs.extend(self._fetch_job_infos(job_ids, queue))
+
+                for status, registry_class in registry_classes.items():
+                    if status_filter and status_filter != status:
                         continue
 
-                    if "registry" in reg_data:
-                        job_ids = reg_data["registry"].get_job_ids()
-                    else:
-                        job_ids = reg_data["jobs"]
-
-                    for job_id in job_ids[:limit_per_registry]:
-                        try:
-                            job = Job.fetch(job_id, connection=queue.connection)
-                            job_model = job_to_model(job, queue_name)
-
-                            all_jobs.append(
-                                JobInfo(
-                                    id=job_model.id,
-                                    func_name=job_model.func_name,
-                                    status=job_model.status,
-                                    queue=queue_name,
-                                    created_at=job_model.created_at,
-                                    started_at=job_model.started_at,
-                                    ended_at=job_model.ended_at,
-                                )
-                            )
-                        except Exception:
-                            continue
+                    registry = registry_class(
+                        queue_name, connection=queue.connection, serializer=queue.serializer
+                    )
+                    job_ids = self._registry_page(registry, offset, limit_per_registry)
+                    all_jobs.extend(self._fetch_job_infos(job_ids, queue))
 
             except Exception as e:
                 logger.debug(f"Failed to get jobs from queue {queue_name}: {e}")
@@ -228,6 +217,38 @@ class JobService:
 
         return all_jobs
 
+    @staticmethod
+    def _registry_page(registry, offset: int, limit: int | None) -> list[str]:
+        """
+        Read one page of job ids from a registry with a single ZRANGE.
+
+        Skips the registry's expiry cleanup: listing is read-only, workers
+        and the maintenance tasks run cleanup.
+        """
+        end = -1 if limit is None else offset + limit - 1
+        return registry.get_job_ids(offset, end, cleanup=False)
+
+    def _fetch_job_infos(self, job_ids: list[str], queue) -> list[JobInfo]:
+        """Load jobs with pipelined HGETALLs (`Job.fetch_many`) and convert them."""
+        from rq.job import Job
+
+        infos = []
+        for start in range(0, len(job_ids), FETCH_BATCH_SIZE):
+            jobs = Job.fetch_many(
+                job_ids[start:start + FETCH_BATCH_SIZE],
+                connection=queue.connection,
+                serializer=queue.serializer,
+            )
+            for job in jobs:
+                # None: the job hash expired between listing and fetching
+                if job is None:
+                    continue
+                try:
+                    infos.append(job_to_info(job, queue.name))
+                except Exception as e:
+                    logger.debug(f"Failed to read job {job.id}: {e}")
+        return infos
+
     def cancel_job(self, job_id: str, force: bool = False) -> JobActionResult:
         """
         Cancel a job.
@@ -366,6 +387,8 @@ class JobService:
         self,
         registry_name: str,
         queue_filter: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[JobInfo]:
         """
         List jobs from a specific registry.
@@ -373,13 +396,14 @@ class JobService:
         Args:
             registry_name: One of 'failed', 'finished', 'deferred', 'started'
             queue_filter: Only return jobs from this queue
+            limit: Max jobs per queue (default: all)
+            offset: Jobs to skip in each queue's registry
 
         Returns:
             List of JobInfo objects
         """
         import django_rq
         from django.conf import settings
-        from rq.job import Job
         from rq.registry import (
             FinishedJobRegistry,
             FailedJobRegistry,
@@ -406,27 +430,11 @@ class JobService:
         for queue_name in queue_names:
             try:
                 queue = django_rq.get_queue(queue_name)
-                registry = registry_classes[registry_name](queue_name, connection=queue.connection)
-                job_ids = registry.get_job_ids()
-
-                for job_id in job_ids:
-                    try:
-                        job = Job.fetch(job_id, connection=queue.connection)
-                        job_model = job_to_model(job, queue_name)
-
-                        all_jobs.append(
-                            JobInfo(
-                                id=job_model.id,
-                                func_name=job_model.func_name,
-                                status=job_model.status,
-                                queue=queue_name,
-                                created_at=job_model.created_at,
-                                started_at=job_model.started_at,
-                                ended_at=job_model.ended_at,
-                            )
-                        )
-                    except Exception:
-                        continue
+                registry = registry_classes[registry_name](
+                    queue_name, connection=queue.connection, serializer=queue.serializer
+                )
+                job_ids = self._registry_page(registry, offset, limit)
+                all_jobs.extend(self._fetch_job_infos(job_ids, queue))
 
             except Exception as e:
                 logger.debug(f"Failed to get {registry_name} jobs for queue {queue_name}: {e}")
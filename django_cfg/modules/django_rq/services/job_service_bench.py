@@ -0,0 +1,134 @@
+"""
+Benchmark: Redis round trips for JobService.list_jobs versus job count.
+
+Jobs are spread over the queue and the failed/finished registries of one
+fakeredis-backed queue. Compares:
+- before: full registry reads, then `Job.fetch` + `job_to_model` per job
+  (the previous `list_jobs`)
+- after: one LRANGE/ZRANGE page and one pipelined HGETALL per registry
+
+Usage:
+    python -m django_cfg.modules.django_rq.services.job_service_bench
+"""
+
+import time
+
+import django
+from django.conf import settings
+
+JOB_COUNTS = (100, 1000, 5000)
+LIMIT_PER_REGISTRY = 100
+
+
+def _setup() -> None:
+    if not settings.configured:
+        settings.configure(RQ_QUEUES={"default": {}}, INSTALLED_APPS=[])
+        django.setup()
+
+
+def _counting_redis():
+    import fakeredis
+
+    class CountingRedis(fakeredis.FakeStrictRedis):
+        """Counts commands and pipelines as one round trip each."""
+
+        round_trips = 0
+
+        def execute_command(self, *args, **options):
+            CountingRedis.round_trips += 1
+            return super().execute_command(*args, **options)
+
+        def pipeline(self, transaction=True, shard_hint=None):
+            pipe = super().pipeline(transaction, shard_hint)
+            execute = pipe.execute
+
+            def counted_execute(*args, **kwargs):
+                CountingRedis.round_trips += 1
+                return execute(*args, **kwargs)
+
+            pipe.execute = counted_execute
+            return pipe
+
+    return CountingRedis()
+
+
+def _populate(queue, count: int) -> None:
+    from rq.job import JobStatus
+    from rq.registry import FailedJobRegistry, FinishedJobRegistry
+
+    failed = FailedJobRegistry(queue.name, connection=queue.connection)
+    finished = FinishedJobRegistry(queue.name, connection=queue.connection)
+    for n in range(count):
+        job = queue.enqueue("builtins.print", n)
+        if n % 3 == 1:
+            queue.remove(job)
+            job.set_status(JobStatus.FAILED)
+            failed.add(job, ttl=3600)
+        elif n % 3 == 2:
+            queue.remove(job)
+            job.set_status(JobStatus.FINISHED)
+            finished.add(job, ttl=3600)
+
+
+def _list_before(queue, limit: int) -> int:
+    from rq.job import Job
+    from rq.registry import (
+        DeferredJobRegistry,
+        FailedJobRegistry,
+        FinishedJobRegistry,
+        ScheduledJobRegistry,
+        StartedJobRegistry,
+    )
+
+    from .rq_converters import job_to_model
+
+    id_lists = [queue.job_ids] + [
+        registry_class(queue.name, connection=queue.connection).get_job_ids()
+        for registry_class in (
+            StartedJobRegistry,
+            FinishedJobRegistry,
+            FailedJobRegistry,
+            DeferredJobRegistry,
+            ScheduledJobRegistry,
+        )
+    ]
+    listed = 0
+    for job_ids in id_lists:
+        for job_id in job_ids[:limit]:
+            job_to_model(Job.fetch(job_id, connection=queue.connection), queue.name)
+            listed += 1
+    return listed
+
+
+def main() -> None:
+    _setup()
+    import django_rq
+    from rq import Queue
+
+    from .job_service import JobService
+
+    print(f"list_jobs(limit_per_registry={LIMIT_PER_REGISTRY}), one queue, 6 registries")
+    print(f"{'jobs':>6}  {'before trips':>12}  {'after trips':>11}  {'before ms':>9}  {'after ms':>8}")
+
+    for count in JOB_COUNTS:
+        connection = _counting_redis()
+        queue = Queue("default", connection=connection)
+        _populate(queue, count)
+        django_rq.get_queue = lambda name: queue
+
+        row = []
+        for list_jobs in (
+            lambda: _list_before(queue, LIMIT_PER_REGISTRY),
+            lambda: len(JobService().list_jobs(limit_per_registry=LIMIT_PER_REGISTRY)),
+        ):
+            type(connection).round_trips = 0
+            started = time.perf_counter()
+            list_jobs()
+            row.append((type(connection).round_trips, (time.perf_counter() - started) * 1000))
+
+        (before_trips, before_ms), (after_trips, after_ms) = row
+        print(f"{count:>6}  {before_trips:>12,}  {after_trips:>11,}  {before_ms:>9.0f}  {after_ms:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Tests for paginated, pipelined job listing in JobService.
+"""
+
+import fakeredis
+import pytest
+from rq import Queue
+from rq.job import Job, JobStatus as RQJobStatus
+from rq.registry import FailedJobRegistry
+
+from .job_service import JobService
+from .models import JobStatus
+
+
+@pytest.fixture
+def queues(settings, monkeypatch):
+    import django_rq
+
+    connection = fakeredis.FakeStrictRedis()
+    queues = {name: Queue(name, connection=connection) for name in ("default", "low")}
+    settings.RQ_QUEUES = {name: {} for name in queues}
+    monkeypatch.setattr(django_rq, "get_queue", lambda name: queues[name])
+    return queues
+
+
+def _enqueue(queue, count):
+    return [queue.enqueue("builtins.print", n) for n in range(count)]
+
+
+def _fail(queue, job):
+    job.set_status(RQJobStatus.FAILED)
+    FailedJobRegistry(queue.name, connection=queue.connection).add(job, ttl=3600)
+
+
+class TestListJobs:
+    """Test pagination, status mapping and per-job fetches."""
+
+    def test_pages_each_registry(self, queues):
+        jobs = _enqueue(queues["default"], 7)
+
+        first = JobService().list_jobs(queue_filter="default", limit_per_registry=3)
+        second = JobService().list_jobs(queue_filter="default", limit_per_registry=3, offset=3)
+
+        assert [j.id for j in first] == [job.id for job in jobs[:3]]
+        assert [j.id for j in second] == [job.id for job in jobs[3:6]]
+        assert {j.status for j in first} == {JobStatus.QUEUED}
+
+    def test_registries_and_status_filter(self, queues):
+        jobs = _enqueue(queues["low"], 3)
+        queues["low"].remove(jobs[0])
+        _fail(queues["low"], jobs[0])
+
+        failed = JobService().list_jobs(status_filter="failed")
+        everything = JobService().list_jobs()
+
+        assert [(j.id, j.status, j.queue) for j in failed] == [(jobs[0].id, JobStatus.FAILED, "low")]
+        assert len(everything) == 3
+
+    def test_does_not_fetch_jobs_one_by_one(self, queues, monkeypatch):
+        _enqueue(queues["default"], 20)
+
+        def fail_fetch(*args, **kwargs):
+            raise AssertionError("Job.fetch called per job")
+
+        monkeypatch.setattr(Job, "fetch", fail_fetch)
+
+        assert len(JobService().list_jobs()) == 20
+
+    def test_missing_job_hash_is_skipped(self, queues):
+        jobs = _enqueue(queues["default"], 3)
+        queues["default"].connection.delete(jobs[1].key)
+
+        listed = JobService().list_jobs(queue_filter="default")
+
+        assert [j.id for j in listed] == [jobs[0].id, jobs[2].id]
+
+    def test_list_jobs_by_registry_paginates(self, queues):
+        jobs = _enqueue(queues["default"], 4)
+        for job in jobs:
+            queues["default"].remove(job)
+            _fail(queues["default"], job)
+
+        page = JobService().list_jobs_by_registry("failed", limit=2, offset=1)
+        ordered = FailedJobRegistry("default", connection=queues["default"].connection).get_job_ids()
+
+        assert [j.id for j in page] == ordered[1:3]
@@ -25,6 +25,24 @@ def _get_exc_info(job: Job) -> Optional[str]:
     return None
 
 
+_STATUS_MAP = {
+    RQJobStatus.QUEUED: JobStatus.QUEUED,
+    RQJobStatus.STARTED: JobStatus.STARTED,
+    RQJobStatus.FINISHED: JobStatus.FINISHED,
+    RQJobStatus.FAILED: JobStatus.FAILED,
+    RQJobStatus.DEFERRED: JobStatus.DEFERRED,
+    RQJobStatus.SCHEDULED: JobStatus.SCHEDULED,
+    RQJobStatus.CANCELED: JobStatus.CANCELED,
+    RQJobStatus.CREATED: JobStatus.CREATED,
+    RQJobStatus.STOPPED: JobStatus.STOPPED,
+}
+
+
+def map_job_status(rq_status) -> JobStatus:
+    """Map an RQ job status to JobStatus (unknown values map to QUEUED)."""
+    return _STATUS_MAP.get(rq_status, JobStatus.QUEUED)
+
+
 def job_to_model(job: Job, queue_name: Optional[str] = None) -> RQJobModel:
     """
     Convert RQ Job to Pydantic RQJobModel.
@@ -41,19 +59,7 @@ def job_to_model(job: Job, queue_name: Optional[str] = None) -> RQJobModel:
         queue_name = getattr(job, 'origin', 'unknown')
 
     # Map RQ status to JobStatus enum
-    rq_status = job.get_status()
-    status_map = {
-        RQJobStatus.QUEUED: JobStatus.QUEUED,
-        RQJobStatus.STARTED: JobStatus.STARTED,
-        RQJobStatus.FINISHED: JobStatus.FINISHED,
-        RQJobStatus.FAILED: JobStatus.FAILED,
-        RQJobStatus.DEFERRED: JobStatus.DEFERRED,
-        RQJobStatus.SCHEDULED: JobStatus.SCHEDULED,
-        RQJobStatus.CANCELED: JobStatus.CANCELED,
-        RQJobStatus.CREATED: JobStatus.CREATED,
-        RQJobStatus.STOPPED: JobStatus.STOPPED,
-    }
-    status = status_map.get(rq_status, JobStatus.QUEUED)
+    status = map_job_status(job.get_status())
 
     # Serialize args/kwargs/meta to JSON strings (flat!)
     args_json = json.dumps(list(job.args or []))
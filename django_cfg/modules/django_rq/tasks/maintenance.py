@@ -3,21 +3,51 @@ RQ Maintenance Tasks
 
 Tasks for cleaning up old jobs, managing Redis keys, and maintaining RQ health.
 """
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Dict, List, Set
 
 import django_rq
 from django_cfg.utils import get_logger
 from rq.job import Job, JobStatus
 from rq.queue import Queue
 from rq.registry import (
+    DeferredJobRegistry,
     FailedJobRegistry,
     FinishedJobRegistry,
+    ScheduledJobRegistry,
     StartedJobRegistry,
 )
+from rq.utils import utcparse
 
 logger = get_logger("rq.maintenance")
 
+# Keys per SCAN/SSCAN/ZSCAN step, list entries per LRANGE page, and commands
+# per pipelined round trip. SCAN's COUNT is a hint, not a limit, but it keeps
+# every individual command short so Redis never blocks on a keyspace walk.
+SCAN_COUNT = 1000
+
+# Seconds one invocation may spend walking keys. When it runs out, the task
+# saves its cursor and returns; the next invocation resumes from there.
+DEFAULT_TIME_BUDGET = 30.0
+
+_CURSOR_PREFIX = "dcfg:rq_maintenance:cursor"
+# A saved cursor outliving a day means the task stopped being scheduled;
+# start over rather than resume a walk that stale.
+_CURSOR_TTL = 24 * 60 * 60
+
+# Jobs created this long before an orphan pass started are not trusted to be
+# in its snapshot of queues/registries (clock skew between hosts).
+_FRESH_JOB_GRACE = timedelta(minutes=1)
+
+_REGISTRY_CLASSES = (
+    FinishedJobRegistry,
+    FailedJobRegistry,
+    StartedJobRegistry,
+    DeferredJobRegistry,
+    ScheduledJobRegistry,
+)
+
 
 def _make_aware(dt: datetime) -> datetime:
     """Make datetime timezone-aware if it's naive."""
@@ -53,6 +83,147 @@ def _is_live_schedule_id(job_id: str, redis_conn) -> bool:
         return True
 
 
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _cursor_key(task: str, scope: str = "") -> str:
+    return f"{_CURSOR_PREFIX}:{task}:{scope}" if scope else f"{_CURSOR_PREFIX}:{task}"
+
+
+def _load_cursor(redis_conn, key: str) -> int:
+    """Read a saved cursor; 0 (start over) if none or unreadable."""
+    try:
+        return int(redis_conn.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _save_cursor(redis_conn, key: str, cursor: int) -> None:
+    """Persist a cursor to resume from, or clear it once a walk completes."""
+    if cursor:
+        redis_conn.set(key, cursor, ex=_CURSOR_TTL)
+    else:
+        redis_conn.delete(key)
+
+
+def _queue_names(redis_conn, scan_count: int) -> List[str]:
+    """
+    Configured queue names plus every queue RQ has registered in Redis.
+
+    Jobs of a queue missing from ``RQ_QUEUES`` (renamed, or owned by another
+    service on the same Redis) are still live; treating them as orphans would
+    delete them.
+    """
+    from django.conf import settings
+
+    names = list(getattr(settings, "RQ_QUEUES", {}).keys()) or ["default"]
+    for raw_key in redis_conn.sscan_iter(Queue.redis_queues_keys, count=scan_count):
+        name = _decode(raw_key)[len(Queue.redis_queue_namespace_prefix):]
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def _iter_list_pages(redis_conn, key: str, page_size: int, start: int = 0):
+    """Yield (start, ids) for consecutive LRANGE pages of a list."""
+    while True:
+        page = redis_conn.lrange(key, start, start + page_size - 1)
+        if not page:
+            return
+        yield start, page
+        start += len(page)
+
+
+def _collect_live_job_ids(redis_conn, queue_names: List[str], scan_count: int) -> Dict[str, object]:
+    """
+    Snapshot the IDs of every job RQ still references.
+
+    Queue lists are read in LRANGE pages and registries/the scheduler set with
+    ZSCAN, so no single command walks a whole collection.
+    """
+    live_ids: Set[str] = set()
+    queued_count = 0
+    registry_count = 0
+
+    for qname in queue_names:
+        try:
+            for _, page in _iter_list_pages(redis_conn, f"rq:queue:{qname}", scan_count):
+                live_ids.update(_decode(job_id) for job_id in page)
+                queued_count += len(page)
+
+            for registry_class in _REGISTRY_CLASSES:
+                registry_key = registry_class(qname, connection=redis_conn).key
+                for job_id, _ in redis_conn.zscan_iter(registry_key, count=scan_count):
+                    live_ids.add(_decode(job_id))
+                    registry_count += 1
+        except Exception as e:
+            logger.warning(f"Failed to get jobs from queue {qname}: {e}")
+
+    from django_cfg.modules.django_rq.health.scheduler import SCHEDULED_JOBS_KEY
+
+    scheduled_count = 0
+    for job_id, _ in redis_conn.zscan_iter(SCHEDULED_JOBS_KEY, count=scan_count):
+        live_ids.add(_decode(job_id))
+        scheduled_count += 1
+
+    return {
+        "ids": live_ids,
+        "queued": queued_count,
+        "registries": registry_count,
+        "scheduled": scheduled_count,
+    }
+
+
+def _job_id_from_key(key: str) -> str:
+    # rq:job:<id> and its satellites (rq:job:<id>:dependents, ...) share the ID
+    return key[len(Job.redis_job_namespace_prefix):].split(":", 1)[0]
+
+
+def _created_since(redis_conn, keys: List[str], since: datetime) -> Set[str]:
+    """
+    Return the keys among job hashes created at or after ``since``.
+
+    One pipelined HGET round trip. Non-hash keys (dependents sets) and hashes
+    without a readable created_at are not considered fresh.
+    """
+    with redis_conn.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.hget(key, "created_at")
+        values = pipe.execute(raise_on_error=False)
+
+    fresh = set()
+    for key, value in zip(keys, values):
+        if not value or isinstance(value, Exception):
+            continue
+        try:
+            created_at = _make_aware(utcparse(_decode(value)))
+        except ValueError:
+            continue
+        if created_at >= since:
+            fresh.add(key)
+    return fresh
+
+
+def _log_orphan(redis_conn, key: str) -> None:
+    """Log what an orphaned key held before it is deleted."""
+    try:
+        job = Job.fetch(_job_id_from_key(key), connection=redis_conn)
+        logger.warning(
+            f"  ORPHANED: {key} | func={job.func_name} | "
+            f"status={job.get_status()} | created={job.created_at} | "
+            f"result_ttl={job.result_ttl} | meta={job.meta}"
+        )
+    except Exception as e:
+        # Job data might be corrupted or partially deleted
+        ttl = redis_conn.ttl(key)
+        key_type = _decode(redis_conn.type(key))
+        logger.warning(
+            f"  ORPHANED: {key} | type={key_type} | ttl={ttl} | "
+            f"fetch_error={e}"
+        )
+
+
 def cleanup_old_jobs(
     max_age_days: int = 7,
     dry_run: bool = False,
@@ -194,6 +365,8 @@ def cleanup_old_jobs(
 def cleanup_orphaned_job_keys(
     dry_run: bool = False,
     queue_name: str = "default",
+    scan_count: int = SCAN_COUNT,
+    time_budget: float = DEFAULT_TIME_BUDGET,
 ) -> Dict[str, int]:
     """
     Clean up orphaned job keys that don't belong to any queue or registry.
@@ -201,18 +374,31 @@ def cleanup_orphaned_job_keys(
     Orphaned keys can accumulate when jobs are improperly cancelled or
     when RQ crashes. This task finds and removes such keys.
 
-    IMPORTANT: This function checks ALL configured queues, not just the one specified.
-    The queue_name parameter is only used to get the Redis connection.
+    IMPORTANT: This function checks ALL configured queues, plus any queue
+    registered in ``rq:queues``, not just the one specified. The queue_name
+    parameter is only used to get the Redis connection.
+
+    Job keys are walked with incremental ``SCAN`` (never ``KEYS``), one
+    ``scan_count`` batch at a time. If ``time_budget`` seconds run out first,
+    the SCAN cursor is saved in Redis and the next invocation resumes from it,
+    so the task can run often with bounded latency. Jobs created after the
+    pass started are never deleted, since they may be missing from its
+    snapshot of queues and registries.
 
     Args:
         dry_run: If True, only count keys without deleting them
         queue_name: Queue name to get Redis connection (default: "default")
+        scan_count: COUNT hint per SCAN step (default: SCAN_COUNT)
+        time_budget: Seconds to spend before saving the cursor and returning
 
     Returns:
         Dictionary with cleanup statistics:
         {
             "orphaned_deleted": 15,
-            "dry_run": False
+            "dry_run": False,
+            "complete": True,
+            "cursor": 0,
+            ...
         }
 
     Example:
@@ -221,9 +407,14 @@ def cleanup_orphaned_job_keys(
         >>> print(f"Found {stats['orphaned_deleted']} orphaned keys")
     """
     try:
+        started = time.monotonic()
+        started_at = _make_aware(datetime.utcnow())
+
         # Get Redis connection from default queue
         default_queue = django_rq.get_queue(queue_name)
         redis_conn = default_queue.connection
+        cursor_key = _cursor_key("orphaned_job_keys")
+        cursor = _load_cursor(redis_conn, cursor_key)
 
         stats = {
             "orphaned_deleted": 0,
@@ -233,130 +424,86 @@ def cleanup_orphaned_job_keys(
             "scheduled_job_ids": 0,
             "queued_job_ids": 0,
             "registry_job_ids": 0,
+            # Orphan candidates kept because they were created mid-pass
+            "fresh_skipped": 0,
+            "resumed_from": cursor,
+            "cursor": cursor,
+            "complete": False,
         }
 
-        logger.info(f"=== Starting orphaned job key cleanup [dry_run={dry_run}] ===")
-
-        # Get all job keys (decode bytes to strings for comparison)
-        all_job_keys_raw = redis_conn.keys("rq:job:*")
-        all_job_keys = set(
-            k.decode("utf-8") if isinstance(k, bytes) else k
-            for k in all_job_keys_raw
+        logger.info(
+            f"=== Starting orphaned job key cleanup [dry_run={dry_run}, cursor={cursor}] ==="
         )
-        stats["total_job_keys"] = len(all_job_keys)
-        logger.info(f"Total rq:job:* keys in Redis: {len(all_job_keys)}")
-
-        # Get all valid job IDs from ALL queues' registries
-        valid_job_ids = set()
-        queued_count = 0
-        registry_count = 0
-
-        # Get all configured queue names from Django settings
-        from django.conf import settings
-        queue_names = list(getattr(settings, "RQ_QUEUES", {}).keys())
-        if not queue_names:
-            queue_names = ["default"]
 
+        queue_names = _queue_names(redis_conn, scan_count)
         logger.info(f"Checking jobs from queues: {queue_names}")
 
-        # Collect valid jobs from ALL queues
-        for qname in queue_names:
-            try:
-                queue = django_rq.get_queue(qname)
-
-                # Add queued jobs
-                queue_job_ids = list(queue.job_ids)
-                for job_id in queue_job_ids:
-                    valid_job_ids.add(f"rq:job:{job_id}")
-                    queued_count += 1
-
-                logger.debug(f"Queue '{qname}': {len(queue_job_ids)} queued jobs")
-
-                # Add jobs from registries
-                for registry_class in [FinishedJobRegistry, FailedJobRegistry, StartedJobRegistry]:
-                    registry = registry_class(queue=queue)
-                    registry_job_ids = registry.get_job_ids()
-                    for job_id in registry_job_ids:
-                        valid_job_ids.add(f"rq:job:{job_id}")
-                        registry_count += 1
-
-                    if registry_job_ids:
-                        logger.debug(
-                            f"Queue '{qname}' {registry_class.__name__}: "
-                            f"{len(registry_job_ids)} jobs"
-                        )
-
-            except Exception as e:
-                logger.warning(f"Failed to get jobs from queue {qname}: {e}")
-
-        stats["queued_job_ids"] = queued_count
-        stats["registry_job_ids"] = registry_count
-
-        # Add scheduled jobs from rq-scheduler
-        # Scheduled jobs are stored in rq:scheduler:scheduled_jobs sorted set
-        # and should not be considered orphaned
-        scheduled_job_ids_raw = redis_conn.zrange("rq:scheduler:scheduled_jobs", 0, -1)
-        scheduled_count = 0
-        for job_id in scheduled_job_ids_raw:
-            if isinstance(job_id, bytes):
-                job_id = job_id.decode("utf-8")
-            valid_job_ids.add(f"rq:job:{job_id}")
-            scheduled_count += 1
-
-        stats["scheduled_job_ids"] = scheduled_count
+        live = _collect_live_job_ids(redis_conn, queue_names, scan_count)
+        valid_job_ids = live["ids"]
+        stats["queued_job_ids"] = live["queued"]
+        stats["registry_job_ids"] = live["registries"]
+        stats["scheduled_job_ids"] = live["scheduled"]
         stats["valid_job_ids"] = len(valid_job_ids)
 
         logger.info(
             f"Valid job IDs: {len(valid_job_ids)} total "
-            f"(queued={queued_count}, registries={registry_count}, scheduled={scheduled_count})"
+            f"(queued={live['queued']}, registries={live['registries']}, "
+            f"scheduled={live['scheduled']})"
         )
 
-        # Find orphaned keys
-        orphaned_keys = all_job_keys - valid_job_ids
-        stats["orphaned_deleted"] = len(orphaned_keys)
-
-        if orphaned_keys:
-            logger.warning(f"Found {len(orphaned_keys)} ORPHANED job keys!")
-
-            # Log details of orphaned keys (limit to first 20 to avoid log spam)
-            orphaned_list = sorted(orphaned_keys)
-            for key in orphaned_list[:20]:
-                # Try to get job info before deletion
-                try:
-                    job_id = key.replace("rq:job:", "")
-                    job = Job.fetch(job_id, connection=redis_conn)
-                    logger.warning(
-                        f"  ORPHANED: {key} | func={job.func_name} | "
-                        f"status={job.get_status()} | created={job.created_at} | "
-                        f"result_ttl={job.result_ttl} | meta={job.meta}"
-                    )
-                except Exception as e:
-                    # Job data might be corrupted or partially deleted
-                    ttl = redis_conn.ttl(key)
-                    key_type = redis_conn.type(key)
-                    if isinstance(key_type, bytes):
-                        key_type = key_type.decode()
-                    logger.warning(
-                        f"  ORPHANED: {key} | type={key_type} | ttl={ttl} | "
-                        f"fetch_error={e}"
-                    )
-
-            if len(orphaned_keys) > 20:
-                logger.warning(f"  ... and {len(orphaned_keys) - 20} more orphaned keys")
-
-            # Delete orphaned keys
-            if not dry_run:
-                logger.info(f"Deleting {len(orphaned_keys)} orphaned keys...")
-                redis_conn.delete(*orphaned_keys)
-                logger.info("Deletion complete")
+        logged = 0
+        while True:
+            cursor, raw_keys = redis_conn.scan(
+                cursor=cursor, match=f"{Job.redis_job_namespace_prefix}*", count=scan_count
+            )
+            keys = [_decode(k) for k in raw_keys]
+            stats["total_job_keys"] += len(keys)
+
+            orphaned = [k for k in keys if _job_id_from_key(k) not in valid_job_ids]
+            if orphaned:
+                fresh = _created_since(redis_conn, orphaned, started_at - _FRESH_JOB_GRACE)
+                stats["fresh_skipped"] += len(fresh)
+                orphaned = [k for k in orphaned if k not in fresh]
+
+            if orphaned:
+                # Log details of the first orphaned keys only, to avoid log spam
+                for key in orphaned[:max(0, 20 - logged)]:
+                    _log_orphan(redis_conn, key)
+                logged += len(orphaned)
+
+                stats["orphaned_deleted"] += len(orphaned)
+                if not dry_run:
+                    redis_conn.delete(*orphaned)
+
+            if cursor == 0:
+                stats["complete"] = True
+                break
+            if time.monotonic() - started >= time_budget:
+                break
+
+        stats["cursor"] = cursor
+        _save_cursor(redis_conn, cursor_key, cursor)
+
+        if logged > 20:
+            logger.warning(f"  ... and {logged - 20} more orphaned keys")
+
+        if stats["orphaned_deleted"]:
+            if dry_run:
+                logger.info(f"DRY RUN: Would delete {stats['orphaned_deleted']} orphaned keys")
             else:
-                logger.info(f"DRY RUN: Would delete {len(orphaned_keys)} orphaned keys")
+                logger.warning(f"Deleted {stats['orphaned_deleted']} ORPHANED job keys")
         else:
             logger.info("No orphaned job keys found")
 
+        if not stats["complete"]:
+            logger.info(
+                f"Time budget of {time_budget}s used up after {stats['total_job_keys']} keys; "
+                f"next run resumes from cursor {cursor}"
+            )
+
         logger.info(
             f"=== Orphaned key cleanup completed: {stats['orphaned_deleted']} keys "
-            f"[dry_run={dry_run}] ==="
+            f"[dry_run={dry_run}, complete={stats['complete']}] ==="
         )
         logger.info(f"Stats: {stats}")
 
@@ -370,6 +517,8 @@ def cleanup_orphaned_job_keys(
 def prune_orphaned_queue_ids(
     queue_name: str = "default",
     dry_run: bool = False,
+    scan_count: int = SCAN_COUNT,
+    time_budget: float = DEFAULT_TIME_BUDGET,
 ) -> Dict[str, int]:
     """
     Remove stale job IDs from a queue list whose job hash no longer exists.
@@ -379,8 +528,13 @@ def prune_orphaned_queue_ids(
     list. Those IDs accumulate when a job hash TTL-expires while its ID is still
     queued, and a worker wastes a cycle fetching each one.
 
-    This task scans ``rq:queue:<queue_name>`` and ``LREM``s every ID whose
-    ``rq:job:<id>`` hash is missing.
+    This task reads ``rq:queue:<queue_name>`` in ``LRANGE`` pages of
+    ``scan_count`` IDs, checks each page with one pipelined ``EXISTS`` round
+    trip and ``LREM``s every ID whose ``rq:job:<id>`` hash is missing. If
+    ``time_budget`` seconds run out first, the list offset is saved and the
+    next invocation resumes from it. Workers popping the list head while a
+    pass runs shift that offset; any ID skipped that way is picked up by the
+    next full pass.
 
     NOTE: This is the self-heal action behind ``RQHealthConfig.auto_prune_orphan_ids``.
     The queue-health monitor only *reports* the orphan ratio unless that flag is
@@ -389,6 +543,8 @@ def prune_orphaned_queue_ids(
     Args:
         queue_name: Queue whose list to prune.
         dry_run: If True, only count orphan IDs without removing them.
+        scan_count: IDs per LRANGE page and pipelined round trip.
+        time_budget: Seconds to spend before saving the offset and returning.
 
     Returns:
         Dictionary with statistics::
@@ -399,12 +555,17 @@ def prune_orphaned_queue_ids(
                 "orphaned": 37,
                 "pruned": 37,
                 "dry_run": False,
+                "complete": True,
+                "offset": 0,
             }
     """
     try:
+        started = time.monotonic()
         queue = django_rq.get_queue(queue_name)
         redis_conn = queue.connection
         queue_key = f"rq:queue:{queue_name}"
+        cursor_key = _cursor_key("orphaned_queue_ids", queue_name)
+        offset = _load_cursor(redis_conn, cursor_key)
 
         stats: Dict[str, int] = {
             "queue": queue_name,
@@ -412,44 +573,73 @@ def prune_orphaned_queue_ids(
             "orphaned": 0,
             "pruned": 0,
             "dry_run": dry_run,
+            "resumed_from": offset,
+            "offset": offset,
+            "complete": True,
         }
 
         logger.info(
-            f"=== Pruning orphaned queue IDs from '{queue_key}' [dry_run={dry_run}] ==="
+            f"=== Pruning orphaned queue IDs from '{queue_key}' "
+            f"[dry_run={dry_run}, offset={offset}] ==="
         )
 
-        raw_ids = redis_conn.lrange(queue_key, 0, -1)
-        stats["scanned"] = len(raw_ids)
-
-        orphan_ids = []
-        for raw_id in raw_ids:
-            job_id = raw_id.decode("utf-8") if isinstance(raw_id, bytes) else raw_id
-            if not redis_conn.exists(f"rq:job:{job_id}"):
-                orphan_ids.append(raw_id)
+        next_offset = offset
+        for start, page in _iter_list_pages(redis_conn, queue_key, scan_count, offset):
+            stats["scanned"] += len(page)
+
+            with redis_conn.pipeline(transaction=False) as pipe:
+                for raw_id in page:
+                    pipe.exists(f"rq:job:{_decode(raw_id)}")
+                exists = pipe.execute()
+
+            orphan_ids = [raw_id for raw_id, found in zip(page, exists) if not found]
+            stats["orphaned"] += len(orphan_ids)
+
+            removed = 0
+            if orphan_ids and not dry_run:
+                with redis_conn.pipeline(transaction=False) as pipe:
+                    for raw_id in orphan_ids:
+                        # LREM removes all matching occurrences of this ID.
+                        pipe.lrem(queue_key, 0, raw_id)
+                    removed = sum(int(n) for n in pipe.execute())
+                stats["pruned"] += removed
+
+            # Removed IDs shift the rest of the list left. Erring towards a
+            # rescan is harmless; skipping past IDs is not.
+            next_offset = max(start, start + len(page) - removed)
+            if time.monotonic() - started >= time_budget:
+                stats["complete"] = False
+                break
+        else:
+            next_offset = 0
 
-        stats["orphaned"] = len(orphan_ids)
+        if not stats["complete"] and not redis_conn.lrange(queue_key, next_offset, next_offset):
+            stats["complete"] = True
+            next_offset = 0
+        stats["offset"] = next_offset
+        _save_cursor(redis_conn, cursor_key, next_offset)
 
-        if orphan_ids:
+        if stats["orphaned"]:
             logger.warning(
-                f"Found {len(orphan_ids)} orphaned IDs in queue '{queue_name}' "
+                f"Found {stats['orphaned']} orphaned IDs in queue '{queue_name}' "
                 f"(of {stats['scanned']} scanned)"
             )
             if not dry_run:
-                pruned = 0
-                for raw_id in orphan_ids:
-                    # LREM removes all matching occurrences of this ID.
-                    removed = redis_conn.lrem(queue_key, 0, raw_id)
-                    pruned += int(removed)
-                stats["pruned"] = pruned
-                logger.info(f"Pruned {pruned} orphaned IDs from queue '{queue_name}'")
+                logger.info(f"Pruned {stats['pruned']} orphaned IDs from queue '{queue_name}'")
             else:
                 logger.info(
-                    f"DRY RUN: would prune {len(orphan_ids)} orphaned IDs "
+                    f"DRY RUN: would prune {stats['orphaned']} orphaned IDs "
                     f"from queue '{queue_name}'"
                 )
         else:
             logger.info(f"No orphaned IDs found in queue '{queue_name}'")
 
+        if not stats["complete"]:
+            logger.info(
+                f"Time budget of {time_budget}s used up; next run resumes "
+                f"'{queue_name}' from offset {next_offset}"
+            )
+
         logger.info(f"Stats: {stats}")
         return stats
 
@@ -458,14 +648,24 @@ def prune_orphaned_queue_ids(
         raise
 
 
-def get_rq_stats(queue_name: str = "default") -> Dict[str, any]:
+def get_rq_stats(
+    queue_name: str = "default",
+    scan_count: int = SCAN_COUNT,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+) -> Dict[str, any]:
     """
     Get statistics about RQ queues and jobs.
 
     Returns detailed statistics about job counts, queue sizes, and Redis usage.
 
+    Key counts come from one incremental ``SCAN`` over ``rq:*`` classified by
+    prefix, instead of a ``KEYS`` call per prefix. If ``time_budget`` seconds
+    run out first, the counts are lower bounds and ``redis.complete`` is False.
+
     Args:
         queue_name: Queue name to get stats for (default: "default")
+        scan_count: COUNT hint per SCAN step (default: SCAN_COUNT)
+        time_budget: Seconds to spend counting keys
 
     Returns:
         Dictionary with statistics:
@@ -482,6 +682,7 @@ def get_rq_stats(queue_name: str = "default") -> Dict[str, any]:
         >>> print(f"Total Redis keys: {stats['redis']['total_keys']}")
     """
     try:
+        started = time.monotonic()
         queue = django_rq.get_queue(queue_name)
         redis_conn = queue.connection
 
@@ -490,6 +691,22 @@ def get_rq_stats(queue_name: str = "default") -> Dict[str, any]:
         failed_registry = FailedJobRegistry(queue=queue)
         started_registry = StartedJobRegistry(queue=queue)
 
+        counts = {"total": 0, "job": 0, "queue": 0, "worker": 0}
+        complete = False
+        for key in redis_conn.scan_iter(match="rq:*", count=scan_count):
+            key = _decode(key)
+            counts["total"] += 1
+            if key.startswith("rq:job:"):
+                counts["job"] += 1
+            elif key.startswith("rq:queue:"):
+                counts["queue"] += 1
+            elif key.startswith("rq:worker:"):
+                counts["worker"] += 1
+            if counts["total"] % scan_count == 0 and time.monotonic() - started >= time_budget:
+                break
+        else:
+            complete = True
+
         stats = {
             "queue": {
                 "name": queue_name,
@@ -499,12 +716,13 @@ def get_rq_stats(queue_name: str = "default") -> Dict[str, any]:
                 "started": len(started_registry),
             },
             "jobs": {
-                "total": len(redis_conn.keys("rq:job:*")),
+                "total": counts["job"],
             },
             "redis": {
-                "total_keys": len(redis_conn.keys("rq:*")),
-                "queue_keys": len(redis_conn.keys("rq:queue:*")),
-                "worker_keys": len(redis_conn.keys("rq:worker:*")),
+                "total_keys": counts["total"],
+                "queue_keys": counts["queue"],
+                "worker_keys": counts["worker"],
+                "complete": complete,
             },
         }
 
@@ -0,0 +1,145 @@
+"""
+Tests for SCAN-based, resumable maintenance tasks.
+"""
+
+from datetime import datetime, timedelta
+
+import fakeredis
+import pytest
+from rq import Queue
+from rq.job import JobStatus
+from rq.registry import FailedJobRegistry
+from rq.utils import utcformat
+
+from . import maintenance
+from .maintenance import cleanup_orphaned_job_keys, get_rq_stats, prune_orphaned_queue_ids
+
+
+@pytest.fixture
+def connection(settings, monkeypatch):
+    import django_rq
+
+    connection = fakeredis.FakeStrictRedis()
+    queues = {name: Queue(name, connection=connection) for name in ("default", "low")}
+    settings.RQ_QUEUES = {"default": {}}
+    monkeypatch.setattr(django_rq, "get_queue", lambda name: queues[name])
+
+    def no_keys(*args, **kwargs):
+        raise AssertionError("KEYS blocks Redis; use SCAN")
+
+    monkeypatch.setattr(connection, "keys", no_keys)
+    return connection
+
+
+def _orphan(queue, created_at=None):
+    """Enqueue a job, then drop it from the queue so only its hash is left."""
+    job = queue.enqueue("builtins.print")
+    queue.remove(job)
+    created_at = created_at or datetime.utcnow() - timedelta(days=1)
+    queue.connection.hset(job.key, "created_at", utcformat(created_at))
+    return job
+
+
+class TestCleanupOrphanedJobKeys:
+    """Test orphan detection, safety checks and cursor resumption."""
+
+    def test_deletes_only_orphans(self, connection):
+        default = Queue("default", connection=connection)
+        # Registered in rq:queues but missing from RQ_QUEUES
+        low = Queue("low", connection=connection)
+
+        queued = default.enqueue("builtins.print")
+        other = low.enqueue("builtins.print")
+        failed = _orphan(default)
+        failed.set_status(JobStatus.FAILED)
+        FailedJobRegistry("default", connection=connection).add(failed, ttl=3600)
+        connection.sadd(f"{queued.key}:dependents", "x")
+        orphans = [_orphan(default) for _ in range(3)]
+
+        stats = cleanup_orphaned_job_keys()
+
+        assert stats["orphaned_deleted"] == 3
+        assert stats["complete"] is True
+        for job in orphans:
+            assert not connection.exists(job.key)
+        for job in (queued, other, failed):
+            assert connection.exists(job.key)
+        assert connection.exists(f"{queued.key}:dependents")
+
+    def test_dry_run_and_fresh_jobs_are_kept(self, connection):
+        default = Queue("default", connection=connection)
+        stale = _orphan(default)
+        fresh = _orphan(default, created_at=datetime.utcnow())
+
+        dry = cleanup_orphaned_job_keys(dry_run=True)
+        real = cleanup_orphaned_job_keys()
+
+        assert dry["orphaned_deleted"] == 1
+        assert real["fresh_skipped"] == 1
+        assert not connection.exists(stale.key)
+        assert connection.exists(fresh.key)
+
+    def test_resumes_from_saved_cursor(self, connection):
+        default = Queue("default", connection=connection)
+        orphans = [_orphan(default) for _ in range(30)]
+        # Unrelated keys make SCAN steps return few or no job keys
+        for n in range(200):
+            connection.set(f"app:{n}", n)
+
+        runs = []
+        while not runs or not runs[-1]["complete"]:
+            runs.append(cleanup_orphaned_job_keys(scan_count=10, time_budget=0))
+
+        assert len(runs) > 1
+        assert runs[1]["resumed_from"] == runs[0]["cursor"] != 0
+        assert sum(run["orphaned_deleted"] for run in runs) == 30
+        assert not any(connection.exists(job.key) for job in orphans)
+        assert not connection.exists(maintenance._cursor_key("orphaned_job_keys"))
+
+
+class TestPruneOrphanedQueueIds:
+    """Test paged, pipelined pruning of queue lists."""
+
+    def test_prunes_missing_hashes(self, connection):
+        default = Queue("default", connection=connection)
+        jobs = [default.enqueue("builtins.print", n) for n in range(25)]
+        for job in jobs[::3]:
+            connection.delete(job.key)
+
+        stats = prune_orphaned_queue_ids(scan_count=4)
+
+        assert stats["orphaned"] == stats["pruned"] == 9
+        assert default.job_ids == [job.id for n, job in enumerate(jobs) if n % 3]
+
+    def test_time_budget_saves_offset(self, connection):
+        default = Queue("default", connection=connection)
+        jobs = [default.enqueue("builtins.print", n) for n in range(12)]
+        for job in jobs[::2]:
+            connection.delete(job.key)
+
+        first = prune_orphaned_queue_ids(scan_count=4, time_budget=0)
+        assert first["complete"] is False
+        assert first["offset"] == 2  # 4 scanned, 2 removed
+
+        runs = [first]
+        while not runs[-1]["complete"]:
+            runs.append(prune_orphaned_queue_ids(scan_count=4, time_budget=0))
+
+        assert sum(run["pruned"] for run in runs) == 6
+        assert default.job_ids == [job.id for job in jobs[1::2]]
+        assert runs[-1]["offset"] == 0
+
+
+def test_rq_stats_counts_keys_by_prefix(connection):
+    default = Queue("default", connection=connection)
+    for n in range(5):
+        default.enqueue("builtins.print", n)
+    connection.set("rq:worker:w1", "x")
+
+    stats = get_rq_stats(scan_count=2)
+
+    assert stats["queue"]["queued"] == 5
+    assert stats["jobs"]["total"] == 5
+    assert stats["redis"]["queue_keys"] == 1
+    assert stats["redis"]["worker_keys"] == 1
+    assert stats["redis"]["complete"] is True
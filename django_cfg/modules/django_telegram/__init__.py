@@ -6,7 +6,8 @@ Supports custom bot_token and chat_id per-call with fallback to config defaults.
 
 Module Structure:
 - exceptions.py: TelegramError, TelegramConfigError, TelegramSendError
-- queue.py: TelegramMessageQueue, MessagePriority, telegram_queue
+- queue.py: TelegramMessageQueue, MessagePriority, MessageDeduplicator, telegram_queue
+- outbox.py: SQLiteOutbox, OutboxDrainer, OutboxMessage, TokenBucket
 - types.py: TelegramParseMode
 - formatters.py: EMOJI_MAP, format_to_yaml, format_message_with_context
 - shortcuts.py: send_error, send_success, send_warning, send_info, send_stats, send_alert
@@ -25,7 +26,14 @@ from .formatters import (
     format_to_yaml,
     markdown_to_telegram_html,
 )
+from .outbox import (
+    OutboxDrainer,
+    OutboxMessage,
+    SQLiteOutbox,
+    TokenBucket,
+)
 from .queue import (
+    MessageDeduplicator,
     MessagePriority,
     TelegramMessageQueue,
     telegram_queue,
@@ -54,9 +62,15 @@ __all__ = [
     "TelegramConfigError",
     "TelegramSendError",
     # Queue
+    "MessageDeduplicator",
     "MessagePriority",
     "TelegramMessageQueue",
     "telegram_queue",
+    # Outbox
+    "OutboxDrainer",
+    "OutboxMessage",
+    "SQLiteOutbox",
+    "TokenBucket",
     # Types
     "TelegramParseMode",
     # Formatters
@@ -0,0 +1,68 @@
+"""
+Shared fixtures for the Telegram tests: a fake Bot API server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from telebot import apihelper
+
+
+class FakeBotAPI(ThreadingHTTPServer):
+    """Records sendMessage calls; `responses` queues error replies per chat."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeBotAPIHandler)
+        self.messages = []
+        self.responses = {}
+        self.lock = threading.Lock()
+
+
+class FakeBotAPIHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        params = dict(parse_qsl(url.query))
+        params.update(parse_qsl(self.rfile.read(length).decode()))
+        chat_id = params["chat_id"]
+
+        with self.server.lock:
+            queued = self.server.responses.get(chat_id)
+            reply = queued.pop(0) if queued else None
+            if reply is None:
+                self.server.messages.append((time.monotonic(), chat_id, params["text"]))
+                message_id = len(self.server.messages)
+                reply = {
+                    "ok": True,
+                    "result": {
+                        "message_id": message_id,
+                        "date": int(time.time()),
+                        "chat": {"id": int(chat_id), "type": "private"},
+                        "text": params["text"],
+                    },
+                }
+
+        body = json.dumps(reply).encode()
+        self.send_response(200 if reply["ok"] else reply["error_code"])
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def bot_api(monkeypatch):
+    server = FakeBotAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(apihelper, "API_URL", f"http://127.0.0.1:{server.server_port}/bot{{0}}/{{1}}")
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,669 @@
+"""
+Cross-process Telegram outbox.
+
+`TelegramMessageQueue` is per process: every gunicorn worker, RQ job and
+management command drains its own queue at its own 20 msg/s, so together they
+can exceed Telegram's limits, and a burst to one chat (1 msg/s, 20 msg/min
+for groups) gets 429s no matter how the queue is sized.
+
+The outbox is a SQLite file every process on the host writes text messages
+to. One drainer at a time — whichever process holds the file lock — sends
+them with a global token bucket plus one bucket per chat. Messages waiting on
+a chat's bucket are coalesced: consecutive messages to the same chat created
+within `coalesce_window` seconds of each other go out as one message.
+
+Delivery is at least once: a message is leased while it is being sent and
+deleted once Telegram accepts it, so a drainer that dies mid-send leaves it
+to be retried by the next one.
+
+Forked children (RQ work horses, pre-fork workers) run no drainer thread,
+like `TelegramMessageQueue`: they may leave through `os._exit` at any time,
+so they push and then flush the outbox before returning to the caller.
+
+Enabled by setting `TelegramConfig.outbox_path`; photos and documents keep
+using the in-process queue.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Union
+
+from ..django_logging import get_logger
+from .queue import MessagePriority, in_forked_child
+
+if TYPE_CHECKING:
+    from django_cfg.models.services.telegram import TelegramConfig
+
+logger = get_logger("django_cfg.telegram.outbox")
+
+# Telegram rejects longer text messages
+MAX_MESSAGE_LENGTH = 4096
+COALESCE_SEPARATOR = "\n\n"
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens per second.
+    Not thread-safe; the drainer owns its buckets.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token (callers check `wait_time()` first)."""
+        self._refill(self._clock())
+        self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (e.g. Telegram's retry_after)."""
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = now + seconds
+
+
+@dataclass
+class OutboxMessage:
+    """A text message waiting in the outbox."""
+
+    chat_id: Union[int, str]
+    text: str
+    parse_mode: Optional[str] = None
+    disable_notification: bool = False
+    reply_to_message_id: Optional[int] = None
+    # None means the default token from TelegramConfig
+    bot_token: Optional[str] = None
+    priority: int = MessagePriority.NORMAL
+    created_at: float = field(default_factory=time.time)
+    id: Optional[int] = None
+    attempts: int = 0
+
+    @property
+    def chat_key(self) -> str:
+        """Rate limit key: one bucket per bot and chat."""
+        return f"{self.bot_token or ''}:{self.chat_id}"
+
+    def can_join(self, other: "OutboxMessage", window: float) -> bool:
+        """Whether `other`, sent right after this message, can be merged into it."""
+        return (
+            other.chat_key == self.chat_key
+            and other.parse_mode == self.parse_mode
+            and other.disable_notification == self.disable_notification
+            and other.reply_to_message_id is None
+            and self.reply_to_message_id is None
+            and abs(other.created_at - self.created_at) <= window
+        )
+
+    def to_payload(self) -> str:
+        data = asdict(self)
+        for key in ("id", "priority", "bot_token", "attempts"):
+            data.pop(key)
+        return json.dumps(data)
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "OutboxMessage":
+        return cls(
+            **json.loads(row["payload"]),
+            bot_token=row["bot_token"],
+            priority=row["priority"],
+            id=row["id"],
+            attempts=row["attempts"],
+        )
+
+
+class SQLiteOutbox:
+    """
+    Outbox table in a SQLite file shared by all processes on a host.
+
+    Runs in WAL mode so writers don't block the drainer's reads; claims
+    take the write lock (`BEGIN IMMEDIATE`) so two drainers never lease the
+    same rows. Connections are opened per process and shared by its threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        lease_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self.dropped_count = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Custom bot tokens are stored with their messages
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+
+        conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " priority INTEGER NOT NULL,"
+            " bot_token TEXT,"
+            " payload TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " leased_until REAL NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS outbox_order ON outbox (priority, id)")
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def push(self, message: OutboxMessage) -> bool:
+        """
+        Add a message. Returns False if it was dropped because the outbox is full.
+
+        CRITICAL messages are always accepted.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if message.priority > MessagePriority.CRITICAL:
+                    (size,) = conn.execute("SELECT COUNT(*) FROM outbox").fetchone()
+                    if size >= self.max_size:
+                        conn.execute("ROLLBACK")
+                        self.dropped_count += 1
+                        logger.warning(
+                            f"Telegram outbox FULL ({size}/{self.max_size}): "
+                            f"Dropped priority={message.priority} message. Total dropped: {self.dropped_count}"
+                        )
+                        return False
+                cursor = conn.execute(
+                    "INSERT INTO outbox (priority, bot_token, payload) VALUES (?, ?, ?)",
+                    (message.priority, message.bot_token, message.to_payload()),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        message.id = cursor.lastrowid
+        return True
+
+    def claim(self, limit: int) -> List[OutboxMessage]:
+        """Lease up to `limit` ready messages, highest priority first."""
+        now = self._clock()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT * FROM outbox WHERE leased_until <= ? ORDER BY priority, id LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+                if rows:
+                    conn.executemany(
+                        "UPDATE outbox SET leased_until = ? WHERE id = ?",
+                        [(now + self.lease_seconds, row["id"]) for row in rows],
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return [OutboxMessage.from_row(row) for row in rows]
+
+    def ack(self, ids: List[int]) -> None:
+        """Delete delivered (or abandoned) messages."""
+        if not ids:
+            return
+        with self._lock:
+            self._connect().executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def release(self, ids: List[int], delay: float = 0.0, failed: bool = False) -> None:
+        """
+        Return leased messages to the outbox, ready again after `delay` seconds.
+
+        Also used to extend a lease: release with delay=lease_seconds.
+        """
+        if not ids:
+            return
+        ready_at = self._clock() + delay
+        increment = 1 if failed else 0
+        with self._lock:
+            self._connect().executemany(
+                "UPDATE outbox SET leased_until = ?, attempts = attempts + ? WHERE id = ?",
+                [(ready_at, increment, i) for i in ids],
+            )
+
+    def size(self) -> int:
+        """Number of messages waiting or being sent."""
+        with self._lock:
+            (size,) = self._connect().execute("SELECT COUNT(*) FROM outbox").fetchone()
+        return size
+
+    def get_stats(self) -> dict:
+        """Outbox statistics, shaped like `TelegramMessageQueue.get_stats()`."""
+        current_size = self.size()
+        return {
+            "backend": "outbox",
+            "outbox_path": self.path,
+            "queue_size": current_size,
+            "max_size": self.max_size,
+            "usage_percent": round((current_size / self.max_size) * 100, 1),
+            "dropped_total": self.dropped_count,
+            "status": "FULL" if current_size >= self.max_size else "OK",
+        }
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds Telegram asked us to wait, if `error` is a 429 response."""
+    if getattr(error, "error_code", None) != 429:
+        return None
+    result_json = getattr(error, "result_json", None) or {}
+    return float((result_json.get("parameters") or {}).get("retry_after", 1))
+
+
+def _is_permanent(error: Exception) -> bool:
+    """Client errors other than 429 (bad markup, bot blocked, chat not found) won't succeed on retry."""
+    error_code = getattr(error, "error_code", None)
+    return isinstance(error_code, int) and 400 <= error_code < 500 and error_code != 429
+
+
+class OutboxDrainer:
+    """
+    Sends outbox messages within Telegram's rate limits.
+
+    Only one drainer per outbox file sends at a time: `start()` runs a
+    daemon thread that takes an exclusive lock on `<outbox_path>.lock` and
+    keeps polling for it while another process holds it. The lock is
+    released by the OS when the holder exits.
+    """
+
+    def __init__(
+        self,
+        outbox: SQLiteOutbox,
+        send: Optional[Callable[[OutboxMessage], None]] = None,
+        *,
+        global_rate: float = 25.0,
+        chat_rate: float = 1.0,
+        group_rate_per_minute: float = 20.0,
+        coalesce_window: float = 2.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        batch_size: int = 500,
+        poll_interval: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.outbox = outbox
+        self._send = send or _send_with_bot
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate_per_minute / 60.0
+        self.coalesce_window = coalesce_window
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._global = TokenBucket(global_rate, capacity=max(1.0, global_rate), clock=clock)
+        self._chats: Dict[str, TokenBucket] = {}
+        # chat_key -> leased messages in send order
+        self._pending: "OrderedDict[str, Deque[OutboxMessage]]" = OrderedDict()
+        self._leased_at: Dict[int, float] = {}
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock_file = None
+        self.sent_count = 0
+        self.coalesced_count = 0
+        self.failed_count = 0
+
+    # ========== RATE LIMITS ==========
+
+    def _chat_bucket(self, message: OutboxMessage) -> TokenBucket:
+        bucket = self._chats.get(message.chat_key)
+        if bucket is None:
+            # Negative IDs are groups and channels, limited to 20 msg/min
+            is_group = str(message.chat_id).startswith("-")
+            rate = min(self.chat_rate, self.group_rate) if is_group else self.chat_rate
+            bucket = self._chats[message.chat_key] = TokenBucket(rate, clock=self._clock)
+        return bucket
+
+    # ========== DRAINING ==========
+
+    def _pending_count(self) -> int:
+        return sum(len(messages) for messages in self._pending.values())
+
+    def _claim(self) -> None:
+        room = self.batch_size - self._pending_count()
+        if room <= 0:
+            return
+        now = self._clock()
+        for message in self.outbox.claim(room):
+            self._pending.setdefault(message.chat_key, deque()).append(message)
+            self._leased_at[message.id] = now
+
+    def _extend_leases(self) -> None:
+        now = self._clock()
+        expiring = [i for i, leased_at in self._leased_at.items() if now - leased_at > self.outbox.lease_seconds / 2]
+        if expiring:
+            self.outbox.release(expiring, delay=self.outbox.lease_seconds)
+            for message_id in expiring:
+                self._leased_at[message_id] = now
+
+    def _coalesce(self, messages: Deque[OutboxMessage]) -> List[OutboxMessage]:
+        """Pop the head message plus the consecutive ones that can be merged into it."""
+        group = [messages.popleft()]
+        length = len(group[0].text)
+        while messages and group[-1].can_join(messages[0], self.coalesce_window):
+            length += len(COALESCE_SEPARATOR) + len(messages[0].text)
+            if length > MAX_MESSAGE_LENGTH:
+                break
+            group.append(messages.popleft())
+        return group
+
+    def _deliver(self, group: List[OutboxMessage]) -> None:
+        head = group[0]
+        ids = [message.id for message in group]
+        message = OutboxMessage(
+            chat_id=head.chat_id,
+            text=COALESCE_SEPARATOR.join(m.text for m in group),
+            parse_mode=head.parse_mode,
+            disable_notification=head.disable_notification,
+            reply_to_message_id=head.reply_to_message_id,
+            bot_token=head.bot_token,
+            priority=min(m.priority for m in group),
+            created_at=head.created_at,
+            id=head.id,
+            attempts=max(m.attempts for m in group),
+        )
+        try:
+            self._send(message)
+        except Exception as e:
+            retry_after = _retry_after(e)
+            if retry_after is not None:
+                # Rate limited: keep the messages in order and pause the chat
+                logger.warning(f"Telegram rate limited chat {head.chat_id}; retrying in {retry_after}s")
+                self._chat_bucket(head).pause(retry_after)
+                self._pending.setdefault(head.chat_key, deque()).extendleft(reversed(group))
+                self._pending.move_to_end(head.chat_key, last=False)
+                return
+            self._forget(ids)
+            if _is_permanent(e) or message.attempts + 1 > self.max_retries:
+                self.failed_count += len(group)
+                logger.error(f"Telegram outbox dropped message to chat {head.chat_id}: {e}")
+                self.outbox.ack(ids)
+            else:
+                delay = self.retry_delay * (2 ** message.attempts)
+                logger.warning(f"Telegram outbox send to chat {head.chat_id} failed, retrying in {delay}s: {e}")
+                self.outbox.release(ids, delay=delay, failed=True)
+            return
+
+        self._forget(ids)
+        self.outbox.ack(ids)
+        self.sent_count += 1
+        self.coalesced_count += len(group) - 1
+        logger.debug(f"Telegram outbox sent {len(group)} message(s) to chat {head.chat_id}")
+
+    def _forget(self, ids: List[int]) -> None:
+        for message_id in ids:
+            self._leased_at.pop(message_id, None)
+
+    def run_once(self) -> float:
+        """
+        Claim ready messages and send those the rate limits allow.
+
+        Returns:
+            Seconds until the next send could happen (0 if more are ready now)
+        """
+        self._claim()
+        self._extend_leases()
+
+        next_send = self.poll_interval
+        sent = False
+        for chat_key in list(self._pending):
+            messages = self._pending.get(chat_key)
+            if not messages:
+                self._pending.pop(chat_key, None)
+                continue
+
+            chat_bucket = self._chat_bucket(messages[0])
+            chat_wait = chat_bucket.wait_time()
+            if chat_wait > 0:
+                next_send = min(next_send, chat_wait)
+                continue
+            global_wait = self._global.wait_time()
+            if global_wait > 0:
+                next_send = min(next_send, global_wait)
+                break
+
+            chat_bucket.consume()
+            self._global.consume()
+            self._deliver(self._coalesce(messages))
+            sent = True
+            if not self._pending.get(chat_key):
+                self._pending.pop(chat_key, None)
+
+        # After a send there may be room to claim more, possibly for idle chats
+        return 0.0 if sent else next_send
+
+    def drain(self, timeout: float = 10.0) -> bool:
+        """
+        Send until the outbox is empty, in the calling thread.
+
+        Returns:
+            True if the outbox was emptied, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            delay = self.run_once()
+            if not self._pending and self.outbox.size() == 0:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            if delay > 0:
+                time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+
+    # ========== BACKGROUND THREAD ==========
+
+    def _try_lead(self) -> bool:
+        import fcntl
+
+        if self._lock_file is not None:
+            return True
+        lock_file = open(f"{self.outbox.path}.lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        logger.info(f"Telegram outbox drainer started in pid={os.getpid()}: {self.outbox.path}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            delay = 1.0
+            try:
+                if self._try_lead():
+                    delay = self.run_once()
+            except Exception as e:
+                logger.error(f"Telegram outbox drainer error: {e}")
+            if delay > 0:
+                self._wakeup.wait(delay)
+                self._wakeup.clear()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is alive (it is not after fork)."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start draining in a daemon thread (idempotent)."""
+        if self.is_running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="TelegramOutboxDrainer")
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and give up the drainer lock."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._step_down()
+
+    def _step_down(self) -> None:
+        """Give up the drainer lock; unsent messages go back for the next drainer."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        ids = [m.id for messages in self._pending.values() for m in messages]
+        self.outbox.release(ids)
+        self._pending.clear()
+        self._leased_at.clear()
+
+    def notify(self) -> None:
+        """Wake the background thread (a message was just pushed)."""
+        self._wakeup.set()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until the outbox is empty.
+
+        Drains in the calling thread when no drainer is running, e.g. at the
+        end of a management command or in a forked child, and then gives the
+        drainer lock back.
+        """
+        if not self.is_running and self._try_lead():
+            try:
+                return self.drain(timeout)
+            finally:
+                self._step_down()
+        deadline = time.monotonic() + timeout
+        while self.outbox.size() > 0:
+            if time.monotonic() >= deadline:
+                logger.warning(f"Telegram outbox flush timeout ({self.outbox.size()} messages remaining)")
+                return False
+            time.sleep(0.1)
+        return True
+
+    def get_stats(self) -> dict:
+        return {
+            **self.outbox.get_stats(),
+            "draining": self._lock_file is not None,
+            "sent_total": self.sent_count,
+            "coalesced_total": self.coalesced_count,
+            "failed_total": self.failed_count,
+        }
+
+
+def _send_with_bot(message: OutboxMessage) -> None:
+    """Send through the same cached TeleBot instances as `DjangoTelegram`."""
+    from .service import DjangoTelegram
+
+    DjangoTelegram()._get_bot(message.bot_token).send_message(
+        chat_id=message.chat_id,
+        text=message.text,
+        parse_mode=message.parse_mode,
+        disable_notification=message.disable_notification,
+        reply_to_message_id=message.reply_to_message_id,
+    )
+
+
+_drainer: Optional[OutboxDrainer] = None
+_drainer_pid: Optional[int] = None
+_drainer_lock = threading.Lock()
+
+
+def _reusable(drainer: Optional[OutboxDrainer], config: "TelegramConfig") -> bool:
+    return (
+        drainer is not None
+        # Never reuse a drainer inherited over fork: its lock file and SQLite
+        # connection belong to the parent
+        and _drainer_pid == os.getpid()
+        and drainer.outbox.path == config.outbox_path
+        and (drainer.is_running or in_forked_child())
+    )
+
+
+def get_outbox_drainer(config: Optional["TelegramConfig"]) -> Optional[OutboxDrainer]:
+    """
+    The process-wide outbox drainer for `config`.
+
+    Returns None when `config.outbox_path` is not set. The drainer thread is
+    started on first use, except in a forked child: there the drainer is
+    only used through `flush()`, which sends in the calling thread (see
+    `DjangoTelegram._dispatch_text`).
+    """
+    global _drainer, _drainer_pid
+
+    if config is None or not config.outbox_path:
+        return None
+    drainer = _drainer
+    if _reusable(drainer, config):
+        return drainer
+
+    with _drainer_lock:
+        drainer = _drainer
+        if not _reusable(drainer, config):
+            outbox = SQLiteOutbox(config.outbox_path, max_size=config.outbox_max_size)
+            drainer = OutboxDrainer(
+                outbox,
+                global_rate=config.outbox_global_rate,
+                chat_rate=config.outbox_chat_rate,
+                group_rate_per_minute=config.outbox_group_rate_per_minute,
+                coalesce_window=config.outbox_coalesce_window,
+                max_retries=config.max_retries,
+                retry_delay=config.retry_delay,
+            )
+            if not in_forked_child():
+                drainer.start()
+            _drainer = drainer
+            _drainer_pid = os.getpid()
+    return drainer
+
+
+__all__ = [
+    "MAX_MESSAGE_LENGTH",
+    "OutboxDrainer",
+    "OutboxMessage",
+    "SQLiteOutbox",
+    "TokenBucket",
+    "get_outbox_drainer",
+]
@@ -0,0 +1,164 @@
+"""
+Tests for the cross-process Telegram outbox against a fake Bot API server
+(the `bot_api` fixture in conftest.py).
+"""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from django_cfg.models.services.telegram import TelegramConfig
+
+from . import outbox as outbox_module
+from .outbox import OutboxDrainer, OutboxMessage, SQLiteOutbox, get_outbox_drainer
+from .queue import MessagePriority
+from .service import DjangoTelegram
+
+BOT_TOKEN = "123456:fake-token-for-outbox-tests-0000000"
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return SQLiteOutbox(str(tmp_path / "telegram-outbox.sqlite3"))
+
+
+def _message(chat_id, text, **kwargs):
+    return OutboxMessage(chat_id=chat_id, text=text, bot_token=BOT_TOKEN, **kwargs)
+
+
+def _push_from_child(path, texts):
+    child_outbox = SQLiteOutbox(path)
+    for text in texts:
+        child_outbox.push(_message(1, text))
+
+
+class TestOutboxDrainer:
+    """Test delivery, coalescing and rate limits."""
+
+    def test_drains_messages_from_other_processes(self, outbox, bot_api):
+        outbox.push(_message(1, "parent"))
+        child = multiprocessing.get_context("spawn").Process(
+            target=_push_from_child, args=(outbox.path, ["child 1", "child 2"])
+        )
+        child.start()
+        child.join(10)
+        assert child.exitcode == 0
+        outbox.push(_message(2, "other chat"))
+
+        drainer = OutboxDrainer(outbox, coalesce_window=60)
+        assert drainer.drain(timeout=10)
+
+        # Consecutive messages to chat 1 went out as one message
+        assert [(chat, text) for _, chat, text in bot_api.messages] == [
+            ("1", "parent\n\nchild 1\n\nchild 2"),
+            ("2", "other chat"),
+        ]
+        assert outbox.size() == 0
+        assert (drainer.sent_count, drainer.coalesced_count) == (2, 2)
+
+    def test_coalescing_respects_window_and_length(self, outbox):
+        sent = []
+        now = time.time()
+        outbox.push(_message(1, "a", created_at=now))
+        outbox.push(_message(1, "b", created_at=now + 1))
+        outbox.push(_message(1, "c", created_at=now + 30))
+        outbox.push(_message(1, "x" * 4094, created_at=now + 30))
+        outbox.push(_message(1, "html", created_at=now + 30, parse_mode="HTML"))
+
+        drainer = OutboxDrainer(outbox, sent.append, chat_rate=1000, coalesce_window=5)
+        assert drainer.drain(timeout=5)
+
+        assert [m.text[:4] for m in sent] == ["a\n\nb", "c", "xxxx", "html"]
+
+    def test_global_and_per_chat_limits(self, outbox):
+        clock = [0.0]
+        sent = []
+        for chat_id in range(1, 6):
+            outbox.push(_message(chat_id, f"to {chat_id}"))
+        outbox.push(_message(1, "to 1 again", created_at=time.time() + 60))
+
+        drainer = OutboxDrainer(
+            outbox, lambda m: sent.append(m.chat_id), global_rate=2, chat_rate=0.5, clock=lambda: clock[0]
+        )
+
+        drainer.run_once()
+        assert sent == [1, 2]  # global bucket holds 2 tokens
+        clock[0] = 0.5
+        drainer.run_once()
+        assert sent == [1, 2, 3]
+        clock[0] = 1.5
+        drainer.run_once()
+        assert sent == [1, 2, 3, 4, 5]
+        # Chat 1 gets its second message only after 1 / chat_rate seconds
+        clock[0] = 1.9
+        drainer.run_once()
+        assert sent == [1, 2, 3, 4, 5]
+        clock[0] = 2.0
+        drainer.run_once()
+        assert sent == [1, 2, 3, 4, 5, 1]
+
+    def test_retry_after_pauses_chat(self, outbox, bot_api):
+        bot_api.responses["7"] = [
+            {"ok": False, "error_code": 429, "description": "Too Many Requests", "parameters": {"retry_after": 1}}
+        ]
+        outbox.push(_message(7, "slow down"))
+        outbox.push(_message(8, "unaffected"))
+        started = time.monotonic()
+
+        drainer = OutboxDrainer(outbox)
+        assert drainer.drain(timeout=10)
+
+        delivered = {chat: at - started for at, chat, _ in bot_api.messages}
+        assert delivered["7"] >= 1.0
+        assert delivered["8"] < 1.0
+        assert len(bot_api.messages) == 2
+
+    def test_permanent_errors_are_dropped(self, outbox, bot_api):
+        bot_api.responses["9"] = [{"ok": False, "error_code": 400, "description": "Bad Request: can't parse entities"}]
+        outbox.push(_message(9, "<b>broken"))
+
+        drainer = OutboxDrainer(outbox)
+        assert drainer.drain(timeout=5)
+
+        assert bot_api.messages == []
+        assert drainer.failed_count == 1
+
+
+def _send_from_work_horse(path):
+    config = TelegramConfig(bot_token=BOT_TOKEN, chat_id=1, outbox_path=path)
+    drainer = get_outbox_drainer(config)
+    if drainer.is_running:
+        os._exit(1)
+    DjangoTelegram._get_outbox_drainer = classmethod(lambda cls: drainer)
+    DjangoTelegram(bot_token=BOT_TOKEN)._dispatch_text("from job", 1, BOT_TOKEN, None)
+    os._exit(0)  # how RQ work horses leave
+
+
+def test_forked_child_sends_before_exit(outbox, bot_api, monkeypatch):
+    monkeypatch.setattr(outbox_module, "_drainer", None)
+    child = multiprocessing.get_context("fork").Process(target=_send_from_work_horse, args=(outbox.path,))
+    child.start()
+    child.join(10)
+
+    assert child.exitcode == 0
+    assert [text for _, _, text in bot_api.messages] == ["from job"]
+    assert outbox.size() == 0
+    # The child gave the drainer lock back
+    assert OutboxDrainer(outbox)._try_lead()
+
+
+def test_full_outbox_keeps_critical_messages(tmp_path):
+    outbox = SQLiteOutbox(str(tmp_path / "outbox.sqlite3"), max_size=2)
+    assert outbox.push(_message(1, "one"))
+    assert outbox.push(_message(1, "two"))
+
+    assert not outbox.push(_message(1, "dropped", priority=MessagePriority.HIGH))
+    assert outbox.push(_message(1, "kept", priority=MessagePriority.CRITICAL))
+
+    assert outbox.size() == 3
+    assert outbox.get_stats()["dropped_total"] == 1
+    # Highest priority is claimed first
+    assert [m.text for m in outbox.claim(10)] == ["kept", "one", "two"]
+    assert outbox.claim(10) == []  # all leased
@@ -4,11 +4,13 @@ Telegram Message Queue with Rate Limiting.
 Singleton priority queue for rate-limited Telegram message delivery.
 """
 
+import hashlib
 import itertools
 import os
 import queue
 import threading
 import time
+from typing import Callable, Dict, List
 
 from ..django_logging import get_logger
 
@@ -32,6 +34,11 @@ def _mark_forked_child() -> None:
 os.register_at_fork(after_in_child=_mark_forked_child)
 
 
+def in_forked_child() -> bool:
+    """Whether this process was forked after the module was imported."""
+    return _in_forked_child
+
+
 class MessagePriority:
     """Message priority levels for Telegram queue."""
 
@@ -41,6 +48,107 @@ class MessagePriority:
     LOW = 4       # Debug, non-urgent notifications
 
 
+# Identical messages to a chat within this many seconds are collapsed
+DEFAULT_DEDUP_WINDOW = 60.0
+
+
+def message_fingerprint(*parts) -> str:
+    """Content hash identifying a message (e.g. bot token, chat ID, parse mode, text)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def format_repeated(text: str, count: int) -> str:
+    """Text of the summary sent when a window closes with `count` suppressed repeats."""
+    return f"{text}\n\n×{count} repeated"
+
+
+class _DedupEntry:
+    __slots__ = ("expires_at", "repeats", "on_repeat")
+
+    def __init__(self, expires_at: float, on_repeat: Callable[[int], None]):
+        self.expires_at = expires_at
+        self.repeats = 0
+        self.on_repeat = on_repeat
+
+
+class MessageDeduplicator:
+    """
+    Content-hash dedup window for outgoing messages.
+
+    The first message with a given fingerprint goes through; identical ones
+    within `ttl` seconds are only counted. When the window closes, the
+    entry's `on_repeat(count)` callback is called once if any were counted,
+    so an alert storm becomes two messages: the first alert and a
+    "×N repeated" summary.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _DedupEntry] = {}
+        self.suppressed_count = 0
+
+    def admit(self, fingerprint: str, ttl: float, on_repeat: Callable[[int], None]) -> bool:
+        """
+        Whether a message should be sent now.
+
+        Args:
+            fingerprint: Content hash from `message_fingerprint()`
+            ttl: Dedup window in seconds (<= 0 disables deduplication)
+            on_repeat: Called with the repeat count when the window closes
+        """
+        if ttl <= 0:
+            return True
+        self.flush_expired()
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None:
+                entry.repeats += 1
+                self.suppressed_count += 1
+                return False
+            if len(self._entries) >= self.max_entries:
+                # Windows open in roughly expiry order; close the oldest early
+                oldest = next(iter(self._entries))
+                evicted = [self._entries.pop(oldest)]
+            else:
+                evicted = []
+            self._entries[fingerprint] = _DedupEntry(self._clock() + ttl, on_repeat)
+        self._report(evicted)
+        return True
+
+    def flush_expired(self, force: bool = False) -> int:
+        """
+        Close expired windows (all of them if `force`) and send their summaries.
+
+        Returns:
+            Number of summaries sent
+        """
+        now = self._clock()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if force or entry.expires_at <= now]
+            closed = [self._entries.pop(key) for key in expired]
+        return self._report(closed)
+
+    def _report(self, entries: List[_DedupEntry]) -> int:
+        sent = 0
+        for entry in entries:
+            if entry.repeats:
+                try:
+                    entry.on_repeat(entry.repeats)
+                    sent += 1
+                except Exception as e:
+                    logger.error(f"Telegram repeat summary error: {e}")
+        return sent
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class TelegramMessageQueue:
     """
     Global singleton queue for all Telegram messages with rate limiting and auto-cleanup.
@@ -83,6 +191,7 @@ class TelegramMessageQueue:
         self._counter = itertools.count()  # Tie-breaker for same-priority items
         self._dropped_count = 0  # Track dropped messages
         self._last_cleanup_warning = 0  # Timestamp of last warning
+        self.dedup = MessageDeduplicator()  # Collapses identical messages (see DjangoTelegram.send_message)
         # Skip the background worker thread in a forked child — enqueue()
         # routes around it (sync send) anyway, and starting a daemon thread
         # in a child that's about to exit is pure waste.
@@ -120,11 +229,14 @@ class TelegramMessageQueue:
 
             except queue.Empty:
                 # No messages, continue waiting
-                continue
+                pass
             except Exception as e:
                 logger.error(f"Telegram queue worker error: {e}")
                 time.sleep(1)  # Back off on errors
 
+            # Send "×N repeated" summaries for dedup windows that closed
+            self.dedup.flush_expired()
+
     def enqueue(self, func, priority=MessagePriority.NORMAL, *args, **kwargs):
         """
         Add a message to the queue with priority and smart cleanup.
@@ -215,6 +327,9 @@ class TelegramMessageQueue:
         Returns:
             True if queue was flushed, False if timeout
         """
+        # Summaries of suppressed repeats are part of what's pending
+        self.dedup.flush_expired(force=True)
+
         if self._queue.qsize() == 0:
             return True
 
@@ -241,6 +356,8 @@ class TelegramMessageQueue:
             "max_size": self.MAX_QUEUE_SIZE,
             "usage_percent": round((current_size / self.MAX_QUEUE_SIZE) * 100, 1),
             "dropped_total": self._dropped_count,
+            "dedup_windows": len(self.dedup),
+            "suppressed_total": self.dedup.suppressed_count,
             "warning_threshold": self.WARNING_THRESHOLD,
             "critical_threshold": self.CRITICAL_THRESHOLD,
             "status": (
@@ -257,7 +374,12 @@ telegram_queue = TelegramMessageQueue()
 
 
 __all__ = [
+    "DEFAULT_DEDUP_WINDOW",
+    "in_forked_child",
+    "MessageDeduplicator",
     "MessagePriority",
     "TelegramMessageQueue",
+    "format_repeated",
+    "message_fingerprint",
     "telegram_queue",
 ]
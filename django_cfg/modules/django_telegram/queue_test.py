@@ -0,0 +1,79 @@
+"""
+Tests for the Telegram queue's dedup window.
+"""
+
+import pytest
+
+from . import queue as queue_module
+from .queue import MessageDeduplicator, format_repeated, message_fingerprint, telegram_queue
+from .service import DjangoTelegram
+
+BOT_TOKEN = "123456:fake-token-for-queue-tests-00000000"
+
+
+class TestMessageDeduplicator:
+    """Test window bookkeeping with a fake clock."""
+
+    def test_collapses_repeats_until_window_closes(self):
+        clock = [0.0]
+        summaries = []
+        dedup = MessageDeduplicator(clock=lambda: clock[0])
+
+        admitted = [dedup.admit("alert", 60, summaries.append) for _ in range(1000)]
+
+        assert admitted.count(True) == 1
+        assert dedup.flush_expired() == 0
+        clock[0] = 60
+        assert dedup.flush_expired() == 1
+        assert summaries == [999]
+        # The next occurrence opens a new window
+        assert dedup.admit("alert", 60, summaries.append) is True
+        assert len(dedup) == 1
+
+    def test_windows_are_bounded(self):
+        summaries = []
+        dedup = MessageDeduplicator(max_entries=10)
+
+        for n in range(25):
+            dedup.admit(f"alert {n}", 60, summaries.append)
+            dedup.admit(f"alert {n}", 60, summaries.append)
+
+        assert len(dedup) == 10
+        # Evicted windows report their repeats early instead of losing them
+        assert summaries == [1] * 15
+        assert dedup.admit("other", 0, summaries.append) is True
+        assert dedup.admit("other", 0, summaries.append) is True
+
+    def test_fingerprint_covers_chat_and_text(self):
+        assert message_fingerprint("t", 1, "HTML", "boom") == message_fingerprint("t", 1, "HTML", "boom")
+        assert message_fingerprint("t", 1, "HTML", "boom") != message_fingerprint("t", 2, "HTML", "boom")
+        assert message_fingerprint("t", 1, None, "boom") != message_fingerprint("t", 1, "HTML", "boom")
+
+
+@pytest.fixture
+def storm_queue(monkeypatch, bot_api):
+    monkeypatch.setattr(telegram_queue, "dedup", MessageDeduplicator())
+    monkeypatch.setattr(DjangoTelegram, "_resolve_dedup_window", lambda self: 60.0)
+    monkeypatch.setattr(DjangoTelegram, "_get_outbox_drainer", classmethod(lambda cls: None))
+    assert not queue_module._in_forked_child
+    return bot_api
+
+
+def test_alert_storm_keeps_queue_bounded(storm_queue):
+    telegram = DjangoTelegram(bot_token=BOT_TOKEN, chat_id=1, disable_prefix=True)
+    peak = 0
+
+    for n in range(2000):
+        alert = "disk full" if n % 2 else "db down"
+        assert telegram.send_message(alert, parse_mode="HTML", fail_silently=True)
+        peak = max(peak, telegram_queue.size())
+
+    # Two distinct alerts: at most one queued message each, however many repeats
+    assert peak <= 2
+    assert telegram_queue.get_stats()["suppressed_total"] == 1998
+
+    assert telegram_queue.flush(timeout=10)
+    texts = sorted(text for _, _, text in storm_queue.messages)
+    assert texts == sorted(
+        ["db down", "disk full", format_repeated("db down", 999), format_repeated("disk full", 999)]
+    )
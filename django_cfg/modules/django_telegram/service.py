@@ -19,7 +19,15 @@ from ..django_logging import get_logger
 
 from .exceptions import TelegramConfigError, TelegramSendError
 from .formatters import EMOJI_MAP
-from .queue import MessagePriority, telegram_queue
+from .outbox import OutboxDrainer, OutboxMessage, get_outbox_drainer
+from .queue import (
+    DEFAULT_DEDUP_WINDOW,
+    MessagePriority,
+    format_repeated,
+    in_forked_child,
+    message_fingerprint,
+    telegram_queue,
+)
 from .types import TelegramParseMode
 
 logger = get_logger("django_cfg.telegram")
@@ -33,7 +41,9 @@ class DjangoTelegram(BaseCfgModule):
     from the main DjangoConfig instance.
 
     All messages are queued through a global singleton queue with rate limiting
-    (20 messages/second) to avoid hitting Telegram API limits.
+    (20 messages/second) to avoid hitting Telegram API limits. With
+    `TelegramConfig.outbox_path` set, text messages go through the
+    cross-process outbox instead (see outbox.py).
 
     Supports custom bot_token and chat_id per-call with fallback to config defaults.
     """
@@ -183,11 +193,31 @@ class DjangoTelegram(BaseCfgModule):
             return target_parse_mode
         return None
 
+    @classmethod
+    def _get_outbox_drainer(cls) -> Optional[OutboxDrainer]:
+        """Outbox drainer if `TelegramConfig.outbox_path` is set, else None."""
+        try:
+            config = cls.get_config()
+            return get_outbox_drainer(config.telegram if config else None)
+        except Exception as e:
+            logger.error(f"Telegram outbox unavailable, using in-process queue: {e}")
+            return None
+
+    def _resolve_dedup_window(self) -> float:
+        """Dedup window in seconds from config (0 disables)."""
+        try:
+            telegram_config = self.config.telegram
+            if telegram_config:
+                return telegram_config.dedup_window
+        except Exception:
+            pass
+        return DEFAULT_DEDUP_WINDOW
+
     # ========== CONFIG INFO ==========
 
     def get_config_info(self) -> Dict[str, Any]:
         """Get Telegram configuration information with queue stats."""
-        queue_stats = telegram_queue.get_stats()
+        queue_stats = self.get_queue_stats()
 
         if not self.is_configured:
             return {
@@ -205,26 +235,90 @@ class DjangoTelegram(BaseCfgModule):
             "chat_id": telegram_config.chat_id or "Not set",
             "enabled": True,
             "parse_mode": telegram_config.parse_mode or "None",
-            "rate_limit": "20 messages/second",
+            "rate_limit": (
+                f"{telegram_config.outbox_global_rate:g} messages/second, "
+                f"{telegram_config.outbox_chat_rate:g}/second per chat"
+                if telegram_config.outbox_path
+                else "20 messages/second"
+            ),
             **queue_stats,
         }
 
     @staticmethod
     def get_queue_size() -> int:
         """Get current number of messages in the global queue."""
+        drainer = DjangoTelegram._get_outbox_drainer()
+        if drainer is not None:
+            return drainer.outbox.size()
         return telegram_queue.size()
 
     @staticmethod
     def get_queue_stats() -> dict:
         """Get detailed queue statistics."""
+        drainer = DjangoTelegram._get_outbox_drainer()
+        if drainer is not None:
+            return drainer.get_stats()
         return telegram_queue.get_stats()
 
+    @staticmethod
+    def flush_queue(timeout: float = 10.0) -> bool:
+        """Wait until queued messages are sent: the outbox and the in-process queue."""
+        drainer = DjangoTelegram._get_outbox_drainer()
+        flushed = drainer.flush(timeout) if drainer is not None else True
+        return telegram_queue.flush(timeout) and flushed
+
     # ========== SEND METHODS ==========
 
     def _enqueue_message(self, func, priority=MessagePriority.NORMAL, *args, **kwargs):
         """Add message to global queue with priority and rate limiting."""
         telegram_queue.enqueue(func, priority, *args, **kwargs)
 
+    def _dispatch_text(
+        self,
+        text: str,
+        chat_id: Union[int, str],
+        bot_token: Optional[str],
+        parse_mode: Optional[str],
+        disable_notification: bool = False,
+        reply_to_message_id: Optional[int] = None,
+        priority: int = MessagePriority.NORMAL,
+    ) -> None:
+        """Hand a ready-to-send text message to the outbox or the in-process queue."""
+        drainer = self._get_outbox_drainer()
+        if drainer is not None:
+            drainer.outbox.push(
+                OutboxMessage(
+                    chat_id=chat_id,
+                    text=text,
+                    parse_mode=parse_mode,
+                    disable_notification=disable_notification,
+                    reply_to_message_id=reply_to_message_id,
+                    bot_token=bot_token,
+                    priority=priority,
+                )
+            )
+            if in_forked_child():
+                # No drainer thread here, and the process may exit via
+                # os._exit right after the job: send before returning
+                drainer.flush()
+            else:
+                drainer.notify()
+            return
+
+        bot_instance = self._get_bot(bot_token)
+
+        def _do_send():
+            bot_instance.send_message(
+                chat_id=chat_id,
+                text=text,
+                parse_mode=parse_mode,
+                disable_notification=disable_notification,
+                reply_to_message_id=reply_to_message_id,
+            )
+            logger.info(f"Telegram message sent successfully to chat {chat_id}")
+
+        self._enqueue_message(_do_send, priority=priority)
+
     def send_message(
         self,
         message: str,
@@ -256,20 +350,34 @@ class DjangoTelegram(BaseCfgModule):
                 return False
 
             parse_mode_str = self._resolve_parse_mode(parse_mode)
-            bot_instance = self._get_bot(effective_token)
-
-            def _do_send():
-                prefixed_message = f"{self.project_prefix}{message}"
-                bot_instance.send_message(
-                    chat_id=target_chat_id,
-                    text=prefixed_message,
-                    parse_mode=parse_mode_str,
+            text = f"{self.project_prefix}{message}"
+
+            def _send_repeated(count: int):
+                self._dispatch_text(
+                    format_repeated(text, count),
+                    target_chat_id,
+                    effective_token,
+                    parse_mode_str,
                     disable_notification=disable_notification,
-                    reply_to_message_id=reply_to_message_id,
+                    priority=priority,
                 )
-                logger.info(f"Telegram message sent successfully to chat {target_chat_id}")
 
-            self._enqueue_message(_do_send, priority=priority)
+            # Identical messages to the same chat within the window collapse
+            # into this one plus a "×N repeated" summary when it closes
+            fingerprint = message_fingerprint(effective_token or "", target_chat_id, parse_mode_str, text)
+            if not telegram_queue.dedup.admit(fingerprint, self._resolve_dedup_window(), _send_repeated):
+                logger.debug(f"Suppressed repeated Telegram message to chat {target_chat_id}")
+                return True
+
+            self._dispatch_text(
+                text,
+                target_chat_id,
+                effective_token,
+                parse_mode_str,
+                disable_notification=disable_notification,
+                reply_to_message_id=reply_to_message_id,
+                priority=priority,
+            )
             return True
 
         except Exception as e:
@@ -4,7 +4,141 @@ Database Router for Django Config Toolkit
 Simple and reliable database routing.
 """
 
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
 from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db.utils import InterfaceError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+# Seconds a replica stays out of rotation after a connection error
+DEFAULT_REPLICA_COOLDOWN = 30
+
+# Set by db_for_write: once the current request has written, its reads stay
+# on the primary so it sees its own writes regardless of replica lag.
+_pinned_to_primary: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "django_cfg_db_pinned_to_primary", default=False
+)
+
+# True inside a request or a read_your_writes() block. Writes outside one
+# (RQ workers, management commands, threads) don't pin: nothing would ever
+# unpin them again.
+_pin_scope: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "django_cfg_db_pin_scope", default=False
+)
+
+
+def pin_to_primary() -> None:
+    """Send all reads in the current request/context to the primary."""
+    _pinned_to_primary.set(True)
+
+
+def reset_primary_pin(**kwargs) -> None:
+    """Allow reads in the current context to go to replicas again."""
+    _pinned_to_primary.set(False)
+
+
+@contextmanager
+def read_your_writes(pinned: bool = False) -> Iterator[None]:
+    """
+    Scope read-your-writes pinning to a block of code outside a request.
+
+    After the first write inside the block its reads go to the primary;
+    on exit the previous pin state is restored. Use it around a job or a
+    command's unit of work::
+
+        with read_your_writes():
+            order.save()
+            Order.objects.get(pk=order.pk)  # primary
+
+    Args:
+        pinned: Pin reads to the primary from the start of the block
+    """
+    scope_token = _pin_scope.set(True)
+    pin_token = _pinned_to_primary.set(pinned)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(pin_token)
+        _pin_scope.reset(scope_token)
+
+
+def _start_request(**kwargs) -> None:
+    _pin_scope.set(True)
+    _pinned_to_primary.set(False)
+
+
+def _finish_request(**kwargs) -> None:
+    _pin_scope.set(False)
+    _pinned_to_primary.set(False)
+
+
+request_started.connect(_start_request, dispatch_uid="django_cfg_reset_primary_pin")
+request_finished.connect(_finish_request, dispatch_uid="django_cfg_clear_primary_pin")
+
+
+class _ReplicaPool:
+    """
+    Smooth weighted round-robin over replica aliases.
+
+    Replicas that failed to connect are skipped until their cooldown expires.
+    State is per process and shared by all threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current: Dict[str, Dict[str, int]] = {}
+        self._down_until: Dict[str, float] = {}
+
+    def choose(self, primary: str, replicas: List[Tuple[str, int]]) -> Optional[str]:
+        """Pick the next healthy replica of ``primary``, or None if all are down."""
+        now = time.monotonic()
+        with self._lock:
+            current = self._current.setdefault(primary, {})
+            total = 0
+            best = None
+            for alias, weight in replicas:
+                if self._down_until.get(alias, 0) > now:
+                    continue
+                current[alias] = current.get(alias, 0) + weight
+                total += weight
+                if best is None or current[alias] > current[best]:
+                    best = alias
+            if best is not None:
+                current[best] -= total
+            return best
+
+    def mark_down(self, alias: str, cooldown: float) -> None:
+        """Take a replica out of rotation for ``cooldown`` seconds."""
+        with self._lock:
+            self._down_until[alias] = time.monotonic() + cooldown
+
+    def reset(self) -> None:
+        with self._lock:
+            self._current.clear()
+            self._down_until.clear()
+
+
+_replica_pool = _ReplicaPool()
+
+
+def mark_replica_down(alias: str, cooldown: Optional[float] = None) -> None:
+    """
+    Take a read replica out of rotation (e.g. from a health check).
+
+    Args:
+        alias: Replica database alias
+        cooldown: Seconds to skip it; defaults to DATABASE_REPLICA_COOLDOWN
+    """
+    if cooldown is None:
+        cooldown = getattr(settings, 'DATABASE_REPLICA_COOLDOWN', DEFAULT_REPLICA_COOLDOWN)
+    _replica_pool.mark_down(alias, cooldown)
 
 
 class DatabaseRouter:
@@ -13,6 +147,11 @@ class DatabaseRouter:
     
     Uses DATABASE_ROUTING_RULES setting to determine which apps
     should use which databases.
+
+    Reads are spread across read replicas listed in DATABASE_READ_REPLICAS
+    (primary alias → [(replica alias, weight), ...]) unless the current
+    request (or ``read_your_writes()`` block) already wrote, the primary is inside a transaction, or every
+    replica is out of rotation after connection errors.
     """
 
     @staticmethod
@@ -56,14 +195,57 @@ class DatabaseRouter:
             return mirror
         return alias
 
+    def _choose_replica(self, primary: str) -> Optional[str]:
+        """
+        Pick a read replica for ``primary``, or None to read from the primary.
+
+        A replica without an open connection is connected here; if that fails
+        it is taken out of rotation and the next one is tried. Connecting up
+        front costs nothing extra — the query would open it anyway.
+        """
+        replicas = getattr(settings, 'DATABASE_READ_REPLICAS', {}).get(primary)
+        if not replicas or _pinned_to_primary.get():
+            return None
+
+        from django.db import connections
+
+        # Uncommitted rows of an open transaction are only visible on the primary
+        if connections[self._resolve_alias(primary)].in_atomic_block:
+            return None
+
+        for _ in range(len(replicas)):
+            alias = _replica_pool.choose(primary, replicas)
+            if alias is None:
+                return None
+
+            resolved = self._resolve_alias(alias)
+            connection = connections[resolved]
+            if connection.connection is not None:
+                return resolved
+            try:
+                connection.ensure_connection()
+            except (OperationalError, InterfaceError) as e:
+                logger.warning(f"Read replica '{alias}' unavailable, removing from rotation: {e}")
+                mark_replica_down(alias)
+                continue
+            return resolved
+
+        return None
+
     def db_for_read(self, model, **hints):
-        """Route reads to correct database."""
+        """Route reads to correct database (or one of its replicas)."""
         rules = getattr(settings, 'DATABASE_ROUTING_RULES', {})
         alias = rules.get(model._meta.app_label)
+        replica = self._choose_replica(alias or 'default')
+        if replica:
+            return replica
         return self._resolve_alias(alias) if alias else None
 
     def db_for_write(self, model, **hints):
         """Route writes to correct database."""
+        # Read-your-writes: the rest of this request reads from the primary
+        if _pin_scope.get():
+            _pinned_to_primary.set(True)
         rules = getattr(settings, 'DATABASE_ROUTING_RULES', {})
         alias = rules.get(model._meta.app_label)
         return self._resolve_alias(alias) if alias else None
@@ -90,6 +272,11 @@ class DatabaseRouter:
 
     def allow_migrate(self, db, app_label, **hints):
         """Allow migrations to correct database."""
+        replicas = getattr(settings, 'DATABASE_READ_REPLICAS', {})
+        if any(db == alias for group in replicas.values() for alias, _ in group):
+            # Replicas receive schema changes through replication
+            return False
+
         rules = getattr(settings, 'DATABASE_ROUTING_RULES', {})
         target_db = rules.get(app_label)
 
@@ -0,0 +1,111 @@
+"""
+Tests for read replica routing in DatabaseRouter.
+
+Uses several SQLite aliases; the "down" replica points into a missing
+directory so connecting to it fails.
+"""
+
+from collections import Counter
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.signals import request_finished, request_started
+from django.db.utils import ConnectionHandler
+from django.test import override_settings
+
+from . import routers
+from .routers import DatabaseRouter, pin_to_primary, read_your_writes, reset_primary_pin
+
+
+@pytest.fixture
+def sqlite_connections(tmp_path, django_db_blocker):
+    handler = ConnectionHandler({
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": str(tmp_path / "primary.db")},
+        "replica1": {"ENGINE": "django.db.backends.sqlite3", "NAME": str(tmp_path / "replica1.db")},
+        "replica2": {"ENGINE": "django.db.backends.sqlite3", "NAME": str(tmp_path / "replica2.db")},
+        "down": {"ENGINE": "django.db.backends.sqlite3", "NAME": str(tmp_path / "missing" / "down.db")},
+    })
+    routers._replica_pool.reset()
+    reset_primary_pin()
+    with django_db_blocker.unblock(), patch("django.db.connections", handler):
+        yield handler
+    handler.close_all()
+    routers._replica_pool.reset()
+    reset_primary_pin()
+
+
+def _model(app_label="shop"):
+    model = Mock()
+    model._meta.app_label = app_label
+    return model
+
+
+class TestReplicaRouting:
+    """Test replica selection for reads."""
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("replica1", 3), ("replica2", 1)]})
+    def test_weighted_round_robin(self, sqlite_connections):
+        router = DatabaseRouter()
+
+        picks = Counter(router.db_for_read(_model()) for _ in range(40))
+
+        assert picks == {"replica1": 30, "replica2": 10}
+
+    @override_settings(DATABASE_READ_REPLICAS={})
+    def test_no_replicas_keeps_default_routing(self, sqlite_connections):
+        assert DatabaseRouter().db_for_read(_model()) is None
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("replica1", 1)]})
+    def test_read_your_writes_pinning(self, sqlite_connections):
+        router = DatabaseRouter()
+        request_started.send(sender=None)
+        assert router.db_for_read(_model()) == "replica1"
+
+        router.db_for_write(_model())
+
+        assert router.db_for_read(_model()) is None
+
+        request_finished.send(sender=None)
+        assert router.db_for_read(_model()) == "replica1"
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("replica1", 1)]})
+    def test_pin_is_scoped_outside_requests(self, sqlite_connections):
+        router = DatabaseRouter()
+
+        # A bare write (worker, command) must not pin the process for good
+        router.db_for_write(_model())
+        assert router.db_for_read(_model()) == "replica1"
+
+        with read_your_writes():
+            assert router.db_for_read(_model()) == "replica1"
+            router.db_for_write(_model())
+            assert router.db_for_read(_model()) is None
+
+        assert router.db_for_read(_model()) == "replica1"
+        router.db_for_write(_model())
+        assert router.db_for_read(_model()) == "replica1"
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("replica1", 1)]})
+    def test_explicit_pin(self, sqlite_connections):
+        pin_to_primary()
+
+        assert DatabaseRouter().db_for_read(_model()) is None
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("down", 5), ("replica1", 1)]})
+    def test_failed_replica_leaves_rotation(self, sqlite_connections):
+        router = DatabaseRouter()
+
+        picks = {router.db_for_read(_model()) for _ in range(10)}
+
+        assert picks == {"replica1"}
+
+    @override_settings(DATABASE_READ_REPLICAS={"default": [("down", 1)]})
+    def test_all_replicas_down_falls_back_to_primary(self, sqlite_connections):
+        assert DatabaseRouter().db_for_read(_model()) is None
+
+    @override_settings(
+        DATABASE_ROUTING_RULES={"shop": "default"},
+        DATABASE_READ_REPLICAS={"default": [("replica1", 1)]},
+    )
+    def test_replicas_never_migrate(self, sqlite_connections):
+        assert DatabaseRouter().allow_migrate("replica1", "shop") is False
@@ -0,0 +1,43 @@
+"""
+Redis client from the Django cache.
+
+Shared helper for services that use Redis directly (atomic scripts, hashes,
+SET NX) when the default cache is django-redis, and fall back to local state
+otherwise.
+
+Usage:
+    from django_cfg.utils.cache_redis import get_cache_redis_client
+
+    redis_client = get_cache_redis_client()
+    if redis_client is not None:
+        redis_client.hset("key", "field", "value")
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_redis_client(alias: str = "default"):
+    """
+    Get the raw redis-py client behind a django-redis cache.
+
+    Args:
+        alias: Django cache alias
+
+    Returns:
+        redis.Redis instance, or None if the cache is not Redis-backed
+    """
+    try:
+        from django.core.cache import caches
+
+        cache = caches[alias]
+        if hasattr(cache, "client") and hasattr(cache.client, "get_client"):
+            return cache.client.get_client(write=True)
+    except Exception as e:
+        logger.warning(f"Could not get Redis client from cache '{alias}': {e}")
+
+    return None
+
+
+__all__ = ["get_cache_redis_client"]